@@ -1,3 +1,25 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
-# Register your models here.
+from apps.accounts.models import User
+
+
+@admin.register(User)
+class UserAdmin(BaseUserAdmin):
+    list_display = (
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "is_staff",
+        "is_director",
+        "is_project_manager",
+        "is_tech_lead",
+    )
+    list_filter = (*BaseUserAdmin.list_filter, "is_director", "is_project_manager", "is_tech_lead")
+    # Los roles se asignan con los grupos; los flags son de solo lectura
+    readonly_fields = ("is_director", "is_project_manager", "is_tech_lead")
+    fieldsets = (
+        *BaseUserAdmin.fieldsets,
+        ("Roles", {"fields": ("is_director", "is_project_manager", "is_tech_lead")}),
+    )
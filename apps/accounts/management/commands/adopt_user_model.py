@@ -0,0 +1,49 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.db.migrations.recorder import MigrationRecorder
+
+
+class Command(BaseCommand):
+    help = (
+        "Prepara una base de datos creada con django.contrib.auth.User para el "
+        "usuario propio (accounts.User sobre la misma tabla auth_user): marca "
+        "accounts.0001_initial como aplicada y mueve el content type de auth.user. "
+        "Ejecutar una sola vez antes de migrate; en bases de datos nuevas no hace falta."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Alias de la base de datos (default: 'default')",
+        )
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+        recorder = MigrationRecorder(connections[alias])
+        applied = recorder.applied_migrations()
+
+        if ("accounts", "0001_initial") in applied:
+            self.stdout.write("accounts.0001_initial ya está aplicada")
+            return
+        if ("auth", "0001_initial") not in applied:
+            self.stdout.write("Base de datos nueva: basta con migrate")
+            return
+
+        with transaction.atomic(using=alias):
+            # La tabla auth_user ya existe: solo se registra la migración
+            recorder.record_applied("accounts", "0001_initial")
+            # Conserva los permisos add/change/delete/view_user ya asignados
+            moved = (
+                ContentType.objects.using(alias)
+                .filter(app_label="auth", model="user")
+                .update(app_label="accounts")
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"accounts.0001_initial registrada ({moved} content type movido); "
+                "ya se puede ejecutar migrate"
+            )
+        )
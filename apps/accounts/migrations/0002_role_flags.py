@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:53
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+ROLE_GROUPS = {
+    "is_director": "Dirección",
+    "is_project_manager": "Gestión de proyectos",
+    "is_tech_lead": "Technical leads",
+}
+
+
+def sync_role_flags(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    memberships = User.groups.through.objects.filter(user_id=OuterRef("pk"))
+    User.objects.update(
+        **{
+            flag: Exists(memberships.filter(group__name=group))
+            for flag, group in ROLE_GROUPS.items()
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='is_director',
+            field=models.BooleanField(default=False, editable=False, help_text='Grupo «Dirección»', verbose_name='dirección'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='is_project_manager',
+            field=models.BooleanField(default=False, editable=False, help_text='Grupo «Gestión de proyectos»', verbose_name='gestión de proyectos'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='is_tech_lead',
+            field=models.BooleanField(default=False, editable=False, help_text='Grupo «Technical leads»', verbose_name='technical lead'),
+        ),
+        migrations.RunPython(sync_role_flags, migrations.RunPython.noop),
+    ]
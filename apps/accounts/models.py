@@ -1,3 +1,41 @@
+from django.contrib.auth.models import AbstractUser
 from django.db import models
 
-# Create your models here.
+# Grupo de Django que otorga cada rol. Los flags del usuario son una copia
+# desnormalizada (ver apps.accounts.services.UserRoleService) para que la UI y
+# los selectors consulten el rol sin un JOIN con auth_group.
+ROLE_GROUPS = {
+    "is_director": "Dirección",
+    "is_project_manager": "Gestión de proyectos",
+    "is_tech_lead": "Technical leads",
+}
+
+
+class User(AbstractUser):
+    """Usuario de la intranet con los flags de rol desnormalizados."""
+
+    # auth_user se creó con la clave entera de django.contrib.auth
+    id = models.AutoField(primary_key=True, verbose_name="ID")
+    is_director = models.BooleanField(
+        "dirección",
+        default=False,
+        editable=False,
+        help_text=f"Grupo «{ROLE_GROUPS['is_director']}»",
+    )
+    is_project_manager = models.BooleanField(
+        "gestión de proyectos",
+        default=False,
+        editable=False,
+        help_text=f"Grupo «{ROLE_GROUPS['is_project_manager']}»",
+    )
+    is_tech_lead = models.BooleanField(
+        "technical lead",
+        default=False,
+        editable=False,
+        help_text=f"Grupo «{ROLE_GROUPS['is_tech_lead']}»",
+    )
+
+    class Meta(AbstractUser.Meta):
+        # Misma tabla que django.contrib.auth.User: las bases de datos
+        # existentes conservan usuarios, grupos y permisos (ver 0001_initial)
+        db_table = "auth_user"
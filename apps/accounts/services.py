@@ -0,0 +1,51 @@
+"""
+Service layer de cuentas: flags de rol desnormalizados.
+
+``is_director``, ``is_project_manager`` e ``is_tech_lead`` copian la
+pertenencia a los grupos de ROLE_GROUPS. Se recalculan en una sola UPDATE
+cada vez que cambian los grupos de un usuario o el nombre de un grupo de rol
+(ver ``apps.accounts.signals``).
+"""
+
+import logging
+from collections.abc import Iterable
+
+from django.db.models import Exists, OuterRef
+
+from apps.accounts.models import ROLE_GROUPS, User
+from apps.core.auth import invalidate_auth_cache
+from apps.core.inertia import invalidate_shared_props
+from config.telemetry import traced
+
+logger = logging.getLogger(__name__)
+
+
+class UserRoleService:
+    """Sincronización de los flags de rol con los grupos."""
+
+    @staticmethod
+    @traced
+    def sync_role_flags(*, user_ids: Iterable[int] | None = None) -> int:
+        """
+        Recalcular los flags de rol a partir de los grupos.
+
+        Args:
+            user_ids: Usuarios a sincronizar (None = todos)
+
+        Returns:
+            Número de usuarios actualizados
+        """
+        memberships = User.groups.through.objects.filter(user_id=OuterRef("pk"))
+        users = User.objects.all() if user_ids is None else User.objects.filter(pk__in=user_ids)
+        updated = users.update(
+            **{
+                flag: Exists(memberships.filter(group__name=group))
+                for flag, group in ROLE_GROUPS.items()
+            }
+        )
+        # update() no emite post_save: descartar aquí lo cacheado
+        pks = users.values_list("pk", flat=True) if user_ids is None else user_ids
+        invalidate_auth_cache(pks)
+        invalidate_shared_props(pks)
+        logger.info(f"Flags de rol sincronizados para {updated} usuarios")
+        return updated
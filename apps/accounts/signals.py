@@ -0,0 +1,58 @@
+"""
+Señales que mantienen los flags de rol (apps.accounts.services).
+
+Se recalculan al añadir o quitar grupos de un usuario (desde cualquiera de
+los dos lados de la relación), al renombrar un grupo y al borrarlo.
+"""
+
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.accounts.models import ROLE_GROUPS, User
+from apps.accounts.services import UserRoleService
+
+_ROLE_GROUP_NAMES = frozenset(ROLE_GROUPS.values())
+
+
+def _members(group: Group) -> list[int]:
+    return list(group.user_set.values_list("pk", flat=True))
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def user_groups_changed(instance, action, reverse, pk_set, **kwargs):
+    """user.groups o group.user_set."""
+    if action == "pre_clear" and reverse:
+        # group.user_set.clear(): pk_set no viene informado
+        instance._role_members = _members(instance)
+    elif action == "post_clear" and reverse:
+        UserRoleService.sync_role_flags(user_ids=instance.__dict__.pop("_role_members", []))
+    elif action in ("post_add", "post_remove", "post_clear"):
+        UserRoleService.sync_role_flags(user_ids=pk_set if reverse else [instance.pk])
+
+
+@receiver(post_init, sender=Group)
+def group_post_init(instance, **kwargs):
+    """Recordar el nombre original para detectar renombrados."""
+    instance._role_name = instance.__dict__.get("name")
+
+
+@receiver(post_save, sender=Group)
+def group_saved(instance, created, **kwargs):
+    """Un grupo renombrado puede ganar o perder un rol."""
+    renamed = not created and instance._role_name != instance.name
+    if renamed and {instance._role_name, instance.name} & _ROLE_GROUP_NAMES:
+        UserRoleService.sync_role_flags(user_ids=_members(instance))
+    instance._role_name = instance.name
+
+
+@receiver(pre_delete, sender=Group)
+def group_pre_delete(instance, **kwargs):
+    # El borrado en cascada de las relaciones no emite m2m_changed
+    instance._role_members = _members(instance) if instance.name in _ROLE_GROUP_NAMES else []
+
+
+@receiver(post_delete, sender=Group)
+def group_deleted(instance, **kwargs):
+    if instance._role_members:
+        UserRoleService.sync_role_flags(user_ids=instance._role_members)
@@ -4,3 +4,24 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
+
+    def ready(self):
+        """Registrar receptores de señales de Celery, de invalidación de cache y trazas."""
+        import apps.core.celery_metrics  # noqa
+        import apps.core.signals  # noqa
+
+        # Props de Inertia serializadas con orjson. inertia-django espera una
+        # clase en INERTIA_JSON_ENCODER y no se puede importar desde settings.
+        from inertia.http import InertiaResponse
+
+        from apps.core.json import FastInertiaJSONEncoder
+
+        InertiaResponse.json_encoder = FastInertiaJSONEncoder
+
+        # Invalidación de la cache de selectors y precalentamiento al arrancar beat
+        from apps.core import selector_cache  # noqa: F401
+
+        # Muestreo y exportador de trazas (TELEMETRY_*), spans de queries SQL
+        from apps.core.tracing import install as install_tracing
+
+        install_tracing()
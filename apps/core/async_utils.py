@@ -0,0 +1,104 @@
+"""
+Utilidades para vistas y services async (despliegue ASGI).
+
+Reglas de acceso a base de datos desde código async:
+- Lecturas simples: ORM async nativo (``aget``, ``acount``, ``async for``).
+- Escrituras y transacciones: los services son síncronos (@transaction.atomic
+  no funciona en async); llamarlos con ``async_service`` para que se ejecuten
+  completos en el thread de base de datos de la request.
+- Nunca usar el ORM síncrono directamente dentro de una corrutina: Django
+  lanza SynchronousOnlyOperation.
+- Respuestas en streaming de vistas síncronas servidas por ASGI: pasar el
+  iterador por ``aiter_sync``. Con un iterador síncrono Django lo consume
+  entero con ``sync_to_async(list)`` antes de enviar nada.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
+from itertools import islice
+from typing import Any
+
+import httpx
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_sync_client: httpx.Client | None = None
+_sync_client_lock = threading.Lock()
+
+
+def async_service[**P, R](func: Callable[P, R]) -> Callable[P, Coroutine[Any, Any, R]]:
+    """
+    Versión awaitable de una función síncrona de service o selector.
+
+    Usa ``thread_sensitive=True``: todas las llamadas de una misma request
+    comparten thread y por tanto conexión del pool, igual que en WSGI.
+
+    Example:
+        >>> job = await async_service(ExportService.start_export)(
+        ...     user=user, export_name="time_entries", fmt="csv", params={}
+        ... )
+    """
+    return sync_to_async(func, thread_sensitive=True)
+
+
+async def aiter_sync(iterator: Iterator[str], *, chunk_size: int) -> AsyncIterator[str]:
+    """
+    Consumir un iterador síncrono de texto desde código async, por bloques.
+
+    Cada bloque de ``chunk_size`` elementos se lee con ``sync_to_async``
+    (``thread_sensitive=True``, el thread de la request, que es el dueño de
+    la conexión y de su cursor de servidor) y se envía unido en una sola
+    cadena. En memoria solo hay un bloque a la vez.
+    """
+    next_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)), thread_sensitive=True)
+    try:
+        while chunk := await next_chunk():
+            yield "".join(chunk)
+    finally:
+        # Cliente desconectado a mitad: cerrar el generador (y su cursor) en su thread
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=True)()
+
+
+def _client_options() -> dict[str, Any]:
+    return {
+        "timeout": httpx.Timeout(
+            settings.OUTBOUND_HTTP_TIMEOUT, connect=settings.OUTBOUND_HTTP_CONNECT_TIMEOUT
+        ),
+        "limits": httpx.Limits(
+            max_connections=settings.OUTBOUND_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OUTBOUND_HTTP_MAX_CONNECTIONS,
+        ),
+        "headers": {"User-Agent": "10code-intranet"},
+    }
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Cliente HTTP async compartido para llamadas salientes (integraciones).
+
+    Hay uno por event loop, así las conexiones keep-alive se reutilizan entre
+    requests del mismo worker uvicorn.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_clients[loop] = httpx.AsyncClient(**_client_options())
+    return client
+
+
+def get_http_client() -> httpx.Client:
+    """Cliente HTTP síncrono compartido por proceso (vistas WSGI y tareas Celery)."""
+    global _sync_client
+    if _sync_client is None:
+        with _sync_client_lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(**_client_options())
+    return _sync_client
@@ -0,0 +1,63 @@
+"""
+Backend de autenticación con usuario y permisos en cache.
+
+Con sesiones ``cached_db`` y este backend, una request autenticada con la
+cache caliente no hace ninguna query de autenticación:
+- Sesión: cache (``SESSION_ENGINE = cached_db``)
+- Usuario: ``AUTH_USER_CACHE_KEY`` en lugar del SELECT de ``get_user``
+- Permisos: ``AUTH_PERMISSIONS_CACHE_KEY`` en lugar de las queries de
+  permisos directos y de grupo; dentro de la request se memorizan en el
+  propio usuario (``_perm_cache``), como hace ModelBackend
+
+Las entradas caducan a los AUTH_CACHE_TTL segundos y se invalidan antes al
+cambiar el usuario, sus grupos o sus permisos (ver ``apps.core.signals``).
+"""
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+AUTH_USER_CACHE_KEY = "auth:user:{user_id}"
+AUTH_PERMISSIONS_CACHE_KEY = "auth:perms:{user_id}"
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend que lee el usuario de la sesión y sus permisos de cache."""
+
+    def get_user(self, user_id):
+        key = AUTH_USER_CACHE_KEY.format(user_id=user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            cache.set(key, user, settings.AUTH_CACHE_TTL)
+        return user if self.user_can_authenticate(user) else None
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if not hasattr(user_obj, "_perm_cache"):
+            key = AUTH_PERMISSIONS_CACHE_KEY.format(user_id=user_obj.pk)
+            permissions = cache.get(key)
+            if permissions is None:
+                permissions = super().get_all_permissions(user_obj)
+                cache.set(key, permissions, settings.AUTH_CACHE_TTL)
+            user_obj._perm_cache = permissions
+        return user_obj._perm_cache
+
+
+def invalidate_auth_cache(user_ids) -> None:
+    """
+    Descartar el usuario y los permisos cacheados de estos usuarios.
+
+    Tras el commit, como ``apps.core.inertia.invalidate_shared_props``.
+    """
+    keys = [
+        key.format(user_id=user_id)
+        for user_id in set(user_ids)
+        for key in (AUTH_USER_CACHE_KEY, AUTH_PERMISSIONS_CACHE_KEY)
+    ]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,453 @@
+"""
+Backend de caché en dos niveles: LRU local por proceso + Redis.
+
+Las lecturas consultan primero una caché LRU en memoria del proceso (sin
+round-trip de red) y después Redis. Las escrituras van siempre a Redis,
+eliminan la entrada local y publican la invalidación por pub/sub para que el
+resto de workers la eliminen también.
+
+La caché local solo guarda entradas durante LOCAL_TIMEOUT segundos (o
+menos, si a la clave le queda menos TTL en Redis), lo que acota la
+obsolescencia incluso si se pierde un mensaje de invalidación. Las claves
+de LOCAL_EXCLUDE_PREFIXES no pasan por el nivel local ni publican
+invalidaciones.
+
+Django crea una instancia del backend por thread y por contexto async; el
+nivel local (LRU, id de nodo, thread de invalidación y contadores) es uno
+por proceso y LOCATION, compartido por todas ellas (ver LocalTier).
+
+En las trazas muestreadas cada round-trip a Redis abre un span CLIENT
+(config.telemetry); los aciertos locales no generan spans.
+
+Configuración (CACHES["default"]["OPTIONS"]):
+    LOCAL_MAX_ENTRIES: Número máximo de entradas locales (default: 1024)
+    LOCAL_TIMEOUT: TTL máximo de una entrada local en segundos (default: 5)
+    LOCAL_EXCLUDE_PREFIXES: Prefijos de clave que no se cachean localmente
+        (contadores, throttling... claves que cambian en cada request)
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from django_redis.cache import CONNECTION_INTERRUPTED, RedisCache, omit_exception
+from django_redis.exceptions import ConnectionInterrupted
+from redis import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from config.telemetry import SpanKind, start_span
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Tipos inmutables que pueden devolverse sin copiar
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+# Errores de Redis que django-redis convierte en ConnectionInterrupted
+_REDIS_ERRORS = (RedisConnectionError, RedisTimeoutError, ResponseError, TimeoutError)
+
+
+def _redis_span(operation: str, keys: int = 1):
+    """Span de una operación contra Redis (no-op si la traza no se muestrea)."""
+    return start_span(
+        f"cache.{operation}",
+        kind=SpanKind.CLIENT,
+        attributes={"db.system": "redis", "db.operation.name": operation, "cache.keys": keys},
+    )
+
+
+class LocalLRU:
+    """Caché LRU en memoria con TTL y tamaño acotado (thread-safe)."""
+
+    def __init__(self, *, max_entries: int, timeout: float):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._data: OrderedDict[str, tuple[float, bool, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Devuelve el valor o _MISSING si no está o ha caducado."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, pickled, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+        # Los valores mutables se guardan serializados para que el llamante
+        # no pueda modificar la copia compartida del proceso
+        return pickle.loads(value) if pickled else value  # noqa: S301
+
+    def set(self, key: str, value: Any, timeout: float | None = None) -> None:
+        ttl = self.timeout if timeout is None else min(timeout, self.timeout)
+        if ttl <= 0:
+            return
+        pickled = not isinstance(value, _IMMUTABLE_TYPES)
+        stored = pickle.dumps(value, pickle.HIGHEST_PROTOCOL) if pickled else value
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, pickled, stored)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LocalTier:
+    """
+    Nivel local de un proceso: LRU, id de nodo, contadores y listener pub/sub.
+
+    Uno por (LOCATION, KEY_PREFIX, pid), compartido por todas las instancias
+    de TwoTierRedisCache del proceso (ver get_local_tier). Tras un fork el
+    hijo crea el suyo: el thread del listener no sobrevive al fork.
+    """
+
+    def __init__(self, *, channel: str, max_entries: int, timeout: float):
+        self.lru = LocalLRU(max_entries=max_entries, timeout=timeout)
+        self.node_id = uuid.uuid4().hex
+        self.channel = channel
+        self.pid = os.getpid()
+        self.stats = {"local_hits": 0, "local_misses": 0, "redis_hits": 0, "redis_misses": 0}
+        self._listener: threading.Thread | None = None
+        self._listener_lock = threading.Lock()
+
+    def count(self, stat: str) -> None:
+        # Contadores aproximados: sin lock para no añadir contención al hot path
+        self.stats[stat] += 1
+
+    def ensure_listener(self, get_client: Callable[[], Redis]) -> None:
+        """Arrancar el thread de invalidación si no está vivo (uno por proceso)."""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        with self._listener_lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self.lru.clear()
+            self._listener = threading.Thread(
+                target=self._listen, args=(get_client,), name="cache-invalidation", daemon=True
+            )
+            self._listener.start()
+
+    def _listen(self, get_client: Callable[[], Redis]) -> None:
+        backoff = 0.5
+        while True:
+            try:
+                pubsub = get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                backoff = 0.5
+                for message in pubsub.listen():
+                    self.handle_invalidation(message["data"])
+            except Exception as e:
+                # Mientras no hay suscripción se pudieron perder invalidaciones
+                self.lru.clear()
+                logger.warning(f"Suscripción de invalidación de caché perdida: {e}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def handle_invalidation(self, data: bytes | str) -> None:
+        if isinstance(data, bytes):
+            data = data.decode()
+        node_id, _, key = data.partition("|")
+        if node_id == self.node_id:
+            return
+        if key == "*":
+            self.lru.clear()
+        else:
+            self.lru.delete(key)
+
+
+_tiers: dict[tuple[str, str, int], LocalTier] = {}
+_tiers_lock = threading.Lock()
+
+
+def get_local_tier(
+    location: str, key_prefix: str, *, max_entries: int, timeout: float
+) -> LocalTier:
+    """Nivel local del proceso actual para un Redis (LOCATION) y prefijo."""
+    pid = os.getpid()
+    key = (location, key_prefix, pid)
+    tier = _tiers.get(key)
+    if tier is None:
+        with _tiers_lock:
+            tier = _tiers.get(key)
+            if tier is None:
+                # Los niveles heredados del padre tras un fork ya no sirven
+                for stale in [k for k in _tiers if k[2] != pid]:
+                    del _tiers[stale]
+                tier = _tiers[key] = LocalTier(
+                    channel=f"{key_prefix or 'cache'}:invalidate",
+                    max_entries=max_entries,
+                    timeout=timeout,
+                )
+    return tier
+
+
+class TwoTierRedisCache(RedisCache):
+    """
+    Caché django-redis con un nivel LRU local delante.
+
+    Mantiene contadores de aciertos/fallos por nivel (ver get_stats()).
+    """
+
+    def __init__(self, server: str, params: dict[str, Any]) -> None:
+        options = dict(params.get("OPTIONS", {}))
+        self._local_max_entries = int(options.pop("LOCAL_MAX_ENTRIES", 1024))
+        self._local_timeout = float(options.pop("LOCAL_TIMEOUT", 5))
+        self._local_exclude = tuple(options.pop("LOCAL_EXCLUDE_PREFIXES", ()))
+        super().__init__(server, {**params, "OPTIONS": options})
+        self._tier: LocalTier | None = None
+
+    # --- NIVEL LOCAL ---
+
+    @property
+    def tier(self) -> LocalTier:
+        """Nivel local compartido del proceso (se renueva tras un fork)."""
+        tier = self._tier
+        if tier is None or tier.pid != os.getpid():
+            tier = self._tier = get_local_tier(
+                self._server,
+                self.key_prefix,
+                max_entries=self._local_max_entries,
+                timeout=self._local_timeout,
+            )
+        return tier
+
+    def _local_enabled(self, key: str) -> bool:
+        return self._local_max_entries > 0 and not str(key).startswith(self._local_exclude)
+
+    def _local_tier(self) -> LocalTier:
+        """Nivel local con el listener de invalidación arrancado."""
+        tier = self.tier
+        tier.ensure_listener(lambda: self.client.get_client(write=False))
+        return tier
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Aciertos y fallos por nivel en este proceso.
+
+        Returns:
+            {local_hits, local_misses, redis_hits, redis_misses, local_entries}
+        """
+        tier = self.tier
+        return {**tier.stats, "local_entries": len(tier.lru)}
+
+    def reset_stats(self) -> None:
+        stats = self.tier.stats
+        for stat in stats:
+            stats[stat] = 0
+
+    # --- INVALIDACIÓN POR PUB/SUB ---
+
+    def _invalidate(self, *made_keys: str) -> None:
+        """Elimina claves del nivel local y lo notifica al resto de procesos."""
+        if not made_keys:
+            return
+        tier = self.tier
+        for made_key in made_keys:
+            tier.lru.delete(made_key)
+        try:
+            redis_client = self.client.get_client(write=True)
+            for made_key in made_keys:
+                redis_client.publish(tier.channel, f"{tier.node_id}|{made_key}")
+        except Exception as e:
+            logger.warning(f"No se pudo publicar la invalidación de caché: {e}")
+
+    def _invalidate_keys(self, keys, version=None) -> None:
+        """Invalidar solo las claves que pueden estar en el nivel local."""
+        self._invalidate(
+            *(self.make_key(key, version=version) for key in keys if self._local_enabled(key))
+        )
+
+    def _invalidate_all(self) -> None:
+        tier = self.tier
+        tier.lru.clear()
+        try:
+            self.client.get_client(write=True).publish(tier.channel, f"{tier.node_id}|*")
+        except Exception as e:
+            logger.warning(f"No se pudo publicar la invalidación de caché: {e}")
+
+    # --- LECTURAS DE REDIS CON TTL ---
+
+    @omit_exception(return_value=CONNECTION_INTERRUPTED)
+    def _get_with_ttl(
+        self, made_keys: list[str], client: Redis | None = None
+    ) -> list[tuple[bytes | None, int]]:
+        """
+        GET + PTTL de cada clave en un solo round-trip.
+
+        El TTL restante limita cuánto se guarda la clave en el nivel local: una
+        clave de vida corta (lock, ventana de throttling) no debe sobrevivir
+        en local a su expiración en Redis.
+        """
+        if client is None:
+            client = self.client.get_client(write=False)
+        pipeline = client.pipeline(transaction=False)
+        for made_key in made_keys:
+            pipeline.get(made_key)
+            pipeline.pttl(made_key)
+        try:
+            results = pipeline.execute()
+        except _REDIS_ERRORS as e:
+            raise ConnectionInterrupted(connection=client) from e
+        return list(zip(results[::2], results[1::2], strict=True))
+
+    def _local_set(self, tier: LocalTier, made_key: str, value: Any, pttl: int) -> None:
+        # pttl -1: sin expiración en Redis; -2: la clave ya no existe
+        if pttl == -1:
+            tier.lru.set(made_key, value)
+        elif pttl > 0:
+            tier.lru.set(made_key, value, timeout=pttl / 1000)
+
+    # --- API DE CACHÉ ---
+
+    def get(self, key, default=None, version=None, client=None):
+        if not self._local_enabled(key):
+            with _redis_span("get"):
+                return super().get(key, default=default, version=version, client=client)
+
+        tier = self._local_tier()
+        made_key = self.make_key(key, version=version)
+        value = tier.lru.get(made_key)
+        if value is not _MISSING:
+            tier.count("local_hits")
+            return value
+        tier.count("local_misses")
+
+        with _redis_span("get") as span:
+            fetched = self._get_with_ttl([made_key], client=client)
+            raw, pttl = (None, -2) if fetched is CONNECTION_INTERRUPTED else fetched[0]
+            span.set_attribute("cache.hit", raw is not None)
+        if raw is None:
+            tier.count("redis_misses")
+            return default
+        tier.count("redis_hits")
+        value = self.client.decode(raw)
+        self._local_set(tier, made_key, value, pttl)
+        return value
+
+    def get_many(self, keys, version=None, client=None):
+        found = {}
+        pending = []
+        tier = None
+        for key in keys:
+            if not self._local_enabled(key):
+                pending.append(key)
+                continue
+            tier = tier or self._local_tier()
+            value = tier.lru.get(self.make_key(key, version=version))
+            if value is _MISSING:
+                tier.count("local_misses")
+                pending.append(key)
+            else:
+                tier.count("local_hits")
+                found[key] = value
+
+        if not pending:
+            return found
+        if tier is None:
+            # Ninguna clave pasa por el nivel local: MGET sin TTL
+            with _redis_span("get_many", len(pending)) as span:
+                fetched = super().get_many(pending, version=version, client=client) or {}
+                span.set_attribute("cache.hits", len(fetched))
+            found.update(fetched)
+            return found
+
+        made_keys = [self.make_key(key, version=version) for key in pending]
+        with _redis_span("get_many", len(pending)) as span:
+            results = self._get_with_ttl(made_keys, client=client)
+            if results is CONNECTION_INTERRUPTED:
+                results = [(None, -2)] * len(pending)
+            span.set_attribute("cache.hits", sum(raw is not None for raw, _ in results))
+        for key, made_key, (raw, pttl) in zip(pending, made_keys, results, strict=True):
+            if raw is None:
+                tier.count("redis_misses")
+                continue
+            tier.count("redis_hits")
+            value = found[key] = self.client.decode(raw)
+            if self._local_enabled(key):
+                self._local_set(tier, made_key, value, pttl)
+        return found
+
+    def set(
+        self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None, nx=False, xx=False
+    ):
+        with _redis_span("set"):
+            result = super().set(
+                key, value, timeout=timeout, version=version, client=client, nx=nx, xx=xx
+            )
+        self._invalidate_keys([key], version=version)
+        return result
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        result = super().add(key, value, timeout=timeout, version=version, client=client)
+        if result:
+            self._invalidate_keys([key], version=version)
+        return result
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        with _redis_span("set_many", len(data)):
+            result = super().set_many(data, timeout=timeout, version=version, client=client)
+        self._invalidate_keys(data, version=version)
+        return result
+
+    def delete(self, key, version=None, prefix=None, client=None):
+        with _redis_span("delete"):
+            result = super().delete(key, version=version, prefix=prefix, client=client)
+        self._invalidate_keys([key], version=version)
+        return result
+
+    def delete_many(self, keys, version=None, client=None):
+        keys = list(keys)
+        with _redis_span("delete_many", len(keys)):
+            result = super().delete_many(keys, version=version, client=client)
+        self._invalidate_keys(keys, version=version)
+        return result
+
+    def incr(self, key, delta=1, version=None, client=None, ignore_key_check=False):
+        result = super().incr(
+            key, delta=delta, version=version, client=client, ignore_key_check=ignore_key_check
+        )
+        self._invalidate_keys([key], version=version)
+        return result
+
+    def decr(self, key, delta=1, version=None, client=None):
+        return self.incr(key, -delta, version=version, client=client)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        result = super().touch(key, timeout=timeout, version=version, client=client)
+        self._invalidate_keys([key], version=version)
+        return result
+
+    def delete_pattern(self, pattern, version=None, prefix=None, client=None, **kwargs):
+        result = super().delete_pattern(
+            pattern, version=version, prefix=prefix, client=client, **kwargs
+        )
+        self._invalidate_all()
+        return result
+
+    def clear(self):
+        result = super().clear()
+        self._invalidate_all()
+        return result
@@ -0,0 +1,131 @@
+"""
+Métricas de tiempos de tareas Celery basadas en señales.
+
+Registra por tarea: ejecuciones, fallos, reintentos, tiempo de ejecución y
+tiempo de espera en cola (desde que se publica hasta que un worker la
+empieza). Los contadores se acumulan en la caché (Redis) para agregarlos
+entre workers; ver el comando ``celery_task_stats``.
+"""
+
+import logging
+import threading
+import time
+
+from celery.signals import before_task_publish, task_failure, task_postrun, task_prerun, task_retry
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY_PREFIX = "celery_metrics"
+METRIC_FIELDS = ("count", "failures", "retries", "runtime_ms", "wait_ms")
+
+# Cabecera del mensaje con el instante de publicación (epoch)
+SENT_AT_HEADER = "sent_at"
+
+# Inicio de cada tarea en ejecución en este proceso, por task_id
+_started: dict[str, tuple[float, float | None]] = {}
+_started_lock = threading.Lock()
+
+
+def metric_key(task_name: str, field: str) -> str:
+    """Clave de caché de un contador de métricas."""
+    return f"{METRICS_KEY_PREFIX}:{task_name}:{field}"
+
+
+def _incr(task_name: str, field: str, delta: int = 1) -> None:
+    """Incrementa un contador sin fallar si la caché no está disponible."""
+    key = metric_key(task_name, field)
+    try:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, delta)
+    except Exception as e:
+        logger.debug(f"No se pudo registrar la métrica {key}: {e}")
+
+
+def get_task_stats(task_names: list[str]) -> dict[str, dict[str, float]]:
+    """
+    Lee las métricas acumuladas de un conjunto de tareas.
+
+    Args:
+        task_names: Nombres completos de las tareas
+
+    Returns:
+        {tarea: {count, failures, retries, runtime_ms, wait_ms,
+                 avg_runtime_ms, avg_wait_ms}} solo para tareas con datos
+    """
+    keys = [metric_key(name, field) for name in task_names for field in METRIC_FIELDS]
+    values = cache.get_many(keys)
+
+    stats = {}
+    for name in task_names:
+        row = {field: values.get(metric_key(name, field), 0) for field in METRIC_FIELDS}
+        if not row["count"]:
+            continue
+        row["avg_runtime_ms"] = row["runtime_ms"] / row["count"]
+        row["avg_wait_ms"] = row["wait_ms"] / row["count"]
+        stats[name] = row
+    return stats
+
+
+def reset_task_stats(task_names: list[str]) -> None:
+    """Borra las métricas acumuladas de las tareas indicadas."""
+    cache.delete_many([metric_key(name, field) for name in task_names for field in METRIC_FIELDS])
+
+
+@before_task_publish.connect
+def _stamp_sent_at(headers=None, **kwargs):
+    """Añade al mensaje el instante de publicación para medir la espera en cola."""
+    if headers is not None and settings.CELERY_METRICS_ENABLED:
+        headers.setdefault(SENT_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def _task_started(task_id=None, task=None, **kwargs):
+    if not settings.CELERY_METRICS_ENABLED:
+        return
+    sent_at = getattr(task.request, SENT_AT_HEADER, None)
+    wait_ms = max(0.0, (time.time() - sent_at) * 1000) if sent_at else None
+    with _started_lock:
+        _started[task_id] = (time.monotonic(), wait_ms)
+
+
+@task_postrun.connect
+def _task_finished(task_id=None, task=None, state=None, **kwargs):
+    with _started_lock:
+        started = _started.pop(task_id, None)
+    if started is None:
+        return
+
+    started_at, wait_ms = started
+    runtime_ms = (time.monotonic() - started_at) * 1000
+
+    _incr(task.name, "count")
+    _incr(task.name, "runtime_ms", int(runtime_ms))
+    if wait_ms is not None:
+        _incr(task.name, "wait_ms", int(wait_ms))
+
+    logger.info(
+        f"Tarea {task.name} {state} en {runtime_ms:.0f}ms",
+        extra={
+            "task_id": task_id,
+            "task_name": task.name,
+            "state": state,
+            "runtime_ms": round(runtime_ms, 1),
+            "wait_ms": round(wait_ms, 1) if wait_ms is not None else None,
+            "retries": task.request.retries,
+        },
+    )
+
+
+@task_retry.connect
+def _task_retried(request=None, **kwargs):
+    if settings.CELERY_METRICS_ENABLED and request is not None:
+        _incr(request.task, "retries")
+
+
+@task_failure.connect
+def _task_failed(sender=None, **kwargs):
+    if settings.CELERY_METRICS_ENABLED and sender is not None:
+        _incr(sender.name, "failures")
@@ -0,0 +1,346 @@
+"""
+Utilidades de base de datos compartidas.
+
+Helpers de infraestructura para inspeccionar el pool de conexiones de psycopg3,
+el uso de conexiones en el servidor PostgreSQL, el enrutado de lecturas a la
+réplica (ver config.db_routers.PrimaryReplicaRouter), la espera de arranque y
+los advisory locks de PostgreSQL.
+"""
+
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.models import QuerySet
+
+from config.telemetry import is_recording, start_span
+
+logger = logging.getLogger(__name__)
+
+REPLICA_ALIAS = "replica"
+
+# Lecturas dentro de un selector marcado como apto para réplica
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+# Instante (monotonic) de la última escritura en el contexto actual
+_last_write_at: ContextVar[float | None] = ContextVar("last_write_at", default=None)
+
+# Estado de salud de la réplica compartido por el proceso
+_replica_health_lock = threading.Lock()
+_replica_health: dict[str, float | bool] = {"checked_at": 0.0, "healthy": False}
+
+
+def get_pool_stats(alias: str = "default") -> dict[str, int] | None:
+    """
+    Devuelve las estadísticas del pool de conexiones del proceso actual.
+
+    Args:
+        alias: Alias de la base de datos en DATABASES
+
+    Returns:
+        Diccionario con las métricas del pool o None si el alias no usa pool
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    return {
+        "min_size": stats.get("pool_min", 0),
+        "max_size": stats.get("pool_max", 0),
+        "size": size,
+        "available": available,
+        "checked_out": size - available,
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": stats.get("requests_num", 0),
+        "requests_queued": stats.get("requests_queued", 0),
+        "wait_ms": stats.get("requests_wait_ms", 0),
+        "errors": stats.get("requests_errors", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
+
+
+def get_server_connections(alias: str = "default") -> list[dict[str, str | int]]:
+    """
+    Cuenta las conexiones abiertas en PostgreSQL agrupadas por rol y estado.
+
+    Cada proceso se identifica con ``application_name`` (``10code-<rol>``), por
+    lo que esta vista agrega el uso real de todos los workers de web y Celery.
+
+    Args:
+        alias: Alias de la base de datos en DATABASES
+
+    Returns:
+        Lista de filas con application_name, state y count
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute(
+            "SELECT application_name, coalesce(state, 'unknown'), count(*) "
+            "FROM pg_stat_activity "
+            "WHERE datname = current_database() "
+            "GROUP BY 1, 2 ORDER BY 1, 2"
+        )
+        rows = cursor.fetchall()
+
+    return [
+        {"application_name": name, "state": state, "count": count} for name, state, count in rows
+    ]
+
+
+# --- ARRANQUE Y LOCKS ---
+
+
+def _probe_connection(alias: str, connect_timeout: float) -> None:
+    """Abre y cierra una conexión directa (sin pasar por el pool)."""
+    connection = connections[alias]
+    if connection.vendor != "postgresql":
+        connection.ensure_connection()
+        return
+    params = connection.get_connection_params()
+    params["connect_timeout"] = max(1, int(connect_timeout))
+    connection.Database.connect(**params).close()
+
+
+def wait_for_database(
+    alias: str = "default",
+    *,
+    timeout: float = 60.0,
+    initial_delay: float = 0.05,
+    max_delay: float = 2.0,
+) -> int:
+    """
+    Esperar a que la base de datos acepte conexiones, con backoff exponencial.
+
+    Se ejecuta en el propio proceso: sin intérpretes nuevos por intento y con
+    reintentos rápidos al principio (50ms, 100ms, 200ms...) hasta max_delay.
+
+    Args:
+        alias: Alias de la base de datos en DATABASES
+        timeout: Segundos máximos de espera
+        initial_delay: Espera tras el primer fallo
+        max_delay: Espera máxima entre intentos
+
+    Returns:
+        Número de intentos realizados
+
+    Raises:
+        DatabaseError: Si no hay conexión antes del timeout
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            _probe_connection(alias, connect_timeout=min(max_delay * 2, timeout))
+            return attempt
+        except Exception as e:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DatabaseError(
+                    f"Base de datos '{alias}' no disponible tras {attempt} intentos: {e}"
+                ) from e
+            logger.info(f"Base de datos '{alias}' no disponible (intento {attempt}): {e}")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+
+@contextmanager
+def advisory_lock(lock_id: int, alias: str = "default") -> Iterator[None]:
+    """
+    Advisory lock de sesión de PostgreSQL (bloqueante) durante el bloque.
+
+    Serializa operaciones entre procesos o contenedores, p.ej. migraciones
+    lanzadas a la vez por varias réplicas. En otros motores no hace nada.
+
+    Args:
+        lock_id: Identificador entero (bigint) del lock
+        alias: Alias de la base de datos en DATABASES
+    """
+    connection = connections[alias]
+    if connection.vendor != "postgresql":
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+
+# --- RÉPLICA DE LECTURA ---
+
+
+def replica_configured() -> bool:
+    """Indica si hay una réplica de lectura definida en DATABASES."""
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def mark_write() -> None:
+    """Registra una escritura para activar la ventana read-your-writes."""
+    _last_write_at.set(time.monotonic())
+
+
+def pin_primary() -> None:
+    """Fuerza lecturas del primario durante la ventana read-your-writes."""
+    mark_write()
+
+
+def last_write_at() -> float | None:
+    """Instante (monotonic) de la última escritura en el contexto actual."""
+    return _last_write_at.get()
+
+
+def reset_write_state() -> None:
+    """Olvida escrituras previas (inicio de request en threads reutilizados)."""
+    _last_write_at.set(None)
+
+
+def recent_write() -> bool:
+    """Indica si hubo una escritura dentro de la ventana read-your-writes."""
+    last_write = last_write_at()
+    if last_write is None:
+        return False
+    return time.monotonic() - last_write < settings.DATABASE_REPLICA_READ_YOUR_WRITES
+
+
+_REPLICA_LAG_SQL = (
+    "SELECT CASE WHEN pg_is_in_recovery() "
+    "THEN coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "ELSE 0 END"
+)
+
+
+def _replica_lag() -> float:
+    """
+    Lag de replicación en segundos, con una conexión directa a la réplica.
+
+    No pasa por el pool: si la réplica está caída, sacar una conexión del pool
+    esperaría DATABASE_POOL_TIMEOUT; la conexión directa falla tras
+    DATABASE_REPLICA_CONNECT_TIMEOUT.
+    """
+    connection = connections[REPLICA_ALIAS]
+    if connection.vendor != "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(_REPLICA_LAG_SQL)
+            return float(cursor.fetchone()[0])
+    params = connection.get_connection_params()
+    params["connect_timeout"] = settings.DATABASE_REPLICA_CONNECT_TIMEOUT
+    with connection.Database.connect(**params) as conn:
+        return float(conn.execute(_REPLICA_LAG_SQL).fetchone()[0])
+
+
+def _check_replica_health() -> bool:
+    """Consulta disponibilidad y lag de replicación de la réplica."""
+    try:
+        lag = _replica_lag()
+    except (DatabaseError, connections[REPLICA_ALIAS].Database.Error) as e:
+        logger.warning(f"Réplica no disponible, leyendo del primario: {e}")
+        return False
+
+    if lag > settings.DATABASE_REPLICA_MAX_LAG:
+        logger.warning(
+            f"Réplica con lag de {lag:.1f}s (máximo {settings.DATABASE_REPLICA_MAX_LAG}s), "
+            "leyendo del primario"
+        )
+        return False
+    return True
+
+
+def replica_is_healthy() -> bool:
+    """
+    Indica si la réplica está disponible y dentro del lag máximo.
+
+    El resultado se cachea por proceso durante
+    DATABASE_REPLICA_HEALTH_CHECK_INTERVAL segundos para no añadir una
+    consulta por lectura.
+    """
+    now = time.monotonic()
+    interval = settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL
+    if now - _replica_health["checked_at"] < interval:
+        return bool(_replica_health["healthy"])
+
+    with _replica_health_lock:
+        if now - _replica_health["checked_at"] >= interval:
+            _replica_health["healthy"] = _check_replica_health()
+            _replica_health["checked_at"] = now
+    return bool(_replica_health["healthy"])
+
+
+def get_read_alias() -> str | None:
+    """
+    Alias desde el que leer en el contexto actual.
+
+    Returns:
+        "replica" si estamos en un selector apto para réplica, hay réplica sana,
+        no hubo escrituras recientes y no hay una transacción abierta en el
+        primario; None para dejar el enrutado por defecto
+    """
+    if not _replica_reads.get() or not replica_configured():
+        return None
+    # Lo que se lee dentro de atomic() (validar antes de guardar, leer y luego
+    # actualizar) pertenece a la transacción: siempre del primario
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return None
+    if recent_write() or not replica_is_healthy():
+        return None
+    return REPLICA_ALIAS
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Context manager que permite leer de la réplica dentro del bloque."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def replica_selector[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """
+    Decorador para selectors cuyas lecturas pueden ir a la réplica.
+
+    Los QuerySets son perezosos, así que si el selector devuelve uno se fija
+    su alias con ``.using()`` en el momento de la llamada; el resto de
+    resultados (agregados, dicts) se evalúan dentro del contexto de réplica.
+    En las trazas muestreadas cada llamada abre un span ``selector ...`` (si
+    devuelve un QuerySet, sus queries se ejecutan después, fuera del span).
+
+    Example:
+        >>> @replica_selector
+        ... def get_projects_list(*, user: User) -> QuerySet[Project]:
+        ...     return Project.objects.filter(members__user=user)
+    """
+
+    span_name = f"selector {func.__qualname__}"
+    attributes = {"code.function": func.__qualname__, "code.namespace": func.__module__}
+
+    def call(*args: P.args, **kwargs: P.kwargs) -> R:
+        with replica_reads():
+            result = func(*args, **kwargs)
+            if isinstance(result, QuerySet) and result._db is None:
+                alias = get_read_alias()
+                if alias is not None:
+                    result = result.using(alias)
+        return result
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not is_recording():
+            return call(*args, **kwargs)
+        with start_span(span_name, attributes=attributes):
+            return call(*args, **kwargs)
+
+    return wrapper
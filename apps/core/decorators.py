@@ -0,0 +1,36 @@
+"""
+Decoradores reutilizables.
+"""
+
+from collections.abc import Callable
+
+
+def query_budget(
+    *,
+    max_queries: int | None = None,
+    n_plus_one_threshold: int | None = None,
+    exempt: bool = False,
+) -> Callable:
+    """
+    Ajustar el presupuesto de queries de una vista (QueryBudgetMiddleware).
+
+    Args:
+        max_queries: Máximo de queries de esta vista (None = el global)
+        n_plus_one_threshold: Repeticiones que cuentan como N+1 (None = el global)
+        exempt: No comprobar presupuesto (p.ej. long-polling que repite
+            la misma query a propósito); se sigue emitiendo Server-Timing
+
+    Example:
+        >>> @query_budget(max_queries=60)
+        ... def dashboard(request): ...
+    """
+
+    def decorator(view):
+        view.query_budget = {
+            "max_queries": max_queries,
+            "n_plus_one_threshold": n_plus_one_threshold,
+            "exempt": exempt,
+        }
+        return view
+
+    return decorator
@@ -0,0 +1,184 @@
+"""
+Capa de ayuda para vistas Inertia.
+
+Props por página:
+- ``lazy_prop``: solo se evalúa cuando el cliente la pide en un partial
+  reload (``router.reload({ only: ['prop'] })``); nunca en la primera carga
+- ``deferred_prop``: no se evalúa en la primera carga; el cliente la pide
+  automáticamente justo después, agrupada por ``group``
+
+En ambos casos el selector se pasa sin llamar, con sus argumentos, y en un
+partial reload solo se ejecutan los selectors de las props pedidas.
+
+Props compartidas (``auth``, ``permissions``, ``menu``): las añade
+InertiaSharedPropsMiddleware a todas las páginas. Se calculan una vez por
+usuario y se guardan en cache hasta que cambian el usuario, sus grupos o sus
+permisos (ver ``apps.core.signals``). Se comparten como callables, así que
+un partial reload que no las pide no toca ni la cache ni la base de datos.
+
+Las vistas Inertia son síncronas: las props se resuelven al renderizar.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import cache, partial
+from typing import Any
+
+from inertia import defer, optional, share
+from inertia.prop_classes import DeferredProp, OptionalProp
+
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.http import HttpRequest
+from django.urls import NoReverseMatch, reverse
+
+logger = logging.getLogger(__name__)
+
+SHARED_PROPS_KEY = "inertia:shared:{user_id}"
+
+
+# --- PROPS POR PÁGINA ---
+
+
+def lazy_prop(selector: Callable[..., Any], /, *args: Any, **kwargs: Any) -> OptionalProp:
+    """
+    Prop evaluada solo cuando un partial reload la pide explícitamente.
+
+    Ejemplo:
+        "history": lazy_prop(get_project_history, project_id=project.pk)
+    """
+    return optional(partial(selector, *args, **kwargs))
+
+
+def deferred_prop(
+    selector: Callable[..., Any], /, *args: Any, group: str = "default", **kwargs: Any
+) -> DeferredProp:
+    """
+    Prop cargada tras la primera pintura con una request adicional.
+
+    Las props del mismo ``group`` se piden juntas; usar grupos distintos para
+    que una prop lenta no retrase a las demás.
+
+    Ejemplo:
+        "chart": deferred_prop(get_hours_series, group="charts", user_id=user.pk)
+    """
+    return defer(partial(selector, *args, **kwargs), group=group)
+
+
+# --- MENÚ ---
+
+
+@dataclass(frozen=True)
+class MenuItem:
+    """
+    Entrada del menú principal.
+
+    Attributes:
+        label: Texto visible
+        url_name: Nombre de URL (``reverse``)
+        permission: Permiso necesario para verla (None = cualquier usuario autenticado)
+        icon: Nombre del icono (lucide-react) en el frontend
+    """
+
+    label: str
+    url_name: str
+    permission: str | None = None
+    icon: str = ""
+
+
+MENU_ITEMS: list[MenuItem] = []
+
+
+def register_menu_item(item: MenuItem) -> MenuItem:
+    """Añadir una entrada al menú principal (en el orden de registro)."""
+    MENU_ITEMS.append(item)
+    return item
+
+
+def _build_menu(permissions: Iterable[str]) -> list[dict[str, str]]:
+    granted = set(permissions)
+    menu = []
+    for item in MENU_ITEMS:
+        if item.permission and item.permission not in granted:
+            continue
+        try:
+            url = reverse(item.url_name)
+        except NoReverseMatch:
+            logger.warning(f"Entrada de menú '{item.label}' con URL inexistente: {item.url_name}")
+            continue
+        menu.append({"label": item.label, "url": url, "icon": item.icon})
+    return menu
+
+
+# --- PROPS COMPARTIDAS ---
+
+
+def build_shared_props(user) -> dict[str, Any]:
+    """Calcular las props compartidas de un usuario (sin cache)."""
+    if not user.is_authenticated:
+        return {"auth": {"user": None}, "permissions": {}, "menu": _build_menu(())}
+
+    permissions = sorted(user.get_all_permissions())
+    return {
+        "auth": {
+            "user": {
+                "id": user.pk,
+                "username": user.get_username(),
+                "email": user.email,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "is_staff": user.is_staff,
+                "is_director": user.is_director,
+                "is_project_manager": user.is_project_manager,
+                "is_tech_lead": user.is_tech_lead,
+            }
+        },
+        "permissions": dict.fromkeys(permissions, True),
+        "menu": _build_menu(permissions),
+    }
+
+
+def get_shared_props(user) -> dict[str, Any]:
+    """Props compartidas del usuario, cacheadas INERTIA_SHARED_PROPS_TTL segundos."""
+    if not user.is_authenticated:
+        return build_shared_props(user)
+    key = SHARED_PROPS_KEY.format(user_id=user.pk)
+    props = django_cache.get(key)
+    if props is None:
+        props = build_shared_props(user)
+        django_cache.set(key, props, settings.INERTIA_SHARED_PROPS_TTL)
+    return props
+
+
+def invalidate_shared_props(user_ids: Iterable[int]) -> None:
+    """
+    Descartar las props cacheadas de estos usuarios.
+
+    Se ejecuta tras el commit: si se borrara antes, una request concurrente
+    podría volver a cachear los datos antiguos.
+    """
+    keys = [SHARED_PROPS_KEY.format(user_id=user_id) for user_id in set(user_ids)]
+    if keys:
+        transaction.on_commit(lambda: django_cache.delete_many(keys))
+
+
+def share_cached_props(request: HttpRequest) -> None:
+    """
+    Compartir ``auth``, ``permissions`` y ``menu`` con todas las páginas.
+
+    Se comparten callables con una única lectura de cache por request; solo
+    se ejecutan si la respuesta incluye alguna de estas props.
+    """
+
+    @cache
+    def props() -> dict[str, Any]:
+        return get_shared_props(request.user)
+
+    share(
+        request,
+        auth=lambda: props()["auth"],
+        permissions=lambda: props()["permissions"],
+        menu=lambda: props()["menu"],
+    )
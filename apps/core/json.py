@@ -0,0 +1,127 @@
+"""
+Serialización JSON rápida (orjson) para props de Inertia y respuestas DRF.
+
+orjson serializa en C los tipos nativos (dict, list, str, int, float, UUID,
+date, datetime, time, dataclasses, arrays de numpy) y solo vuelve a Python
+para los tipos que necesitan la semántica de Django:
+- Decimal: string como DjangoJSONEncoder. En DRF, string o float según
+  COERCE_DECIMAL_TO_STRING, igual que un DecimalField: las filas de
+  ``.values()`` (ValuesSerializer) llegan con Decimal sin convertir
+- cadenas de traducción lazy (gettext_lazy): str
+- cualquier otro tipo: el ``default`` del encoder original (modelos y
+  QuerySets en Inertia, iterables en DRF), con la misma salida que el
+  encoder de la stdlib
+
+Fechas: los datetime aware conservan su offset (los que vienen de la base de
+datos están en UTC y se emiten con "Z", igual que DjangoJSONEncoder; para
+mostrar la hora de Europe/Madrid tal cual, convertir con
+``timezone.localtime`` en el selector). A diferencia de DjangoJSONEncoder
+se emiten microsegundos en vez de milisegundos; ``Date.parse`` los acepta.
+
+Renderer/parser DRF: FastJSONRenderer / FastJSONParser.
+Inertia: FastInertiaJSONEncoder, activado en CoreConfig.ready().
+"""
+
+import json
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any, override
+
+import orjson
+from inertia.utils import InertiaJsonEncoder
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
+
+from django.utils.functional import Promise
+
+# Claves no string (p. ej. IDs) aceptadas como en json.dumps; UTC como "Z"
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+
+def make_default(
+    fallback: json.JSONEncoder, *, decimal: Callable[[Decimal], Any] = str
+) -> Callable[[Any], Any]:
+    """
+    Construir el ``default`` de orjson delegando en ``fallback`` lo desconocido.
+
+    Args:
+        fallback: Encoder cuyo ``default`` resuelve el resto de tipos
+        decimal: Conversión de Decimal (str en Django/Inertia; en DRF según
+            COERCE_DECIMAL_TO_STRING)
+    """
+    # Conversión por tipo exacto: un dict es más barato que una cadena de
+    # isinstance y ``default`` se llama una vez por cada valor no nativo
+    converters: dict[type, Callable[[Any], Any]] = {Decimal: decimal}
+
+    def default(obj: Any) -> Any:
+        converter = converters.get(type(obj))
+        if converter is not None:
+            return converter(obj)
+        if isinstance(obj, Decimal):
+            converters[type(obj)] = decimal
+            return decimal(obj)
+        if isinstance(obj, Promise):
+            # Clases proxy que crea ``lazy()`` (gettext_lazy...)
+            converters[type(obj)] = str
+            return str(obj)
+        return fallback.default(obj)
+
+    return default
+
+
+_drf_default = make_default(
+    DRFJSONEncoder(), decimal=str if api_settings.COERCE_DECIMAL_TO_STRING else float
+)
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any]) -> bytes:
+    """Serializar a bytes UTF-8 compactos."""
+    return orjson.dumps(obj, default=default, option=OPTIONS)
+
+
+class FastInertiaJSONEncoder(InertiaJsonEncoder):
+    """
+    Encoder de Inertia sobre orjson.
+
+    inertia-django llama a ``json.dumps(page, cls=...)``, que instancia el
+    encoder y llama a ``encode``; el resto de opciones de json.dumps no se
+    usan. Modelos, QuerySets e InertiaMeta siguen yendo por InertiaJsonEncoder.
+    """
+
+    def encode(self, o: Any) -> str:
+        return dumps(o, default=make_default(self)).decode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer de DRF sobre orjson.
+
+    Las respuestas con indentación (API navegable, ``; indent=N``) usan el
+    renderer original: orjson solo sabe indentar con 2 espacios.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = dumps(data, default=_drf_default)
+        # Igual que DRF: U+2028/U+2029 escapados para que sea JS válido
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser de DRF sobre orjson (rechaza NaN/Infinity como STRICT_JSON)."""
+
+    @override
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
@@ -0,0 +1,44 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from apps.core.celery_metrics import get_task_stats, reset_task_stats
+from config.celery import app
+
+
+class Command(BaseCommand):
+    help = (
+        "Muestra métricas acumuladas por tarea Celery: ejecuciones, fallos, reintentos, "
+        "tiempo medio de ejecución y de espera en cola."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Emitir la salida en JSON")
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Borrar las métricas acumuladas tras mostrarlas",
+        )
+
+    def handle(self, *args, **options):
+        app.loader.import_default_modules()
+        task_names = sorted(name for name in app.tasks if not name.startswith("celery."))
+        stats = get_task_stats(task_names)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, indent=2))
+        elif not stats:
+            self.stdout.write(self.style.WARNING("Sin métricas registradas"))
+        else:
+            self.stdout.write(
+                f"{'tarea':<50} {'count':>7} {'fail':>5} {'retry':>5} {'avg ms':>9} {'wait ms':>9}"
+            )
+            for name, row in stats.items():
+                self.stdout.write(
+                    f"{name:<50} {row['count']:>7} {row['failures']:>5} {row['retries']:>5} "
+                    f"{row['avg_runtime_ms']:>9.1f} {row['avg_wait_ms']:>9.1f}"
+                )
+
+        if options["reset"]:
+            reset_task_stats(task_names)
+            self.stdout.write(self.style.SUCCESS("Métricas reiniciadas"))
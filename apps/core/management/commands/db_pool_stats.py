@@ -0,0 +1,57 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.core.db import get_pool_stats, get_server_connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Muestra la configuración y estadísticas del pool de conexiones (checked-out, "
+        "en espera, tiempo de espera) y las conexiones abiertas en PostgreSQL por rol."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Alias de la base de datos a inspeccionar (default: 'default')",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Emitir la salida en formato JSON",
+        )
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+        pool_options = connections[alias].settings_dict["OPTIONS"].get("pool")
+
+        report = {
+            "database": alias,
+            "role": settings.PROCESS_ROLE,
+            "pool_options": pool_options or None,
+            "pool_stats": get_pool_stats(alias),
+            "server_connections": get_server_connections(alias),
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f"Base de datos: {alias} (rol: {report['role']})")
+        if not pool_options:
+            self.stdout.write(self.style.WARNING("Pool de conexiones desactivado"))
+        else:
+            self.stdout.write(f"Configuración del pool: {pool_options}")
+            self.stdout.write("Estadísticas del pool (este proceso):")
+            for key, value in report["pool_stats"].items():
+                self.stdout.write(f"  {key:<18} {value}")
+
+        self.stdout.write("Conexiones en PostgreSQL por rol:")
+        for row in report["server_connections"]:
+            self.stdout.write(
+                f"  {row['application_name'] or '-':<24} {row['state']:<22} {row['count']}"
+            )
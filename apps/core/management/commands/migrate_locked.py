@@ -0,0 +1,47 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.migrations.executor import MigrationExecutor
+
+from apps.core.db import advisory_lock
+
+# Identificador del advisory lock de migraciones (constante para todo el proyecto)
+MIGRATIONS_LOCK_ID = 0x10C0DE_0001
+
+
+class Command(BaseCommand):
+    help = (
+        "Aplica las migraciones pendientes bajo un advisory lock de PostgreSQL, "
+        "de modo que varias réplicas o jobs pueden lanzarlo a la vez sin pisarse. "
+        "Si no hay migraciones pendientes termina sin tomar el lock."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Alias de la base de datos (default: 'default')",
+        )
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+
+        if not self._pending_migrations(alias):
+            self.stdout.write("Sin migraciones pendientes")
+            return
+
+        self.stdout.write("Esperando lock de migraciones...")
+        with advisory_lock(MIGRATIONS_LOCK_ID, alias=alias):
+            # Otra réplica puede haberlas aplicado mientras esperábamos:
+            # migrate es idempotente y en ese caso no hace nada
+            call_command(
+                "migrate",
+                database=alias,
+                interactive=False,
+                verbosity=options["verbosity"],
+            )
+
+    @staticmethod
+    def _pending_migrations(alias: str) -> list:
+        executor = MigrationExecutor(connections[alias])
+        return executor.migration_plan(executor.loader.graph.leaf_nodes())
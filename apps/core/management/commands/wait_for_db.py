@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from apps.core.db import wait_for_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Espera a que la base de datos acepte conexiones con backoff exponencial. "
+        "Pensado para el entrypoint de los contenedores."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Alias de la base de datos (default: 'default')",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=60.0,
+            help="Segundos máximos de espera (default: 60)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            attempts = wait_for_database(options["database"], timeout=options["timeout"])
+        except DatabaseError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(self.style.SUCCESS(f"Base de datos disponible ({attempts} intentos)"))
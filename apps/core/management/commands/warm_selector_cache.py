@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.selector_cache import get_cached_selectors, warm_selectors
+from apps.core.tasks import warm_selector_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Precalienta la cache de selectors (claves declaradas con warm en @cached_selector). "
+        "Beat ya lo hace al arrancar; útil tras despliegues sin beat o para comprobarlo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help="Selectors a precalentar (módulo.función); por defecto todos",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recalcular todas las claves aunque estén vigentes",
+        )
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="run_async",
+            help="Encolar la tarea en Celery en lugar de ejecutarla aquí",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="Listar los selectors cacheados y salir",
+        )
+
+    def handle(self, *args, **options):
+        selectors = get_cached_selectors()
+        if options["list"]:
+            for name, selector in sorted(selectors.items()):
+                warm = "warm" if selector.warm_args is not None else "-"
+                self.stdout.write(f"{name:<60} {warm:<5} {', '.join(selector.tags)}")
+            return
+
+        names = options["names"] or None
+        unknown = sorted(set(names or ()) - set(selectors))
+        if unknown:
+            raise CommandError(f"Selectors desconocidos: {', '.join(unknown)}")
+
+        if options["run_async"]:
+            result = warm_selector_cache.delay(names=names, force=options["force"])
+            self.stdout.write(f"Precalentamiento encolado: {result.id}")
+            return
+
+        for name, warmed in warm_selectors(names=names, force=options["force"]).items():
+            self.stdout.write(f"{name}: {warmed} entradas recalculadas")
@@ -0,0 +1,292 @@
+"""
+Middleware genérico de infraestructura para 10Code Intranet.
+"""
+
+import logging
+import random
+import re
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from django.conf import settings
+
+from apps.core.db import last_write_at, pin_primary, replica_configured, reset_write_state
+from apps.core.inertia import share_cached_props
+from apps.core.query_budget import QueryBudgetExceededError, check_budget, track_queries
+from config.telemetry import (
+    SpanKind,
+    StatusCode,
+    parse_traceparent,
+    reset_request_id,
+    set_request_id,
+    start_span,
+)
+
+logger = logging.getLogger(__name__)
+
+REPLICA_PIN_COOKIE = "primary_pin"
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# X-Request-ID recibido de un proxy: solo se acepta si es un identificador razonable
+_REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._-]{8,64}$")
+
+
+class HybridMiddleware:
+    """
+    Base para middleware que funciona igual en WSGI y en ASGI.
+
+    Django envuelve cada middleware solo síncrono con un cambio de thread
+    cuando la vista es async; declarando ambos modos la cadena se mantiene
+    async de principio a fin. Las subclases implementan ``handle`` (síncrono)
+    y ``ahandle`` (async).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.ahandle(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        raise NotImplementedError
+
+    async def ahandle(self, request):
+        raise NotImplementedError
+
+
+class TracingMiddleware(HybridMiddleware):
+    """
+    Abre el span SERVER de cada request y un span hijo para la vista.
+
+    Continúa la traza del llamante si llega ``traceparent`` y fija el
+    request_id (``X-Request-ID`` del proxy o uno nuevo) que llevan los logs
+    y las tareas Celery encoladas durante la request. Ambos se devuelven en
+    las cabeceras ``X-Request-ID`` y ``traceresponse``.
+
+    En las requests no muestreadas (TELEMETRY_SAMPLE_RATE) solo se generan
+    los identificadores. Debe ser el primer middleware.
+    """
+
+    def handle(self, request):
+        span, token = self._start(request)
+        try:
+            response = self.get_response(request)
+        except BaseException as exc:
+            span.record_exception(exc)
+            self._end(request, span, token)
+            raise
+        return self._finish(request, response, span, token)
+
+    async def ahandle(self, request):
+        span, token = self._start(request)
+        try:
+            response = await self.get_response(request)
+        except BaseException as exc:
+            span.record_exception(exc)
+            self._end(request, span, token)
+            raise
+        return self._finish(request, response, span, token)
+
+    def process_view(self, request, view_func, _view_args, _view_kwargs):
+        if not request.telemetry_span.sampled:
+            return None
+        name = getattr(view_func, "__qualname__", type(view_func).__qualname__)
+        view_span = start_span(
+            f"view {name}",
+            attributes={"code.function": name, "code.namespace": view_func.__module__},
+        )
+        view_span.activate()
+        request._telemetry_view_span = view_span
+        return None
+
+    def _start(self, request):
+        request_id = request.headers.get(REQUEST_ID_HEADER, "")
+        if not _REQUEST_ID_RE.match(request_id):
+            request_id = uuid.uuid4().hex
+        span = start_span(
+            request.method,
+            kind=SpanKind.SERVER,
+            parent=parse_traceparent(request.headers.get("traceparent")),
+            attributes={
+                "http.request.method": request.method,
+                "url.path": request.path,
+                "url.scheme": request.scheme,
+                "user_agent.original": request.headers.get("User-Agent", "")[:200],
+            },
+        )
+        span.activate()
+        request.request_id = request_id
+        request.telemetry_span = span
+        return span, set_request_id(request_id)
+
+    def _finish(self, request, response, span, token):
+        response[REQUEST_ID_HEADER] = request.request_id
+        response["traceresponse"] = span.traceparent
+        if span.sampled:
+            match = getattr(request, "resolver_match", None)
+            route = f"/{match.route}" if match and match.route else None
+            if route:
+                span.name = f"{request.method} {route}"
+            span.set_attributes(
+                {"http.route": route, "http.response.status_code": response.status_code}
+            )
+            if response.status_code >= 500:
+                span.set_status(StatusCode.ERROR, str(response.status_code))
+        self._end(request, span, token)
+        return response
+
+    @staticmethod
+    def _end(request, span, token) -> None:
+        view_span = request.__dict__.pop("_telemetry_view_span", None)
+        if view_span is not None:
+            view_span.end()
+        span.end()
+        reset_request_id(token)
+
+
+class ReplicaPinMiddleware(HybridMiddleware):
+    """
+    Mantiene la consistencia read-your-writes entre requests.
+
+    Si una request escribe en la base de datos, se envía una cookie de corta
+    duración que fija las lecturas del mismo usuario al primario durante
+    DATABASE_REPLICA_READ_YOUR_WRITES segundos, evitando que vea datos
+    desactualizados de la réplica justo después de guardar.
+    """
+
+    def handle(self, request):
+        if not replica_configured():
+            return self.get_response(request)
+        write_mark = self._start(request)
+        return self._finish(self.get_response(request), write_mark)
+
+    async def ahandle(self, request):
+        # Las variables de contexto se propagan a los threads de sync_to_async
+        if not replica_configured():
+            return await self.get_response(request)
+        write_mark = self._start(request)
+        return self._finish(await self.get_response(request), write_mark)
+
+    def _start(self, request) -> float | None:
+        # Los threads de los workers se reutilizan entre requests
+        reset_write_state()
+        if request.COOKIES.get(REPLICA_PIN_COOKIE):
+            pin_primary()
+        return last_write_at()
+
+    def _finish(self, response, write_mark: float | None):
+        if last_write_at() != write_mark:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.DATABASE_REPLICA_READ_YOUR_WRITES,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class QueryBudgetMiddleware(HybridMiddleware):
+    """
+    Controla el número de queries SQL por request y detecta N+1.
+
+    En las requests muestreadas (QUERY_BUDGET_SAMPLE_RATE) cuenta queries y
+    tiempo en base de datos, añade la cabecera ``Server-Timing`` y, si se
+    supera QUERY_BUDGET_MAX_QUERIES o una misma query se repite
+    QUERY_BUDGET_N_PLUS_ONE_THRESHOLD veces, según QUERY_BUDGET_MODE:
+    - "log": registra un warning (producción)
+    - "raise": lanza QueryBudgetExceededError (tests y desarrollo)
+
+    Las requests no muestreadas no tienen coste adicional.
+    """
+
+    def handle(self, request):
+        if not self._sampled():
+            return self.get_response(request)
+
+        with track_queries() as stats:
+            response = self.get_response(request)
+        return self._finish(request, response, stats)
+
+    async def ahandle(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+
+        # Las conexiones son por thread: el contador se instala en el thread
+        # de base de datos de la request (el de sync_to_async thread_sensitive)
+        tracker = track_queries()
+        stats = await sync_to_async(tracker.__enter__)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(tracker.__exit__)(None, None, None)
+        return self._finish(request, response, stats)
+
+    @staticmethod
+    def _sampled() -> bool:
+        sample_rate = settings.QUERY_BUDGET_SAMPLE_RATE
+        return sample_rate > 0 and random.random() < sample_rate  # noqa: S311
+
+    def _finish(self, request, response, stats):
+        timing = f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries"'
+        if response.has_header("Server-Timing"):
+            timing = f"{response['Server-Timing']}, {timing}"
+        response["Server-Timing"] = timing
+
+        # Ajustes por vista con @query_budget (apps.core.decorators)
+        match = getattr(request, "resolver_match", None)
+        overrides = getattr(match.func, "query_budget", {}) if match else {}
+        if overrides.get("exempt"):
+            return response
+
+        # None = usar el global; 0 es un límite explícito
+        max_queries = overrides.get("max_queries")
+        if max_queries is None:
+            max_queries = settings.QUERY_BUDGET_MAX_QUERIES
+        n_plus_one_threshold = overrides.get("n_plus_one_threshold")
+        if n_plus_one_threshold is None:
+            n_plus_one_threshold = settings.QUERY_BUDGET_N_PLUS_ONE_THRESHOLD
+
+        violations = check_budget(
+            stats, max_queries=max_queries, n_plus_one_threshold=n_plus_one_threshold
+        )
+        if violations:
+            message = f"Presupuesto de queries superado en {request.method} {request.path}"
+            if settings.QUERY_BUDGET_MODE == "raise":
+                raise QueryBudgetExceededError(f"{message}:\n" + "\n".join(violations))
+            logger.warning(
+                f"{message}: {'; '.join(violations)}",
+                extra={
+                    "path": request.path,
+                    "query_count": stats.count,
+                    "db_time_ms": round(stats.duration_ms, 1),
+                },
+            )
+        return response
+
+
+class InertiaSharedPropsMiddleware(HybridMiddleware):
+    """
+    Comparte ``auth``, ``permissions`` y ``menu`` con todas las páginas Inertia.
+
+    Solo registra callables (apps.core.inertia.share_cached_props): la cache
+    se consulta al renderizar y únicamente si la respuesta incluye esas props.
+    Debe ir después de AuthenticationMiddleware.
+    """
+
+    def handle(self, request):
+        share_cached_props(request)
+        return self.get_response(request)
+
+    async def ahandle(self, request):
+        share_cached_props(request)
+        return await self.get_response(request)
@@ -1,3 +1,11 @@
 from django.db import models
 
-# Create your models here.
+
+class TimestampedModel(models.Model):
+    """Modelo abstracto con fechas de creación y última modificación."""
+
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
@@ -0,0 +1,147 @@
+"""
+Paginación por defecto de la API (keyset / cursor).
+
+Con OFFSET la base de datos recorre y descarta todas las filas anteriores a
+la página pedida, así que el coste crece linealmente con el número de página.
+Con un cursor la página siguiente se pide como
+``WHERE (date, id) < (última fecha, último id)`` y, si hay un índice sobre
+los campos de ``ordering``, cada página cuesta lo mismo que la primera.
+
+Requisitos para cada vista:
+- ``ordering`` con todos los campos en la misma dirección y sin nulos. Si no
+  incluye la clave primaria se añade como desempate, así el cursor apunta
+  siempre a una sola fila
+- Un índice que cubra ``ordering`` (con la clave primaria) en el mismo orden
+  o el inverso
+- Con querysets de ``.values()``, incluir los campos de ``ordering``
+"""
+
+import json
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db.models import F
+from django.db.models.fields.tuple_lookups import Tuple, TupleGreaterThan, TupleLessThan
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor por clave primaria descendente (los más recientes primero).
+
+    Las vistas sobrescriben el orden con un atributo ``ordering`` propio;
+    ``?page_size=`` permite pedir páginas más grandes hasta ``max_page_size``.
+    El cursor guarda el valor de todos los campos de ``ordering`` de la última
+    fila (no solo el primero), así que nunca hace falta OFFSET para los empates.
+    """
+
+    ordering = "-id"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def get_ordering(self, request, queryset, view) -> tuple[str, ...]:
+        # CursorPagination solo mira ``view.ordering`` a través de un
+        # OrderingFilter; sin él, el orden declarado en la vista manda
+        ordering = getattr(view, "ordering", None)
+        has_ordering_filter = any(
+            hasattr(backend, "get_ordering") for backend in getattr(view, "filter_backends", ())
+        )
+        if ordering and not has_ordering_filter:
+            ordering = (ordering,) if isinstance(ordering, str) else tuple(ordering)
+        else:
+            ordering = super().get_ordering(request, queryset, view)
+
+        descending = ordering[0].startswith("-")
+        if any(field.startswith("-") != descending for field in ordering):
+            raise ImproperlyConfigured(
+                f"KeysetPagination necesita todos los campos en la misma dirección: {ordering}"
+            )
+        pk_name = queryset.model._meta.pk.name
+        if not {"pk", pk_name} & {field.lstrip("-") for field in ordering}:
+            ordering = (*ordering, f"-{pk_name}" if descending else pk_name)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # CursorPagination.paginate_queryset, salvo el filtro por posición: una
+        # comparación de tuplas sobre todos los campos de ``ordering``
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = queryset.filter(self._position_filter(queryset, current_position))
+
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = list(results[: self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def _position_filter(self, queryset, position: str):
+        """``(campo1, campo2, ...) < (valores del cursor)`` (o ``>`` según dirección)."""
+        opts = queryset.model._meta
+        names = [field.lstrip("-") for field in self.ordering]
+        try:
+            values = json.loads(position)
+            if not isinstance(values, list) or len(values) != len(names):
+                raise ValueError(position)
+            values = [
+                (opts.pk if name == "pk" else opts.get_field(name)).to_python(value)
+                for name, value in zip(names, values, strict=True)
+            ]
+        except (ValueError, ValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        descending = self.ordering[0].startswith("-")
+        lookup = TupleLessThan if self.cursor.reverse != descending else TupleGreaterThan
+        return lookup(Tuple(*(F(name) for name in names)), values)
+
+    def _get_position_from_instance(self, instance, ordering) -> str:
+        values = []
+        for field in ordering:
+            name = field.lstrip("-")
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            values.append(str(value))
+        return json.dumps(values, separators=(",", ":"))
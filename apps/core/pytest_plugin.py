@@ -0,0 +1,60 @@
+"""
+Fixtures de pytest compartidas (registradas en conftest.py).
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+from django.conf import settings
+from django.db import connections
+from django.db.models.signals import pre_migrate
+
+from apps.core.query_budget import QueryStats, check_budget, track_queries
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., AbstractContextManager[QueryStats]]:
+    """
+    Falla el test si el bloque supera el presupuesto de queries o tiene N+1.
+
+    Example:
+        def test_get_projects_list(query_budget, user):
+            with query_budget(max_queries=2):
+                projects = list(get_projects_list(user=user))
+                for p in projects:
+                    _ = p.created_by.email
+    """
+
+    @contextmanager
+    def _query_budget(
+        max_queries: int | None = None,
+        n_plus_one_threshold: int | None = settings.QUERY_BUDGET_N_PLUS_ONE_THRESHOLD,
+    ) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        violations = check_budget(
+            stats, max_queries=max_queries, n_plus_one_threshold=n_plus_one_threshold
+        )
+        if violations:
+            pytest.fail("\n".join(violations), pytrace=False)
+
+    return _query_budget
+
+
+def _create_extensions(using, **kwargs):
+    """
+    Extensiones de PostgreSQL de las migraciones (TrigramExtension).
+
+    Con ``--nomigrations`` la base de datos de test se crea desde los modelos
+    sin ejecutar las migraciones, y los índices ``gin_trgm_ops`` necesitan
+    pg_trgm antes de crear las tablas.
+    """
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+pre_migrate.connect(_create_extensions, dispatch_uid="apps.core.pytest_plugin.extensions")
@@ -0,0 +1,94 @@
+"""
+Contador de queries SQL y detección de N+1.
+
+Registra, mediante ``connection.execute_wrapper``, el número de queries, el
+tiempo total en base de datos y cuántas veces se repite cada "forma" de query
+(SQL con parámetros). Una misma forma repetida muchas veces en una request es
+el síntoma típico de un N+1 (falta de select_related/prefetch_related).
+
+Lo usan QueryBudgetMiddleware y el fixture de pytest ``query_budget``.
+"""
+
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+# "IN (%s, %s, %s)" con distinto número de parámetros es la misma forma
+_IN_CLAUSE_RE = re.compile(r"\((?:%s, )+%s\)")
+
+
+class QueryBudgetExceededError(Exception):
+    """Se lanza cuando una vista o test supera el presupuesto de queries."""
+
+
+class QueryStats:
+    """Estadísticas de queries acumuladas en un bloque."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration_ms = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        # Firma de connection.execute_wrapper
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration_ms += (time.perf_counter() - started) * 1000
+            self.count += 1
+            self.shapes[_IN_CLAUSE_RE.sub("(%s...)", sql)] += 1
+
+    def repeated_queries(self, threshold: int) -> list[tuple[str, int]]:
+        """Formas de query ejecutadas al menos ``threshold`` veces."""
+        return [(sql, n) for sql, n in self.shapes.most_common() if n >= threshold]
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Cuenta las queries ejecutadas dentro del bloque en todas las bases de datos.
+
+    Example:
+        >>> with track_queries() as stats:
+        ...     list(get_projects_list(user=user))
+        >>> stats.count, stats.duration_ms
+    """
+    stats = QueryStats()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        yield stats
+
+
+def check_budget(
+    stats: QueryStats,
+    *,
+    max_queries: int | None,
+    n_plus_one_threshold: int | None,
+) -> list[str]:
+    """
+    Compara las estadísticas con el presupuesto.
+
+    Args:
+        stats: Estadísticas recogidas con track_queries()
+        max_queries: Número máximo de queries (None = sin límite)
+        n_plus_one_threshold: Repeticiones de una misma forma que se
+            consideran N+1 (None = no comprobar)
+
+    Returns:
+        Lista de violaciones legibles (vacía si se cumple el presupuesto)
+    """
+    violations = []
+    if max_queries is not None and stats.count > max_queries:
+        violations.append(
+            f"{stats.count} queries ({stats.duration_ms:.1f}ms) superan el máximo de {max_queries}"
+        )
+    if n_plus_one_threshold is not None:
+        for sql, times in stats.repeated_queries(n_plus_one_threshold):
+            violations.append(f"Posible N+1: query repetida {times} veces: {sql[:300]}")
+    return violations
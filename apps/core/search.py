@@ -0,0 +1,218 @@
+"""
+Búsqueda global sobre PostgreSQL: full-text en castellano + trigramas.
+
+Cada dominio (proyectos, y más adelante CRM o backlog) declara un
+SearchDomain y lo registra con ``register_search_domain``; el selector
+``search`` recorre los dominios registrados y es el único punto de entrada,
+tanto para la página Inertia como para la API.
+
+Por dominio:
+- Un ``SearchVectorField`` generado por la base de datos (``GeneratedField``
+  con ``search_vector(...)``), así que se mantiene al día en cualquier
+  escritura (save, update, bulk_create, COPY) sin señales ni triggers
+- Un GinIndex sobre ese campo para las consultas ``@@``
+- GinIndex con ``gin_trgm_ops`` en los campos cortos (nombre, cliente) para
+  coincidencias aproximadas: erratas y palabras a medias
+
+Una búsqueda es una query por dominio: ``@@`` y ``<%`` combinados con OR
+(BitmapOr sobre los dos índices GIN) y ordenados por ts_rank + similitud.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, Q, QuerySet, Value
+from django.db.models.functions import Greatest
+
+from apps.core.db import replica_selector
+
+# Configuración de texto de PostgreSQL acorde a LANGUAGE_CODE = "es-ES"
+# (stemming y stopwords en castellano). Cambiarla exige regenerar las
+# columnas de búsqueda con una migración.
+SEARCH_CONFIG = "spanish"
+
+# Con menos caracteres casi todo coincide por trigramas
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_LENGTH = 200
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+
+
+def search_vector(**weights: str) -> SearchVector:
+    """
+    Expresión del vector de búsqueda para un ``GeneratedField``.
+
+    Args:
+        **weights: Campo -> peso ("A" más relevante ... "D" menos)
+
+    Example:
+        search_vector = models.GeneratedField(
+            expression=search_vector(name="A", client="A", description="B"),
+            output_field=SearchVectorField(),
+            db_persist=True,
+        )
+    """
+    vectors = [
+        SearchVector(name, weight=weight, config=SEARCH_CONFIG) for name, weight in weights.items()
+    ]
+    vector = vectors[0]
+    for other in vectors[1:]:
+        vector = vector + other
+    return vector
+
+
+@dataclass(frozen=True)
+class SearchDomain:
+    """
+    Declaración de un dominio buscable.
+
+    Attributes:
+        name: Identificador del tipo de resultado ("project", "task"...)
+        label: Nombre legible para agrupar resultados en el frontend
+        queryset: Selector (*, user) -> QuerySet con lo que ``user`` puede ver
+        title: Campo mostrado como título del resultado
+        subtitle: Campo mostrado como subtítulo (opcional)
+        vector: Campo ``SearchVectorField`` del modelo
+        trigram_fields: Campos con índice ``gin_trgm_ops``
+        permission: Permiso necesario para buscar en el dominio
+            (None = cualquier usuario autenticado)
+    """
+
+    name: str
+    label: str
+    queryset: Callable[..., QuerySet]
+    title: str
+    subtitle: str = ""
+    vector: str = "search_vector"
+    trigram_fields: tuple[str, ...] = ()
+    permission: str | None = None
+
+
+SEARCH_DOMAINS: dict[str, SearchDomain] = {}
+
+
+def register_search_domain(domain: SearchDomain) -> SearchDomain:
+    """Registrar un dominio buscable por nombre."""
+    SEARCH_DOMAINS[domain.name] = domain
+    return domain
+
+
+def normalize_query(query: str) -> str:
+    """Texto de búsqueda limpio, o cadena vacía si es demasiado corto."""
+    query = " ".join(query.split())[:MAX_QUERY_LENGTH]
+    return query if len(query) >= MIN_QUERY_LENGTH else ""
+
+
+def parse_search_params(params: Mapping[str, str]) -> dict[str, Any]:
+    """
+    Convertir los query params (``q``, ``type``, ``limit``) en argumentos de ``search``.
+
+    ``type`` admite varios dominios separados por comas.
+
+    Raises:
+        ValueError: Si un dominio no existe o ``limit`` no es un entero
+    """
+    domains = None
+    if params.get("type"):
+        domains = [name.strip() for name in params["type"].split(",") if name.strip()]
+        unknown = sorted(set(domains) - SEARCH_DOMAINS.keys())
+        if unknown:
+            raise ValueError(f"Tipos de resultado desconocidos: {', '.join(unknown)}")
+    try:
+        limit = int(params.get("limit") or DEFAULT_LIMIT)
+    except ValueError:
+        raise ValueError("limit debe ser un número entero") from None
+    return {
+        "query": params.get("q", ""),
+        "domains": domains,
+        "limit": max(1, min(limit, MAX_LIMIT)),
+    }
+
+
+def search_domain(domain: SearchDomain, *, user, query: str) -> QuerySet:
+    """
+    QuerySet de resultados de un dominio, ordenado por relevancia.
+
+    La consulta se interpreta como en un buscador web (``websearch``):
+    comillas para frases, ``-`` para excluir, ``or`` para alternativas.
+    """
+    ts_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    matches = Q(**{domain.vector: ts_query})
+    similarities = []
+    for name in domain.trigram_fields:
+        # <% usa el índice de trigramas (umbral pg_trgm.word_similarity_threshold)
+        matches |= Q(**{f"{name}__trigram_word_similar": query})
+        similarities.append(TrigramWordSimilarity(query, name))
+
+    if len(similarities) > 1:
+        similarity = Greatest(*similarities)
+    elif similarities:
+        similarity = similarities[0]
+    else:
+        similarity = Value(0.0, output_field=FloatField())
+    return (
+        domain.queryset(user=user)
+        .filter(matches)
+        .annotate(score=SearchRank(F(domain.vector), ts_query) + similarity)
+        .order_by("-score", "-pk")
+    )
+
+
+@replica_selector
+def search(
+    *, user, query: str, domains: Iterable[str] | None = None, limit: int = DEFAULT_LIMIT
+) -> list[dict[str, Any]]:
+    """
+    Buscar en los dominios registrados que ``user`` puede ver.
+
+    Args:
+        user: Usuario que busca
+        query: Texto de búsqueda
+        domains: Nombres de dominio (None = todos)
+        limit: Máximo de resultados por dominio y en total
+
+    Returns:
+        Resultados ordenados por relevancia: dicts con type, label, id,
+        title, subtitle y score
+    """
+    query = normalize_query(query)
+    if not query:
+        return []
+
+    selected = (
+        SEARCH_DOMAINS.values()
+        if domains is None
+        else (SEARCH_DOMAINS[name] for name in domains if name in SEARCH_DOMAINS)
+    )
+    results = []
+    for domain in selected:
+        if domain.permission and not user.has_perm(domain.permission):
+            continue
+        # Alias propios: el modelo puede tener campos "title" o "subtitle"
+        rows = search_domain(domain, user=user, query=query).values(
+            "pk",
+            "score",
+            hit_title=F(domain.title),
+            hit_subtitle=F(domain.subtitle) if domain.subtitle else Value(""),
+        )
+        results.extend(
+            {
+                "type": domain.name,
+                "label": domain.label,
+                "id": row["pk"],
+                "title": row["hit_title"],
+                "subtitle": row["hit_subtitle"],
+                "score": round(row["score"], 4),
+            }
+            for row in rows[:limit]
+        )
+
+    results.sort(key=lambda result: result["score"], reverse=True)
+    return results[:limit]
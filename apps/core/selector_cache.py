@@ -0,0 +1,397 @@
+"""
+Cache de resultados de selectors con invalidación por etiquetas.
+
+``@cached_selector`` guarda el resultado de un selector por sus argumentos y
+lo etiqueta con los modelos de los que depende:
+
+    @cached_selector(tags=[DailyTimeRollup, WeeklyTimeRollup], warm=dashboard_args)
+    @replica_selector
+    def get_hours_series(*, period: Period = "week", ...) -> list[dict]:
+        ...
+
+Invalidación: cada etiqueta tiene una versión en cache (``selector:tag:...``)
+que se renueva tras el commit cuando se guarda o borra una instancia del
+modelo (post_save/post_delete) o cuando un service llama a
+``invalidate_tags`` (escrituras que no emiten señales: update(), bulk_create,
+INSERT ... ON CONFLICT). Cada entrada recuerda las versiones con las que se
+calculó; si alguna ha cambiado, está obsoleta.
+
+Estampidas (dogpile):
+- Lock (``cache.add``): solo un proceso recalcula cada entrada. Los demás
+  sirven la entrada obsoleta mientras tanto o, si no hay ninguna, esperan
+  hasta SELECTOR_CACHE_LOCK_WAIT segundos a que aparezca una con las
+  versiones actuales. La espera es ``time.sleep``: bloquea el thread que
+  llama, así que desde una vista async el selector se llama con
+  ``sync_to_async`` (como cualquier consulta del ORM síncrono), nunca
+  directamente en el event loop
+- Recálculo anticipado probabilístico (XFetch): cerca de la caducidad, cada
+  lectura tiene una probabilidad creciente, proporcional a lo que costó
+  calcular la entrada, de recalcularla antes de que caduque
+
+Precalentamiento: ``warm`` devuelve los argumentos de las claves más pedidas.
+``apps.core.tasks.warm_selector_cache`` las recalcula cada
+SELECTOR_CACHE_WARM_INTERVAL segundos (beat), al arrancar beat tras un
+despliegue y SELECTOR_CACHE_WARM_DELAY segundos después de cada invalidación
+de sus etiquetas.
+
+Las entradas se guardan serializadas (pickle): el selector debe devolver
+datos evaluados (listas, dicts), no QuerySets. Si cambia la forma del
+resultado, subir ``version`` para no leer entradas del código anterior.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from enum import Enum
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from celery.signals import beat_init
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import autodiscover_modules
+
+logger = logging.getLogger(__name__)
+
+SELECTOR_TAG_KEY = "selector:tag:{tag}"
+SELECTOR_RESULT_KEY = "selector:{key}"
+SELECTOR_LOCK_KEY = "selector:lock:{key}"
+SELECTOR_WARM_PENDING_KEY = "selector:warm:{name}"
+
+# Espera entre lecturas mientras otro proceso calcula una entrada
+_WAIT_POLL_INTERVAL = 0.05
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+type Tag = type[models.Model] | str
+type WarmArgs = Callable[[], Iterable[dict[str, Any]]]
+
+# Etiquetas pendientes de invalidar en este thread hasta el commit
+_pending = threading.local()
+
+
+class _Entry(NamedTuple):
+    """Resultado cacheado con las versiones de etiquetas con las que se calculó."""
+
+    versions: tuple[str, ...]
+    value: Any
+    expires_at: float
+    cost: float
+
+
+def _tag(model: Tag) -> str:
+    """Etiqueta de un modelo (``app_label.modelname``)."""
+    if isinstance(model, str):
+        return model.lower()
+    return model._meta.label_lower
+
+
+def _key_part(value: Any) -> Any:
+    """Representación estable de un argumento para la clave de cache."""
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, models.Model):
+        return (value._meta.label_lower, value.pk)
+    if isinstance(value, Enum):
+        return _key_part(value.value)
+    if isinstance(value, Decimal | UUID):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, list | tuple):
+        return tuple(_key_part(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return tuple(sorted((_key_part(item) for item in value), key=repr))
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _key_part(item)) for key, item in value.items()))
+    raise TypeError(f"Argumento no admitido en un selector cacheado: {type(value).__name__}")
+
+
+def _get_versions(tags: tuple[str, ...]) -> tuple[str, ...]:
+    keys = [SELECTOR_TAG_KEY.format(tag=tag) for tag in tags]
+    versions = cache.get_many(keys)
+    missing = {key: uuid.uuid4().hex[:12] for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return tuple(versions[key] for key in keys)
+
+
+def _expires_early(entry: _Entry) -> bool:
+    """
+    XFetch: recalcular antes de caducar con probabilidad creciente.
+
+    Cuanto más cuesta calcular la entrada, antes empieza a recalcularse; una
+    sola lectura gana y el resto sigue leyendo la entrada vigente.
+    """
+    jitter = -math.log(1.0 - random.random())  # noqa: S311
+    return time.time() + entry.cost * settings.SELECTOR_CACHE_EARLY_BETA * jitter >= (
+        entry.expires_at
+    )
+
+
+class CachedSelector:
+    """Selector envuelto por ``cached_selector`` (ver docstring del módulo)."""
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        *,
+        tags: Iterable[Tag],
+        ttl: int | None,
+        warm: WarmArgs | None,
+        version: int,
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self.uncached = func
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        self.tags = tuple(sorted({_tag(tag) for tag in tags}))
+        self.ttl = ttl
+        self.warm_args = warm
+        self.version = version
+        self._signature = inspect.signature(func)
+
+    def __repr__(self) -> str:
+        return f"<CachedSelector {self.name} tags={list(self.tags)}>"
+
+    def _key(self, args: tuple, kwargs: dict) -> str:
+        bound = self._signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        digest = hashlib.blake2b(
+            repr(_key_part(bound.arguments)).encode(), digest_size=16
+        ).hexdigest()
+        return f"{self.name}:v{self.version}:{digest}"
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not settings.SELECTOR_CACHE_ENABLED:
+            return self.uncached(*args, **kwargs)
+
+        key = self._key(args, kwargs)
+        versions = _get_versions(self.tags)
+        entry = cache.get(SELECTOR_RESULT_KEY.format(key=key))
+        if entry is not None and entry.versions == versions and not _expires_early(entry):
+            return entry.value
+
+        computed = self._compute_locked(key, versions, args, kwargs)
+        if computed is not None:
+            return computed.value
+        if entry is not None:
+            # Otro proceso la está recalculando: servir la anterior entretanto
+            return entry.value
+
+        # Bloquea el thread (ver docstring del módulo): en una vista async,
+        # llamar al selector con sync_to_async
+        deadline = time.monotonic() + settings.SELECTOR_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(_WAIT_POLL_INTERVAL)
+            entry = cache.get(SELECTOR_RESULT_KEY.format(key=key))
+            # Una entrada de antes de la última invalidación no sirve
+            if entry is not None and entry.versions == versions:
+                return entry.value
+        logger.warning(f"Selector {self.name}: sin resultado tras esperar al lock, calculando")
+        return self._compute(key, versions, args, kwargs).value
+
+    def _compute_locked(
+        self, key: str, versions: tuple[str, ...], args: tuple, kwargs: dict
+    ) -> _Entry | None:
+        """Calcular la entrada si nadie más la está calculando (None si hay otro)."""
+        lock = SELECTOR_LOCK_KEY.format(key=key)
+        if not cache.add(lock, 1, timeout=settings.SELECTOR_CACHE_LOCK_TIMEOUT):
+            return None
+        try:
+            return self._compute(key, versions, args, kwargs)
+        finally:
+            cache.delete(lock)
+
+    def _compute(self, key: str, versions: tuple[str, ...], args: tuple, kwargs: dict) -> _Entry:
+        started = time.perf_counter()
+        value = self.uncached(*args, **kwargs)
+        if isinstance(value, QuerySet):
+            raise TypeError(
+                f"{self.name} devuelve un QuerySet: un selector cacheado debe devolver "
+                "datos evaluados (list, dict)"
+            )
+        ttl = self.ttl or settings.SELECTOR_CACHE_TTL
+        # Versiones leídas antes de calcular: si hubo una invalidación mientras
+        # tanto, la entrada ya nace obsoleta y la siguiente lectura la recalcula
+        entry = _Entry(versions, value, time.time() + ttl, time.perf_counter() - started)
+        cache.set(
+            SELECTOR_RESULT_KEY.format(key=key),
+            entry,
+            timeout=ttl + settings.SELECTOR_CACHE_STALE_TTL,
+        )
+        return entry
+
+    def warm(self, *, force: bool = False) -> int:
+        """
+        Recalcular las claves de ``warm`` que falten, estén obsoletas o caduquen
+        antes del siguiente precalentamiento.
+
+        Args:
+            force: Recalcular todas (p.ej. tras un despliegue)
+
+        Returns:
+            Número de entradas recalculadas
+        """
+        if self.warm_args is None or not settings.SELECTOR_CACHE_ENABLED:
+            return 0
+        horizon = time.time() + settings.SELECTOR_CACHE_WARM_INTERVAL
+        versions = _get_versions(self.tags)
+        warmed = 0
+        for kwargs in self.warm_args():
+            key = self._key((), kwargs)
+            entry = cache.get(SELECTOR_RESULT_KEY.format(key=key))
+            fresh = entry is not None and entry.versions == versions
+            if fresh and not force and entry.expires_at > horizon:
+                continue
+            if self._compute_locked(key, versions, (), kwargs) is not None:
+                warmed += 1
+        return warmed
+
+
+# Selectors cacheados por nombre (``módulo.función``)
+_registry: dict[str, CachedSelector] = {}
+
+
+def cached_selector(
+    *,
+    tags: Iterable[Tag],
+    ttl: int | None = None,
+    warm: WarmArgs | None = None,
+    version: int = 1,
+) -> Callable[[Callable[..., Any]], CachedSelector]:
+    """
+    Decorador que cachea el resultado de un selector por sus argumentos.
+
+    Va por encima de ``@replica_selector``: en un fallo de cache el cálculo
+    lee de la réplica y abre su span como cualquier otro selector.
+
+    Args:
+        tags: Modelos (o ``"app_label.Model"``) de los que depende el resultado
+        ttl: Segundos de validez (default: SELECTOR_CACHE_TTL)
+        warm: Callable sin argumentos que devuelve los kwargs de las claves a
+            precalentar
+        version: Subir al cambiar la forma del resultado
+
+    Example:
+        >>> @cached_selector(tags=[Project], ttl=60)
+        ... @replica_selector
+        ... def get_project_stats(*, project_id: int) -> dict:
+        ...     ...
+    """
+
+    def decorator(func: Callable[..., Any]) -> CachedSelector:
+        selector = CachedSelector(func, tags=tags, ttl=ttl, warm=warm, version=version)
+        _registry[selector.name] = selector
+        for tag in selector.tags:
+            # Remitente perezoso: el modelo puede no estar cargado todavía
+            uid = f"selector_cache:{tag}"
+            post_save.connect(_model_changed, sender=tag, weak=False, dispatch_uid=uid)
+            post_delete.connect(_model_changed, sender=tag, weak=False, dispatch_uid=uid)
+        return selector
+
+    return decorator
+
+
+def get_cached_selectors() -> dict[str, CachedSelector]:
+    """Selectors cacheados de todas las apps, por nombre."""
+    autodiscover_modules("selectors")
+    return dict(_registry)
+
+
+# --- INVALIDACIÓN ---
+
+
+def _model_changed(sender, **kwargs):
+    invalidate_tags(sender)
+
+
+def invalidate_tags(*tags: Tag) -> None:
+    """
+    Invalidar tras el commit los selectors que dependen de estos modelos.
+
+    Las señales de los modelos etiquetados ya lo hacen; llamar desde services
+    que escriben sin señales. Como ``RollupService.schedule_refresh``, las
+    etiquetas se acumulan por thread y se renuevan juntas en el commit.
+    """
+    pending = getattr(_pending, "tags", None)
+    if pending is None:
+        pending = _pending.tags = set()
+    pending.update(_tag(tag) for tag in tags)
+    transaction.on_commit(_flush_pending)
+
+
+def _flush_pending() -> None:
+    tags = getattr(_pending, "tags", None)
+    if not tags:
+        return
+    _pending.tags = set()
+    version = uuid.uuid4().hex[:12]
+    cache.set_many({SELECTOR_TAG_KEY.format(tag=tag): version for tag in tags}, timeout=None)
+    logger.debug(f"Selectors invalidados: {', '.join(sorted(tags))}")
+    _schedule_warm(tags)
+
+
+def _schedule_warm(tags: set[str]) -> None:
+    """Encolar el precalentamiento de los selectors afectados (uno pendiente por selector)."""
+    from apps.core.tasks import warm_selector_cache
+
+    delay = settings.SELECTOR_CACHE_WARM_DELAY
+    names = [
+        name
+        for name, selector in _registry.items()
+        if selector.warm_args is not None
+        and tags.intersection(selector.tags)
+        and cache.add(SELECTOR_WARM_PENDING_KEY.format(name=name), 1, timeout=delay)
+    ]
+    if not names:
+        return
+    try:
+        warm_selector_cache.apply_async(kwargs={"names": names}, countdown=delay)
+    except Exception as e:
+        # Best effort: sin broker las entradas se recalculan en la siguiente lectura
+        logger.warning(f"No se pudo encolar el precalentamiento de {names}: {e}")
+
+
+# --- PRECALENTAMIENTO ---
+
+
+def warm_selectors(*, names: Iterable[str] | None = None, force: bool = False) -> dict[str, int]:
+    """
+    Precalentar los selectors cacheados con ``warm``.
+
+    Args:
+        names: Limitar a estos selectors (None = todos)
+        force: Recalcular todas las claves aunque estén vigentes
+
+    Returns:
+        Entradas recalculadas por selector
+    """
+    selectors = get_cached_selectors()
+    if names is not None:
+        selectors = {name: selectors[name] for name in names if name in selectors}
+    return {
+        name: selector.warm(force=force)
+        for name, selector in selectors.items()
+        if selector.warm_args is not None
+    }
+
+
+@beat_init.connect
+def _warm_after_deploy(**kwargs):
+    """Beat arranca en cada despliegue: recalcular todo con el código nuevo."""
+    from apps.core.tasks import warm_selector_cache
+
+    warm_selector_cache.delay(force=True)
@@ -0,0 +1,94 @@
+"""
+Serializers de solo lectura para listados de la API.
+
+Un ModelSerializer construye una instancia del modelo por fila y después
+recorre sus campos uno a uno; en listados de cientos de filas ese coste
+domina la respuesta. ValuesSerializer pide a la base de datos solo las
+columnas que se devuelven (``.values()``) y emite cada dict tal cual: sin
+instancias, sin ``to_representation`` por campo.
+
+Ejemplo:
+    class TimeEntryRowSerializer(ValuesSerializer):
+        class Meta:
+            model = TimeEntry
+            fields = {
+                "id": "id",
+                "date": "date",
+                "hours": "hours",
+                "project_name": "project__name",
+            }
+
+    class TimeEntryListView(ListAPIView):
+        serializer_class = TimeEntryRowSerializer
+
+        def get_queryset(self):
+            return TimeEntryRowSerializer.values(get_time_entries(user=self.request.user))
+
+Los Decimal de las filas salen como string, igual que un DecimalField
+(COERCE_DECIMAL_TO_STRING); las fechas y UUID los serializa el renderer.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from rest_framework import serializers
+
+from django.db.models import F, QuerySet
+from django.db.models.manager import BaseManager
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """Lista de filas ya serializadas: no llama al child por cada fila."""
+
+    def to_representation(self, data) -> list[Mapping[str, Any]]:
+        return list(data.all() if isinstance(data, BaseManager) else data)
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    Serializer de solo lectura sobre filas de ``.values()``.
+
+    ``Meta.fields`` indica las claves de salida: una tupla de campos del
+    modelo o un dict ``{"clave": "lookup__del__orm"}`` para seguir relaciones
+    sin cargar el objeto relacionado. Una clave renombrada no puede coincidir
+    con el nombre de un campo del modelo (limitación de ``.values()``).
+
+    Solo serializa: no valida ni guarda (``create``/``update`` no existen).
+    """
+
+    class Meta:
+        model = None
+        fields: tuple[str, ...] | Mapping[str, str] = ()
+
+    @classmethod
+    def many_init(cls, *args, **kwargs) -> ValuesListSerializer:
+        kwargs["child"] = cls()
+        return ValuesListSerializer(*args, **kwargs)
+
+    @classmethod
+    def get_field_map(cls) -> dict[str, str]:
+        """Claves de salida → lookups del ORM."""
+        fields = cls.Meta.fields
+        if isinstance(fields, Mapping):
+            return dict(fields)
+        return {name: name for name in fields}
+
+    @classmethod
+    def values(cls, queryset: QuerySet | None = None) -> QuerySet[dict]:
+        """
+        Restringir ``queryset`` (por defecto ``Meta.model.objects.all()``) a
+        las columnas del serializer, como QuerySet de dicts.
+        """
+        if queryset is None:
+            queryset = cls.Meta.model._default_manager.all()
+        plain = []
+        aliased = {}
+        for key, lookup in cls.get_field_map().items():
+            if key == lookup:
+                plain.append(key)
+            else:
+                aliased[key] = F(lookup)
+        return queryset.values(*plain, **aliased)
+
+    def to_representation(self, instance: Mapping[str, Any]) -> Mapping[str, Any]:
+        return instance
@@ -0,0 +1,76 @@
+"""
+Invalidación de la cache de autenticación (apps.core.auth) y de las props
+compartidas de Inertia (apps.core.inertia).
+
+Cualquier cambio en el usuario, en sus grupos, en sus permisos directos o en
+los permisos de uno de sus grupos descarta sus entradas de cache.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.core.auth import invalidate_auth_cache
+from apps.core.inertia import invalidate_shared_props
+
+User = get_user_model()
+
+_RELATION_ACTIONS = ("post_add", "post_remove", "pre_clear")
+
+
+def _invalidate(user_ids) -> None:
+    user_ids = list(user_ids)
+    invalidate_auth_cache(user_ids)
+    invalidate_shared_props(user_ids)
+
+
+def _users_in_groups(groups) -> list[int]:
+    return list(User.objects.filter(groups__in=groups).values_list("pk", flat=True).distinct())
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(instance, **kwargs):
+    _invalidate([instance.pk])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def user_relations_changed(instance, action, reverse, pk_set, **kwargs):
+    """user.groups / user.user_permissions (o el lado inverso desde Group/Permission)."""
+    if action not in _RELATION_ACTIONS:
+        return
+    if not reverse:
+        _invalidate([instance.pk])
+    elif action == "pre_clear":
+        # group.user_set.clear(): pk_set no viene informado
+        field = "groups" if isinstance(instance, Group) else "user_permissions"
+        _invalidate(User.objects.filter(**{field: instance}).values_list("pk", flat=True))
+    else:
+        _invalidate(pk_set)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def group_permissions_changed(instance, action, reverse, pk_set, **kwargs):
+    """group.permissions (o permission.group_set)."""
+    if action not in _RELATION_ACTIONS:
+        return
+    if not reverse:
+        _invalidate(_users_in_groups([instance.pk]))
+    elif action == "pre_clear":
+        _invalidate(_users_in_groups(Group.objects.filter(permissions=instance)))
+    else:
+        _invalidate(_users_in_groups(pk_set))
+
+
+@receiver(pre_delete, sender=Group)
+def group_deleted(instance, **kwargs):
+    # El borrado en cascada de las relaciones no emite m2m_changed
+    _invalidate(_users_in_groups([instance.pk]))
+
+
+@receiver(pre_delete, sender=Permission)
+def permission_deleted(instance, **kwargs):
+    direct = User.objects.filter(user_permissions=instance).values_list("pk", flat=True)
+    _invalidate({*direct, *_users_in_groups(Group.objects.filter(permissions=instance))})
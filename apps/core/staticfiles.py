@@ -0,0 +1,28 @@
+"""
+Storage de estáticos para el build de Vite servido por WhiteNoise.
+
+Vite ya genera los bundles con hash de contenido en el nombre
+(``dist/assets/main-B2x9fQ1a.js``) y los chunks se importan entre sí por ese
+nombre. Si el manifest de Django volviera a añadir su propio hash, los
+``import`` internos de los chunks apuntarían a ficheros sin hash y el
+navegador tendría que revalidarlos. Estos ficheros se dejan tal cual; el
+resto de estáticos (admin, DRF...) sigue el flujo normal de
+CompressedManifestStaticFilesStorage.
+
+En ambos casos ``collectstatic`` genera las variantes ``.gz`` y ``.br``
+(Brotli si el paquete ``brotli`` está instalado) en build.
+"""
+
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+# Directorio (relativo a STATIC_ROOT) donde Vite deja los ficheros con hash
+VITE_ASSETS_PREFIX = "dist/assets/"
+
+
+class ViteManifestStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """CompressedManifestStaticFilesStorage que respeta el hash de Vite."""
+
+    def hashed_name(self, name: str, content=None, filename=None) -> str:
+        if name.replace("\\", "/").startswith(VITE_ASSETS_PREFIX):
+            return name
+        return super().hashed_name(name, content, filename)
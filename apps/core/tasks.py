@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from apps.core.selector_cache import warm_selectors
+
+
+@shared_task(name="apps.core.tasks.warm_selector_cache")
+def warm_selector_cache(names: list[str] | None = None, force: bool = False) -> dict[str, int]:
+    """
+    Precalienta los selectors cacheados (beat, arranque de beat e invalidaciones).
+
+    Args:
+        names: Limitar a estos selectors (None = todos)
+        force: Recalcular todas las claves aunque estén vigentes
+    """
+    return warm_selectors(names=names, force=force)
@@ -0,0 +1,91 @@
+"""
+Throttling de la API con contadores atómicos en Redis.
+
+Los throttles de DRF guardan en la cache la lista de timestamps de cada
+cliente y la reescriben en cada request (lectura + escritura no atómicas, y
+un valor que crece con el límite). Aquí se usa una ventana fija: una clave
+por cliente y ventana con ``INCR``, un round-trip y sin condiciones de
+carrera entre workers.
+
+Las claves empiezan por ``throttle_``, que está en LOCAL_EXCLUDE_PREFIXES de
+la cache: el contador vive solo en Redis, nunca en la LRU local del proceso.
+"""
+
+import time
+from typing import override
+
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle, UserRateThrottle
+
+
+class FixedWindowRateThrottleMixin:
+    """
+    Sustituye el historial de SimpleRateThrottle por un contador por ventana.
+
+    Una ventana fija permite hasta 2x el límite en el borde entre dos
+    ventanas; a cambio cada request cuesta una operación atómica en Redis.
+    """
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+        ident = self.get_cache_key(request, view)
+        if ident is None:
+            return True
+
+        self.now = self.timer()
+        self.window_end = (int(self.now) // self.duration + 1) * self.duration
+        key = f"{ident}_{self.window_end}"
+        # add() crea el contador con TTL de la ventana; si ya existía, incr()
+        if self.cache.add(key, 1, self.duration):
+            count = 1
+        else:
+            try:
+                count = self.cache.incr(key)
+            except ValueError:
+                # La clave ha expirado entre add() e incr()
+                self.cache.add(key, 1, self.duration)
+                count = 1
+        return count <= self.num_requests
+
+    def wait(self) -> float:
+        return max(self.window_end - self.now, 0)
+
+    def timer(self) -> float:
+        return time.time()
+
+
+class BurstUserRateThrottle(FixedWindowRateThrottleMixin, UserRateThrottle):
+    """Límite por usuario autenticado (scope ``user``)."""
+
+
+class BurstAnonRateThrottle(FixedWindowRateThrottleMixin, AnonRateThrottle):
+    """Límite por IP para peticiones anónimas (scope ``anon``)."""
+
+
+class ScopedRateThrottle(FixedWindowRateThrottleMixin, SimpleRateThrottle):
+    """
+    Límite por vista: usar ``throttle_scope = "..."`` en la vista y definir
+    la tasa en DEFAULT_THROTTLE_RATES.
+    """
+
+    scope_attr = "throttle_scope"
+
+    def __init__(self):
+        # La tasa depende de la vista: se resuelve en allow_request
+        pass
+
+    def allow_request(self, request, view) -> bool:
+        self.scope = getattr(view, self.scope_attr, None)
+        if not self.scope:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    @override
+    def get_cache_key(self, request, view) -> str:
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
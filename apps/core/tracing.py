@@ -0,0 +1,162 @@
+"""
+Instrumentación de Django y Celery con config.telemetry.
+
+- Requests y vistas: TracingMiddleware (apps.core.middleware)
+- Queries SQL: un execute_wrapper en cada conexión (``connection_created``)
+- Redis: spans en TwoTierRedisCache (apps.core.cache)
+- Tareas Celery: span CONSUMER por ejecución, hijo del span que la encoló
+  (``traceparent`` y ``request_id`` viajan en las cabeceras del mensaje)
+- Selectors y services: ``@replica_selector`` y ``@traced``
+
+``install()`` se llama desde CoreConfig.ready y configura el muestreo y el
+exportador a partir de TELEMETRY_*.
+"""
+
+import logging
+import threading
+
+from celery.signals import before_task_publish, task_failure, task_postrun, task_prerun
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+from config.telemetry import (
+    SpanKind,
+    StatusCode,
+    build_exporter,
+    configure,
+    current_span,
+    get_request_id,
+    is_recording,
+    parse_traceparent,
+    reset_request_id,
+    set_request_id,
+    start_span,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cabeceras del mensaje Celery (accesibles como atributos de task.request)
+TRACEPARENT_HEADER = "traceparent"
+REQUEST_ID_HEADER = "request_id"
+
+# Longitud máxima del SQL guardado en db.query.text
+_MAX_STATEMENT_LENGTH = 2000
+
+# Spans de las tareas en ejecución en este proceso, por task_id
+_task_spans: dict[str, tuple] = {}
+_task_spans_lock = threading.Lock()
+
+
+def install() -> None:
+    """Configurar el tracer y engancharse a las conexiones de base de datos."""
+    exporter = None
+    if settings.TELEMETRY_ENABLED:
+        exporter = build_exporter(
+            settings.TELEMETRY_EXPORTER,
+            file_path=settings.TELEMETRY_FILE_PATH,
+            endpoint=settings.TELEMETRY_OTLP_ENDPOINT,
+        )
+    configure(
+        enabled=settings.TELEMETRY_ENABLED,
+        sample_rate=settings.TELEMETRY_SAMPLE_RATE,
+        exporter=exporter,
+        service_name=settings.TELEMETRY_SERVICE_NAME,
+        resource={
+            "deployment.environment.name": settings.ENVIRONMENT,
+            "process.role": settings.PROCESS_ROLE,
+        },
+        max_queue_size=settings.TELEMETRY_MAX_QUEUE_SIZE,
+        interval=settings.TELEMETRY_EXPORT_INTERVAL,
+    )
+    connection_created.connect(_instrument_connection, dispatch_uid="telemetry_db")
+
+
+# --- BASE DE DATOS ---
+
+
+def _instrument_connection(connection, **kwargs):
+    # Al principio de la lista: es el wrapper más interno (mide solo la query)
+    # y el pop() de connection.execute_wrapper() (track_queries) no lo quita
+    if trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, trace_query)
+
+
+def trace_query(execute, sql, params, many, context):
+    """execute_wrapper que abre un span CLIENT por query en trazas muestreadas."""
+    if not is_recording():
+        return execute(sql, params, many, context)
+
+    connection = context["connection"]
+    operation = sql.lstrip().split(None, 1)[0].upper() if sql else ""
+    attributes = {
+        "db.system": connection.vendor,
+        "db.namespace": connection.alias,
+        "db.operation.name": operation,
+    }
+    if settings.TELEMETRY_DB_STATEMENT:
+        attributes["db.query.text"] = sql[:_MAX_STATEMENT_LENGTH]
+    if many:
+        attributes["db.operation.batch.size"] = len(params)
+    with start_span(f"{operation} {connection.alias}", kind=SpanKind.CLIENT, attributes=attributes):
+        return execute(sql, params, many, context)
+
+
+# --- CELERY ---
+
+
+@before_task_publish.connect
+def _inject_trace_context(headers=None, **kwargs):
+    """Propagar la traza y el request_id de quien encola la tarea."""
+    if headers is None:
+        return
+    span = current_span()
+    if span is not None:
+        headers.setdefault(TRACEPARENT_HEADER, span.traceparent)
+    request_id = get_request_id()
+    if request_id:
+        headers.setdefault(REQUEST_ID_HEADER, request_id)
+
+
+@task_prerun.connect
+def _task_span_started(task_id=None, task=None, **kwargs):
+    request = task.request
+    span = start_span(
+        f"task {task.name}",
+        kind=SpanKind.CONSUMER,
+        parent=parse_traceparent(getattr(request, TRACEPARENT_HEADER, None)),
+        attributes={
+            "messaging.system": "celery",
+            "messaging.operation.type": "process",
+            "messaging.destination.name": (request.delivery_info or {}).get("routing_key"),
+            "messaging.message.id": task_id,
+            "celery.task.name": task.name,
+            "celery.task.retries": request.retries,
+        },
+    )
+    span.activate()
+    token = set_request_id(getattr(request, REQUEST_ID_HEADER, None) or task_id)
+    with _task_spans_lock:
+        _task_spans[task_id] = (span, token)
+
+
+@task_failure.connect
+def _task_span_failed(task_id=None, exception=None, **kwargs):
+    with _task_spans_lock:
+        entry = _task_spans.get(task_id)
+    if entry is not None and exception is not None:
+        entry[0].record_exception(exception)
+
+
+@task_postrun.connect
+def _task_span_finished(task_id=None, state=None, **kwargs):
+    with _task_spans_lock:
+        entry = _task_spans.pop(task_id, None)
+    if entry is None:
+        return
+    span, token = entry
+    span.set_attribute("celery.task.state", state)
+    if state == "SUCCESS":
+        span.set_status(StatusCode.OK)
+    span.end()
+    reset_request_id(token)
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.urls import path
+
+from apps.core import views
+
+app_name = "core"
+
+urlpatterns = [
+    path("healthz/", views.healthz, name="healthz"),
+    path("readyz/", views.readyz, name="readyz"),
+    path("search/", views.search_page, name="search"),
+    path("api/search/", views.SearchAPIView.as_view(), name="search_api"),
+]
+
+if settings.BENCHMARK_ENDPOINTS:
+    urlpatterns += [
+        path("_bench/mixed/", views.bench_mixed, name="bench_mixed"),
+        path("_bench/amixed/", views.abench_mixed, name="abench_mixed"),
+    ]
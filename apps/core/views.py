@@ -1,3 +1,105 @@
-from django.shortcuts import render
+"""
+Vistas de infraestructura y de la búsqueda global.
 
-# Create your views here.
+``healthz/`` (liveness) y ``readyz/`` (readiness) los usan los healthchecks
+de los contenedores y el orquestador. Los endpoints ``_bench/`` solo se registran con BENCHMARK_ENDPOINTS=True y
+los usa scripts/bench_server.py para comparar WSGI y ASGI con una carga
+mixta: una query a la base de datos más una llamada HTTP saliente.
+
+La búsqueda global (``apps.core.search``) se sirve como página Inertia
+(``search/``) y como API (``api/search/``) con el mismo selector.
+"""
+
+import logging
+
+from inertia import render
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.db import DatabaseError, connection
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.views.decorators.http import require_GET
+
+from apps.core.async_utils import async_service, get_async_http_client, get_http_client
+from apps.core.decorators import query_budget
+from apps.core.search import parse_search_params, search
+
+logger = logging.getLogger(__name__)
+
+
+def _ping_database() -> int:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        return cursor.fetchone()[0]
+
+
+@query_budget(exempt=True)
+def healthz(_request):
+    """Liveness: el proceso atiende requests (sin I/O)."""
+    return JsonResponse({"status": "ok"})
+
+
+@query_budget(exempt=True)
+def readyz(_request):
+    """Readiness: la base de datos responde."""
+    try:
+        _ping_database()
+    except DatabaseError as e:
+        logger.warning(f"Readiness fallida: {e}")
+        return JsonResponse({"status": "unavailable"}, status=503)
+    return JsonResponse({"status": "ok"})
+
+
+def bench_mixed(_request):
+    """Carga mixta síncrona: ocupa el worker durante la llamada saliente."""
+    _ping_database()
+    get_http_client().get(settings.BENCHMARK_UPSTREAM_URL)
+    return JsonResponse({"ok": True})
+
+
+async def abench_mixed(_request):
+    """Carga mixta async: la espera de I/O no bloquea el worker ASGI."""
+    await async_service(_ping_database)()
+    await get_async_http_client().get(settings.BENCHMARK_UPSTREAM_URL)
+    return JsonResponse({"ok": True})
+
+
+@login_required
+@require_GET
+def search_page(request):
+    """Página de resultados de la búsqueda global (Inertia ``Search/Index``)."""
+    try:
+        params = parse_search_params(request.GET)
+    except ValueError as exc:
+        return HttpResponseBadRequest(str(exc))
+    return render(
+        request,
+        "Search/Index",
+        props={
+            "query": params["query"],
+            "types": params["domains"],
+            "results": lambda: search(user=request.user, **params),
+        },
+    )
+
+
+class SearchAPIView(APIView):
+    """
+    Búsqueda global para el buscador del frontend y las integraciones.
+
+    Query params: q (texto), type (dominios separados por comas, p. ej.
+    ``project``), limit (máx. 50).
+    """
+
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request):
+        try:
+            params = parse_search_params(request.query_params)
+        except ValueError as exc:
+            raise ValidationError({"detail": str(exc)}) from None
+        return Response({"results": search(user=request.user, **params)})
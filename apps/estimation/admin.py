@@ -0,0 +1,55 @@
+from typing import override
+
+from django.contrib import admin, messages
+
+from apps.estimation.models import ModelArtifact, ProjectEstimation
+from apps.estimation.services import ModelArtifactService
+
+
+@admin.register(ProjectEstimation)
+class ProjectEstimationAdmin(admin.ModelAdmin):
+    list_display = ("project", "effort_hours", "model_version", "estimated_at")
+    list_select_related = ("project",)
+    list_filter = ("model_version",)
+    search_fields = ("project__name",)
+    readonly_fields = ("project", "effort_hours", "features_hash", "model_version", "estimated_at")
+
+
+@admin.register(ModelArtifact)
+class ModelArtifactAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "version",
+        "artifact_format",
+        "is_active",
+        "size",
+        "created_at",
+        "activated_at",
+    )
+    list_filter = ("name", "is_active")
+    readonly_fields = (
+        "name",
+        "version",
+        "artifact_format",
+        "file",
+        "sha256",
+        "size",
+        "metrics",
+        "is_active",
+        "activated_at",
+    )
+    actions = ("activate",)
+
+    @override
+    def has_add_permission(self, request):
+        # Se publican con manage.py publish_model o ModelArtifactService.publish
+        return False
+
+    @admin.action(description="Activar la versión seleccionada")
+    def activate(self, request, queryset):
+        if queryset.count() != 1:
+            self.message_user(request, "Selecciona una sola versión", messages.ERROR)
+            return
+        artifact = queryset.get()
+        ModelArtifactService.activate(name=artifact.name, version=artifact.version)
+        self.message_user(request, f"{artifact} activado; los workers lo cargarán en breve")
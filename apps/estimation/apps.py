@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class EstimationConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.estimation"
+
+    def ready(self):
+        """Registrar la precarga del modelo en los workers de inferencia."""
+        import apps.estimation.inference  # noqa
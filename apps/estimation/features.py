@@ -0,0 +1,241 @@
+"""
+Features de texto de las estimaciones (spaCy) con cache en disco.
+
+El texto de un proyecto (nombre y descripción) se convierte en un vector con
+una posición por FEATURE_NAMES. Preprocesar con spaCy es lo caro de estimar
+en lote, así que FeatureExtractor:
+- Busca primero cada texto en disco (ESTIMATION_FEATURE_CACHE_DIR) por el
+  hash de su contenido: re-estimar tras reentrenar el modelo no vuelve a
+  procesar las descripciones que no han cambiado
+- Procesa el resto en un pool de procesos (``nlp.pipe`` por sub-lote), cada
+  uno con el modelo de spaCy cargado una sola vez, y guarda los vectores
+
+El hash incluye FEATURE_VERSION y el modelo de spaCy: al cambiar cualquiera
+de los dos las entradas antiguas dejan de usarse.
+
+Los procesos del pool solo importan este módulo y spaCy (no tocan la base de
+datos ni los settings de Django).
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Self
+
+from apps.estimation.lazy import spacy
+
+logger = logging.getLogger(__name__)
+
+# Subir al cambiar FEATURE_NAMES o cómo se calcula alguna
+FEATURE_VERSION = 1
+
+FEATURE_NAMES = (
+    "tokens",
+    "sentences",
+    "unique_lemmas",
+    "mean_token_length",
+    "noun_ratio",
+    "verb_ratio",
+    "adjective_ratio",
+    "stopword_ratio",
+    "entities",
+    "numbers",
+    "list_items",
+)
+
+# Máximo de textos por llamada a nlp.pipe (y por sub-lote enviado al pool)
+_PIPE_BATCH_SIZE = 32
+
+# Líneas de lista (requisitos enumerados): "- ", "* ", "1. ", "2) "
+_LIST_ITEM_RE = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+", re.MULTILINE)
+
+_VECTOR_TYPECODE = "d"
+
+# Modelo de spaCy del proceso (uno por proceso del pool)
+_nlp = None
+
+
+def project_text(name: str, description: str) -> str:
+    """Texto de un proyecto del que se extraen las features."""
+    return f"{name}\n\n{description}".strip()
+
+
+def content_hash(text: str, *, model_name: str) -> str:
+    """Clave de cache de las features de un texto."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{FEATURE_VERSION}:{model_name}:".encode())
+    digest.update(text.encode())
+    return digest.hexdigest()
+
+
+# --- EXTRACCIÓN ---
+
+
+def _load_nlp(model_name: str) -> None:
+    """Inicializador de cada proceso: cargar el modelo de spaCy una vez."""
+    global _nlp
+    _nlp = spacy.load(model_name)
+
+
+def _doc_features(doc, text: str) -> list[float]:
+    words = [token for token in doc if not token.is_punct and not token.is_space]
+    total = len(words) or 1
+    pos_counts: dict[str, int] = {}
+    for token in words:
+        pos_counts[token.pos_] = pos_counts.get(token.pos_, 0) + 1
+    return [
+        float(len(words)),
+        float(sum(1 for _ in doc.sents)),
+        float(len({token.lemma_.lower() for token in words})),
+        sum(len(token.text) for token in words) / total,
+        (pos_counts.get("NOUN", 0) + pos_counts.get("PROPN", 0)) / total,
+        (pos_counts.get("VERB", 0) + pos_counts.get("AUX", 0)) / total,
+        pos_counts.get("ADJ", 0) / total,
+        sum(1 for token in words if token.is_stop) / total,
+        float(len(doc.ents)),
+        float(sum(1 for token in words if token.like_num)),
+        float(len(_LIST_ITEM_RE.findall(text))),
+    ]
+
+
+def extract_batch(texts: Sequence[str]) -> list[list[float]]:
+    """Features de varios textos en el proceso actual (tras ``_load_nlp``)."""
+    docs = _nlp.pipe(texts, batch_size=_PIPE_BATCH_SIZE)
+    return [_doc_features(doc, text) for doc, text in zip(docs, texts, strict=True)]
+
+
+# --- CACHE EN DISCO ---
+
+
+class FeatureCache:
+    """
+    Vectores de features en disco, un fichero por hash de contenido.
+
+    Ficheros de bytes de ``array('d')`` repartidos en subdirectorios por los
+    dos primeros caracteres del hash. Se escriben en un temporal y se
+    renombran, así que varios procesos pueden compartir el directorio.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> list[float] | None:
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        vector = array(_VECTOR_TYPECODE)
+        vector.frombytes(data)
+        if len(vector) != len(FEATURE_NAMES):
+            return None
+        return vector.tolist()
+
+    def set(self, key: str, vector: Sequence[float]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(array(_VECTOR_TYPECODE, vector).tobytes())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+# --- POOL ---
+
+
+class FeatureExtractor:
+    """
+    Extrae features de muchos textos con cache en disco y un pool de procesos.
+
+    Usar como context manager para cerrar el pool:
+
+        with FeatureExtractor(model_name="es_core_news_sm", cache_dir=path) as extractor:
+            vectors, hashes = extractor.extract(texts)
+
+    Con ``workers <= 1`` (o dentro de un proceso daemon, p.ej. un worker
+    prefork de Celery, que no puede tener hijos) se procesa en el propio
+    proceso. En Celery el paralelismo viene de repartir el lote en tareas
+    (EstimationService.schedule_estimation), no de este pool.
+    """
+
+    def __init__(self, *, model_name: str, cache_dir: Path, workers: int | None = None):
+        self.model_name = model_name
+        self.cache = FeatureCache(cache_dir)
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        if self.workers > 1 and multiprocessing.current_process().daemon:
+            logger.info("Proceso daemon: features en el propio proceso, sin pool")
+            self.workers = 1
+        self._executor: Executor | None = None
+        self.stats = {"cached": 0, "computed": 0}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _compute(self, texts: list[str]) -> list[list[float]]:
+        if self.workers <= 1:
+            if _nlp is None:
+                _load_nlp(self.model_name)
+            return extract_batch(texts)
+
+        if self._executor is None:
+            # forkserver: no hereda los threads ni las conexiones del proceso padre
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_load_nlp,
+                initargs=(self.model_name,),
+            )
+        # Varios sub-lotes por proceso para repartir bien aunque la página sea pequeña
+        size = max(1, min(_PIPE_BATCH_SIZE, -(-len(texts) // (self.workers * 4))))
+        batches = [texts[i : i + size] for i in range(0, len(texts), size)]
+        return [vector for batch in self._executor.map(extract_batch, batches) for vector in batch]
+
+    def extract(self, texts: Sequence[str]) -> tuple[list[list[float]], list[str]]:
+        """
+        Features de cada texto, del disco o calculadas.
+
+        Returns:
+            (vectores, hashes de contenido), en el orden de ``texts``
+        """
+        hashes = [content_hash(text, model_name=self.model_name) for text in texts]
+        vectors: dict[str, list[float]] = {}
+        pending: dict[str, str] = {}
+        for key, text in zip(hashes, texts, strict=True):
+            if key in vectors or key in pending:
+                continue
+            vector = self.cache.get(key)
+            if vector is None:
+                pending[key] = text
+            else:
+                vectors[key] = vector
+        self.stats["cached"] += len(vectors)
+
+        if pending:
+            computed = self._compute(list(pending.values()))
+            for key, vector in zip(pending, computed, strict=True):
+                self.cache.set(key, vector)
+                vectors[key] = vector
+            self.stats["computed"] += len(pending)
+
+        return [vectors[key] for key in hashes], hashes
@@ -0,0 +1,261 @@
+"""
+Servicio de inferencia de estimaciones (CEPF + ML).
+
+Se ejecuta en un worker Celery dedicado que consume la cola ``ml_inference``
+con pool de threads. El modelo se carga una sola vez al arrancar el worker y
+las peticiones concurrentes se agrupan en una única llamada vectorizada a
+``predict`` mediante MicroBatcher.
+
+El modelo sale del registro de modelos (apps.estimation.registry) con los
+pesos mapeados en memoria. Al activar otra versión los workers la cargan y la
+cambian en caliente, sin reiniciar; cada predicción lleva la versión del
+modelo que la hizo.
+
+El proceso web nunca importa las librerías de ML: solo publica tareas (ver
+EstimationService.run_ml_prediction) y los imports de ML son diferidos
+(apps.estimation.lazy).
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from typing import Any, NamedTuple
+
+from celery.signals import worker_init, worker_process_init
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from apps.estimation import registry
+from apps.estimation.lazy import numpy as np
+from apps.estimation.models import ModelArtifact
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_QUEUE = "ml_inference"
+
+# Nombre del modelo de estimación en el registro (ModelArtifact.name)
+ESTIMATION_MODEL_NAME = "estimation"
+# Versión de las predicciones hechas con ESTIMATION_MODEL_PATH (sin registro)
+LOCAL_MODEL_VERSION = "local"
+
+
+class Prediction(NamedTuple):
+    effort_hours: float
+    model_version: str
+
+
+class LoadedModel(NamedTuple):
+    model: Any
+    version: str
+
+
+PredictFn = Callable[[list[Sequence[float]]], Sequence[Prediction]]
+
+
+class MicroBatcher:
+    """
+    Agrupa predicciones concurrentes en lotes.
+
+    Cada llamada a submit() encola un vector de features y devuelve un Future.
+    Un thread de fondo espera hasta ``max_wait_ms`` o hasta reunir
+    ``max_batch_size`` peticiones y resuelve todo el lote con una sola
+    llamada a ``predict_fn``.
+    """
+
+    def __init__(self, predict_fn: PredictFn, *, max_batch_size: int, max_wait_ms: float):
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: queue.Queue[tuple[Sequence[float], Future]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def submit(self, features: Sequence[float]) -> Future:
+        """Encola un vector de features para la próxima predicción en lote."""
+        self._ensure_thread()
+        future: Future = Future()
+        self._queue.put((features, future))
+        return future
+
+    def _ensure_thread(self) -> None:
+        # Los threads no sobreviven a un fork (pool prefork): arrancar por proceso
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="estimation-batcher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list[tuple[Sequence[float], Future]]) -> None:
+        features = [item[0] for item in batch]
+        started = time.monotonic()
+        try:
+            predictions = self._predict_fn(features)
+        except Exception as e:
+            logger.exception("Error en la predicción en lote")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        logger.debug(
+            f"Lote de {len(batch)} estimaciones en {(time.monotonic() - started) * 1000:.1f}ms"
+        )
+        for (_, future), prediction in zip(batch, predictions, strict=True):
+            future.set_result(prediction)
+
+
+_loaded: LoadedModel | None = None
+_checked_at = 0.0
+_batcher: MicroBatcher | None = None
+_model_lock = threading.Lock()
+
+
+def load_model(artifact: ModelArtifact | None = None) -> Any:
+    """
+    Carga una versión del modelo de estimación con los pesos mapeados en memoria.
+
+    Args:
+        artifact: Versión del registro; None = fichero ESTIMATION_MODEL_PATH
+            (instalaciones sin ninguna versión publicada)
+
+    Returns:
+        Estimador con interfaz scikit-learn (``predict(X)``)
+    """
+    if artifact is None:
+        path, artifact_format = settings.ESTIMATION_MODEL_PATH, ModelArtifact.Format.JOBLIB
+    else:
+        path, artifact_format = registry.artifact_path(artifact), artifact.artifact_format
+    started = time.monotonic()
+    model = registry.load_artifact(path, artifact_format)
+    logger.info(f"Modelo de estimación cargado desde {path} en {time.monotonic() - started:.1f}s")
+    return model
+
+
+def _predict(features: list[Sequence[float]]) -> list[Prediction]:
+    # Una sola versión por lote aunque se cambie el modelo a mitad
+    model, version = get_model()
+    predictions = model.predict(np.asarray(features, dtype=np.float64))
+    return [Prediction(float(prediction), version) for prediction in predictions]
+
+
+def _refresh_model() -> None:
+    """Cargar la versión activa si no es la del proceso (con _model_lock)."""
+    global _loaded, _checked_at
+    try:
+        artifact = registry.get_active_artifact(ESTIMATION_MODEL_NAME)
+        version = artifact.tag if artifact is not None else LOCAL_MODEL_VERSION
+        if _loaded is None or _loaded.version != version:
+            model = load_model(artifact)
+            if _loaded is not None:
+                logger.info(
+                    f"Modelo de estimación cambiado en caliente: {_loaded.version} -> {version}"
+                )
+            _loaded = LoadedModel(model, version)
+    except Exception:
+        if _loaded is None:
+            raise
+        logger.exception(f"No se pudo cargar la versión activa; se sigue con {_loaded.version}")
+    finally:
+        _checked_at = time.monotonic()
+        # El thread del MicroBatcher vive lo que el worker: no retener su conexión
+        if not connection.in_atomic_block:
+            close_old_connections()
+
+
+def get_model() -> LoadedModel:
+    """
+    Devuelve el modelo de este proceso y su versión, cargándolo si hace falta.
+
+    Cada ML_MODEL_CHECK_INTERVAL segundos comprueba la versión activa en el
+    registro y, si ha cambiado, carga la nueva. Mientras tanto el resto de
+    threads siguen con la anterior; el cambio es una sola asignación.
+    """
+    loaded = _loaded
+    if loaded is not None and time.monotonic() - _checked_at < settings.ML_MODEL_CHECK_INTERVAL:
+        return loaded
+    # Con un modelo ya cargado no se espera: otro thread está comprobando
+    if not _model_lock.acquire(blocking=loaded is None):
+        return loaded
+    try:
+        if _loaded is None or time.monotonic() - _checked_at >= settings.ML_MODEL_CHECK_INTERVAL:
+            _refresh_model()
+    finally:
+        _model_lock.release()
+    return _loaded
+
+
+def get_batcher() -> MicroBatcher:
+    """Devuelve el MicroBatcher del proceso."""
+    global _batcher
+    if _batcher is None:
+        with _model_lock:
+            if _batcher is None:
+                _batcher = MicroBatcher(
+                    _predict,
+                    max_batch_size=settings.ESTIMATION_BATCH_MAX_SIZE,
+                    max_wait_ms=settings.ESTIMATION_BATCH_MAX_WAIT_MS,
+                )
+    return _batcher
+
+
+def predict(features: Sequence[float], *, timeout: float | None = None) -> Prediction:
+    """
+    Predice el esfuerzo para un vector de features, agrupándolo en lote.
+
+    Args:
+        features: Vector de features de la estimación
+        timeout: Segundos máximos de espera del resultado
+
+    Returns:
+        Esfuerzo estimado en horas y versión del modelo
+    """
+    return get_batcher().submit(features).result(timeout=timeout)
+
+
+def predict_many(features_list: Sequence[Sequence[float]]) -> list[Prediction]:
+    """
+    Predice el esfuerzo de muchos vectores con una sola llamada al modelo.
+
+    Para procesos por lotes (EstimationService.estimate_projects) que ya
+    tienen todos los vectores: sin MicroBatcher ni espera.
+    """
+    if not features_list:
+        return []
+    return _predict(list(features_list))
+
+
+def is_inference_worker() -> bool:
+    """Indica si este proceso es un worker de la cola de inferencia."""
+    return settings.CELERY_WORKER_QUEUE == INFERENCE_QUEUE
+
+
+@worker_init.connect
+@worker_process_init.connect
+def _warm_up(**kwargs):
+    """Precarga el modelo al arrancar el worker para no penalizar la 1ª petición."""
+    if is_inference_worker():
+        get_model()
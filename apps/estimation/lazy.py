@@ -0,0 +1,116 @@
+"""
+Importación diferida de dependencias pesadas de ML.
+
+TensorFlow, PyTorch, spaCy, transformers... tardan segundos en importarse y
+ocupan cientos de MB. Los módulos del dominio de estimación deben importarlas
+desde aquí en lugar de a nivel de módulo, de forma que ``django.setup()``,
+``manage.py`` y los workers de test no paguen ese coste:
+
+    from apps.estimation.lazy import numpy as np, joblib
+
+    def predict(features):
+        return model.predict(np.asarray(features))  # numpy se importa aquí
+
+El import real ocurre en el primer acceso a un atributo. Si el extra ``[ml]``
+no está instalado se lanza ImportError con instrucciones en ese momento.
+"""
+
+import importlib
+import importlib.util
+import threading
+import types
+from typing import Any
+
+ML_INSTALL_HINT = "Instala las dependencias de ML con: uv sync --extra ml (o make ml-build)"
+
+
+class LazyModule(types.ModuleType):
+    """Proxy de módulo que importa el módulo real en el primer acceso."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+
+        with self.__dict__["_lazy_lock"]:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                try:
+                    module = importlib.import_module(self.__name__)
+                except ImportError as e:
+                    raise ImportError(
+                        f"No se pudo importar '{self.__name__}'. {ML_INSTALL_HINT}"
+                    ) from e
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Indica si el módulo real ya se ha importado."""
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "cargado" if self.is_loaded else "pendiente"
+        return f"<LazyModule '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Devuelve un proxy que importa ``name`` en el primer acceso.
+
+    Args:
+        name: Nombre completo del módulo (ej: "sklearn.ensemble")
+
+    Returns:
+        LazyModule que se comporta como el módulo una vez cargado
+    """
+    return LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """
+    Comprueba si un módulo está instalado sin importarlo.
+
+    Args:
+        name: Nombre del paquete de primer nivel (ej: "torch")
+
+    Returns:
+        True si el módulo puede importarse
+    """
+    return importlib.util.find_spec(name) is not None
+
+
+# Dependencias del extra [ml] (pyproject.toml)
+numpy = lazy_import("numpy")
+pandas = lazy_import("pandas")
+joblib = lazy_import("joblib")
+sklearn = lazy_import("sklearn")
+tensorflow = lazy_import("tensorflow")
+torch = lazy_import("torch")
+spacy = lazy_import("spacy")
+nltk = lazy_import("nltk")
+transformers = lazy_import("transformers")
+
+# Módulos que no deben aparecer en el arranque de Django (ver
+# scripts/check_import_time.py)
+HEAVY_MODULES = (
+    "numpy",
+    "pandas",
+    "sklearn",
+    "tensorflow",
+    "torch",
+    "spacy",
+    "nltk",
+    "transformers",
+)
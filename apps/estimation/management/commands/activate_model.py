@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.estimation.inference import ESTIMATION_MODEL_NAME
+from apps.estimation.models import ModelArtifact
+from apps.estimation.services import ModelArtifactService
+
+
+class Command(BaseCommand):
+    help = (
+        "Activa una versión publicada de un modelo (también para volver a una anterior). "
+        "Sin versión, lista las publicadas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("version", nargs="?", type=int, help="Versión a activar")
+        parser.add_argument(
+            "--name",
+            default=ESTIMATION_MODEL_NAME,
+            help=f"Nombre del modelo (default: {ESTIMATION_MODEL_NAME})",
+        )
+
+    def handle(self, *args, **options):
+        name = options["name"]
+        if options["version"] is None:
+            for artifact in ModelArtifact.objects.filter(name=name):
+                active = "*" if artifact.is_active else " "
+                created = artifact.created_at.strftime("%Y-%m-%d %H:%M")
+                self.stdout.write(f"{active} {artifact.tag:<30} {created}  {artifact.metrics}")
+            return
+
+        try:
+            artifact = ModelArtifactService.activate(name=name, version=options["version"])
+        except ModelArtifact.DoesNotExist as e:
+            raise CommandError(f"No existe la versión {name}@{options['version']}") from e
+        self.stdout.write(self.style.SUCCESS(f"{artifact} activado"))
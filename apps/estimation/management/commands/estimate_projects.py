@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from apps.estimation.services import EstimationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-estima proyectos en lote (p.ej. tras reentrenar el modelo). Las features de "
+        "texto se extraen en paralelo (un proceso por núcleo) y se cachean en disco."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "project_ids",
+            nargs="*",
+            type=int,
+            help="Proyectos a estimar; por defecto todos los borradores y activos",
+        )
+        parser.add_argument(
+            "--changed",
+            action="store_true",
+            help="Solo proyectos cuyo texto ha cambiado desde su última estimación",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Proyectos por página (default: ESTIMATION_PIPELINE_CHUNK_SIZE)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Procesos de extracción (default: ESTIMATION_PIPELINE_WORKERS; 0 = núcleos)",
+        )
+
+    def handle(self, *args, **options):
+        stats = EstimationService.estimate_projects(
+            project_ids=options["project_ids"] or None,
+            only_changed=options["changed"],
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{stats['estimated']} proyectos estimados de {stats['projects']} "
+                f"({stats['skipped']} sin cambios); features: {stats['features_computed']} "
+                f"calculadas, {stats['features_cached']} de cache"
+            )
+        )
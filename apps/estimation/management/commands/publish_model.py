@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.estimation.inference import ESTIMATION_MODEL_NAME
+from apps.estimation.models import ModelArtifact
+from apps.estimation.services import ModelArtifactService
+
+
+class Command(BaseCommand):
+    help = (
+        "Publica un fichero de modelo como nueva versión en el registro (storage por "
+        "defecto) y la activa: los workers de inferencia la cargan sin reiniciar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path, help="Fichero del modelo (.joblib o .safetensors)")
+        parser.add_argument(
+            "--name",
+            default=ESTIMATION_MODEL_NAME,
+            help=f"Nombre del modelo (default: {ESTIMATION_MODEL_NAME})",
+        )
+        parser.add_argument(
+            "--format",
+            dest="artifact_format",
+            choices=ModelArtifact.Format.values,
+            help="Formato del fichero (default: según la extensión)",
+        )
+        parser.add_argument("--metrics", help="Métricas en JSON, p.ej. '{\"mae\": 12.4}'")
+        parser.add_argument(
+            "--no-activate",
+            action="store_true",
+            help="Publicar sin activar (activar después con activate_model)",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path.is_file():
+            raise CommandError(f"No existe el fichero {path}")
+        try:
+            metrics = json.loads(options["metrics"]) if options["metrics"] else None
+        except ValueError as e:
+            raise CommandError(f"--metrics no es JSON válido: {e}") from e
+
+        try:
+            artifact = ModelArtifactService.publish(
+                name=options["name"],
+                path=path,
+                artifact_format=options["artifact_format"],
+                metrics=metrics,
+                activate=not options["no_activate"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        state = "activa" if artifact.is_active else "sin activar"
+        self.stdout.write(self.style.SUCCESS(f"{artifact} publicado ({state})"))
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0002_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectEstimation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('effort_hours', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('features_hash', models.CharField(max_length=40)),
+                ('estimated_at', models.DateTimeField()),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='estimation', to='projects.project')),
+            ],
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:22
+
+import apps.estimation.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('estimation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectestimation',
+            name='model_version',
+            field=models.CharField(blank=True, max_length=120),
+        ),
+        migrations.CreateModel(
+            name='ModelArtifact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=100)),
+                ('version', models.PositiveIntegerField()),
+                ('format', models.CharField(choices=[('joblib', 'joblib'), ('safetensors', 'safetensors')], default='joblib', max_length=20)),
+                ('file', models.FileField(max_length=255, upload_to=apps.estimation.models._artifact_upload_to)),
+                ('sha256', models.CharField(max_length=64)),
+                ('size', models.PositiveBigIntegerField()),
+                ('metrics', models.JSONField(blank=True, default=dict)),
+                ('is_active', models.BooleanField(default=False)),
+                ('activated_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['name', '-version'],
+                'constraints': [models.UniqueConstraint(fields=('name', 'version'), name='uniq_model_artifact_version'), models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('name',), name='uniq_model_artifact_active')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('estimation', '0002_model_registry'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='modelartifact',
+            old_name='format',
+            new_name='artifact_format',
+        ),
+    ]
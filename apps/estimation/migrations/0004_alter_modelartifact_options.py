@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('estimation', '0003_rename_format_modelartifact_artifact_format'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='modelartifact',
+            options={'ordering': ('name', '-version')},
+        ),
+    ]
@@ -0,0 +1,71 @@
+from django.db import models
+
+from apps.core.models import TimestampedModel
+
+
+class ProjectEstimation(models.Model):
+    """
+    Última estimación de esfuerzo de un proyecto (CEPF + ML).
+
+    La escribe EstimationService.estimate_projects en lote; no se edita a mano.
+    """
+
+    project = models.OneToOneField(
+        "projects.Project", on_delete=models.CASCADE, related_name="estimation"
+    )
+    effort_hours = models.DecimalField(max_digits=10, decimal_places=2)
+    # Hash del texto del que salieron las features (apps.estimation.features)
+    features_hash = models.CharField(max_length=40)
+    # Versión del modelo que hizo la predicción (ModelArtifact.tag)
+    model_version = models.CharField(max_length=120, blank=True)
+    estimated_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.project_id}: {self.effort_hours}h"
+
+
+def _artifact_upload_to(instance, filename: str) -> str:
+    return f"ml_models/{instance.name}/{instance.version}/{filename}"
+
+
+class ModelArtifact(TimestampedModel):
+    """
+    Versión publicada de un modelo de ML, guardada en el storage por defecto.
+
+    Los ficheros no se modifican una vez publicados: una versión nueva es una
+    fila nueva. Los workers cargan la versión activa (una por nombre) y la
+    cambian en caliente al activar otra (ver apps.estimation.registry).
+    """
+
+    class Format(models.TextChoices):
+        JOBLIB = "joblib", "joblib"
+        SAFETENSORS = "safetensors", "safetensors"
+
+    name = models.CharField(max_length=100)
+    version = models.PositiveIntegerField()
+    artifact_format = models.CharField(max_length=20, choices=Format.choices, default=Format.JOBLIB)
+    file = models.FileField(upload_to=_artifact_upload_to, max_length=255)
+    sha256 = models.CharField(max_length=64)
+    size = models.PositiveBigIntegerField()
+    metrics = models.JSONField(default=dict, blank=True)
+    is_active = models.BooleanField(default=False)
+    activated_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("name", "-version")
+        constraints = (
+            models.UniqueConstraint(fields=["name", "version"], name="uniq_model_artifact_version"),
+            models.UniqueConstraint(
+                fields=["name"],
+                condition=models.Q(is_active=True),
+                name="uniq_model_artifact_active",
+            ),
+        )
+
+    def __str__(self):
+        return self.tag
+
+    @property
+    def tag(self) -> str:
+        """Versión con la que se etiquetan las predicciones (p.ej. ``estimation@3``)."""
+        return f"{self.name}@{self.version}"
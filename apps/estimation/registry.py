@@ -0,0 +1,186 @@
+"""
+Registro de modelos de ML: versión activa, fichero local y carga con mmap.
+
+Cada versión publicada es un ModelArtifact con su fichero en el storage por
+defecto (MEDIA_ROOT o S3 con django-storages). Publicar y activar versiones
+es cosa de ModelArtifactService; aquí está lo que necesitan los workers:
+
+- ``get_active_artifact``: versión activa de un modelo, desde cache
+- ``artifact_path``: fichero local del artefacto. Con FileSystemStorage es el
+  propio fichero del storage; con storages remotos se descarga una vez por
+  nodo a ML_ARTIFACT_CACHE_DIR, con el sha256 como nombre (los artefactos no
+  cambian nunca)
+- ``load_artifact``: joblib con ``mmap_mode="r"`` y safetensors con
+  ``numpy.memmap``. Los pesos se leen del page cache del sistema en lugar de
+  copiarse a la memoria de cada proceso: todos los procesos del nodo que
+  cargan la misma versión comparten una sola copia
+
+Solo se comparten las arrays de numpy que el modelo usa tal cual (pesos,
+coeficientes). Lo que el modelo copia al deserializarse (p.ej. los árboles
+de scikit-learn) sigue siendo memoria privada de cada proceso.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.estimation.lazy import joblib
+from apps.estimation.lazy import numpy as np
+from apps.estimation.models import ModelArtifact
+
+logger = logging.getLogger(__name__)
+
+MODEL_ACTIVE_KEY = "ml:active:{name}"
+
+# dtype de safetensors -> dtype de numpy (little-endian)
+_SAFETENSORS_DTYPES = {
+    "F64": "<f8",
+    "F32": "<f4",
+    "F16": "<f2",
+    "I64": "<i8",
+    "I32": "<i4",
+    "I16": "<i2",
+    "I8": "i1",
+    "U64": "<u8",
+    "U32": "<u4",
+    "U16": "<u2",
+    "U8": "u1",
+    "BOOL": "?",
+}
+
+
+# --- VERSIÓN ACTIVA ---
+
+
+def get_active_artifact(name: str) -> ModelArtifact | None:
+    """Versión activa del modelo ``name`` (None si no hay ninguna publicada)."""
+    key = MODEL_ACTIVE_KEY.format(name=name)
+    artifact = cache.get(key)
+    if artifact is None:
+        artifact = ModelArtifact.objects.filter(name=name, is_active=True).first()
+        # False: "sin versión activa", para no consultar la BD en cada comprobación
+        cache.set(key, artifact or False)
+    return artifact or None
+
+
+def invalidate_active_artifact(name: str) -> None:
+    """Olvidar la versión activa cacheada (tras activar otra)."""
+    cache.delete(MODEL_ACTIVE_KEY.format(name=name))
+
+
+# --- FICHEROS ---
+
+
+def file_sha256(path: Path) -> tuple[str, int]:
+    """sha256 y tamaño en bytes de un fichero."""
+    digest = hashlib.sha256()
+    size = 0
+    with Path(path).open("rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def check_artifact(path: Path, artifact_format: str) -> None:
+    """
+    Comprobar que un fichero se puede cargar mapeado en memoria.
+
+    Raises:
+        ValueError: joblib comprimido (no se puede mapear) o safetensors inválido
+    """
+    if artifact_format == ModelArtifact.Format.SAFETENSORS:
+        _safetensors_header(path)
+        return
+    with Path(path).open("rb") as f:
+        # Los pickles de joblib sin comprimir empiezan por el opcode PROTO
+        if f.read(1) != b"\x80":
+            raise ValueError(
+                f"{path}: joblib comprimido, no se puede mapear en memoria. "
+                "Guardar con joblib.dump(modelo, path, compress=0)"
+            )
+
+
+def artifact_path(artifact: ModelArtifact) -> Path:
+    """
+    Fichero local de un artefacto, descargándolo si el storage es remoto.
+
+    La descarga se escribe en un temporal y se renombra tras comprobar el
+    sha256, así que varios procesos del nodo pueden pedirlo a la vez.
+    """
+    storage = artifact.file.storage
+    try:
+        return Path(storage.path(artifact.file.name))
+    except NotImplementedError:
+        pass
+
+    cache_dir = Path(settings.ML_ARTIFACT_CACHE_DIR)
+    path = cache_dir / f"{artifact.sha256}{Path(artifact.file.name).suffix}"
+    if path.exists():
+        return path
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+    digest = hashlib.sha256()
+    try:
+        with os.fdopen(fd, "wb") as out, storage.open(artifact.file.name, "rb") as src:
+            for chunk in src.chunks():
+                digest.update(chunk)
+                out.write(chunk)
+        if digest.hexdigest() != artifact.sha256:
+            raise ValueError(f"{artifact}: el sha256 del fichero descargado no coincide")
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    logger.info(f"Artefacto {artifact} descargado a {path}")
+    return path
+
+
+# --- CARGA ---
+
+
+def load_artifact(path: Path, artifact_format: str) -> Any:
+    """
+    Cargar un artefacto con los pesos mapeados en memoria (solo lectura).
+
+    Returns:
+        joblib: el objeto guardado (p.ej. un estimador de scikit-learn)
+        safetensors: dict nombre -> array de numpy de solo lectura
+    """
+    if artifact_format == ModelArtifact.Format.SAFETENSORS:
+        return _load_safetensors(path)
+    return joblib.load(path, mmap_mode="r")
+
+
+def _safetensors_header(path: Path) -> tuple[dict, int]:
+    with Path(path).open("rb") as f:
+        header_size = int.from_bytes(f.read(8), "little")
+        try:
+            header = json.loads(f.read(header_size))
+        except ValueError as e:
+            raise ValueError(f"{path}: cabecera safetensors inválida") from e
+    header.pop("__metadata__", None)
+    return header, 8 + header_size
+
+
+def _load_safetensors(path: Path) -> dict[str, Any]:
+    # Un solo mapeo del fichero; cada tensor es una vista sobre él
+    header, data_start = _safetensors_header(path)
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    tensors = {}
+    for name, info in header.items():
+        dtype = _SAFETENSORS_DTYPES.get(info["dtype"])
+        if dtype is None:
+            raise ValueError(f"{path}: dtype {info['dtype']} de '{name}' no soportado por numpy")
+        start, end = info["data_offsets"]
+        data = buffer[data_start + start : data_start + end]
+        tensors[name] = data.view(dtype).reshape(info["shape"])
+    return tensors
@@ -0,0 +1,385 @@
+"""
+Service layer del dominio de estimaciones.
+"""
+
+import logging
+import tempfile
+import zlib
+from collections.abc import Iterable
+from decimal import Decimal
+from itertools import batched
+from pathlib import Path
+from typing import Any
+
+from celery import chord, group
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.core.db import advisory_lock
+from apps.estimation import inference, registry
+from apps.estimation.features import FeatureExtractor, content_hash, project_text
+from apps.estimation.inference import Prediction
+from apps.estimation.lazy import joblib
+from apps.estimation.models import ModelArtifact, ProjectEstimation
+from apps.estimation.tasks import (
+    estimate_projects_chunk,
+    predict_effort,
+    summarize_estimations,
+)
+from apps.projects.models import Project
+from config.telemetry import traced
+
+logger = logging.getLogger(__name__)
+
+# 32 bits altos de los advisory locks de publicación de modelos (ver migrate_locked)
+PUBLISH_LOCK_NAMESPACE = 0x10C0DE
+
+
+class EstimationService:
+    """
+    Service para estimaciones CEPF + ML.
+
+    La inferencia se delega al worker ``ml_inference``, que mantiene el modelo
+    cargado en memoria; el proceso web no importa librerías de ML.
+    """
+
+    @staticmethod
+    @traced
+    def run_ml_prediction(*, features: list[float], timeout: float | None = None) -> Prediction:
+        """
+        Obtener la predicción de esfuerzo para una estimación.
+
+        Args:
+            features: Vector de features de la estimación
+            timeout: Segundos máximos de espera (default: ESTIMATION_PREDICT_TIMEOUT)
+
+        Returns:
+            Esfuerzo estimado en horas y versión del modelo que lo ha predicho
+
+        Raises:
+            celery.exceptions.TimeoutError: Si el worker no responde a tiempo
+        """
+        timeout = timeout or settings.ESTIMATION_PREDICT_TIMEOUT
+        return Prediction(**predict_effort.delay(features).get(timeout=timeout))
+
+    @staticmethod
+    @traced
+    def run_ml_predictions(
+        *, features_list: list[list[float]], timeout: float | None = None
+    ) -> list[Prediction]:
+        """
+        Obtener predicciones para varias estimaciones en paralelo.
+
+        Las tareas se publican a la vez para que el worker las agrupe en lote.
+
+        Args:
+            features_list: Vectores de features, uno por estimación
+            timeout: Segundos máximos de espera (default: ESTIMATION_PREDICT_TIMEOUT)
+
+        Returns:
+            Esfuerzos estimados en horas (con la versión del modelo), en el mismo orden
+        """
+        timeout = timeout or settings.ESTIMATION_PREDICT_TIMEOUT
+        result = group(predict_effort.s(features) for features in features_list).apply_async()
+        return [Prediction(**prediction) for prediction in result.get(timeout=timeout)]
+
+    @staticmethod
+    @traced
+    def estimate_projects(
+        *,
+        project_ids: Iterable[int] | None = None,
+        only_changed: bool = False,
+        chunk_size: int | None = None,
+        workers: int | None = None,
+    ) -> dict[str, int]:
+        """
+        Re-estimar proyectos en lote (p.ej. tras reentrenar el modelo).
+
+        Los proyectos se leen en páginas de ``chunk_size`` por pk (sin cursor
+        abierto mientras se procesa). Por página: features de texto (cache en
+        disco y pool de procesos, ver apps.estimation.features), una sola
+        llamada al modelo y escritura con bulk_update/bulk_create.
+
+        Necesita las dependencias de ML: se ejecuta en la cola batch
+        (``tasks.estimate_projects``) o con ``manage.py estimate_projects``,
+        nunca en el web.
+
+        Args:
+            project_ids: Limitar a estos proyectos (None = borradores y activos)
+            only_changed: Saltar los proyectos cuyo texto no ha cambiado desde
+                su última estimación, si se estimaron con la versión actual del modelo
+            chunk_size: Proyectos por página (default: ESTIMATION_PIPELINE_CHUNK_SIZE)
+            workers: Procesos de extracción (default: ESTIMATION_PIPELINE_WORKERS;
+                0 = uno por núcleo)
+
+        Returns:
+            Proyectos leídos, estimados y saltados; features calculadas y leídas de cache
+        """
+        chunk_size = chunk_size or settings.ESTIMATION_PIPELINE_CHUNK_SIZE
+        if workers is None:
+            workers = settings.ESTIMATION_PIPELINE_WORKERS
+        model_name = settings.ESTIMATION_SPACY_MODEL
+
+        qs = EstimationService._candidates(project_ids).values_list(
+            "pk",
+            "name",
+            "description",
+            "estimation__features_hash",
+            "estimation__model_version",
+        )
+        model_version = inference.get_model().version
+
+        stats = {"projects": 0, "estimated": 0, "skipped": 0}
+        with FeatureExtractor(
+            model_name=model_name,
+            cache_dir=settings.ESTIMATION_FEATURE_CACHE_DIR,
+            workers=workers or None,
+        ) as extractor:
+            last_pk = 0
+            while chunk := list(qs.filter(pk__gt=last_pk)[:chunk_size]):
+                last_pk = chunk[-1][0]
+                stats["projects"] += len(chunk)
+
+                candidates = [
+                    (pk, project_text(name, description))
+                    for pk, name, description, previous_hash, previous_version in chunk
+                    if not only_changed
+                    or previous_version != model_version
+                    or previous_hash
+                    != content_hash(project_text(name, description), model_name=model_name)
+                ]
+                stats["skipped"] += len(chunk) - len(candidates)
+                if not candidates:
+                    continue
+
+                vectors, hashes = extractor.extract([text for _, text in candidates])
+                predictions = inference.predict_many(vectors)
+                EstimationService._save_estimations(
+                    [
+                        (pk, features_hash, prediction)
+                        for (pk, _), features_hash, prediction in zip(
+                            candidates, hashes, predictions, strict=True
+                        )
+                    ]
+                )
+                stats["estimated"] += len(candidates)
+                logger.debug(f"Estimaciones: {stats['estimated']}/{stats['projects']} proyectos")
+
+        stats["features_computed"] = extractor.stats["computed"]
+        stats["features_cached"] = extractor.stats["cached"]
+        logger.info(f"Estimación en lote completada: {stats}")
+        return stats
+
+    @staticmethod
+    def schedule_estimation(
+        *,
+        project_ids: Iterable[int] | None = None,
+        only_changed: bool = False,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Re-estimar proyectos en la cola batch, una tarea por página.
+
+        Un worker prefork de Celery es un proceso daemon y no puede abrir el
+        pool de procesos de FeatureExtractor. En su lugar el lote se reparte:
+        cada página de ``chunk_size`` proyectos es una tarea
+        ``estimate_projects_chunk`` y los procesos de los workers batch las
+        procesan en paralelo, cada uno con spaCy cargado una vez. Un chord
+        suma las estadísticas al terminar (``summarize_estimations``).
+
+        Args:
+            project_ids: Limitar a estos proyectos (None = borradores y activos)
+            only_changed: Ver ``estimate_projects``
+            chunk_size: Proyectos por tarea (default: ESTIMATION_PIPELINE_CHUNK_SIZE)
+
+        Returns:
+            Número de tareas encoladas
+        """
+        chunk_size = chunk_size or settings.ESTIMATION_PIPELINE_CHUNK_SIZE
+        pks = EstimationService._candidates(project_ids).values_list("pk", flat=True)
+        pages = [
+            list(page)
+            for page in batched(pks.iterator(chunk_size=chunk_size), chunk_size, strict=False)
+        ]
+        if not pages:
+            return 0
+
+        chord(
+            estimate_projects_chunk.s(project_ids=page, only_changed=only_changed) for page in pages
+        )(summarize_estimations.s())
+        logger.info(f"Estimación en lote: {len(pages)} tareas de hasta {chunk_size} proyectos")
+        return len(pages)
+
+    @staticmethod
+    def _candidates(project_ids: Iterable[int] | None) -> QuerySet[Project]:
+        """Proyectos a estimar, por pk: los indicados o los borradores y activos."""
+        qs = Project.objects.all()
+        if project_ids is not None:
+            qs = qs.filter(pk__in=list(project_ids))
+        else:
+            qs = qs.filter(status__in=[Project.Status.DRAFT, Project.Status.ACTIVE])
+        return qs.order_by("pk")
+
+    @staticmethod
+    @transaction.atomic
+    def _save_estimations(rows: list[tuple[int, str, Prediction]]) -> None:
+        """Escribir (project_id, features_hash, predicción) de una página."""
+        now = timezone.now()
+        existing = ProjectEstimation.objects.in_bulk(
+            [project_id for project_id, _, _ in rows], field_name="project_id"
+        )
+        to_update, to_create = [], []
+        for project_id, features_hash, prediction in rows:
+            effort_hours = Decimal(f"{max(prediction.effort_hours, 0.0):.2f}")
+            estimation = existing.get(project_id)
+            if estimation is None:
+                to_create.append(
+                    ProjectEstimation(
+                        project_id=project_id,
+                        effort_hours=effort_hours,
+                        features_hash=features_hash,
+                        model_version=prediction.model_version,
+                        estimated_at=now,
+                    )
+                )
+                continue
+            estimation.effort_hours = effort_hours
+            estimation.features_hash = features_hash
+            estimation.model_version = prediction.model_version
+            estimation.estimated_at = now
+            to_update.append(estimation)
+
+        ProjectEstimation.objects.bulk_update(
+            to_update, ["effort_hours", "features_hash", "model_version", "estimated_at"]
+        )
+        ProjectEstimation.objects.bulk_create(to_create)
+
+
+def _publish_lock_id(name: str) -> int:
+    """Advisory lock de las publicaciones de un modelo (bigint estable por nombre)."""
+    return (PUBLISH_LOCK_NAMESPACE << 32) | zlib.crc32(name.encode())
+
+
+class ModelArtifactService:
+    """
+    Service del registro de modelos: publicar y activar versiones.
+
+    Los workers de inferencia comprueban la versión activa cada
+    ML_MODEL_CHECK_INTERVAL segundos y la cambian en caliente (ver
+    apps.estimation.registry e inference.get_model).
+    """
+
+    @staticmethod
+    def publish(
+        *,
+        name: str,
+        path: Path,
+        artifact_format: str | None = None,
+        metrics: dict[str, Any] | None = None,
+        activate: bool = True,
+    ) -> ModelArtifact:
+        """
+        Publicar un fichero como la siguiente versión de un modelo.
+
+        La versión se numera bajo un advisory lock por nombre, así que dos
+        publicaciones simultáneas del mismo modelo obtienen versiones
+        consecutivas. Llamar fuera de ``transaction.atomic``: dentro de una
+        transacción exterior el lock se libera antes de su commit.
+
+        Args:
+            name: Nombre del modelo (p.ej. inference.ESTIMATION_MODEL_NAME)
+            path: Fichero local del modelo
+            artifact_format: joblib | safetensors (default: según la extensión)
+            metrics: Métricas de evaluación para comparar versiones
+            activate: Activar la versión al publicarla
+
+        Returns:
+            Versión publicada
+
+        Raises:
+            ValueError: Si el fichero no se puede cargar mapeado en memoria
+        """
+        path = Path(path)
+        if artifact_format is None:
+            artifact_format = (
+                ModelArtifact.Format.SAFETENSORS
+                if path.suffix == ".safetensors"
+                else ModelArtifact.Format.JOBLIB
+            )
+        registry.check_artifact(path, artifact_format)
+        sha256, size = registry.file_sha256(path)
+        artifact = ModelArtifact(
+            name=name,
+            artifact_format=artifact_format,
+            sha256=sha256,
+            size=size,
+            metrics=metrics or {},
+        )
+
+        # La primera versión de un nombre no tiene filas que bloquear con
+        # select_for_update: el lock por nombre serializa hasta el commit
+        with advisory_lock(_publish_lock_id(name)):
+            try:
+                with transaction.atomic():
+                    last = ModelArtifact.objects.filter(name=name).order_by("-version").first()
+                    artifact.version = last.version + 1 if last else 1
+                    with path.open("rb") as f:
+                        artifact.file.save(path.name, File(f), save=False)
+                    artifact.save()
+                    if activate:
+                        artifact = ModelArtifactService.activate(
+                            name=name, version=artifact.version
+                        )
+            except BaseException:
+                # El fichero ya está en el storage: no dejarlo huérfano sin su fila
+                if artifact.file:
+                    artifact.file.storage.delete(artifact.file.name)
+                raise
+
+        logger.info(f"Modelo {artifact} publicado ({size} bytes, sha256 {sha256[:12]})")
+        return artifact
+
+    @staticmethod
+    def publish_estimator(
+        *,
+        name: str,
+        estimator: Any,
+        metrics: dict[str, Any] | None = None,
+        activate: bool = True,
+    ) -> ModelArtifact:
+        """
+        Publicar un estimador entrenado (p.ej. desde el script de entrenamiento).
+
+        Se guarda con joblib sin comprimir para que los workers lo carguen
+        mapeado en memoria.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / f"{name}.joblib"
+            joblib.dump(estimator, path, compress=0)
+            return ModelArtifactService.publish(
+                name=name, path=path, metrics=metrics, activate=activate
+            )
+
+    @staticmethod
+    @transaction.atomic
+    def activate(*, name: str, version: int) -> ModelArtifact:
+        """
+        Activar una versión (también para volver a una anterior).
+
+        Raises:
+            ModelArtifact.DoesNotExist: Si la versión no existe
+        """
+        artifact = ModelArtifact.objects.select_for_update().get(name=name, version=version)
+        ModelArtifact.objects.filter(name=name, is_active=True).exclude(pk=artifact.pk).update(
+            is_active=False
+        )
+        artifact.is_active = True
+        artifact.activated_at = timezone.now()
+        artifact.save(update_fields=["is_active", "activated_at", "updated_at"])
+        transaction.on_commit(lambda: registry.invalidate_active_artifact(name))
+        logger.info(f"Modelo {artifact} activado")
+        return artifact
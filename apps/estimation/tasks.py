@@ -0,0 +1,59 @@
+import logging
+from collections import Counter
+
+from celery import shared_task
+
+from django.conf import settings
+
+from apps.estimation import inference
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="apps.estimation.tasks.predict_effort", queue=inference.INFERENCE_QUEUE)
+def predict_effort(features: list[float]) -> dict[str, float | str]:
+    """
+    Predice el esfuerzo de un vector de features en el worker de inferencia.
+
+    Returns:
+        ``{"effort_hours": ..., "model_version": ...}`` (inference.Prediction)
+    """
+    return inference.predict(features, timeout=settings.ESTIMATION_PREDICT_TIMEOUT)._asdict()
+
+
+@shared_task(name="apps.estimation.tasks.estimate_projects")
+def estimate_projects(project_ids: list[int] | None = None, only_changed: bool = False) -> int:
+    """
+    Re-estima proyectos en lote (cola batch), p.ej. tras reentrenar el modelo.
+
+    Reparte el lote en tareas ``estimate_projects_chunk`` que los workers
+    procesan en paralelo (ver EstimationService.schedule_estimation).
+
+    Returns:
+        Número de tareas encoladas
+    """
+    from apps.estimation.services import EstimationService
+
+    return EstimationService.schedule_estimation(project_ids=project_ids, only_changed=only_changed)
+
+
+@shared_task(name="apps.estimation.tasks.estimate_projects_chunk")
+def estimate_projects_chunk(project_ids: list[int], only_changed: bool = False) -> dict[str, int]:
+    """Estima una página del lote en el proceso del worker (spaCy cargado una vez)."""
+    from apps.estimation.services import EstimationService
+
+    # El proceso del worker es daemon: la extracción va en el propio proceso y
+    # el paralelismo lo dan las demás tareas del chord
+    return EstimationService.estimate_projects(
+        project_ids=project_ids, only_changed=only_changed, workers=1
+    )
+
+
+@shared_task(name="apps.estimation.tasks.summarize_estimations")
+def summarize_estimations(results: list[dict[str, int]]) -> dict[str, int]:
+    """Callback del chord de estimate_projects: estadísticas del lote completo."""
+    stats = Counter()
+    for result in results:
+        stats.update(result)
+    logger.info(f"Estimación en lote completada: {dict(stats)}")
+    return dict(stats)
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from apps.projects.models import Project
+
+
+@admin.register(Project)
+class ProjectAdmin(admin.ModelAdmin):
+    list_display = ("name", "client", "status", "created_by", "created_at")
+    list_filter = ("status",)
+    list_select_related = ("created_by",)
+    search_fields = ("name", "client")
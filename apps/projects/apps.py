@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ProjectsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.projects"
+
+    def ready(self):
+        """Registrar los proyectos en la búsqueda global."""
+        import apps.projects.search  # noqa
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_search'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='project',
+            options={'ordering': ('-created_at',)},
+        ),
+    ]
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+from apps.core.models import TimestampedModel
+from apps.core.search import search_vector
+
+
+class Project(TimestampedModel):
+    """Modelo de Proyecto."""
+
+    class Status(models.TextChoices):
+        DRAFT = "draft", "Borrador"
+        ACTIVE = "active", "Activo"
+        COMPLETED = "completed", "Completado"
+
+    name = models.CharField(max_length=200, db_index=True)
+    client = models.CharField(max_length=200, blank=True)
+    description = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.DRAFT)
+    budget_hours = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="created_projects",
+    )
+
+    # Lo calcula PostgreSQL en cada escritura (ver apps.core.search)
+    search_vector = models.GeneratedField(
+        expression=search_vector(name="A", client="A", description="B"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = (
+            models.Index(fields=["status", "created_at"]),
+            GinIndex(fields=["search_vector"], name="project_search_idx"),
+            GinIndex(OpClass("name", name="gin_trgm_ops"), name="project_name_trgm_idx"),
+            GinIndex(OpClass("client", name="gin_trgm_ops"), name="project_client_trgm_idx"),
+        )
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def is_active(self) -> bool:
+        """Property simple sin queries."""
+        return self.status == self.Status.ACTIVE
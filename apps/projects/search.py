@@ -0,0 +1,17 @@
+"""
+Registro de proyectos en la búsqueda global (apps.core.search).
+"""
+
+from apps.core.search import SearchDomain, register_search_domain
+from apps.projects.selectors import get_visible_projects
+
+register_search_domain(
+    SearchDomain(
+        name="project",
+        label="Proyectos",
+        queryset=get_visible_projects,
+        title="name",
+        subtitle="client",
+        trigram_fields=("name", "client"),
+    )
+)
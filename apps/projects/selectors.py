@@ -0,0 +1,22 @@
+"""
+Selectors de proyectos.
+"""
+
+from django.db.models import Q, QuerySet
+
+from apps.core.db import replica_selector
+from apps.projects.models import Project
+
+
+@replica_selector
+def get_visible_projects(*, user) -> QuerySet[Project]:
+    """
+    Proyectos que puede consultar ``user``.
+
+    Con el permiso ``projects.view_project`` todos; sin él, los que no están
+    en borrador y los borradores propios.
+    """
+    qs = Project.objects.all()
+    if not user.has_perm("projects.view_project"):
+        qs = qs.filter(~Q(status=Project.Status.DRAFT) | Q(created_by=user))
+    return qs
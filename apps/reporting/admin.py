@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from apps.reporting.models import ExportJob
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = ("export_name", "format", "status", "row_count", "requested_by", "created_at")
+    list_filter = ("status", "format", "export_name")
+    list_select_related = ("requested_by",)
+    readonly_fields = ("finished_at", "row_count", "error")
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ReportingConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.reporting"
+
+    def ready(self):
+        """Registrar señales que mantienen actualizados los agregados."""
+        import apps.reporting.signals  # noqa
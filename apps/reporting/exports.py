@@ -0,0 +1,274 @@
+"""
+Exportaciones CSV/XLSX en streaming.
+
+Las filas se leen con un cursor de servidor (``.iterator(chunk_size=...)``)
+y se escriben a medida que llegan, de modo que la memoria no depende del
+número de filas:
+- CSV: generador que alimenta directamente un StreamingHttpResponse
+- XLSX: XlsxWriter en modo ``constant_memory`` sobre un fichero temporal
+
+Cada exportación se declara con un ExportDefinition y se registra con
+``register_export``; las vistas y la tarea Celery solo conocen el nombre.
+"""
+
+import csv
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date
+from typing import IO, Any, Literal
+
+from django.conf import settings
+from django.db.models import QuerySet, Sum
+from django.db.models.functions import TruncMonth
+
+from apps.reporting.models import DailyTimeRollup, WeeklyTimeRollup
+from apps.timetracking.selectors import get_visible_time_entries
+
+type ExportFormat = Literal["csv", "xlsx"]
+
+CONTENT_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+@dataclass(frozen=True)
+class ExportDefinition:
+    """
+    Declaración de una exportación.
+
+    Attributes:
+        name: Identificador usado en URLs y tareas
+        title: Título legible (nombre de hoja y de fichero)
+        headers: Cabeceras de columna
+        queryset: Función (*, user, **filters) -> QuerySet de ``values_list``
+            con las columnas en el mismo orden que ``headers``, limitado a lo
+            que ``user`` puede ver
+        permission: Permiso necesario para exportar (None = cualquier usuario)
+    """
+
+    name: str
+    title: str
+    headers: tuple[str, ...]
+    queryset: Callable[..., QuerySet]
+    permission: str | None = None
+
+
+EXPORTS: dict[str, ExportDefinition] = {}
+
+
+def register_export(definition: ExportDefinition) -> ExportDefinition:
+    """Registrar una exportación por nombre."""
+    EXPORTS[definition.name] = definition
+    return definition
+
+
+def get_export(name: str) -> ExportDefinition:
+    """
+    Obtener una exportación registrada.
+
+    Raises:
+        KeyError: Si no existe
+    """
+    return EXPORTS[name]
+
+
+_DATE_FILTERS = ("date_from", "date_to")
+_ID_FILTERS = ("user_id", "project_id")
+
+
+def parse_filters(params: Mapping[str, str]) -> dict[str, Any]:
+    """
+    Convertir filtros en crudo (GET o JSON) a los tipos esperados.
+
+    Raises:
+        ValueError: Si una fecha o un ID no son válidos
+    """
+    filters: dict[str, Any] = {}
+    for key in _DATE_FILTERS:
+        if params.get(key):
+            filters[key] = date.fromisoformat(params[key])
+    for key in _ID_FILTERS:
+        if params.get(key):
+            filters[key] = int(params[key])
+    return filters
+
+
+def iter_rows(definition: ExportDefinition, *, user, filters: dict[str, Any]) -> Iterator[tuple]:
+    """Filas de la exportación visibles para ``user``, leídas con un cursor de servidor."""
+    return definition.queryset(user=user, **filters).iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+
+class _Echo:
+    """Pseudo-buffer: csv.writer devuelve la línea en vez de acumularla."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv(headers: Iterable[str], rows: Iterable[tuple]) -> Iterator[str]:
+    """
+    Generar el CSV línea a línea para StreamingHttpResponse.
+
+    Empieza con BOM UTF-8 para que Excel detecte la codificación.
+    """
+    writer = csv.writer(_Echo())
+    yield "\ufeff" + writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_csv(fileobj: IO[str], headers: Iterable[str], rows: Iterable[tuple]) -> int:
+    """Escribir el CSV en un fichero de texto. Devuelve el número de filas."""
+    writer = csv.writer(fileobj)
+    fileobj.write("\ufeff")
+    writer.writerow(headers)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_xlsx(
+    fileobj: IO[bytes], headers: Iterable[str], rows: Iterable[tuple], *, title: str
+) -> int:
+    """
+    Escribir un XLSX con memoria constante. Devuelve el número de filas.
+
+    En modo ``constant_memory`` XlsxWriter vuelca cada fila a disco en cuanto
+    se pasa a la siguiente.
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(
+        fileobj,
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd",
+            "remove_timezone": True,
+        },
+    )
+    worksheet = workbook.add_worksheet(title[:31])
+    worksheet.write_row(0, 0, list(headers), workbook.add_format({"bold": True}))
+    count = 0
+    for row in rows:
+        count += 1
+        worksheet.write_row(count, 0, row)
+    workbook.close()
+    return count
+
+
+def _filtered(
+    qs: QuerySet,
+    period_field: str,
+    *,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    user_id: int | None = None,
+    project_id: int | None = None,
+) -> QuerySet:
+    """Filtros comunes a todas las exportaciones."""
+    if date_from:
+        qs = qs.filter(**{f"{period_field}__gte": date_from})
+    if date_to:
+        qs = qs.filter(**{f"{period_field}__lte": date_to})
+    if user_id:
+        qs = qs.filter(user_id=user_id)
+    if project_id:
+        qs = qs.filter(project_id=project_id)
+    return qs
+
+
+def _visible_rollups(model, *, user) -> QuerySet:
+    """
+    Agregados que puede consultar ``user``.
+
+    Salen de TimeEntry, así que siguen las reglas de get_visible_time_entries:
+    sin el permiso ``timetracking.view_timeentry`` solo las horas propias,
+    aunque los filtros pidan otro ``user_id``.
+    """
+    qs = model.objects.all()
+    if not user.has_perm("timetracking.view_timeentry"):
+        qs = qs.filter(user=user)
+    return qs
+
+
+def _time_entries(*, user, **filters) -> QuerySet:
+    return (
+        _filtered(get_visible_time_entries(user=user), "date", **filters)
+        .order_by("date", "user_id", "pk")
+        .values_list(
+            "date",
+            "user__username",
+            "user__email",
+            "project__name",
+            "hours",
+            "billable",
+            "description",
+        )
+    )
+
+
+def _monthly_hours(*, user, **filters) -> QuerySet:
+    return (
+        _filtered(_visible_rollups(DailyTimeRollup, user=user), "date", **filters)
+        .annotate(month=TruncMonth("date"))
+        .values("month", "user__username", "user__email")
+        .annotate(total_hours=Sum("hours"), total_billable=Sum("billable_hours"))
+        .order_by("month", "user__username")
+        .values_list("month", "user__username", "user__email", "total_hours", "total_billable")
+    )
+
+
+def _project_hours(*, user, **filters) -> QuerySet:
+    return (
+        _filtered(_visible_rollups(WeeklyTimeRollup, user=user), "week_start", **filters)
+        .order_by("project__name", "week_start", "user__username")
+        .values_list(
+            "project__name",
+            "project__client",
+            "week_start",
+            "user__username",
+            "hours",
+            "billable_hours",
+            "entry_count",
+        )
+    )
+
+
+register_export(
+    ExportDefinition(
+        name="time_entries",
+        title="Registro de horas",
+        headers=("Fecha", "Usuario", "Email", "Proyecto", "Horas", "Facturable", "Descripción"),
+        queryset=_time_entries,
+        permission="timetracking.view_timeentry",
+    )
+)
+register_export(
+    ExportDefinition(
+        name="monthly_hours",
+        title="Horas mensuales por persona",
+        headers=("Mes", "Usuario", "Email", "Horas", "Horas facturables"),
+        queryset=_monthly_hours,
+        permission="timetracking.view_timeentry",
+    )
+)
+register_export(
+    ExportDefinition(
+        name="project_hours",
+        title="Horas por proyecto",
+        headers=(
+            "Proyecto",
+            "Cliente",
+            "Semana",
+            "Usuario",
+            "Horas",
+            "Horas facturables",
+            "Entradas",
+        ),
+        queryset=_project_hours,
+        permission="projects.view_project",
+    )
+)
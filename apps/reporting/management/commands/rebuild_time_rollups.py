@@ -0,0 +1,33 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from apps.reporting.services import RollupService
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye los agregados de horas (diarios y semanales) a partir de las "
+        "entradas de horas. Útil para la carga inicial o tras importaciones masivas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            help="Reconstruir solo desde esta fecha (YYYY-MM-DD); por defecto todo",
+        )
+        parser.add_argument(
+            "--until",
+            type=date.fromisoformat,
+            help="Reconstruir solo hasta esta fecha (YYYY-MM-DD)",
+        )
+
+    def handle(self, *args, **options):
+        stats = RollupService.rebuild(date_from=options["since"], date_to=options["until"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Agregados reconstruidos: {stats['daily']} diarios, {stats['weekly']} semanales "
+                f"({stats['daily_deleted']} + {stats['weekly_deleted']} huérfanos eliminados)"
+            )
+        )
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyTimeRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hours', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('billable_hours', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('entry_count', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('date', models.DateField()),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='projects.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['project', 'date'], name='reporting_d_project_04804e_idx'), models.Index(fields=['user', 'date'], name='reporting_d_user_id_d7408d_idx'), models.Index(fields=['date'], name='reporting_d_date_b5f036_idx')],
+                'constraints': [models.UniqueConstraint(fields=('project', 'user', 'date'), name='uniq_daily_time_rollup')],
+            },
+        ),
+        migrations.CreateModel(
+            name='WeeklyTimeRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hours', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('billable_hours', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('entry_count', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('week_start', models.DateField()),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='projects.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['project', 'week_start'], name='reporting_w_project_1483fd_idx'), models.Index(fields=['user', 'week_start'], name='reporting_w_user_id_d40efe_idx'), models.Index(fields=['week_start'], name='reporting_w_week_st_569e51_idx')],
+                'constraints': [models.UniqueConstraint(fields=('project', 'user', 'week_start'), name='uniq_weekly_time_rollup')],
+            },
+        ),
+    ]
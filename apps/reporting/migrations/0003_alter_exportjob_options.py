@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:19
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0002_exportjob'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='exportjob',
+            options={'ordering': ('-created_at',)},
+        ),
+    ]
@@ -0,0 +1,105 @@
+from django.conf import settings
+from django.db import models
+
+from apps.core.models import TimestampedModel
+
+
+class TimeRollup(models.Model):
+    """
+    Agregado precalculado de horas por proyecto y persona.
+
+    Lo mantiene apps.reporting.services.RollupService; no se escribe a mano.
+    """
+
+    project = models.ForeignKey("projects.Project", on_delete=models.CASCADE, related_name="+")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    hours = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    billable_hours = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    entry_count = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class DailyTimeRollup(TimeRollup):
+    """Horas por proyecto, persona y día."""
+
+    date = models.DateField()
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=["project", "user", "date"], name="uniq_daily_time_rollup"
+            ),
+        )
+        indexes = (
+            models.Index(fields=["project", "date"]),
+            models.Index(fields=["user", "date"]),
+            models.Index(fields=["date"]),
+        )
+
+    def __str__(self):
+        return f"{self.project_id} · {self.user_id} · {self.date}: {self.hours}h"
+
+
+class WeeklyTimeRollup(TimeRollup):
+    """Horas por proyecto, persona y semana (week_start = lunes)."""
+
+    week_start = models.DateField()
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=["project", "user", "week_start"], name="uniq_weekly_time_rollup"
+            ),
+        )
+        indexes = (
+            models.Index(fields=["project", "week_start"]),
+            models.Index(fields=["user", "week_start"]),
+            models.Index(fields=["week_start"]),
+        )
+
+    def __str__(self):
+        return f"{self.project_id} · {self.user_id} · {self.week_start}: {self.hours}h"
+
+
+class ExportJob(TimestampedModel):
+    """Exportación grande generada en segundo plano por Celery."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pendiente"
+        RUNNING = "running", "En curso"
+        DONE = "done", "Completada"
+        FAILED = "failed", "Fallida"
+
+    class Format(models.TextChoices):
+        CSV = "csv", "CSV"
+        XLSX = "xlsx", "XLSX"
+
+    export_name = models.CharField(max_length=100)
+    format = models.CharField(max_length=10, choices=Format.choices, default=Format.CSV)
+    filters = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    file = models.FileField(upload_to="exports/%Y/%m/", blank=True)
+    row_count = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="export_jobs",
+    )
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = (models.Index(fields=["requested_by", "created_at"]),)
+
+    def __str__(self):
+        return f"{self.export_name}.{self.format} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self) -> bool:
+        """Property simple sin queries."""
+        return self.status in (self.Status.DONE, self.Status.FAILED)
@@ -0,0 +1,181 @@
+"""
+Selectors de cuadros de mando.
+
+Leen los agregados precalculados (un registro por proyecto/persona/periodo)
+en lugar de agregar TimeEntry en cada carga: el coste depende del número de
+periodos y no del volumen de entradas de horas.
+
+Las series y totales se cachean (``apps.core.selector_cache``) hasta que se
+recalculan los agregados; el rango por defecto del cuadro de mando se
+precalienta.
+"""
+
+from datetime import date, timedelta
+from typing import Literal
+
+from django.db.models import F, QuerySet, Sum
+from django.utils import timezone
+
+from apps.core.db import replica_selector
+from apps.core.selector_cache import cached_selector
+from apps.reporting.models import DailyTimeRollup, ExportJob, WeeklyTimeRollup
+
+type Period = Literal["day", "week"]
+
+_PERIOD_SOURCES = {
+    "day": (DailyTimeRollup, "date"),
+    "week": (WeeklyTimeRollup, "week_start"),
+}
+
+# Semanas del rango por defecto del cuadro de mando
+DASHBOARD_WEEKS = 12
+
+
+def dashboard_range(today: date | None = None) -> tuple[date, date]:
+    """Rango por defecto del cuadro de mando: las últimas DASHBOARD_WEEKS semanas completas."""
+    today = today or timezone.localdate()
+    monday = today - timedelta(days=today.weekday())
+    return monday - timedelta(weeks=DASHBOARD_WEEKS - 1), monday + timedelta(days=6)
+
+
+def _dashboard_series_args() -> list[dict]:
+    date_from, date_to = dashboard_range()
+    return [{"period": "week", "date_from": date_from, "date_to": date_to}]
+
+
+def _dashboard_totals_args() -> list[dict]:
+    date_from, date_to = dashboard_range()
+    return [
+        {"group_by": group_by, "date_from": date_from, "date_to": date_to}
+        for group_by in ("project", "user")
+    ]
+
+
+def _rollups(
+    *,
+    period: Period,
+    date_from: date | None,
+    date_to: date | None,
+    project_ids: list[int] | None,
+    user_ids: list[int] | None,
+) -> tuple[QuerySet, str]:
+    model, period_field = _PERIOD_SOURCES[period]
+    qs = model.objects.all()
+    if date_from:
+        qs = qs.filter(**{f"{period_field}__gte": date_from})
+    if date_to:
+        qs = qs.filter(**{f"{period_field}__lte": date_to})
+    if project_ids is not None:
+        qs = qs.filter(project_id__in=project_ids)
+    if user_ids is not None:
+        qs = qs.filter(user_id__in=user_ids)
+    return qs, period_field
+
+
+@cached_selector(tags=[DailyTimeRollup, WeeklyTimeRollup], warm=_dashboard_series_args)
+@replica_selector
+def get_hours_series(
+    *,
+    period: Period = "week",
+    date_from: date | None = None,
+    date_to: date | None = None,
+    project_ids: list[int] | None = None,
+    user_ids: list[int] | None = None,
+) -> list[dict]:
+    """
+    Serie temporal de horas (una fila por periodo) para gráficas de evolución.
+
+    Args:
+        period: "day" o "week" (semanas que empiezan en lunes)
+        date_from: Inicio del rango (inclusive)
+        date_to: Fin del rango (inclusive)
+        project_ids: Limitar a estos proyectos
+        user_ids: Limitar a estas personas
+
+    Returns:
+        Lista de dicts {period, hours, billable_hours, entries}
+    """
+    qs, period_field = _rollups(
+        period=period,
+        date_from=date_from,
+        date_to=date_to,
+        project_ids=project_ids,
+        user_ids=user_ids,
+    )
+    return list(
+        qs.values(period=F(period_field))
+        .annotate(
+            hours=Sum("hours"),
+            billable_hours=Sum("billable_hours"),
+            entries=Sum("entry_count"),
+        )
+        .order_by("period")
+    )
+
+
+@cached_selector(tags=[DailyTimeRollup, WeeklyTimeRollup], warm=_dashboard_totals_args)
+@replica_selector
+def get_hours_totals(
+    *,
+    group_by: Literal["project", "user"],
+    date_from: date | None = None,
+    date_to: date | None = None,
+    project_ids: list[int] | None = None,
+    user_ids: list[int] | None = None,
+) -> list[dict]:
+    """
+    Totales de horas por proyecto o por persona en un rango (KPIs y rankings).
+
+    Usa los agregados semanales cuando el rango está alineado a semanas y los
+    diarios en caso contrario.
+
+    Args:
+        group_by: "project" o "user"
+        date_from: Inicio del rango (inclusive)
+        date_to: Fin del rango (inclusive)
+        project_ids: Limitar a estos proyectos
+        user_ids: Limitar a estas personas
+
+    Returns:
+        Lista de dicts {project_id|user_id, hours, billable_hours, entries},
+        ordenado por horas descendente
+    """
+    week_aligned = (date_from is None or date_from.weekday() == 0) and (
+        date_to is None or date_to.weekday() == 6
+    )
+    qs, _ = _rollups(
+        period="week" if week_aligned else "day",
+        date_from=date_from,
+        date_to=date_to,
+        project_ids=project_ids,
+        user_ids=user_ids,
+    )
+    return list(
+        qs.values(f"{group_by}_id")
+        .annotate(
+            hours=Sum("hours"),
+            billable_hours=Sum("billable_hours"),
+            entries=Sum("entry_count"),
+        )
+        .order_by("-hours")
+    )
+
+
+def get_export_job(*, job_id: int, user) -> ExportJob:
+    """
+    Obtener una exportación del usuario.
+
+    Raises:
+        ExportJob.DoesNotExist: Si no existe o es de otro usuario
+    """
+    return ExportJob.objects.get(pk=job_id, requested_by=user)
+
+
+async def aget_export_job(*, job_id: int, user) -> ExportJob:
+    """
+    Versión async de get_export_job (ORM async nativo).
+
+    Raises:
+        ExportJob.DoesNotExist: Si no existe o es de otro usuario
+    """
+    return await ExportJob.objects.aget(pk=job_id, requested_by=user)
@@ -0,0 +1,409 @@
+"""
+Service layer de reporting: agregados para cuadros de mando y exportaciones.
+
+Los agregados (DailyTimeRollup, WeeklyTimeRollup) se recalculan por bucket
+(proyecto, persona, día) a partir de los TimeEntry: recalcular en vez de
+sumar deltas hace que refrescar sea idempotente, tolerante a reintentos y a
+tareas que llegan desordenadas. La reconciliación nocturna reconstruye todo
+para corregir cambios que no emiten señales (bulk_create, update()).
+"""
+
+import io
+import logging
+import tempfile
+import threading
+from collections.abc import Iterable, Mapping
+from datetime import date, timedelta
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.core.files import File
+from django.core.mail import send_mail
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncWeek
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.core.selector_cache import invalidate_tags
+from apps.reporting.exports import (
+    ExportDefinition,
+    get_export,
+    iter_rows,
+    parse_filters,
+    write_csv,
+    write_xlsx,
+)
+from apps.reporting.models import DailyTimeRollup, ExportJob, WeeklyTimeRollup
+from apps.timetracking.models import TimeEntry
+from config.telemetry import traced
+
+logger = logging.getLogger(__name__)
+
+type RollupKey = tuple[int, int, date]
+
+_ROLLUP_FIELDS = ["hours", "billable_hours", "entry_count", "refreshed_at"]
+# Máximo de buckets por query al recalcular (limita el tamaño del OR)
+_KEYS_PER_QUERY = 500
+
+# Buckets pendientes de refrescar en este thread hasta el commit
+_pending = threading.local()
+
+
+def week_start(day: date) -> date:
+    """Lunes de la semana de ``day``."""
+    return day - timedelta(days=day.weekday())
+
+
+def _entry_totals() -> dict:
+    """Agregaciones de TimeEntry para un bucket diario."""
+    return {
+        "total_hours": Sum("hours", default=0),
+        "total_billable_hours": Sum("hours", filter=Q(billable=True), default=0),
+        "total_entries": Count("id"),
+    }
+
+
+def _daily_totals() -> dict:
+    """Agregaciones de DailyTimeRollup para un bucket semanal."""
+    return {
+        "total_hours": Sum("hours", default=0),
+        "total_billable_hours": Sum("billable_hours", default=0),
+        "total_entries": Sum("entry_count", default=0),
+    }
+
+
+def _upsert(model, rows: Iterable[dict], period_field: str) -> int:
+    """Inserta o actualiza filas de agregados (INSERT ... ON CONFLICT)."""
+    objs = [
+        model(
+            project_id=row["project_id"],
+            user_id=row["user_id"],
+            hours=row["total_hours"],
+            billable_hours=row["total_billable_hours"],
+            entry_count=row["total_entries"],
+            **{period_field: row[period_field]},
+        )
+        for row in rows
+    ]
+    if objs:
+        model.objects.bulk_create(
+            objs,
+            batch_size=settings.ROLLUP_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["project", "user", period_field],
+            update_fields=_ROLLUP_FIELDS,
+        )
+    return len(objs)
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class RollupService:
+    """Service para mantener los agregados de horas."""
+
+    @staticmethod
+    def schedule_refresh(*, keys: Iterable[RollupKey]) -> None:
+        """
+        Encolar el refresco de buckets tras el commit de la transacción actual.
+
+        Los buckets se acumulan por thread y se envían en una única tarea por
+        commit, así una request que guarda muchas entradas encola una sola
+        tarea. Llamar desde services que escriben TimeEntry en bloque
+        (bulk_create/update no emiten señales).
+
+        Args:
+            keys: Tuplas (project_id, user_id, date)
+        """
+        pending = getattr(_pending, "keys", None)
+        if pending is None:
+            pending = _pending.keys = set()
+        pending.update(keys)
+        transaction.on_commit(RollupService._flush_pending)
+
+    @staticmethod
+    def _flush_pending() -> None:
+        from apps.reporting.tasks import refresh_time_rollups
+
+        keys = getattr(_pending, "keys", None)
+        if not keys:
+            return
+        _pending.keys = set()
+        payload = sorted(
+            [project_id, user_id, day.isoformat()] for project_id, user_id, day in keys
+        )
+        refresh_time_rollups.delay(payload)
+
+    @staticmethod
+    @transaction.atomic
+    @traced
+    def refresh_buckets(*, keys: Iterable[RollupKey]) -> int:
+        """
+        Recalcular los buckets diarios indicados y las semanas que los contienen.
+
+        Args:
+            keys: Tuplas (project_id, user_id, date)
+
+        Returns:
+            Número de buckets diarios recalculados
+        """
+        keys = sorted(set(keys))
+        if not keys:
+            return 0
+
+        for chunk in _chunks(keys, _KEYS_PER_QUERY):
+            bucket_filter = reduce(or_, (Q(project_id=p, user_id=u, date=d) for p, u, d in chunk))
+            rows = list(
+                TimeEntry.objects.filter(bucket_filter)
+                .values("project_id", "user_id", "date")
+                .annotate(**_entry_totals())
+                .order_by()
+            )
+            _upsert(DailyTimeRollup, rows, "date")
+
+            present = {(r["project_id"], r["user_id"], r["date"]) for r in rows}
+            empty = [key for key in chunk if key not in present]
+            if empty:
+                DailyTimeRollup.objects.filter(
+                    reduce(or_, (Q(project_id=p, user_id=u, date=d) for p, u, d in empty))
+                ).delete()
+
+        weeks = sorted({(p, u, week_start(d)) for p, u, d in keys})
+        for chunk in _chunks(weeks, _KEYS_PER_QUERY):
+            week_filter = reduce(
+                or_,
+                (
+                    Q(project_id=p, user_id=u, date__range=(ws, ws + timedelta(days=6)))
+                    for p, u, ws in chunk
+                ),
+            )
+            rows = list(
+                DailyTimeRollup.objects.filter(week_filter)
+                .annotate(week_start=TruncWeek("date"))
+                .values("project_id", "user_id", "week_start")
+                .annotate(**_daily_totals())
+                .order_by()
+            )
+            _upsert(WeeklyTimeRollup, rows, "week_start")
+
+            present = {(r["project_id"], r["user_id"], r["week_start"]) for r in rows}
+            empty = [key for key in chunk if key not in present]
+            if empty:
+                WeeklyTimeRollup.objects.filter(
+                    reduce(or_, (Q(project_id=p, user_id=u, week_start=ws) for p, u, ws in empty))
+                ).delete()
+
+        # INSERT ... ON CONFLICT no emite señales
+        invalidate_tags(DailyTimeRollup, WeeklyTimeRollup)
+        return len(keys)
+
+    @staticmethod
+    @traced
+    def rebuild(*, date_from: date | None = None, date_to: date | None = None) -> dict[str, int]:
+        """
+        Reconstruir los agregados a partir de las entradas de horas.
+
+        Se reconstruye semana a semana, cada una en su propia transacción: una
+        reconstrucción completa no mantiene abierta una transacción larga (locks
+        sobre los agregados, bloat por el snapshot) y si se interrumpe, las
+        semanas ya reconstruidas quedan guardadas.
+
+        Args:
+            date_from: Primer día a reconstruir (None = desde el principio)
+            date_to: Último día a reconstruir (None = hasta hoy y posteriores)
+
+        Returns:
+            Filas diarias/semanales escritas y huérfanas eliminadas
+        """
+        stats = {"daily": 0, "weekly": 0, "daily_deleted": 0, "weekly_deleted": 0}
+        # Sin límites: del primer al último día con entradas o agregados
+        if date_from is None or date_to is None:
+            bounds = [
+                TimeEntry.objects.aggregate(first=Min("date"), last=Max("date")),
+                DailyTimeRollup.objects.aggregate(first=Min("date"), last=Max("date")),
+                WeeklyTimeRollup.objects.aggregate(first=Min("week_start"), last=Max("week_start")),
+            ]
+            firsts = [b["first"] for b in bounds if b["first"]]
+            lasts = [b["last"] for b in bounds if b["last"]]
+            if not firsts:
+                return stats
+            date_from = date_from or min(firsts)
+            date_to = date_to or max(lasts)
+
+        week = week_start(date_from)
+        while week <= date_to:
+            for name, count in RollupService._rebuild_week(week).items():
+                stats[name] += count
+            week += timedelta(days=7)
+
+        logger.info(f"Agregados reconstruidos ({date_from} - {date_to}): {stats}")
+        return stats
+
+    @staticmethod
+    def _rebuild_week(week: date) -> dict[str, int]:
+        """Reconstruir los agregados diarios y el semanal de una semana."""
+        days = (week, week + timedelta(days=6))
+        batch_size = settings.ROLLUP_BATCH_SIZE
+        with transaction.atomic():
+            started = timezone.now()
+            source = (
+                TimeEntry.objects.filter(date__range=days)
+                .values("project_id", "user_id", "date")
+                .annotate(**_entry_totals())
+                .order_by()
+            )
+            daily = 0
+            for batch in _chunks(list(source), batch_size):
+                daily += _upsert(DailyTimeRollup, batch, "date")
+
+            # Lo que no se ha reescrito en esta reconstrucción ya no tiene entradas
+            daily_deleted, _ = DailyTimeRollup.objects.filter(
+                date__range=days, refreshed_at__lt=started
+            ).delete()
+
+            weekly_source = (
+                DailyTimeRollup.objects.filter(date__range=days)
+                .values("project_id", "user_id")
+                .annotate(**_daily_totals())
+                .order_by()
+            )
+            weekly = _upsert(
+                WeeklyTimeRollup,
+                ({**row, "week_start": week} for row in weekly_source),
+                "week_start",
+            )
+            weekly_deleted, _ = WeeklyTimeRollup.objects.filter(
+                week_start=week, refreshed_at__lt=started
+            ).delete()
+
+        # INSERT ... ON CONFLICT no emite señales
+        invalidate_tags(DailyTimeRollup, WeeklyTimeRollup)
+        return {
+            "daily": daily,
+            "weekly": weekly,
+            "daily_deleted": daily_deleted,
+            "weekly_deleted": weekly_deleted,
+        }
+
+
+class ExportService:
+    """Service para exportaciones grandes en segundo plano."""
+
+    @staticmethod
+    def check_permission(*, user, definition: ExportDefinition) -> None:
+        """
+        Comprobar que el usuario puede lanzar la exportación.
+
+        Raises:
+            PermissionDenied: Si el usuario no tiene el permiso requerido
+        """
+        if definition.permission and not user.has_perm(definition.permission):
+            raise PermissionDenied(f"Sin permiso para exportar '{definition.name}'")
+
+    @staticmethod
+    @transaction.atomic
+    @traced
+    def start_export(*, user, export_name: str, fmt: str, params: Mapping[str, str]) -> ExportJob:
+        """
+        Crear un ExportJob y encolar su generación en la cola batch.
+
+        Args:
+            user: Usuario que solicita la exportación (recibe el aviso)
+            export_name: Nombre de la exportación registrada
+            fmt: "csv" o "xlsx"
+            params: Filtros en crudo (date_from, date_to, user_id, project_id)
+
+        Returns:
+            ExportJob pendiente
+
+        Raises:
+            KeyError: Si la exportación no existe
+            ValueError: Si los filtros no son válidos
+            PermissionDenied: Si el usuario no tiene permiso
+        """
+        from apps.reporting.tasks import generate_export
+
+        definition = get_export(export_name)
+        ExportService.check_permission(user=user, definition=definition)
+        filters = parse_filters(params)
+
+        job = ExportJob.objects.create(
+            export_name=export_name,
+            format=fmt,
+            filters={key: str(value) for key, value in filters.items()},
+            requested_by=user,
+        )
+        transaction.on_commit(lambda: generate_export.delay(job.pk))
+        return job
+
+    @staticmethod
+    @traced
+    def run_export(*, job_id: int) -> ExportJob:
+        """
+        Generar el fichero de un ExportJob y guardarlo en el storage por defecto.
+
+        El fichero se escribe primero en un temporal en disco, así la memoria
+        del worker no crece con el número de filas.
+
+        Args:
+            job_id: ID del ExportJob
+
+        Returns:
+            ExportJob completado o fallido
+        """
+        job = ExportJob.objects.select_related("requested_by").get(pk=job_id)
+        job.status = ExportJob.Status.RUNNING
+        job.save(update_fields=["status", "updated_at"])
+
+        try:
+            definition = get_export(job.export_name)
+            rows = iter_rows(definition, user=job.requested_by, filters=parse_filters(job.filters))
+            with tempfile.TemporaryFile() as tmp:
+                if job.format == ExportJob.Format.XLSX:
+                    job.row_count = write_xlsx(
+                        tmp, definition.headers, rows, title=definition.title
+                    )
+                else:
+                    text = io.TextIOWrapper(tmp, encoding="utf-8", newline="")
+                    job.row_count = write_csv(text, definition.headers, rows)
+                    text.flush()
+                    text.detach()
+                tmp.seek(0)
+                filename = f"{job.export_name}-{job.pk}.{job.format}"
+                job.file.save(filename, File(tmp), save=False)
+            job.status = ExportJob.Status.DONE
+        except Exception as exc:
+            logger.exception(f"Error generando exportación {job.pk} ({job.export_name})")
+            job.status = ExportJob.Status.FAILED
+            job.error = str(exc)
+
+        job.finished_at = timezone.now()
+        job.save()
+        logger.info(
+            f"Exportación {job.pk} ({job.export_name}.{job.format}): "
+            f"{job.get_status_display()}, {job.row_count} filas"
+        )
+        ExportService._notify(job=job)
+        return job
+
+    @staticmethod
+    def _notify(*, job: ExportJob) -> None:
+        """Avisar por email al solicitante de que la exportación ha terminado."""
+        email = job.requested_by.email
+        if not email:
+            return
+        if job.status == ExportJob.Status.DONE:
+            url = settings.SITE_URL + reverse("reporting:export_job_download", args=[job.pk])
+            subject = f"Exportación lista: {job.export_name}"
+            message = f"Tu exportación ({job.row_count} filas) está disponible en {url}"
+        else:
+            subject = f"Exportación fallida: {job.export_name}"
+            message = (
+                "No se ha podido generar la exportación. Inténtalo de nuevo o contacta con soporte."
+            )
+        send_mail(subject, message, None, [email], fail_silently=True)
@@ -0,0 +1,43 @@
+"""
+Señales que mantienen los agregados de horas al día.
+
+Cada alta, cambio o baja de un TimeEntry encola (tras el commit) el refresco
+de los buckets afectados; si una entrada cambia de proyecto, persona o día se
+refrescan el bucket anterior y el nuevo.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.reporting.services import RollupService
+from apps.timetracking.models import TimeEntry
+
+
+def _bucket(instance: TimeEntry) -> tuple | None:
+    # Leer de __dict__ para no disparar queries con campos diferidos
+    values = instance.__dict__
+    key = (values.get("project_id"), values.get("user_id"), values.get("date"))
+    return key if None not in key else None
+
+
+@receiver(post_init, sender=TimeEntry)
+def time_entry_post_init(instance, **kwargs):
+    """Recordar el bucket original para detectar cambios de bucket al guardar."""
+    instance._rollup_bucket = _bucket(instance)
+
+
+@receiver(post_save, sender=TimeEntry)
+def time_entry_post_save(instance, **kwargs):
+    """Refrescar el bucket actual y, si ha cambiado, el anterior."""
+    keys = {_bucket(instance), getattr(instance, "_rollup_bucket", None)} - {None}
+    instance._rollup_bucket = _bucket(instance)
+    if keys:
+        RollupService.schedule_refresh(keys=keys)
+
+
+@receiver(post_delete, sender=TimeEntry)
+def time_entry_post_delete(instance, **kwargs):
+    """Refrescar el bucket de la entrada eliminada."""
+    key = _bucket(instance)
+    if key:
+        RollupService.schedule_refresh(keys=[key])
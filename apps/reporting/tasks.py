@@ -0,0 +1,33 @@
+from datetime import date, timedelta
+
+from celery import shared_task
+
+from django.utils import timezone
+
+from apps.reporting.services import ExportService, RollupService
+
+
+@shared_task(name="apps.reporting.tasks.refresh_time_rollups")
+def refresh_time_rollups(keys: list[list]) -> int:
+    """Recalcula los buckets [project_id, user_id, "YYYY-MM-DD"] afectados por cambios."""
+    return RollupService.refresh_buckets(
+        keys=[(project_id, user_id, date.fromisoformat(day)) for project_id, user_id, day in keys]
+    )
+
+
+@shared_task(name="apps.reporting.tasks.reconcile_time_rollups")
+def reconcile_time_rollups(days: int | None = None) -> dict[str, int]:
+    """
+    Reconciliación completa de los agregados (programada cada noche en beat).
+
+    Args:
+        days: Limitar a los últimos N días (None = reconstruir todo)
+    """
+    date_from = timezone.localdate() - timedelta(days=days) if days else None
+    return RollupService.rebuild(date_from=date_from)
+
+
+@shared_task(name="apps.reporting.tasks.generate_export")
+def generate_export(job_id: int) -> str:
+    """Genera el fichero de un ExportJob (cola batch) y avisa al solicitante."""
+    return ExportService.run_export(job_id=job_id).status
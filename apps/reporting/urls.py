@@ -0,0 +1,15 @@
+from django.urls import path
+
+from apps.reporting import views
+
+app_name = "reporting"
+
+urlpatterns = [
+    path("exports/<slug:name>/", views.export_download, name="export_download"),
+    path("exports/jobs/<int:job_id>/", views.export_job_status, name="export_job_status"),
+    path(
+        "exports/jobs/<int:job_id>/download/",
+        views.export_job_download,
+        name="export_job_download",
+    ),
+]
@@ -0,0 +1,151 @@
+import asyncio
+from tempfile import TemporaryFile
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.core.handlers.asgi import ASGIRequest
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.urls import reverse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+
+from apps.core.async_utils import aiter_sync
+from apps.core.decorators import query_budget
+from apps.reporting.exports import (
+    CONTENT_TYPES,
+    get_export,
+    iter_rows,
+    parse_filters,
+    stream_csv,
+    write_xlsx,
+)
+from apps.reporting.models import ExportJob
+from apps.reporting.selectors import aget_export_job, get_export_job
+from apps.reporting.services import ExportService
+
+
+def _job_payload(job: ExportJob) -> dict:
+    payload = {
+        "job_id": job.pk,
+        "status": job.status,
+        "row_count": job.row_count,
+        "status_url": reverse("reporting:export_job_status", args=[job.pk]),
+    }
+    if job.status == ExportJob.Status.DONE:
+        payload["download_url"] = reverse("reporting:export_job_download", args=[job.pk])
+    return payload
+
+
+@login_required
+@require_GET
+def export_download(request, name: str):
+    """
+    Descargar una exportación.
+
+    Query params: format (csv|xlsx), date_from, date_to, user_id, project_id,
+    async=1 para forzar la generación en segundo plano.
+
+    Las exportaciones de hasta EXPORT_SYNC_MAX_ROWS filas se sirven en la
+    propia request (CSV en streaming); las mayores se delegan a Celery y se
+    responde 202 con la URL de estado. En ASGI el CSV se entrega como
+    iterador async para que se siga enviando por bloques de EXPORT_CHUNK_SIZE
+    filas.
+    """
+    try:
+        definition = get_export(name)
+    except KeyError:
+        raise Http404(f"Exportación desconocida: {name}") from None
+    ExportService.check_permission(user=request.user, definition=definition)
+
+    fmt = request.GET.get("format", "csv")
+    if fmt not in CONTENT_TYPES:
+        return HttpResponseBadRequest(f"Formato no soportado: {fmt}")
+    try:
+        filters = parse_filters(request.GET)
+    except ValueError as exc:
+        return HttpResponseBadRequest(f"Filtros no válidos: {exc}")
+
+    max_rows = settings.EXPORT_SYNC_MAX_ROWS
+    # COUNT acotado: no recorre más de max_rows + 1 filas
+    too_large = definition.queryset(user=request.user, **filters)[: max_rows + 1].count() > max_rows
+    if request.GET.get("async") == "1" or too_large:
+        job = ExportService.start_export(
+            user=request.user, export_name=name, fmt=fmt, params=request.GET
+        )
+        return JsonResponse(_job_payload(job), status=202)
+
+    filename = f"{name}-{timezone.localdate():%Y%m%d}.{fmt}"
+    rows = iter_rows(definition, user=request.user, filters=filters)
+    if fmt == "xlsx":
+        # FileResponse cierra el fichero al terminar la respuesta; aquí solo
+        # hay que cerrarlo si falla antes de crearla
+        tmp = TemporaryFile()  # noqa: SIM115
+        try:
+            write_xlsx(tmp, definition.headers, rows, title=definition.title)
+            tmp.seek(0)
+            return FileResponse(
+                tmp, as_attachment=True, filename=filename, content_type=CONTENT_TYPES[fmt]
+            )
+        except BaseException:
+            tmp.close()
+            raise
+
+    content = stream_csv(definition.headers, rows)
+    if isinstance(request, ASGIRequest):
+        content = aiter_sync(content, chunk_size=settings.EXPORT_CHUNK_SIZE)
+    response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[fmt])
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+@login_required
+@require_GET
+@query_budget(exempt=True)
+async def export_job_status(request, job_id: int):
+    """
+    Estado de una exportación en segundo plano.
+
+    Con ``?wait=N`` hace long-polling: responde en cuanto la exportación
+    termina o tras N segundos (máx. EXPORT_STATUS_MAX_WAIT). En ASGI la espera
+    no ocupa el worker.
+    """
+    try:
+        wait = min(float(request.GET.get("wait") or 0), settings.EXPORT_STATUS_MAX_WAIT)
+    except ValueError:
+        return HttpResponseBadRequest("wait debe ser un número de segundos")
+
+    user = await request.auser()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        try:
+            job = await aget_export_job(job_id=job_id, user=user)
+        except ExportJob.DoesNotExist:
+            raise Http404 from None
+        if job.is_finished or loop.time() >= deadline:
+            return JsonResponse(_job_payload(job))
+        await asyncio.sleep(settings.EXPORT_STATUS_POLL_INTERVAL)
+
+
+@login_required
+@require_GET
+def export_job_download(request, job_id: int):
+    """Descargar el fichero generado por una exportación en segundo plano."""
+    try:
+        job = get_export_job(job_id=job_id, user=request.user)
+    except ExportJob.DoesNotExist:
+        raise Http404 from None
+    if job.status != ExportJob.Status.DONE or not job.file:
+        raise Http404("La exportación todavía no está disponible")
+    return FileResponse(
+        job.file.open("rb"),
+        as_attachment=True,
+        filename=job.file.name.rsplit("/", 1)[-1],
+        content_type=CONTENT_TYPES.get(job.format),
+    )
@@ -0,0 +1,44 @@
+from django.contrib import admin
+
+from apps.resources.models import Absence, Assignment, Holiday, Team, TeamMember, WorkCalendar
+
+
+class HolidayInline(admin.TabularInline):
+    model = Holiday
+    extra = 0
+
+
+@admin.register(WorkCalendar)
+class WorkCalendarAdmin(admin.ModelAdmin):
+    list_display = ("name", "region", "weekly_hours")
+    inlines = (HolidayInline,)
+
+
+@admin.register(Team)
+class TeamAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    search_fields = ("name",)
+
+
+@admin.register(TeamMember)
+class TeamMemberAdmin(admin.ModelAdmin):
+    list_display = ("user", "team", "calendar", "workload_percent")
+    list_filter = ("team", "calendar")
+    list_select_related = ("user", "team", "calendar")
+    raw_id_fields = ("user",)
+
+
+@admin.register(Absence)
+class AbsenceAdmin(admin.ModelAdmin):
+    list_display = ("user", "kind", "status", "start_date", "end_date", "minutes_per_day")
+    list_filter = ("kind", "status")
+    list_select_related = ("user",)
+    date_hierarchy = "start_date"
+    raw_id_fields = ("user",)
+
+
+@admin.register(Assignment)
+class AssignmentAdmin(admin.ModelAdmin):
+    list_display = ("user", "project", "percent", "start_date", "end_date")
+    list_select_related = ("user", "project")
+    raw_id_fields = ("user", "project")
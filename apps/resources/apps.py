@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ResourcesConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.resources"
+
+    def ready(self):
+        """Registrar señales que invalidan los calendarios de capacidad cacheados."""
+        import apps.resources.signals  # noqa
@@ -0,0 +1,391 @@
+"""
+Motor de capacidad: disponibilidad diaria por persona como arrays compactos.
+
+La capacidad de una persona en un mes son dos ``array('H')`` de un elemento
+por día (minutos): ``available`` (jornada del calendario por porcentaje de
+jornada, sin festivos ni ausencias aprobadas) y ``assigned`` (minutos
+comprometidos en proyectos según el porcentaje de cada asignación). Un mes
+ocupa 124 bytes y se cachea por (persona, mes).
+
+Las operaciones entre personas y rangos (sumas de equipo, tiempo libre,
+sobreasignación, solapes) se hacen día a día con ``map`` sobre funciones de
+``operator``, que iteran en C sin bucles Python por día. NumPy no se usa:
+solo está en las dependencias de ML y el proceso web no debe importarlo.
+
+Cache: cada persona tiene una versión (``CAPACITY_VERSION_KEY``) que forma
+parte de la clave de sus meses. Cambiar una ausencia, una asignación, su
+ficha o su calendario renueva la versión tras el commit (ver
+``apps.resources.signals``), lo que invalida todos sus meses a la vez
+aunque la asignación no tenga fecha de fin.
+"""
+
+from __future__ import annotations
+
+import calendar
+import logging
+import operator
+import uuid
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import partial
+from itertools import repeat
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from apps.resources.models import Absence, Assignment, Holiday, TeamMember
+
+logger = logging.getLogger(__name__)
+
+CAPACITY_VERSION_KEY = "capacity:version:{user_id}"
+CAPACITY_MONTH_KEY = "capacity:{user_id}:{month:%Y-%m}:{version}"
+
+# Minutos por persona y día (máx. 65535) y sumas de equipo
+_MINUTES = "H"
+_TOTALS = "L"
+_MAX_MINUTES = 0xFFFF
+
+
+def _zeros(typecode: str, days: int) -> array:
+    return array(typecode, [0]) * max(days, 0)
+
+
+def _clip(values: Iterable[int], low: int = 0, high: int | None = None) -> Iterator[int]:
+    values = map(partial(max, low), values)
+    return map(partial(min, high), values) if high is not None else values
+
+
+def _daily(func: Callable[[int, int], int], a: array, b: array) -> Iterator[int]:
+    """``func`` aplicada día a día a dos arrays del mismo tamaño."""
+    return map(func, a, b, strict=True)
+
+
+@dataclass(frozen=True)
+class Capacity:
+    """
+    Capacidad diaria de una persona (o suma de un equipo) desde ``start``.
+
+    Attributes:
+        start: Primer día
+        available: Minutos disponibles por día
+        assigned: Minutos asignados a proyectos por día
+    """
+
+    start: date
+    available: array
+    assigned: array
+
+    @property
+    def days(self) -> int:
+        return len(self.available)
+
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=self.days - 1)
+
+    def dates(self) -> Iterator[date]:
+        return (self.start + timedelta(days=i) for i in range(self.days))
+
+    @property
+    def free(self) -> array:
+        """Minutos sin asignar por día (0 si el día está sobreasignado)."""
+        return array(_TOTALS, _clip(_daily(operator.sub, self.available, self.assigned)))
+
+    @property
+    def overallocated(self) -> array:
+        """Minutos asignados por encima de lo disponible, por día."""
+        return array(_TOTALS, _clip(_daily(operator.sub, self.assigned, self.available)))
+
+    @property
+    def utilization(self) -> float | None:
+        """Fracción de lo disponible que está asignada (None si no hay disponibilidad)."""
+        available = sum(self.available)
+        return sum(self.assigned) / available if available else None
+
+    def slice(self, date_from: date, date_to: date) -> Capacity:
+        """Subrango ``[date_from, date_to]`` (acotado a los días disponibles)."""
+        first = max((date_from - self.start).days, 0)
+        last = min((date_to - self.start).days + 1, self.days)
+        return Capacity(
+            start=self.start + timedelta(days=first),
+            available=self.available[first:last],
+            assigned=self.assigned[first:last],
+        )
+
+    def __add__(self, other: Capacity) -> Capacity:
+        if (self.start, self.days) != (other.start, other.days):
+            raise ValueError("Solo se pueden sumar capacidades del mismo rango de días")
+        return Capacity(
+            start=self.start,
+            available=array(_TOTALS, _daily(operator.add, self.available, other.available)),
+            assigned=array(_TOTALS, _daily(operator.add, self.assigned, other.assigned)),
+        )
+
+    def to_dict(self) -> dict:
+        """Representación para props de Inertia y respuestas de la API."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "available": self.available.tolist(),
+            "assigned": self.assigned.tolist(),
+            "utilization": self.utilization,
+        }
+
+
+def empty_capacity(date_from: date, date_to: date) -> Capacity:
+    days = (date_to - date_from).days + 1
+    return Capacity(
+        start=date_from, available=_zeros(_TOTALS, days), assigned=_zeros(_TOTALS, days)
+    )
+
+
+def sum_capacity(capacities: Iterable[Capacity], *, date_from: date, date_to: date) -> Capacity:
+    """Capacidad total de varias personas en ``[date_from, date_to]``."""
+    total = empty_capacity(date_from, date_to)
+    for capacity in capacities:
+        total += capacity.slice(date_from, date_to)
+    return total
+
+
+def common_free_minutes(capacities: Iterable[Capacity]) -> array:
+    """
+    Minutos libres que todas las personas tienen a la vez, por día.
+
+    Útil para encontrar huecos comunes (reuniones, formación). Las
+    capacidades deben cubrir el mismo rango de días.
+    """
+    overlap = None
+    for capacity in capacities:
+        free = capacity.free
+        overlap = free if overlap is None else array(_TOTALS, _daily(min, overlap, free))
+    return overlap if overlap is not None else array(_TOTALS)
+
+
+def month_starts(date_from: date, date_to: date) -> list[date]:
+    """Primer día de cada mes que toca el rango."""
+    months = []
+    month = date_from.replace(day=1)
+    while month <= date_to:
+        months.append(month)
+        month = (month + timedelta(days=32)).replace(day=1)
+    return months
+
+
+def _month_end(month: date) -> date:
+    return month.replace(day=calendar.monthrange(month.year, month.month)[1])
+
+
+def _overlap(start: date, end: date | None, month: date, days: int) -> tuple[int, int] | None:
+    """Índices ``[a, b)`` del mes cubiertos por ``[start, end]`` (end None = abierto)."""
+    first = max((start - month).days, 0)
+    last = days if end is None else min((end - month).days + 1, days)
+    return (first, last) if first < last else None
+
+
+def build_month(
+    month: date,
+    *,
+    weekday_minutes: Sequence[int],
+    holidays: Iterable[date] = (),
+    absences: Iterable[tuple[date, date, int | None]] = (),
+    assignments: Iterable[tuple[date, date | None, int]] = (),
+) -> tuple[array, array]:
+    """
+    Arrays ``(available, assigned)`` de una persona en el mes de ``month``.
+
+    Args:
+        month: Primer día del mes
+        weekday_minutes: Minutos de jornada de lunes a domingo (ya ajustados
+            al porcentaje de jornada de la persona)
+        holidays: Festivos del calendario (se ignoran los de otros meses)
+        absences: (inicio, fin, minutos por día o None = día completo)
+        assignments: (inicio, fin o None, porcentaje)
+    """
+    days = _month_end(month).day
+    # Jornada semanal repetida 6 semanas: cualquier mes es un corte de la lista
+    offset = month.weekday()
+    working = array(_MINUTES, (list(weekday_minutes) * 6)[offset : offset + days])
+    for day in holidays:
+        if (day.year, day.month) == (month.year, month.month):
+            working[day.day - 1] = 0
+
+    available = array(_MINUTES, working)
+    for start, end, minutes in absences:
+        span = _overlap(start, end, month, days)
+        if span is None:
+            continue
+        a, b = span
+        if minutes is None:
+            available[a:b] = _zeros(_MINUTES, b - a)
+        else:
+            reduced = map(partial(operator.add, -minutes), available[a:b])
+            available[a:b] = array(_MINUTES, _clip(reduced))
+
+    percent = _zeros(_MINUTES, days)
+    for start, end, value in assignments:
+        span = _overlap(start, end, month, days)
+        if span is not None:
+            a, b = span
+            percent[a:b] = array(_MINUTES, map(partial(operator.add, value), percent[a:b]))
+    # working * percent // 100, sin pasar por floats
+    products = _daily(operator.mul, working, percent)
+    assigned = array(
+        _MINUTES,
+        _clip(map(operator.floordiv, products, repeat(100), strict=False), high=_MAX_MINUTES),
+    )
+    return available, assigned
+
+
+def _compute_months(
+    user_ids: Iterable[int], date_from: date, date_to: date
+) -> dict[tuple[int, date], tuple[array, array]]:
+    """Calcular los meses de ``[date_from, date_to]`` de varias personas (4 queries)."""
+    user_ids = list(user_ids)
+    months = month_starts(date_from, date_to)
+    first, last = months[0], _month_end(months[-1])
+
+    members = {
+        row["user_id"]: row
+        for row in TeamMember.objects.filter(user_id__in=user_ids).values(
+            "user_id", "calendar_id", "workload_percent", "calendar__weekday_minutes"
+        )
+    }
+    holidays: dict[int, set[date]] = {}
+    for calendar_id, day in Holiday.objects.filter(
+        calendar_id__in={member["calendar_id"] for member in members.values()},
+        date__range=(first, last),
+    ).values_list("calendar_id", "date"):
+        holidays.setdefault(calendar_id, set()).add(day)
+
+    absences: dict[int, list[tuple]] = {}
+    for user_id, *values in Absence.objects.filter(
+        user_id__in=user_ids,
+        status=Absence.Status.APPROVED,
+        start_date__lte=last,
+        end_date__gte=first,
+    ).values_list("user_id", "start_date", "end_date", "minutes_per_day"):
+        absences.setdefault(user_id, []).append(values)
+
+    assignments: dict[int, list[tuple]] = {}
+    for user_id, *values in (
+        Assignment.objects.filter(user_id__in=user_ids, start_date__lte=last)
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=first))
+        .values_list("user_id", "start_date", "end_date", "percent")
+    ):
+        assignments.setdefault(user_id, []).append(values)
+
+    computed = {}
+    for user_id in user_ids:
+        member = members.get(user_id)
+        if member is None:
+            # Sin ficha no hay calendario: capacidad cero
+            for month in months:
+                zeros = _zeros(_MINUTES, _month_end(month).day)
+                computed[user_id, month] = (zeros, zeros)
+            continue
+
+        week = [
+            minutes * member["workload_percent"] // 100
+            for minutes in member["calendar__weekday_minutes"]
+        ]
+        for month in months:
+            computed[user_id, month] = build_month(
+                month,
+                weekday_minutes=week,
+                holidays=holidays.get(member["calendar_id"], ()),
+                absences=absences.get(user_id, ()),
+                assignments=assignments.get(user_id, ()),
+            )
+    return computed
+
+
+def _get_versions(user_ids: list[int]) -> dict[int, str]:
+    keys = {CAPACITY_VERSION_KEY.format(user_id=user_id): user_id for user_id in user_ids}
+    cached = cache.get_many(keys)
+    versions = {keys[key]: version for key, version in cached.items()}
+    missing = {
+        key: uuid.uuid4().hex[:12] for key, user_id in keys.items() if user_id not in versions
+    }
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update({keys[key]: version for key, version in missing.items()})
+    return versions
+
+
+def get_capacity(*, user_ids: Iterable[int], date_from: date, date_to: date) -> dict[int, Capacity]:
+    """
+    Capacidad diaria de cada persona en ``[date_from, date_to]``.
+
+    Los meses se leen de cache; los que faltan se calculan juntos (4 queries
+    para todas las personas) y se guardan CAPACITY_CACHE_TTL segundos.
+
+    Returns:
+        user_id -> Capacity
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids or date_to < date_from:
+        return {}
+    months = month_starts(date_from, date_to)
+    versions = _get_versions(user_ids)
+    keys = {
+        CAPACITY_MONTH_KEY.format(user_id=user_id, month=month, version=versions[user_id]): (
+            user_id,
+            month,
+        )
+        for user_id in user_ids
+        for month in months
+    }
+
+    cached = cache.get_many(keys)
+    data = {}
+    for key, (available, assigned) in cached.items():
+        data[keys[key]] = (array(_MINUTES, available), array(_MINUTES, assigned))
+
+    missing = [bucket for bucket in keys.values() if bucket not in data]
+    if missing:
+        missing_users = {user_id for user_id, _ in missing}
+        missing_months = [month for _, month in missing]
+        computed = _compute_months(
+            missing_users, min(missing_months), _month_end(max(missing_months))
+        )
+        data.update(computed)
+        cache.set_many(
+            {
+                key: (data[bucket][0].tobytes(), data[bucket][1].tobytes())
+                for key, bucket in keys.items()
+                if bucket in computed
+            },
+            timeout=settings.CAPACITY_CACHE_TTL,
+        )
+        logger.debug(f"Capacidad calculada: {len(missing_users)} personas, {len(missing)} meses")
+
+    result = {}
+    for user_id in user_ids:
+        available = array(_MINUTES)
+        assigned = array(_MINUTES)
+        for month in months:
+            month_available, month_assigned = data[user_id, month]
+            available.extend(month_available)
+            assigned.extend(month_assigned)
+        result[user_id] = Capacity(start=months[0], available=available, assigned=assigned).slice(
+            date_from, date_to
+        )
+    return result
+
+
+def invalidate_capacity(user_ids: Iterable[int]) -> None:
+    """
+    Renovar la versión de capacidad de estas personas tras el commit.
+
+    Como en ``apps.core.inertia.invalidate_shared_props``: invalidar antes
+    del commit permitiría a una request concurrente cachear datos antiguos.
+    """
+    keys = [CAPACITY_VERSION_KEY.format(user_id=user_id) for user_id in set(user_ids)]
+    if keys:
+        transaction.on_commit(
+            lambda: cache.set_many(dict.fromkeys(keys, uuid.uuid4().hex[:12]), timeout=None)
+        )
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:48
+
+import datetime
+
+from django.db import migrations
+
+# Festivos nacionales de 2026 comunes a todas las comunidades. Los
+# autonómicos y locales se añaden desde el admin en un calendario propio.
+NATIONAL_HOLIDAYS_2026 = [
+    (datetime.date(2026, 1, 1), "Año Nuevo"),
+    (datetime.date(2026, 1, 6), "Epifanía del Señor"),
+    (datetime.date(2026, 4, 3), "Viernes Santo"),
+    (datetime.date(2026, 5, 1), "Fiesta del Trabajo"),
+    (datetime.date(2026, 8, 15), "Asunción de la Virgen"),
+    (datetime.date(2026, 10, 12), "Fiesta Nacional de España"),
+    (datetime.date(2026, 12, 8), "Inmaculada Concepción"),
+    (datetime.date(2026, 12, 25), "Natividad del Señor"),
+]
+
+
+def create_default_calendar(apps, schema_editor):
+    WorkCalendar = apps.get_model("resources", "WorkCalendar")
+    Holiday = apps.get_model("resources", "Holiday")
+    calendar, _ = WorkCalendar.objects.get_or_create(
+        name="España (37,5 h)",
+        defaults={"weekday_minutes": [450, 450, 450, 450, 450, 0, 0]},
+    )
+    for day, name in NATIONAL_HOLIDAYS_2026:
+        Holiday.objects.get_or_create(calendar=calendar, date=day, defaults={"name": name})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_default_calendar, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0002_default_calendar'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='absence',
+            options={'ordering': ('-start_date',)},
+        ),
+        migrations.AlterModelOptions(
+            name='assignment',
+            options={'ordering': ('-start_date',)},
+        ),
+        migrations.AlterModelOptions(
+            name='holiday',
+            options={'ordering': ('date',)},
+        ),
+        migrations.AlterModelOptions(
+            name='team',
+            options={'ordering': ('name',)},
+        ),
+        migrations.AlterModelOptions(
+            name='workcalendar',
+            options={'ordering': ('name',)},
+        ),
+    ]
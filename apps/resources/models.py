@@ -0,0 +1,153 @@
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+
+from apps.core.models import TimestampedModel
+
+# Jornada de 37,5 horas semanales de lunes a viernes (reducción de jornada
+# prevista para 2026), en minutos por día de la semana (lunes = 0)
+DEFAULT_WEEKDAY_MINUTES = [450, 450, 450, 450, 450, 0, 0]
+
+
+def default_weekday_minutes() -> list[int]:
+    return list(DEFAULT_WEEKDAY_MINUTES)
+
+
+class WorkCalendar(TimestampedModel):
+    """Calendario laboral: jornada por día de la semana y festivos."""
+
+    name = models.CharField(max_length=100, unique=True)
+    region = models.CharField(max_length=100, blank=True, help_text="Comunidad o municipio")
+    weekday_minutes = ArrayField(
+        models.PositiveSmallIntegerField(validators=[MaxValueValidator(24 * 60)]),
+        size=7,
+        default=default_weekday_minutes,
+        help_text="Minutos de jornada de lunes a domingo",
+    )
+
+    class Meta:
+        ordering = ("name",)
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def weekly_hours(self) -> float:
+        return sum(self.weekday_minutes) / 60
+
+
+class Holiday(models.Model):
+    """Festivo de un calendario laboral."""
+
+    calendar = models.ForeignKey(WorkCalendar, on_delete=models.CASCADE, related_name="holidays")
+    date = models.DateField()
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ("date",)
+        constraints = (
+            models.UniqueConstraint(fields=["calendar", "date"], name="holiday_unique_date"),
+        )
+
+    def __str__(self):
+        return f"{self.date} {self.name}"
+
+
+class Team(TimestampedModel):
+    """Equipo de personas."""
+
+    name = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        ordering = ("name",)
+
+    def __str__(self):
+        return self.name
+
+
+class TeamMember(TimestampedModel):
+    """Ficha de capacidad de una persona: equipo, calendario y jornada."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="team_member"
+    )
+    team = models.ForeignKey(
+        Team, on_delete=models.SET_NULL, null=True, blank=True, related_name="members"
+    )
+    calendar = models.ForeignKey(WorkCalendar, on_delete=models.PROTECT, related_name="members")
+    workload_percent = models.PositiveSmallIntegerField(
+        default=100,
+        validators=[MinValueValidator(1), MaxValueValidator(100)],
+        help_text="Porcentaje de jornada (jornada parcial < 100)",
+    )
+
+    def __str__(self):
+        return str(self.user)
+
+
+class Absence(TimestampedModel):
+    """Ausencia de una persona (vacaciones, baja, permiso) en un rango de días."""
+
+    class Kind(models.TextChoices):
+        VACATION = "vacation", "Vacaciones"
+        SICK_LEAVE = "sick_leave", "Baja"
+        LEAVE = "leave", "Permiso"
+
+    class Status(models.TextChoices):
+        REQUESTED = "requested", "Solicitada"
+        APPROVED = "approved", "Aprobada"
+        REJECTED = "rejected", "Rechazada"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="absences"
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.REQUESTED)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    # Ausencias parciales (p. ej. permiso de dos horas); vacío = día completo
+    minutes_per_day = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-start_date",)
+        indexes = (models.Index(fields=["user", "start_date", "end_date"]),)
+        constraints = (
+            models.CheckConstraint(
+                condition=models.Q(end_date__gte=models.F("start_date")),
+                name="absence_valid_range",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.user} {self.get_kind_display()} {self.start_date} - {self.end_date}"
+
+
+class Assignment(TimestampedModel):
+    """Dedicación de una persona a un proyecto, en porcentaje de su jornada."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="assignments"
+    )
+    project = models.ForeignKey(
+        "projects.Project", on_delete=models.CASCADE, related_name="assignments"
+    )
+    percent = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(100)]
+    )
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True, help_text="Vacío = sin fecha de fin")
+
+    class Meta:
+        ordering = ("-start_date",)
+        indexes = (models.Index(fields=["user", "start_date"]),)
+        constraints = (
+            models.CheckConstraint(
+                condition=models.Q(end_date__isnull=True)
+                | models.Q(end_date__gte=models.F("start_date")),
+                name="assignment_valid_range",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.user} → {self.project} {self.percent}%"
@@ -0,0 +1,73 @@
+"""
+Selectors de capacidad de equipos (Gestión de Equipo).
+
+Leen del primario, no de la réplica: los meses calculados se cachean y un
+dato leído con lag quedaría cacheado hasta el siguiente cambio.
+"""
+
+from datetime import date
+
+from apps.resources.capacity import Capacity, get_capacity, sum_capacity
+from apps.resources.models import TeamMember
+from config.telemetry import traced
+
+
+def get_team_member_ids(*, team_id: int) -> list[int]:
+    return list(TeamMember.objects.filter(team_id=team_id).values_list("user_id", flat=True))
+
+
+@traced
+def get_team_capacity(*, team_id: int, date_from: date, date_to: date) -> dict:
+    """
+    Capacidad diaria de un equipo: total y por persona.
+
+    Returns:
+        Dict con ``total`` (Capacity) y ``members`` (user_id -> Capacity)
+    """
+    members = get_capacity(
+        user_ids=get_team_member_ids(team_id=team_id), date_from=date_from, date_to=date_to
+    )
+    return {
+        "total": sum_capacity(members.values(), date_from=date_from, date_to=date_to),
+        "members": members,
+    }
+
+
+@traced
+def get_overallocated_people(*, user_ids: list[int], date_from: date, date_to: date) -> list[dict]:
+    """
+    Personas con más minutos asignados que disponibles algún día del rango.
+
+    Returns:
+        Dicts con user_id, días sobreasignados (fechas) y minutos de exceso,
+        de más a menos exceso
+    """
+    result = []
+    for user_id, capacity in get_capacity(
+        user_ids=user_ids, date_from=date_from, date_to=date_to
+    ).items():
+        excess = capacity.overallocated
+        total = sum(excess)
+        if not total:
+            continue
+        result.append(
+            {
+                "user_id": user_id,
+                "days": [
+                    day for day, minutes in zip(capacity.dates(), excess, strict=True) if minutes
+                ],
+                "excess_minutes": total,
+            }
+        )
+    result.sort(key=lambda row: row["excess_minutes"], reverse=True)
+    return result
+
+
+@traced
+def get_availability_percent(*, user_id: int, date_from: date, date_to: date) -> float | None:
+    """Porcentaje libre de la capacidad de una persona en el rango (None sin jornada)."""
+    capacity: Capacity = get_capacity(user_ids=[user_id], date_from=date_from, date_to=date_to)[
+        user_id
+    ]
+    utilization = capacity.utilization
+    return None if utilization is None else round(max(1 - utilization, 0) * 100, 1)
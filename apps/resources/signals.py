@@ -0,0 +1,51 @@
+"""
+Invalidación de los calendarios de capacidad cacheados (apps.resources.capacity).
+
+Ausencias, asignaciones y fichas invalidan a su persona (y a la anterior si
+se reasignan); festivos y calendarios, a todas las personas del calendario.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.resources.capacity import invalidate_capacity
+from apps.resources.models import Absence, Assignment, Holiday, TeamMember, WorkCalendar
+
+
+def _calendar_members(calendar_id: int) -> list[int]:
+    return list(
+        TeamMember.objects.filter(calendar_id=calendar_id).values_list("user_id", flat=True)
+    )
+
+
+@receiver(post_init, sender=Absence)
+@receiver(post_init, sender=Assignment)
+@receiver(post_init, sender=TeamMember)
+def person_record_post_init(instance, **kwargs):
+    """Recordar la persona original para invalidarla también si cambia."""
+    # Leer de __dict__ para no disparar queries con campos diferidos
+    instance._capacity_user_id = instance.__dict__.get("user_id")
+
+
+@receiver(post_save, sender=Absence)
+@receiver(post_save, sender=Assignment)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=Absence)
+@receiver(post_delete, sender=Assignment)
+@receiver(post_delete, sender=TeamMember)
+def person_record_changed(instance, **kwargs):
+    user_ids = {instance.user_id, getattr(instance, "_capacity_user_id", None)} - {None}
+    instance._capacity_user_id = instance.user_id
+    invalidate_capacity(user_ids)
+
+
+@receiver(post_save, sender=Holiday)
+@receiver(post_delete, sender=Holiday)
+def holiday_changed(instance, **kwargs):
+    invalidate_capacity(_calendar_members(instance.calendar_id))
+
+
+@receiver(post_save, sender=WorkCalendar)
+def calendar_changed(instance, created, **kwargs):
+    if not created:
+        invalidate_capacity(_calendar_members(instance.pk))
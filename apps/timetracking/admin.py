@@ -0,0 +1,12 @@
+from django.contrib import admin
+
+from apps.timetracking.models import TimeEntry
+
+
+@admin.register(TimeEntry)
+class TimeEntryAdmin(admin.ModelAdmin):
+    list_display = ("date", "user", "project", "hours", "billable")
+    list_filter = ("billable", "source", "date")
+    list_select_related = ("user", "project")
+    date_hierarchy = "date"
+    raw_id_fields = ("user", "project")
@@ -0,0 +1,14 @@
+import django_filters
+
+from apps.timetracking.models import TimeEntry
+
+
+class TimeEntryFilter(django_filters.FilterSet):
+    """Filtros del listado de horas (``?date_from=&date_to=&project=&user=&billable=``)."""
+
+    date_from = django_filters.DateFilter(field_name="date", lookup_expr="gte")
+    date_to = django_filters.DateFilter(field_name="date", lookup_expr="lte")
+
+    class Meta:
+        model = TimeEntry
+        fields = ("project", "user", "billable")
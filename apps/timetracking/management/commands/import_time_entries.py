@@ -0,0 +1,69 @@
+import csv
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.timetracking.services import TimeEntryImportService
+
+
+def _read_rows(path: Path) -> Iterator[dict]:
+    """Filas de un CSV con cabecera o de un JSON Lines (un objeto por línea)."""
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa entradas de horas desde un CSV o JSON Lines (external_id, user_id, "
+        "project_id, date, hours, billable, description). Las filas con errores se "
+        "omiten y se listan al final."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path, help="Fichero .csv o .jsonl")
+        parser.add_argument(
+            "--source", required=True, help="Origen de la importación (p. ej. kronos)"
+        )
+        parser.add_argument("--batch-size", type=int, help="Filas por lote")
+        parser.add_argument("--dry-run", action="store_true", help="Validar sin guardar cambios")
+        parser.add_argument(
+            "--max-errors", type=int, default=50, help="Errores a mostrar (default: 50)"
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path.exists():
+            raise CommandError(f"No existe el fichero {path}")
+
+        started = time.perf_counter()
+        result = TimeEntryImportService.import_rows(
+            rows=_read_rows(path),
+            source=options["source"],
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+        elapsed = time.perf_counter() - started
+
+        for error in result.errors[: options["max_errors"]]:
+            self.stderr.write(f"Fila {error.row} [{error.field}]: {error.message}")
+        if len(result.errors) > options["max_errors"]:
+            self.stderr.write(f"... y {len(result.errors) - options['max_errors']} errores más")
+
+        rows = result.imported + len({error.row for error in result.errors})
+        summary = (
+            f"{result.created} creadas, {result.updated} actualizadas, "
+            f"{result.unchanged} sin cambios, {len(result.errors)} errores "
+            f"({rows / elapsed:,.0f} filas/s)"
+        )
+        if options["dry_run"]:
+            summary = f"[dry run] {summary}"
+        style = self.style.WARNING if result.errors else self.style.SUCCESS
+        self.stdout.write(style(summary))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimeEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('date', models.DateField()),
+                ('hours', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('billable', models.BooleanField(default=True)),
+                ('description', models.TextField(blank=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='time_entries', to='projects.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='time_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'time entries',
+                'ordering': ['-date', '-created_at'],
+                'indexes': [models.Index(fields=['project', 'user', 'date'], name='timetrackin_project_89f858_idx'), models.Index(fields=['user', 'date'], name='timetrackin_user_id_e99a43_idx'), models.Index(fields=['date'], name='timetrackin_date_7d698b_idx')],
+            },
+        ),
+    ]
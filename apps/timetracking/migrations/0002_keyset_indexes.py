@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        ('timetracking', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='timeentry',
+            name='timetrackin_user_id_e99a43_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='timeentry',
+            name='timetrackin_date_7d698b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='timeentry',
+            index=models.Index(fields=['user', 'date', 'id'], name='timetrackin_user_id_4ab485_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timeentry',
+            index=models.Index(fields=['date', 'id'], name='timetrackin_date_a5d61a_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('timetracking', '0003_import_source'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='timeentry',
+            options={'ordering': ('-date', '-created_at'), 'verbose_name_plural': 'time entries'},
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.db import models
+
+from apps.core.models import TimestampedModel
+
+
+class TimeEntry(TimestampedModel):
+    """Registro de horas de una persona en un proyecto y día."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="time_entries",
+    )
+    project = models.ForeignKey(
+        "projects.Project",
+        on_delete=models.PROTECT,
+        related_name="time_entries",
+    )
+    date = models.DateField()
+    hours = models.DecimalField(max_digits=5, decimal_places=2)
+    billable = models.BooleanField(default=True)
+    description = models.TextField(blank=True)
+    # Origen e identificador externo de las entradas importadas (vacíos en
+    # altas manuales): reimportar el mismo fichero actualiza en vez de duplicar
+    source = models.CharField(max_length=50, blank=True, default="")
+    external_id = models.CharField(max_length=100, blank=True, default="")
+
+    class Meta:
+        ordering = ("-date", "-created_at")
+        verbose_name_plural = "time entries"
+        indexes = (
+            # Recalcular un bucket (proyecto, persona, día) de los agregados
+            models.Index(fields=["project", "user", "date"]),
+            # Listados paginados por cursor en orden (-date, -id)
+            models.Index(fields=["user", "date", "id"]),
+            models.Index(fields=["date", "id"]),
+        )
+        constraints = (
+            models.UniqueConstraint(
+                fields=["source", "external_id"],
+                condition=~models.Q(external_id=""),
+                name="timeentry_unique_external_id",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.user_id} · {self.project_id} · {self.date} ({self.hours}h)"
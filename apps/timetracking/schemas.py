@@ -0,0 +1,25 @@
+"""
+Esquemas de validación de las importaciones de horas (pydantic).
+
+Los valores llegan como texto (CSV) o JSON de integraciones: pydantic los
+convierte en modo lax ("7.5" → Decimal, "true" → bool, "2026-01-15" → date).
+"""
+
+import datetime as dt
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TimeEntryImportRow(BaseModel):
+    """Una fila de fichaje o parte de horas a importar."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore", frozen=True)
+
+    external_id: str = Field(min_length=1, max_length=100)
+    user_id: int = Field(gt=0)
+    project_id: int = Field(gt=0)
+    date: dt.date
+    hours: Decimal = Field(gt=0, le=24, max_digits=5, decimal_places=2)
+    billable: bool = True
+    description: str = ""
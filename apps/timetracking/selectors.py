@@ -0,0 +1,22 @@
+"""
+Selectors de registro de horas.
+"""
+
+from django.db.models import QuerySet
+
+from apps.core.db import replica_selector
+from apps.timetracking.models import TimeEntry
+
+
+@replica_selector
+def get_visible_time_entries(*, user) -> QuerySet[TimeEntry]:
+    """
+    Entradas de horas que puede consultar ``user``.
+
+    Con el permiso ``timetracking.view_timeentry`` todas; sin él, solo las
+    propias.
+    """
+    qs = TimeEntry.objects.all()
+    if not user.has_perm("timetracking.view_timeentry"):
+        qs = qs.filter(user=user)
+    return qs
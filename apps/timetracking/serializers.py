@@ -0,0 +1,21 @@
+from typing import ClassVar
+
+from apps.core.serializers import ValuesSerializer
+from apps.timetracking.models import TimeEntry
+
+
+class TimeEntryRowSerializer(ValuesSerializer):
+    """Fila del listado de horas (sin instancias de TimeEntry ni de Project)."""
+
+    class Meta:
+        model = TimeEntry
+        fields: ClassVar[dict[str, str]] = {
+            "id": "id",
+            "date": "date",
+            "user_id": "user_id",
+            "project_id": "project_id",
+            "project_name": "project__name",
+            "hours": "hours",
+            "billable": "billable",
+            "description": "description",
+        }
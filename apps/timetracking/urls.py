@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.timetracking import views
+
+app_name = "timetracking"
+
+urlpatterns = [
+    path("entries/", views.TimeEntryListAPIView.as_view(), name="time_entry_list"),
+]
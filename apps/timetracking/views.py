@@ -0,0 +1,23 @@
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAuthenticated
+
+from apps.timetracking.filters import TimeEntryFilter
+from apps.timetracking.selectors import get_visible_time_entries
+from apps.timetracking.serializers import TimeEntryRowSerializer
+
+
+class TimeEntryListAPIView(ListAPIView):
+    """
+    Listado de horas para integraciones, paginado por cursor.
+
+    El orden (-date, -id) lo cubren los índices (date, id) y
+    (user, date, id): cada página es un rango del índice, sin OFFSET.
+    """
+
+    permission_classes = (IsAuthenticated,)
+    serializer_class = TimeEntryRowSerializer
+    filterset_class = TimeEntryFilter
+    ordering = ("-date", "-id")
+
+    def get_queryset(self):
+        return TimeEntryRowSerializer.values(get_visible_time_entries(user=self.request.user))
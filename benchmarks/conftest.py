@@ -0,0 +1,123 @@
+"""
+Configuración de los microbenchmarks (``pytest benchmarks -m perf``).
+
+Opciones:
+    --bench-rounds N         Ejecuciones medidas por benchmark (default: 30)
+    --bench-tolerance F      Regresión de tiempo tolerada (default: 0.25 = +25%)
+    --bench-min-delta-ms F   Diferencia mínima para contar como regresión (default: 1.0)
+    --update-baselines       Guardar los resultados como nuevas baselines
+
+Al terminar se escriben los resultados en ``benchmarks/results/micro.json``
+y, si algún benchmark empeora respecto a ``benchmarks/baselines/micro.json``,
+la sesión termina con fallo.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from benchmarks.data import Dataset, seed_dataset
+from benchmarks.harness import (
+    BASELINES_DIR,
+    RESULTS_DIR,
+    Measurement,
+    compare,
+    load_baselines,
+    measure,
+    save_results,
+)
+
+BASELINE_NAME = "micro"
+
+_results_key = pytest.StashKey[dict[str, Measurement]]()
+_regressions_key = pytest.StashKey[list[str]]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-rounds", type=int, default=30, help="Ejecuciones medidas")
+    group.addoption("--bench-tolerance", type=float, default=0.25, help="Regresión tolerada")
+    group.addoption("--bench-min-delta-ms", type=float, default=1.0, help="Diferencia mínima")
+    group.addoption(
+        "--update-baselines", action="store_true", help="Guardar resultados como baselines"
+    )
+
+
+def pytest_configure(config):
+    config.stash[_results_key] = {}
+    config.stash[_regressions_key] = []
+
+
+def _bench_id(node: pytest.Item) -> str:
+    return node.nodeid.removeprefix("benchmarks/")
+
+
+@pytest.fixture(scope="session")
+def dataset(django_db_setup, django_db_blocker) -> Dataset:
+    """Dataset sintético sembrado una vez por sesión (ver ``benchmarks.data``)."""
+    with django_db_blocker.unblock():
+        return seed_dataset()
+
+
+@pytest.fixture
+def perf(request) -> Callable[..., Measurement]:
+    """
+    Medir una función y registrar el resultado para compararlo con la baseline.
+
+    Example:
+        def test_hours_series(perf, dataset):
+            perf(lambda: list(get_hours_series(period="week")))
+    """
+
+    def run(func: Callable[[], Any], *, rounds: int | None = None, warmup: int = 2) -> Measurement:
+        measurement = measure(
+            func, rounds=rounds or request.config.getoption("bench_rounds"), warmup=warmup
+        )
+        request.config.stash[_results_key][_bench_id(request.node)] = measurement
+        return measurement
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    results = config.stash.get(_results_key, {})
+    if not results:
+        return
+    save_results(BASELINE_NAME, results, directory=RESULTS_DIR)
+    if config.getoption("update_baselines"):
+        save_results(BASELINE_NAME, results, directory=BASELINES_DIR)
+        return
+
+    regressions = compare(
+        results,
+        load_baselines(BASELINE_NAME),
+        tolerance=config.getoption("bench_tolerance"),
+        min_delta_ms=config.getoption("bench_min_delta_ms"),
+    )
+    config.stash[_regressions_key] = regressions
+    if regressions and exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    results = config.stash.get(_results_key, {})
+    if not results:
+        return
+    baselines = load_baselines(BASELINE_NAME)
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<60} {'mediana ms':>11} {'p95 ms':>9} {'queries':>8} {'baseline ms':>12}"
+    )
+    for key, m in sorted(results.items()):
+        base_ms = baselines.get(key, {}).get("median_ms")
+        base = f"{base_ms:.2f}" if base_ms is not None else "-"
+        terminalreporter.write_line(
+            f"{key:<60} {m.median_ms:>11.2f} {m.p95_ms:>9.2f} {m.queries:>8} {base:>12}"
+        )
+
+    if config.getoption("update_baselines"):
+        terminalreporter.write_line(f"\nBaselines actualizadas en {BASELINES_DIR}")
+    for regression in config.stash.get(_regressions_key, []):
+        terminalreporter.write_line(f"REGRESIÓN {regression}", red=True)
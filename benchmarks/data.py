@@ -0,0 +1,119 @@
+"""
+Dataset sintético compartido por los microbenchmarks y la prueba de carga.
+
+Tamaño por defecto parecido a un trimestre de la empresa: 40 personas,
+25 proyectos y ~3 entradas de horas por persona y día laborable. Los datos
+se identifican por el prefijo ``bench-`` en usuarios y proyectos para poder
+reutilizarlos (``seed_dataset`` es idempotente) o borrarlos.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from apps.projects.models import Project
+from apps.reporting.services import RollupService
+from apps.timetracking.models import TimeEntry
+
+PREFIX = "bench-"
+PASSWORD = "bench-password"
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Identificadores y rango del dataset sembrado."""
+
+    user_ids: list[int]
+    project_ids: list[int]
+    date_from: date
+    date_to: date
+    entries: int
+
+
+@transaction.atomic
+def seed_dataset(
+    *,
+    users: int = 40,
+    projects: int = 25,
+    days: int = 90,
+    entries_per_day: int = 3,
+    date_to: date = date(2025, 3, 30),
+    seed: int = 10,
+) -> Dataset:
+    """
+    Crear (o reutilizar) el dataset de benchmark.
+
+    Si ya existen usuarios ``bench-`` se devuelve el dataset existente sin
+    tocarlo: los números solo son comparables con los mismos datos.
+    """
+    user_model = get_user_model()
+    date_from = date_to - timedelta(days=days - 1)
+
+    existing = list(
+        user_model.objects.filter(username__startswith=PREFIX)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    if existing:
+        project_ids = list(
+            Project.objects.filter(name__startswith=PREFIX)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        return Dataset(
+            user_ids=existing,
+            project_ids=project_ids,
+            date_from=date_from,
+            date_to=date_to,
+            entries=TimeEntry.objects.filter(user_id__in=existing).count(),
+        )
+
+    rng = random.Random(seed)
+    people = [
+        user_model(username=f"{PREFIX}{i:03d}", email=f"{PREFIX}{i:03d}@10code.es")
+        for i in range(users)
+    ]
+    for person in people:
+        person.set_password(PASSWORD)
+    people = user_model.objects.bulk_create(people)
+    owners = Project.objects.bulk_create(
+        Project(
+            name=f"{PREFIX}proyecto-{i:02d}",
+            client=f"Cliente {i % 7}",
+            status=Project.Status.ACTIVE,
+            created_by=people[i % users],
+        )
+        for i in range(projects)
+    )
+
+    entries = []
+    for offset in range(days):
+        day = date_from + timedelta(days=offset)
+        if day.weekday() >= 5:
+            continue
+        for person in people:
+            for _ in range(entries_per_day):
+                entries.append(
+                    TimeEntry(
+                        user=person,
+                        project=rng.choice(owners),
+                        date=day,
+                        hours=Decimal(rng.choice(("0.50", "1.00", "2.00", "2.50", "4.00"))),
+                        billable=rng.random() < 0.7,
+                        description="Desarrollo y revisión de PRs",
+                    )
+                )
+    TimeEntry.objects.bulk_create(entries, batch_size=5000)
+    RollupService.rebuild(date_from=date_from, date_to=date_to)
+
+    return Dataset(
+        user_ids=[person.pk for person in people],
+        project_ids=[project.pk for project in owners],
+        date_from=date_from,
+        date_to=date_to,
+        entries=len(entries),
+    )
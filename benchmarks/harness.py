@@ -0,0 +1,144 @@
+"""
+Medición y comparación con baselines de los benchmarks.
+
+Cada medición guarda mediana y p95 en ms, el número de queries de una
+ejecución (microbenchmarks) y el throughput en operaciones/s (prueba de
+carga). Las baselines son JSON versionados en ``benchmarks/baselines/``:
+
+    {
+      "benchmarks": {
+        "<id>": {"median_ms": 4.2, "p95_ms": 5.1, "queries": 1, ...},
+        ...
+      }
+    }
+
+Se considera regresión:
+- queries: cualquier aumento (son deterministas, no dependen de la máquina)
+- tiempo: mediana por encima de ``baseline * (1 + tolerance)`` y al menos
+  ``min_delta_ms`` más lenta (evita falsos positivos en medidas de 1-2 ms)
+- throughput: por debajo de ``baseline * (1 - tolerance)``
+
+Un valor nulo en la baseline desactiva esa comparación (los tiempos solo son
+comparables en la misma máquina: se fijan con ``make bench-baseline`` en la
+máquina de referencia).
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from django.db import connections
+
+from apps.core.query_budget import track_queries
+
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Measurement:
+    """Resultado de un benchmark."""
+
+    median_ms: float
+    p95_ms: float
+    queries: int | None
+    rounds: int
+    throughput: float | None = None
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Percentil por el método del rango más cercano."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(func: Callable[[], Any], *, rounds: int, warmup: int = 2) -> Measurement:
+    """
+    Ejecutar ``func`` ``warmup + rounds`` veces y medir las ``rounds`` últimas.
+
+    Las queries se cuentan en una ejecución aparte, fuera de la medición de
+    tiempo, para no sumar el coste del tracking.
+    """
+    for _ in range(warmup):
+        func()
+    with track_queries() as stats:
+        func()
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return Measurement(
+        median_ms=round(statistics.median(samples), 3),
+        p95_ms=round(percentile(samples, 95), 3),
+        queries=stats.count,
+        rounds=rounds,
+    )
+
+
+def load_baselines(name: str) -> dict[str, dict[str, Any]]:
+    path = BASELINES_DIR / f"{name}.json"
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["benchmarks"]
+
+
+def save_results(name: str, results: dict[str, Measurement], *, directory: Path) -> Path:
+    """Escribir ``results`` en ``<directory>/<name>.json``, conservando el resto de claves."""
+    path = directory / f"{name}.json"
+    current = json.loads(path.read_text())["benchmarks"] if path.exists() else {}
+    current.update({key: asdict(measurement) for key, measurement in results.items()})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "database": connections["default"].vendor,
+        "benchmarks": dict(sorted(current.items())),
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+    return path
+
+
+def compare(
+    results: dict[str, Measurement],
+    baselines: dict[str, dict[str, Any]],
+    *,
+    tolerance: float,
+    min_delta_ms: float,
+) -> list[str]:
+    """
+    Comparar resultados con baselines.
+
+    Returns:
+        Lista de regresiones (vacía si todo está dentro de tolerancia)
+    """
+    regressions = []
+    for key, measurement in sorted(results.items()):
+        baseline = baselines.get(key)
+        if baseline is None:
+            continue
+        base_queries = baseline.get("queries")
+        if None not in (base_queries, measurement.queries) and measurement.queries > base_queries:
+            regressions.append(f"{key}: {measurement.queries} queries (baseline {base_queries})")
+        base_ms = baseline.get("median_ms")
+        if base_ms is not None:
+            delta = measurement.median_ms - base_ms
+            if measurement.median_ms > base_ms * (1 + tolerance) and delta >= min_delta_ms:
+                regressions.append(
+                    f"{key}: mediana {measurement.median_ms:.2f} ms "
+                    f"(baseline {base_ms:.2f} ms, +{delta / base_ms:.0%})"
+                )
+        base_throughput = baseline.get("throughput")
+        if (
+            base_throughput is not None
+            and measurement.throughput is not None
+            and measurement.throughput < base_throughput * (1 - tolerance)
+        ):
+            regressions.append(
+                f"{key}: {measurement.throughput:.1f} op/s (baseline {base_throughput:.1f} op/s)"
+            )
+    return regressions
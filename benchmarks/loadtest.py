@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+"""
+Prueba de carga contra el stack completo de compose.yml.
+
+Dos fases:
+1. HTTP: C clientes concurrentes (cada uno con la sesión de un usuario
+   ``bench-`` distinto) lanzan N requests con una mezcla de escenarios
+   (listado de horas, filtros, paginación por cursor, exportación CSV,
+   readyz). Mide p50/p95 por escenario y requests/s totales.
+2. Celery: encola T tareas ``refresh_time_rollups`` y espera a que los
+   workers las terminen. Mide tareas/s y la espera en cola media
+   (métricas de ``apps.core.celery_metrics``).
+
+Se ejecuta dentro del contenedor web, con el stack levantado sin el override
+de desarrollo (gunicorn en lugar de runserver):
+
+    docker compose -f compose.yml up -d
+    docker compose -f compose.yml exec web python benchmarks/loadtest.py
+
+Siembra el dataset de ``benchmarks.data`` la primera vez. Los resultados se
+escriben en ``benchmarks/results/load.json`` y se comparan con
+``benchmarks/baselines/load.json`` si existe (sale con código 1 si hay
+regresiones).
+Subir API_THROTTLE_USER en el stack si la mezcla supera el límite por usuario:
+las respuestas 429 se cuentan aparte.
+
+Uso:
+    python benchmarks/loadtest.py [--base-url http://localhost:8000] [--requests 3000]
+        [--concurrency 32] [--tasks 200] [--update-baseline] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from benchmarks.data import Dataset
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+BASELINE_NAME = "load"
+
+# (escenario, peso): proporción aproximada del tráfico real de la intranet
+SCENARIOS = (
+    ("entries_first_page", 5),
+    ("entries_filtered", 3),
+    ("entries_walk", 1),
+    ("export_csv_week", 1),
+    ("readyz", 1),
+)
+
+
+def prepare_sessions(count: int) -> tuple[list[str], Dataset]:
+    """Sembrar el dataset y abrir una sesión por cliente (cookies ``sessionid``)."""
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Permission
+    from django.test import Client
+
+    from benchmarks.data import seed_dataset
+
+    dataset = seed_dataset()
+    permission = Permission.objects.get(
+        content_type__app_label="timetracking", codename="view_timeentry"
+    )
+    cookies = []
+    for user in get_user_model().objects.filter(pk__in=dataset.user_ids[:count]):
+        # Exportaciones y listado completo requieren ver todas las horas
+        user.user_permissions.add(permission)
+        client = Client()
+        client.force_login(user)
+        cookies.append(client.cookies[settings.SESSION_COOKIE_NAME].value)
+    return cookies, dataset
+
+
+def build_request(scenario: str, dataset: Dataset, rng: random.Random) -> str:
+    """URL de una request del escenario."""
+    if scenario == "entries_first_page":
+        return "/api/timetracking/entries/"
+    if scenario == "entries_filtered":
+        project_id = rng.choice(dataset.project_ids)
+        return f"/api/timetracking/entries/?project={project_id}&date_from={dataset.date_from}"
+    if scenario == "export_csv_week":
+        date_from = dataset.date_to - timedelta(days=6)
+        return (
+            f"/reporting/exports/time_entries/?format=csv"
+            f"&date_from={date_from}&date_to={dataset.date_to}"
+        )
+    if scenario == "readyz":
+        return "/readyz/"
+    raise ValueError(scenario)
+
+
+async def run_http(args: argparse.Namespace, cookies: list[str], dataset: Dataset) -> dict:
+    """Fase HTTP: latencias por escenario y requests/s."""
+    from django.conf import settings
+
+    rng = random.Random(args.seed)
+    names = [name for name, _ in SCENARIOS]
+    weights = [weight for _, weight in SCENARIOS]
+    plan = rng.choices(names, weights=weights, k=args.requests)
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    counters = {"errors": 0, "throttled": 0}
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for scenario in plan:
+        queue.put_nowait(scenario)
+
+    async def timed_get(client: httpx.AsyncClient, scenario: str, url: str) -> dict | None:
+        started = time.perf_counter()
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError:
+            counters["errors"] += 1
+            return None
+        if response.status_code == 429:
+            counters["throttled"] += 1
+            return None
+        if response.status_code != 200:
+            counters["errors"] += 1
+            return None
+        await response.aread()
+        latencies[scenario].append((time.perf_counter() - started) * 1000)
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.json()
+        return None
+
+    async def worker(cookie: str) -> None:
+        async with httpx.AsyncClient(
+            base_url=args.base_url,
+            cookies={settings.SESSION_COOKIE_NAME: cookie},
+            timeout=60.0,
+        ) as client:
+            while not queue.empty():
+                scenario = queue.get_nowait()
+                if scenario == "entries_walk":
+                    # Recorrer 5 páginas siguiendo el cursor
+                    url = "/api/timetracking/entries/"
+                    for _ in range(5):
+                        page = await timed_get(client, scenario, url)
+                        if not page or not page.get("next"):
+                            break
+                        url = page["next"]
+                else:
+                    await timed_get(client, scenario, build_request(scenario, dataset, rng))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(cookie) for cookie in cookies))
+    elapsed = time.perf_counter() - started
+
+    total = sum(len(samples) for samples in latencies.values())
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "rps": round(total / elapsed, 1),
+        "latencies": latencies,
+        **counters,
+    }
+
+
+def run_celery(args: argparse.Namespace, dataset: Dataset) -> dict:
+    """Fase Celery: tareas/s con los workers del stack y espera media en cola."""
+    from apps.core.celery_metrics import get_task_stats
+    from apps.reporting.tasks import refresh_time_rollups
+
+    task_name = refresh_time_rollups.name
+    before = get_task_stats([task_name]).get(task_name, {})
+    buckets = [
+        [project_id, user_id, dataset.date_to.isoformat()]
+        for user_id in dataset.user_ids
+        for project_id in dataset.project_ids
+    ]
+
+    started = time.perf_counter()
+    results = [
+        refresh_time_rollups.delay(buckets[(i * 20) % len(buckets) :][:20])
+        for i in range(args.tasks)
+    ]
+    for result in results:
+        result.get(timeout=300)
+    elapsed = time.perf_counter() - started
+
+    after = get_task_stats([task_name]).get(task_name, {})
+    count = after.get("count", 0) - before.get("count", 0)
+    wait_ms = after.get("wait_ms", 0) - before.get("wait_ms", 0)
+    runtime_ms = after.get("runtime_ms", 0) - before.get("runtime_ms", 0)
+    return {
+        "tasks": args.tasks,
+        "elapsed_s": round(elapsed, 2),
+        "throughput": round(args.tasks / elapsed, 1),
+        "avg_wait_ms": round(wait_ms / count, 1) if count else None,
+        "avg_runtime_ms": round(runtime_ms / count, 1) if count else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000", help="URL del servidor")
+    parser.add_argument("--requests", type=int, default=3000, help="Requests HTTP en total")
+    parser.add_argument("--concurrency", type=int, default=32, help="Clientes concurrentes")
+    parser.add_argument("--tasks", type=int, default=200, help="Tareas Celery (0 = omitir)")
+    parser.add_argument("--seed", type=int, default=10, help="Semilla de la mezcla de escenarios")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Regresión tolerada")
+    parser.add_argument(
+        "--settings",
+        default=os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings.development"),
+        help="Módulo de settings de Django",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Guardar resultados como baseline"
+    )
+    parser.add_argument("--json", action="store_true", help="Emitir resultados en JSON")
+    args = parser.parse_args()
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    import django
+
+    django.setup()
+
+    from benchmarks.harness import (
+        BASELINES_DIR,
+        RESULTS_DIR,
+        Measurement,
+        compare,
+        load_baselines,
+        percentile,
+        save_results,
+    )
+
+    def summarize(samples: list[float], throughput: float | None = None) -> Measurement:
+        return Measurement(
+            median_ms=round(statistics.median(samples), 2),
+            p95_ms=round(percentile(samples, 95), 2),
+            queries=None,
+            rounds=len(samples),
+            throughput=throughput,
+        )
+
+    cookies, dataset = prepare_sessions(args.concurrency)
+    http = asyncio.run(run_http(args, cookies, dataset))
+    latencies = http.pop("latencies")
+    results = {
+        f"http:{scenario}": summarize(samples) for scenario, samples in sorted(latencies.items())
+    }
+    results["http:total"] = summarize(
+        [ms for samples in latencies.values() for ms in samples], throughput=http["rps"]
+    )
+    celery = run_celery(args, dataset) if args.tasks else None
+    if celery:
+        # Sin latencias por tarea: el tiempo es el total repartido entre las tareas
+        per_task_ms = round(celery["elapsed_s"] * 1000 / celery["tasks"], 2)
+        results["celery:refresh_time_rollups"] = Measurement(
+            median_ms=per_task_ms,
+            p95_ms=per_task_ms,
+            queries=None,
+            rounds=celery["tasks"],
+            throughput=celery["throughput"],
+        )
+
+    save_results(BASELINE_NAME, results, directory=RESULTS_DIR)
+    regressions = []
+    if args.update_baseline:
+        save_results(BASELINE_NAME, results, directory=BASELINES_DIR)
+    else:
+        regressions = compare(
+            results, load_baselines(BASELINE_NAME), tolerance=args.tolerance, min_delta_ms=5.0
+        )
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "http": http,
+                    "celery": celery,
+                    "results": {key: vars(m) for key, m in results.items()},
+                    "regressions": regressions,
+                },
+                indent=2,
+            )
+        )
+        return 1 if regressions else 0
+
+    print(
+        f"\nHTTP: {args.requests} requests, {args.concurrency} clientes, "
+        f"{http['rps']} req/s, {http['errors']} errores, {http['throttled']} throttled\n"
+    )
+    print(f"{'escenario':<36} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'op/s':>8}")
+    for key, m in results.items():
+        throughput = f"{m.throughput:.1f}" if m.throughput is not None else "-"
+        print(f"{key:<36} {m.rounds:>6} {m.median_ms:>9.2f} {m.p95_ms:>9.2f} {throughput:>8}")
+    if celery:
+        print(
+            f"\nCelery: {celery['tasks']} tareas en {celery['elapsed_s']}s, "
+            f"espera media {celery['avg_wait_ms']} ms, ejecución media {celery['avg_runtime_ms']} ms"
+        )
+    if args.update_baseline:
+        print(f"\nBaseline actualizada en {BASELINES_DIR / f'{BASELINE_NAME}.json'}")
+    for regression in regressions:
+        print(f"❌ REGRESIÓN {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Microbenchmarks del camino caliente de autenticación (apps.core.auth).
+
+Lo que hace cada request autenticada antes de llegar a la vista: cargar la
+sesión, resolver el usuario y sus permisos. Con la cache caliente no debe
+hacer ninguna query; con la de usuario y permisos fría, las tres de
+ModelBackend (la sesión sigue en cache).
+"""
+
+from importlib import import_module
+
+import pytest
+
+from django.conf import settings
+from django.contrib import auth
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.test import Client
+
+from apps.accounts.models import User
+from apps.core.auth import AUTH_PERMISSIONS_CACHE_KEY, AUTH_USER_CACHE_KEY
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+
+@pytest.mark.parametrize("warm", [False, True], ids=["cold", "warm"])
+def test_authenticate(perf, dataset, warm):
+    """Sesión, usuario y permisos de una request autenticada."""
+    user = User.objects.get(pk=dataset.user_ids[0])
+    client = Client()
+    client.force_login(user)
+    session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+    session_store = import_module(settings.SESSION_ENGINE).SessionStore
+    auth_keys = [
+        key.format(user_id=user.pk) for key in (AUTH_USER_CACHE_KEY, AUTH_PERMISSIONS_CACHE_KEY)
+    ]
+
+    def run():
+        if not warm:
+            cache.delete_many(auth_keys)
+        request = HttpRequest()
+        request.session = session_store(session_key)
+        auth.get_user(request).has_perm("projects.view_project")
+
+    perf(run)
@@ -0,0 +1,88 @@
+"""
+Microbenchmarks del motor de capacidad (apps.resources.capacity).
+
+``build_month`` es el coste de calcular un mes sin cache; ``get_capacity``
+se mide con la cache fría (4 queries para todo el equipo) y caliente, más
+las operaciones de equipo sobre los arrays.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from django.core.cache import cache
+
+from apps.resources.capacity import (
+    CAPACITY_VERSION_KEY,
+    build_month,
+    common_free_minutes,
+    get_capacity,
+    sum_capacity,
+)
+from apps.resources.models import Absence, Assignment, TeamMember, WorkCalendar
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+WEEK = [450, 450, 450, 450, 450, 0, 0]
+DATE_FROM = date(2026, 1, 1)
+DATE_TO = date(2026, 6, 30)
+
+
+@pytest.fixture
+def team(dataset) -> list[int]:
+    """Fichas, ausencias y asignaciones de las personas del dataset (un semestre)."""
+    calendar = WorkCalendar.objects.get(name="España (37,5 h)")
+    TeamMember.objects.bulk_create(
+        [TeamMember(user_id=user_id, calendar=calendar) for user_id in dataset.user_ids],
+        ignore_conflicts=True,
+    )
+    Absence.objects.bulk_create(
+        Absence(
+            user_id=user_id,
+            kind=Absence.Kind.VACATION,
+            status=Absence.Status.APPROVED,
+            start_date=date(2026, 3, 2) + timedelta(days=i % 20),
+            end_date=date(2026, 3, 6) + timedelta(days=i % 20),
+        )
+        for i, user_id in enumerate(dataset.user_ids)
+    )
+    Assignment.objects.bulk_create(
+        Assignment(
+            user_id=user_id,
+            project_id=dataset.project_ids[(i + offset) % len(dataset.project_ids)],
+            percent=percent,
+            start_date=DATE_FROM + timedelta(days=30 * offset),
+            end_date=None if offset == 0 else DATE_TO - timedelta(days=30 * offset),
+        )
+        for i, user_id in enumerate(dataset.user_ids)
+        for offset, percent in enumerate((50, 30, 40))
+    )
+    return dataset.user_ids
+
+
+def test_build_month(perf):
+    """Un mes de una persona con festivos, una ausencia y dos asignaciones."""
+    perf(
+        lambda: build_month(
+            date(2026, 4, 1),
+            weekday_minutes=WEEK,
+            holidays=[date(2026, 4, 3)],
+            absences=[(date(2026, 4, 6), date(2026, 4, 10), None)],
+            assignments=[(DATE_FROM, None, 50), (date(2026, 4, 15), DATE_TO, 60)],
+        )
+    )
+
+
+@pytest.mark.parametrize("warm", [False, True], ids=["cold", "warm"])
+def test_team_capacity(perf, team, warm):
+    """Semestre de todo el equipo: capacidad por persona, total y huecos comunes."""
+    version_keys = [CAPACITY_VERSION_KEY.format(user_id=user_id) for user_id in team]
+
+    def run():
+        if not warm:
+            cache.delete_many(version_keys)
+        capacities = get_capacity(user_ids=team, date_from=DATE_FROM, date_to=DATE_TO)
+        sum_capacity(capacities.values(), date_from=DATE_FROM, date_to=DATE_TO)
+        common_free_minutes(capacities.values())
+
+    perf(run)
@@ -0,0 +1,30 @@
+"""
+Cache de selectors (apps.core.selector_cache) en el cuadro de mando.
+
+Mismo selector con la entrada borrada en cada ronda (fallo: query más
+escritura en cache) y con la entrada vigente (acierto: sin queries, solo la
+lectura de las versiones de etiquetas y de la entrada).
+"""
+
+import pytest
+
+from django.core.cache import cache
+
+from apps.core.selector_cache import SELECTOR_RESULT_KEY
+from apps.reporting.selectors import get_hours_totals
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+
+@pytest.mark.parametrize("warm", [False, True], ids=["cold", "warm"])
+def test_cached_selector(perf, dataset, warm):
+    """Totales por proyecto del rango del dataset."""
+    kwargs = {"group_by": "project", "date_from": dataset.date_from, "date_to": dataset.date_to}
+    key = SELECTOR_RESULT_KEY.format(key=get_hours_totals._key((), kwargs))
+
+    def run():
+        if not warm:
+            cache.delete(key)
+        get_hours_totals(**kwargs)
+
+    perf(run)
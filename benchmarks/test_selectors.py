@@ -0,0 +1,65 @@
+"""
+Microbenchmarks de selectors: coste de las lecturas de cuadros de mando y listados.
+
+Los selectors con ``@cached_selector`` se miden sin cache (``.uncached``);
+la cache se mide en test_selector_cache.py.
+"""
+
+import pytest
+
+from django.contrib.auth import get_user_model
+
+from apps.core.inertia import build_shared_props
+from apps.core.search import search
+from apps.reporting.selectors import get_hours_series, get_hours_totals
+from apps.timetracking.selectors import get_visible_time_entries
+from apps.timetracking.serializers import TimeEntryRowSerializer
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+
+@pytest.mark.parametrize("period", ["day", "week"])
+def test_hours_series(perf, dataset, period):
+    perf(
+        lambda: list(
+            get_hours_series.uncached(
+                period=period, date_from=dataset.date_from, date_to=dataset.date_to
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize("group_by", ["project", "user"])
+def test_hours_totals(perf, dataset, group_by):
+    perf(
+        lambda: list(
+            get_hours_totals.uncached(
+                group_by=group_by, date_from=dataset.date_from, date_to=dataset.date_to
+            )
+        )
+    )
+
+
+def test_time_entries_page(perf, dataset):
+    """Primera página del listado de la API (50 filas de ``.values()``)."""
+    user = get_user_model().objects.get(pk=dataset.user_ids[0])
+    qs = TimeEntryRowSerializer.values(get_visible_time_entries(user=user))
+    perf(lambda: list(qs.order_by("-date", "-id")[:50]))
+
+
+@pytest.mark.parametrize("query", ["proyecto", "cliente 3", "proyeto"])
+def test_search(perf, dataset, query):
+    """Búsqueda global: full-text, varias palabras y una errata (trigramas)."""
+    user = get_user_model().objects.get(pk=dataset.user_ids[0])
+    perf(lambda: search(user=user, query=query))
+
+
+def test_shared_props(perf, dataset):
+    """Props compartidas de Inertia sin cache (permisos + menú)."""
+    user_model = get_user_model()
+
+    def build():
+        # Instancia nueva en cada ronda: get_all_permissions cachea en el objeto
+        build_shared_props(user_model.objects.get(pk=dataset.user_ids[0]))
+
+    perf(build)
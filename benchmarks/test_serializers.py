@@ -0,0 +1,35 @@
+"""Microbenchmarks de serialización: filas de la API y props de Inertia a JSON."""
+
+import json
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.json import FastInertiaJSONEncoder, FastJSONRenderer
+from apps.timetracking.models import TimeEntry
+from apps.timetracking.serializers import TimeEntryRowSerializer
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+PAGE_SIZE = 500
+
+
+@pytest.fixture
+def rows(dataset):
+    qs = TimeEntryRowSerializer.values(TimeEntry.objects.filter(user_id__in=dataset.user_ids))
+    return list(qs.order_by("-date", "-id")[:PAGE_SIZE])
+
+
+def test_values_serializer(perf, rows):
+    perf(lambda: TimeEntryRowSerializer(rows, many=True).data)
+
+
+@pytest.mark.parametrize("renderer", [JSONRenderer, FastJSONRenderer], ids=["stdlib", "orjson"])
+def test_api_render(perf, rows, renderer):
+    data = TimeEntryRowSerializer(rows, many=True).data
+    perf(lambda: renderer().render({"next": None, "previous": None, "results": data}))
+
+
+def test_inertia_props(perf, rows):
+    page = {"component": "Timesheet/Index", "props": {"entries": rows}, "url": "/", "version": ""}
+    perf(lambda: json.dumps(page, cls=FastInertiaJSONEncoder))
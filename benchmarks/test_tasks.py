@@ -0,0 +1,26 @@
+"""
+Microbenchmarks de tareas Celery ejecutadas en el proceso (``apply``).
+
+Miden el cuerpo de la tarea (tareas/s por worker); la espera en cola y el
+throughput con broker real los mide ``benchmarks/loadtest.py``.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from apps.reporting.tasks import refresh_time_rollups
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+
+@pytest.mark.parametrize("buckets", [10, 200])
+def test_refresh_time_rollups(perf, dataset, buckets):
+    """Refresco de buckets tras guardar entradas (una tarea por commit)."""
+    keys = [
+        [project_id, user_id, (dataset.date_to - timedelta(days=i % 20)).isoformat()]
+        for i, (project_id, user_id) in enumerate(
+            (p, u) for u in dataset.user_ids for p in dataset.project_ids
+        )
+    ][:buckets]
+    perf(lambda: refresh_time_rollups.apply(args=[keys]).get(), rounds=10)
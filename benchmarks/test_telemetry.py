@@ -0,0 +1,54 @@
+"""
+Coste de la instrumentación (config.telemetry, apps.core.tracing).
+
+Mismo selector dentro de una request simulada (span raíz) con las trazas
+desactivadas, sin muestrear y muestreadas: la diferencia entre los tres es
+el coste de los spans del selector y de sus queries. Los spans muestreados
+se crean y se descartan (sin exportador) para no medir I/O.
+"""
+
+import pytest
+
+from apps.reporting.selectors import get_hours_totals
+from config import telemetry
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+MODES = {
+    "off": {"enabled": False},
+    "unsampled": {"enabled": True, "sample_rate": 0.0},
+    "sampled": {"enabled": True, "sample_rate": 1.0},
+}
+
+
+@pytest.fixture(params=list(MODES))
+def tracing(request):
+    telemetry.configure(**MODES[request.param])
+    yield request.param
+    telemetry.configure(enabled=False)
+
+
+def test_spans(perf, tracing):
+    """1000 spans hijos de un span raíz (coste por punto instrumentado)."""
+
+    def run():
+        with telemetry.start_span("request"):
+            for _ in range(1000):
+                with telemetry.start_span("child", attributes={"db.system": "postgresql"}):
+                    pass
+
+    perf(run)
+
+
+def test_traced_selector(perf, dataset, tracing):
+    """Selector con su query dentro de una request."""
+
+    def run():
+        with telemetry.start_span("GET /dashboard/"):
+            list(
+                get_hours_totals.uncached(
+                    group_by="project", date_from=dataset.date_from, date_to=dataset.date_to
+                )
+            )
+
+    perf(run)
@@ -0,0 +1,42 @@
+"""
+Microbenchmark de la importación masiva de horas (COPY + ON CONFLICT).
+
+Solo PostgreSQL: la carga usa ``COPY`` de psycopg. Se ejecuta en ``dry_run``
+para que cada ronda importe las mismas filas contra la misma tabla.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from django.db import connection
+
+from apps.timetracking.services import TimeEntryImportService
+
+pytestmark = [
+    pytest.mark.perf,
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="COPY requiere PostgreSQL"),
+]
+
+
+@pytest.mark.parametrize("rows", [1_000, 20_000])
+def test_import_rows(perf, dataset, rows):
+    """Filas/s de una importación nueva (todas las filas se crean)."""
+    data = [
+        {
+            "external_id": f"bench-{i}",
+            "user_id": dataset.user_ids[i % len(dataset.user_ids)],
+            "project_id": dataset.project_ids[i % len(dataset.project_ids)],
+            "date": (dataset.date_to - timedelta(days=i % 60)).isoformat(),
+            "hours": "1.50",
+            "billable": i % 3 != 0,
+            "description": "Importación de benchmark",
+        }
+        for i in range(rows)
+    ]
+    measurement = perf(
+        lambda: TimeEntryImportService.import_rows(rows=data, source="bench", dry_run=True),
+        rounds=5,
+    )
+    measurement.throughput = round(rows / (measurement.median_ms / 1000), 1)
@@ -0,0 +1,24 @@
+"""
+Aplicación Celery para 10Code Intranet.
+
+Colas:
+- interactive: tareas cortas y sensibles a latencia (notificaciones, cache warming)
+- batch: trabajo pesado (estimaciones ML, generación de reportes)
+
+Cada worker consume una sola cola y su perfil (prefetch, acks_late) se define
+en CELERY_QUEUE_PROFILES vía la variable CELERY_WORKER_QUEUE.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("config")
+
+# Toda la configuración vive en settings con el prefijo CELERY_
+app.config_from_object("django.conf:settings", namespace="CELERY")
+
+# Descubrir tasks.py en todas las apps instaladas
+app.autodiscover_tasks()
@@ -0,0 +1,30 @@
+"""
+Routers de base de datos para 10Code Intranet.
+
+PrimaryReplicaRouter envía las escrituras al primario y las lecturas de los
+selectors marcados con @replica_selector a la réplica, salvo que:
+- No exista réplica configurada (alias "replica" en DATABASES)
+- Haya habido una escritura reciente (ventana read-your-writes)
+- La réplica no responda o tenga demasiado lag
+"""
+
+from apps.core.db import get_read_alias, mark_write
+
+
+class PrimaryReplicaRouter:
+    """Router primario/réplica con read-your-writes y fallback al primario."""
+
+    def db_for_read(self, model, **hints) -> str | None:
+        # None deja el comportamiento por defecto (instancia o "default")
+        return get_read_alias()
+
+    def db_for_write(self, model, **hints) -> str:
+        mark_write()
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # Primario y réplica contienen los mismos datos
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        return db == "default"
@@ -0,0 +1,62 @@
+"""
+Logs estructurados en JSON con los identificadores de traza.
+
+Uso en LOGGING (ver config/settings/production.py):
+- ``TraceContextFilter`` añade ``trace_id``, ``span_id`` y ``request_id`` a
+  cada registro a partir del span actual (config.telemetry)
+- ``JsonFormatter`` escribe una línea JSON por registro con esos campos, los
+  ``extra`` del registro y la traza de la excepción si la hay
+
+Así cada línea de log de una request o tarea se puede cruzar con su traza
+aunque la traza no se haya muestreado.
+"""
+
+import logging
+from datetime import UTC, datetime
+
+import orjson
+
+from config.telemetry import current_span, get_request_id
+
+# Atributos propios de LogRecord: todo lo demás viene de ``extra``
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+    | {"message", "asctime", "trace_id", "span_id", "request_id"}
+)
+
+
+class TraceContextFilter(logging.Filter):
+    """Añade trace_id, span_id y request_id del contexto actual al registro."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        span = current_span()
+        record.trace_id = span.trace_id if span is not None else None
+        record.span_id = span.span_id if span is not None else None
+        record.request_id = get_request_id()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro (orjson)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "trace_id": getattr(record, "trace_id", None),
+            "span_id": getattr(record, "span_id", None),
+            "request_id": getattr(record, "request_id", None),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
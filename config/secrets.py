@@ -8,28 +8,162 @@ Prioridades de lectura:
 2. secrets/{nombre}.txt - Archivos locales (desarrollo)
 3. Variable de entorno {nombre} - Fallback
 4. Default (si se proporciona)
+
+Los secretos se resuelven una vez por proceso y se cachean (ver
+invalidate_secret() y el parámetro reload_on_change para secretos rotados).
 """
 
 import logging
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Directorio base del proyecto
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+DOCKER_SECRETS_DIR = Path("/run/secrets")
+
+
+@dataclass(frozen=True)
+class _SecretEntry:
+    """Resultado cacheado de la búsqueda de un secreto."""
+
+    value: str | None
+    source: str  # "docker", "local", "env" o "missing"
+    path: Path | None = None
+    mtime: float | None = None
+
+
+# Caché de secretos por proceso: se resuelve una vez y se reutiliza en cada
+# import de settings y en llamadas en runtime (tokens de API, integraciones).
+_cache: dict[str, _SecretEntry] = {}
+_cache_lock = threading.Lock()
+
+
+def _secret_paths(secret_name: str) -> tuple[Path, Path]:
+    """Rutas candidatas (Docker Secrets, archivo local) para un secreto."""
+    name = secret_name.lower()
+    return DOCKER_SECRETS_DIR / name, BASE_DIR / "secrets" / f"{name}.txt"
+
+
+def _read_file(path: Path, source: str, secret_name: str) -> _SecretEntry | None:
+    """Lee un secreto desde archivo, devolviendo None si no existe o falla."""
+    try:
+        mtime = path.stat().st_mtime
+        value = path.read_text().strip()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Error leyendo secreto '{secret_name}' desde {path}: {e}")
+        return None
+    return _SecretEntry(value=value, source=source, path=path, mtime=mtime)
+
+
+def _load_secret(secret_name: str) -> _SecretEntry:
+    """Busca un secreto en orden de prioridad sin consultar la caché."""
+    docker_secret_path, local_secret_path = _secret_paths(secret_name)
+
+    # 1. Docker Secrets (producción)
+    entry = _read_file(docker_secret_path, "docker", secret_name)
+    if entry is not None:
+        logger.info(f"Secret '{secret_name}' cargado desde Docker Secrets")
+        return entry
+
+    # 2. Archivo local secrets/ (desarrollo)
+    entry = _read_file(local_secret_path, "local", secret_name)
+    if entry is not None:
+        logger.info(f"Secret '{secret_name}' cargado desde {local_secret_path}")
+        return entry
+
+    # 3. Variable de entorno
+    if secret_name in os.environ:
+        logger.info(f"Secret '{secret_name}' cargado desde variable de entorno")
+        return _SecretEntry(value=os.environ[secret_name], source="env")
+
+    return _SecretEntry(value=None, source="missing")
+
+
+def _is_stale(secret_name: str, entry: _SecretEntry) -> bool:
+    """Indica si el origen de un secreto cambió desde que se cacheó."""
+    docker_secret_path, local_secret_path = _secret_paths(secret_name)
+    if entry.path is not None:
+        try:
+            if entry.path.stat().st_mtime != entry.mtime:
+                return True
+        except OSError:
+            # El archivo desapareció (p.ej. secreto retirado): volver a buscar
+            return True
+        # Un Docker Secret creado después tiene prioridad sobre el archivo local
+        return entry.source == "local" and docker_secret_path.exists()
+
+    # Variable de entorno o no encontrado: puede haber aparecido un archivo
+    # o cambiado la variable desde que se cacheó
+    if docker_secret_path.exists() or local_secret_path.exists():
+        return True
+    return os.environ.get(secret_name) != entry.value
+
+
+def _get_entry(secret_name: str, *, reload_on_change: bool) -> tuple[_SecretEntry, bool]:
+    """
+    Obtiene un secreto de la caché o lo carga.
+
+    Returns:
+        Tupla (entrada, recién_cargada)
+    """
+    entry = _cache.get(secret_name)
+    if entry is not None and not (reload_on_change and _is_stale(secret_name, entry)):
+        return entry, False
+
+    with _cache_lock:
+        entry = _cache.get(secret_name)
+        if entry is not None and not (reload_on_change and _is_stale(secret_name, entry)):
+            return entry, False
+        if entry is not None:
+            logger.info(f"Secret '{secret_name}' modificado ({entry.source}), recargando")
+        entry = _load_secret(secret_name)
+        _cache[secret_name] = entry
+        return entry, True
+
+
+def invalidate_secret(secret_name: str | None = None) -> None:
+    """
+    Invalida la caché de secretos del proceso.
+
+    Args:
+        secret_name: Secreto a invalidar; si es None se vacía toda la caché
+    """
+    with _cache_lock:
+        if secret_name is None:
+            _cache.clear()
+        else:
+            _cache.pop(secret_name, None)
+
 
 def read_secret(
     secret_name: str,
     *,
     required: bool = True,
     default: str | None = None,
+    reload_on_change: bool = False,
 ) -> str:
     """
     Lee un secreto desde archivos o variables de entorno.
 
+    El resultado se cachea por proceso: solo la primera lectura consulta el
+    sistema de archivos y escribe en el log. Usa invalidate_secret() para
+    forzar una nueva búsqueda.
+
     Args:
         secret_name: Nombre del secreto (ej: "SECRET_KEY", "DATABASE_PASSWORD")
         required: Si es True, lanza excepción si no se encuentra
         default: Valor por defecto si no se encuentra el secreto
+        reload_on_change: Si es True, recarga el secreto si ha cambiado su
+            origen: archivo rotado o retirado, archivo creado después del
+            arranque o variable de entorno modificada (uno o dos stats por
+            llamada)
 
     Returns:
         El valor del secreto como string
@@ -40,43 +174,21 @@ def read_secret(
     Example:
         >>> secret_key = read_secret("SECRET_KEY", required=True)
         >>> db_password = read_secret("DATABASE_PASSWORD", default="postgres")
+        >>> api_token = read_secret("GITHUB_TOKEN", reload_on_change=True)
     """
-    # Obtener el directorio base del proyecto
-    base_dir = Path(__file__).resolve().parent.parent
-
-    # 1. Intentar leer desde Docker Secrets (producción)
-    docker_secret_path = Path("/run/secrets") / secret_name.lower()
-    if docker_secret_path.exists():
-        try:
-            value = docker_secret_path.read_text().strip()
-            logger.info(f"Secret '{secret_name}' cargado desde Docker Secrets")
-            return value
-        except Exception as e:
-            logger.warning(f"Error leyendo Docker secret '{secret_name}': {e}")
-
-    # 2. Intentar leer desde archivo local secrets/ (desarrollo)
-    local_secret_path = base_dir / "secrets" / f"{secret_name.lower()}.txt"
-    if local_secret_path.exists():
-        try:
-            value = local_secret_path.read_text().strip()
-            logger.info(f"Secret '{secret_name}' cargado desde {local_secret_path}")
-            return value
-        except Exception as e:
-            logger.warning(f"Error leyendo archivo local '{secret_name}': {e}")
-
-    # 3. Intentar leer desde variable de entorno
-    if secret_name in os.environ:
-        value = os.environ[secret_name]
-        logger.info(f"Secret '{secret_name}' cargado desde variable de entorno")
-        return value
+    entry, fresh = _get_entry(secret_name, reload_on_change=reload_on_change)
+    if entry.value is not None:
+        return entry.value
 
-    # 4. Usar default si se proporciona
+    # Usar default si se proporciona
     if default is not None:
-        logger.info(f"Usando valor por defecto para '{secret_name}'")
+        if fresh:
+            logger.info(f"Usando valor por defecto para '{secret_name}'")
         return default
 
-    # 5. Si es requerido y no se encontró, lanzar error
+    # Si es requerido y no se encontró, lanzar error
     if required:
+        docker_secret_path, local_secret_path = _secret_paths(secret_name)
         raise ValueError(
             f"Secret requerido '{secret_name}' no encontrado en:\n"
             f"  - Docker Secrets: {docker_secret_path}\n"
@@ -85,11 +197,41 @@ def read_secret(
             f"Asegúrate de crear el archivo o definir la variable."
         )
 
-    # 6. No requerido y no encontrado
-    logger.warning(f"Secret '{secret_name}' no encontrado, retornando None")
+    # No requerido y no encontrado
+    if fresh:
+        logger.warning(f"Secret '{secret_name}' no encontrado, retornando None")
     return None
 
 
+def read_secrets(
+    secret_names: list[str],
+    *,
+    required: bool = True,
+    reload_on_change: bool = False,
+) -> dict[str, str | None]:
+    """
+    Lee varios secretos de una vez.
+
+    Args:
+        secret_names: Nombres de los secretos a leer
+        required: Si es True, lanza excepción si falta alguno
+        reload_on_change: Ver read_secret()
+
+    Returns:
+        Diccionario {nombre: valor}
+
+    Raises:
+        ValueError: Si algún secreto requerido no se encuentra
+
+    Example:
+        >>> creds = read_secrets(["GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET"])
+    """
+    return {
+        name: read_secret(name, required=required, reload_on_change=reload_on_change)
+        for name in secret_names
+    }
+
+
 def validate_secret_key(secret_key: str, *, environment: str = "production") -> bool:
     """
     Valida que SECRET_KEY cumpla requisitos mínimos de seguridad.
@@ -140,7 +282,7 @@ def get_environment() -> str:
     Detecta el entorno actual basado en DJANGO_SETTINGS_MODULE.
 
     Returns:
-        'development', 'production' o 'staging'
+        'development', 'production', 'staging' o 'testing'
     """
     settings_module = os.getenv("DJANGO_SETTINGS_MODULE", "").lower()
 
@@ -148,6 +290,8 @@ def get_environment() -> str:
         return "production"
     elif "staging" in settings_module:
         return "staging"
+    elif "testing" in settings_module:
+        return "testing"
     elif "development" in settings_module or "dev" in settings_module:
         return "development"
     else:
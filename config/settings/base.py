@@ -5,6 +5,8 @@ import os
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
+from kombu import Queue
 
 from config.secrets import get_environment, read_secret, validate_secret_key
 
@@ -15,7 +17,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 env = environ.Env(
     # set casting, default value
     DEBUG=(bool, False),
-    DATABASE_CONN_MAX_AGE=(int, 60)
+    DATABASE_CONN_MAX_AGE=(int, 60),
+    DATABASE_POOL_ENABLED=(bool, True),
+    DATABASE_POOL_TIMEOUT=(float, 10.0),
+    DATABASE_POOL_MAX_LIFETIME=(float, 1800.0),
+    DATABASE_POOL_MAX_IDLE=(float, 300.0),
+    DATABASE_REPLICA_MAX_LAG=(float, 5.0),
+    DATABASE_REPLICA_HEALTH_CHECK_INTERVAL=(float, 5.0),
+    DATABASE_REPLICA_CONNECT_TIMEOUT=(int, 2),
+    DATABASE_REPLICA_READ_YOUR_WRITES=(int, 10),
 )
 
 environ.Env.read_env(os.path.join(BASE_DIR, ".env"))
@@ -48,40 +58,80 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    # Búsqueda full-text y por trigramas (apps.core.search)
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
     "inertia",
+    "django_vite",
     "rest_framework",
+    "django_filters",
     "corsheaders",
+    "django_celery_beat",
 ]
 
 LOCAL_APPS = [
     "apps.core",
     "apps.accounts",
+    "apps.estimation",
+    "apps.projects",
+    "apps.timetracking",
+    "apps.reporting",
+    "apps.resources",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 # Configuración de middleware
 MIDDLEWARE = [
+    # Primero: el span de la request (y su request_id) cubre todo lo demás
+    "apps.core.middleware.TracingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # WhiteNoise justo después de SecurityMiddleware: los estáticos se sirven
+    # sin pasar por sesiones, CORS ni el presupuesto de queries
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "apps.core.middleware.QueryBudgetMiddleware",  # Presupuesto de queries y N+1
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.core.middleware.InertiaSharedPropsMiddleware",  # Props compartidas cacheadas por usuario
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # Habilitar CORS middleware
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # Sirve archivos estáticos en producción
+    "apps.core.middleware.ReplicaPinMiddleware",  # Read-your-writes con réplica de lectura
 ]
 
+# Presupuesto de queries por request (apps.core.middleware.QueryBudgetMiddleware)
+# Cada vista puede ajustar sus límites con @query_budget (apps.core.decorators).
+QUERY_BUDGET_SAMPLE_RATE = env.float("QUERY_BUDGET_SAMPLE_RATE", default=0.05)
+QUERY_BUDGET_MAX_QUERIES = env.int("QUERY_BUDGET_MAX_QUERIES", default=30)
+QUERY_BUDGET_N_PLUS_ONE_THRESHOLD = env.int("QUERY_BUDGET_N_PLUS_ONE_THRESHOLD", default=5)
+QUERY_BUDGET_MODE = env("QUERY_BUDGET_MODE", default="log")  # log | raise
+
+# Trazas (config.telemetry, instrumentación en apps.core.tracing)
+# Las requests y tareas siempre llevan trace_id/request_id para los logs; los
+# spans solo se registran y exportan en las trazas muestreadas.
+TELEMETRY_ENABLED = env.bool("TELEMETRY_ENABLED", default=False)
+TELEMETRY_SAMPLE_RATE = env.float("TELEMETRY_SAMPLE_RATE", default=0.1)
+TELEMETRY_EXPORTER = env("TELEMETRY_EXPORTER", default="file")  # file | otlp | none
+TELEMETRY_FILE_PATH = env("TELEMETRY_FILE_PATH", default=str(BASE_DIR / "traces" / "spans.jsonl"))
+# Collector OpenTelemetry (OTLP/HTTP) o scripts/otlp_collector.py
+TELEMETRY_OTLP_ENDPOINT = env("TELEMETRY_OTLP_ENDPOINT", default="http://localhost:4318")
+TELEMETRY_SERVICE_NAME = env("TELEMETRY_SERVICE_NAME", default="10code-intranet")
+# Incluir el SQL (con placeholders, sin parámetros) en los spans de queries
+TELEMETRY_DB_STATEMENT = env.bool("TELEMETRY_DB_STATEMENT", default=True)
+# Spans pendientes de exportar por proceso (los que no caben se descartan)
+TELEMETRY_MAX_QUEUE_SIZE = env.int("TELEMETRY_MAX_QUEUE_SIZE", default=2048)
+TELEMETRY_EXPORT_INTERVAL = env.float("TELEMETRY_EXPORT_INTERVAL", default=2.0)
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [],
+        "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -94,11 +144,38 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+# Despliegue ASGI (SERVER_MODE=asgi en docker/gunicorn.conf.py)
+ASGI_APPLICATION = "config.asgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Rol del proceso (web, worker, beat). Lo fija cada servicio de compose y
+# determina el tamaño por defecto del pool de conexiones.
+PROCESS_ROLE = env("PROCESS_ROLE", default="web")
+
+# Tamaños de pool por proceso según rol. Cada worker de gunicorn y cada hijo
+# prefork de Celery tiene su propio pool, así que el total de conexiones contra
+# Postgres es (procesos x max_size): mantenerlos pequeños.
+DATABASE_POOL_SIZES = {
+    "web": {"min_size": 1, "max_size": 4},
+    "worker": {"min_size": 1, "max_size": 2},
+    "beat": {"min_size": 0, "max_size": 1},
+}
+
+_pool_defaults = DATABASE_POOL_SIZES.get(PROCESS_ROLE, DATABASE_POOL_SIZES["web"])
+
+DATABASE_POOL_ENABLED = env("DATABASE_POOL_ENABLED")
+
+DATABASE_POOL_OPTIONS = {
+    "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=_pool_defaults["min_size"]),
+    "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=_pool_defaults["max_size"]),
+    "timeout": env("DATABASE_POOL_TIMEOUT"),
+    "max_lifetime": env("DATABASE_POOL_MAX_LIFETIME"),
+    "max_idle": env("DATABASE_POOL_MAX_IDLE"),
+}
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -107,10 +184,80 @@ DATABASES = {
         "PASSWORD": read_secret("db_password", required=False, default="postgres"),
         "HOST": env("DATABASE_HOST", default="localhost"),
         "PORT": env("DATABASE_PORT", default="5432"),
-        "CONN_MAX_AGE": env("DATABASE_CONN_MAX_AGE", default=60),
+        # El pool de psycopg3 no admite conexiones persistentes de Django
+        "CONN_MAX_AGE": 0 if DATABASE_POOL_ENABLED else env("DATABASE_CONN_MAX_AGE"),
+        "OPTIONS": {
+            # Permite agrupar conexiones por rol en pg_stat_activity
+            "application_name": f"10code-{PROCESS_ROLE}",
+            **({"pool": DATABASE_POOL_OPTIONS} if DATABASE_POOL_ENABLED else {}),
+        },
     }
 }
 
+# Réplica de lectura opcional. Solo se define si hay DATABASE_REPLICA_HOST; los
+# selectors decorados con @replica_selector leen de ella vía DATABASE_ROUTERS.
+if env("DATABASE_REPLICA_HOST", default=""):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": env("DATABASE_REPLICA_HOST"),
+        "PORT": env("DATABASE_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        "OPTIONS": {
+            **DATABASES["default"]["OPTIONS"],
+            "application_name": f"10code-{PROCESS_ROLE}-replica",
+        },
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["config.db_routers.PrimaryReplicaRouter"]
+
+# Lag máximo (segundos) tolerado antes de volver a leer del primario
+DATABASE_REPLICA_MAX_LAG = env("DATABASE_REPLICA_MAX_LAG")
+# Cada cuánto (segundos) se comprueba la salud y el lag de la réplica
+DATABASE_REPLICA_HEALTH_CHECK_INTERVAL = env("DATABASE_REPLICA_HEALTH_CHECK_INTERVAL")
+# Espera máxima (segundos, mínimo 2 en libpq) al conectar para comprobar la salud:
+# una réplica caída no debe bloquear la request hasta el timeout del pool
+DATABASE_REPLICA_CONNECT_TIMEOUT = env("DATABASE_REPLICA_CONNECT_TIMEOUT")
+# Ventana read-your-writes (segundos): tras una escritura se lee del primario
+DATABASE_REPLICA_READ_YOUR_WRITES = env("DATABASE_REPLICA_READ_YOUR_WRITES")
+
+
+# Cache
+# Redis en todos los entornos, con una LRU local por proceso delante
+# (apps.core.cache.TwoTierRedisCache) invalidada por pub/sub.
+
+CACHES = {
+    "default": {
+        "BACKEND": "apps.core.cache.TwoTierRedisCache",
+        "LOCATION": env("REDIS_URL", default="redis://localhost:6379/0"),
+        "KEY_PREFIX": "10code",
+        "TIMEOUT": env.int("CACHE_DEFAULT_TIMEOUT", default=300),
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "LOCAL_MAX_ENTRIES": env.int("CACHE_LOCAL_MAX_ENTRIES", default=1024),
+            "LOCAL_TIMEOUT": env.float("CACHE_LOCAL_TIMEOUT", default=5.0),
+            # Claves que cambian en cada request: solo en Redis
+            "LOCAL_EXCLUDE_PREFIXES": ["celery_metrics:", "throttle_"],
+        },
+    }
+}
+
+# Cache de selectors (apps.core.selector_cache): resultados por argumentos,
+# invalidados por etiqueta (modelo) y precalentados desde Celery.
+SELECTOR_CACHE_ENABLED = env.bool("SELECTOR_CACHE_ENABLED", default=True)
+# Validez de cada entrada (segundos) salvo ttl propio en @cached_selector
+SELECTOR_CACHE_TTL = env.int("SELECTOR_CACHE_TTL", default=300)
+# Tiempo extra que se conserva una entrada caducada u obsoleta para servirla
+# mientras otro proceso la recalcula
+SELECTOR_CACHE_STALE_TTL = env.int("SELECTOR_CACHE_STALE_TTL", default=600)
+# Duración máxima del lock de recálculo y espera si no hay entrada que servir
+SELECTOR_CACHE_LOCK_TIMEOUT = env.int("SELECTOR_CACHE_LOCK_TIMEOUT", default=30)
+SELECTOR_CACHE_LOCK_WAIT = env.float("SELECTOR_CACHE_LOCK_WAIT", default=2.0)
+# Recálculo anticipado (XFetch): >1 empieza antes, 0 lo desactiva
+SELECTOR_CACHE_EARLY_BETA = env.float("SELECTOR_CACHE_EARLY_BETA", default=1.0)
+# Precalentamiento periódico (beat) y retraso tras una invalidación
+SELECTOR_CACHE_WARM_INTERVAL = env.int("SELECTOR_CACHE_WARM_INTERVAL", default=240)
+SELECTOR_CACHE_WARM_DELAY = env.int("SELECTOR_CACHE_WARM_DELAY", default=5)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -130,6 +277,18 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Autenticación
+# Usuario propio (apps.accounts.models.User) sobre la tabla auth_user. Sesión,
+# usuario y permisos se leen de cache: una request autenticada con la cache
+# caliente no hace ninguna query de autenticación (apps.core.auth).
+AUTH_USER_MODEL = "accounts.User"
+AUTHENTICATION_BACKENDS = ["apps.core.auth.CachedModelBackend"]
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+SESSION_CACHE_ALIAS = "default"
+# Segundos que se cachean el usuario y sus permisos. Se invalidan al cambiar
+# el usuario, sus grupos o sus permisos (apps.core.signals).
+AUTH_CACHE_TTL = env.int("AUTH_CACHE_TTL", default=300)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -148,10 +307,73 @@ USE_TZ = True
 
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
-STATICFILES_DIRS = []
 
-# WhiteNoise configuration
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Build de Vite (frontend/dist, ver frontend/vite.config.ts). collectstatic lo
+# copia a STATIC_ROOT/dist. Solo se añade si existe para no generar warnings
+# en desarrollo, donde los assets los sirve el dev server de Vite.
+VITE_BUILD_DIR = BASE_DIR / "frontend" / "dist"
+STATICFILES_DIRS = [("dist", VITE_BUILD_DIR)] if VITE_BUILD_DIR.is_dir() else []
+
+# WhiteNoise configuration. STATICFILES_STORAGE ya no existe en Django 5.1+:
+# el backend de estáticos se declara en STORAGES. collectstatic se ejecuta al
+# construir la imagen (Dockerfile), no al arrancar el contenedor, y genera las
+# variantes .gz y .br de cada fichero.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "apps.core.staticfiles.ViteManifestStaticFilesStorage"},
+}
+
+# Ficheros con hash en el nombre: Cache-Control max-age de 10 años + immutable,
+# de modo que las visitas repetidas no hacen ninguna petición de revalidación.
+# Cubre el hash de Django (nombre.0123456789ab.ext) y todo dist/assets/ (hash
+# de Vite). El resto de estáticos usa WHITENOISE_MAX_AGE (60s por defecto).
+WHITENOISE_IMMUTABLE_FILE_TEST = r"^.+(\.[0-9a-f]{12}\.[^/]+|/dist/assets/.+)$"
+
+# django-vite: se leen los assets del manifest de Vite y cada entrada genera
+# <script type="module"> + <link rel="modulepreload"> de sus chunks importados.
+# En desarrollo (dev_mode) los sirve el dev server de Vite con HMR.
+DJANGO_VITE = {
+    "default": {
+        "dev_mode": env.bool("DJANGO_VITE_DEV_MODE", default=False),
+        "dev_server_port": env.int("DJANGO_VITE_DEV_SERVER_PORT", default=5173),
+        "static_url_prefix": "dist",
+        "manifest_path": VITE_BUILD_DIR / "manifest.json",
+    }
+}
+
+# Inertia (el encoder JSON rápido se activa en apps.core.apps.CoreConfig)
+INERTIA_LAYOUT = "base.html"
+# Segundos que se cachean las props compartidas (auth, permissions, menu) de
+# cada usuario. Se invalidan al cambiar el usuario, sus grupos o permisos.
+INERTIA_SHARED_PROPS_TTL = env.int("INERTIA_SHARED_PROPS_TTL", default=300)
+
+# Django REST Framework
+# JSON con orjson (apps.core.json); la API navegable sigue usando el
+# renderer estándar porque necesita indentación.
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.core.json.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.core.json.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    # Cursor sobre un orden indexado: coste constante por página (sin OFFSET)
+    "DEFAULT_PAGINATION_CLASS": "apps.core.pagination.KeysetPagination",
+    "PAGE_SIZE": 50,
+    "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    # Contadores por ventana en Redis (apps.core.throttling)
+    "DEFAULT_THROTTLE_CLASSES": [
+        "apps.core.throttling.BurstAnonRateThrottle",
+        "apps.core.throttling.BurstUserRateThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": env("API_THROTTLE_ANON", default="60/min"),
+        "user": env("API_THROTTLE_USER", default="1200/min"),
+    },
+}
 
 # Media files
 MEDIA_URL = "/media/"
@@ -161,3 +383,158 @@ MEDIA_ROOT = BASE_DIR / "media"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Celery
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html
+
+CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="redis://localhost:6379/1")
+CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND", default=CELERY_BROKER_URL)
+CELERY_ACCEPT_CONTENT = ["json"]
+CELERY_TASK_SERIALIZER = "json"
+CELERY_RESULT_SERIALIZER = "json"
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_RESULT_EXPIRES = 60 * 60 * 24
+
+# Colas separadas para que un trabajo batch largo no bloquee tareas cortas
+CELERY_TASK_DEFAULT_QUEUE = "interactive"
+CELERY_TASK_QUEUES = (
+    Queue("interactive"),
+    Queue("batch"),
+    Queue("ml_inference"),
+)
+
+# Enrutado por nombre de tarea (glob). Las tareas no listadas van a
+# "interactive"; una tarea puede forzar su cola con @shared_task(queue=...).
+CELERY_TASK_ROUTES = {
+    "apps.estimation.tasks.predict_*": {"queue": "ml_inference"},
+    "apps.estimation.tasks.*": {"queue": "batch"},
+    "apps.reporting.tasks.generate_*": {"queue": "batch"},
+    "apps.reporting.tasks.reconcile_*": {"queue": "batch"},
+    "apps.reporting.tasks.refresh_*": {"queue": "interactive"},
+    "*.notify_*": {"queue": "interactive"},
+    "*.warm_*": {"queue": "interactive"},
+}
+
+# Perfil por cola. interactive: prefetch alto y ack temprano para minimizar
+# latencia. batch: prefetch 1 y acks_late para que las tareas largas se
+# repartan entre workers y se reencolen si el worker muere.
+CELERY_QUEUE_PROFILES = {
+    "interactive": {
+        "prefetch_multiplier": 4,
+        "acks_late": False,
+        "soft_time_limit": 60,
+        "time_limit": 90,
+    },
+    "batch": {
+        "prefetch_multiplier": 1,
+        "acks_late": True,
+        "soft_time_limit": 60 * 60,
+        "time_limit": 60 * 65,
+    },
+    # Worker de inferencia (pool de threads): reservar muchos mensajes para
+    # que MicroBatcher pueda agruparlos en una sola predicción vectorizada.
+    "ml_inference": {
+        "prefetch_multiplier": 4,
+        "acks_late": False,
+        "soft_time_limit": 30,
+        "time_limit": 45,
+    },
+}
+
+# Cola que consume este worker (ver command de los servicios en compose)
+CELERY_WORKER_QUEUE = env("CELERY_WORKER_QUEUE", default="interactive")
+_celery_profile = CELERY_QUEUE_PROFILES.get(
+    CELERY_WORKER_QUEUE, CELERY_QUEUE_PROFILES["interactive"]
+)
+
+CELERY_WORKER_PREFETCH_MULTIPLIER = _celery_profile["prefetch_multiplier"]
+CELERY_TASK_ACKS_LATE = _celery_profile["acks_late"]
+CELERY_TASK_REJECT_ON_WORKER_LOST = _celery_profile["acks_late"]
+CELERY_TASK_SOFT_TIME_LIMIT = _celery_profile["soft_time_limit"]
+CELERY_TASK_TIME_LIMIT = _celery_profile["time_limit"]
+
+# Métricas de tiempos por tarea (apps.core.celery_metrics)
+CELERY_METRICS_ENABLED = env.bool("CELERY_METRICS_ENABLED", default=True)
+
+# Tareas periódicas. DatabaseScheduler (django_celery_beat) sincroniza estas
+# entradas en la base de datos al arrancar beat; se pueden ajustar desde el admin.
+CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+CELERY_BEAT_SCHEDULE = {
+    "reconcile-time-rollups": {
+        "task": "apps.reporting.tasks.reconcile_time_rollups",
+        "schedule": crontab(hour=3, minute=30),
+    },
+    "warm-selector-cache": {
+        "task": "apps.core.tasks.warm_selector_cache",
+        "schedule": SELECTOR_CACHE_WARM_INTERVAL,
+    },
+}
+
+
+# Cuadros de mando (apps.reporting)
+
+# Filas por INSERT ... ON CONFLICT al escribir agregados
+ROLLUP_BATCH_SIZE = env.int("ROLLUP_BATCH_SIZE", default=1000)
+
+
+# Capacidad de equipos (apps.resources.capacity)
+# Segundos que se cachea cada mes calculado de una persona; los cambios de
+# ausencias, asignaciones o calendarios lo invalidan antes.
+CAPACITY_CACHE_TTL = env.int("CAPACITY_CACHE_TTL", default=7 * 24 * 3600)
+
+# Importación masiva de horas (apps.timetracking.services)
+
+# Filas por COPY + INSERT ... ON CONFLICT
+TIME_ENTRY_IMPORT_BATCH_SIZE = env.int("TIME_ENTRY_IMPORT_BATCH_SIZE", default=10_000)
+
+# Exportaciones CSV/XLSX (apps.reporting.exports)
+# Espera máxima del long-polling de estado (?wait=N) y frecuencia de consulta
+EXPORT_STATUS_MAX_WAIT = env.float("EXPORT_STATUS_MAX_WAIT", default=30.0)
+EXPORT_STATUS_POLL_INTERVAL = env.float("EXPORT_STATUS_POLL_INTERVAL", default=1.0)
+# Filas por lectura del cursor de servidor
+EXPORT_CHUNK_SIZE = env.int("EXPORT_CHUNK_SIZE", default=2000)
+# Por encima de este número de filas la exportación se genera en Celery
+EXPORT_SYNC_MAX_ROWS = env.int("EXPORT_SYNC_MAX_ROWS", default=50_000)
+# URL pública para enlaces en emails (sin barra final)
+SITE_URL = env("SITE_URL", default="http://localhost:8000")
+
+
+# Llamadas HTTP salientes (apps.core.async_utils)
+
+OUTBOUND_HTTP_TIMEOUT = env.float("OUTBOUND_HTTP_TIMEOUT", default=10.0)
+OUTBOUND_HTTP_CONNECT_TIMEOUT = env.float("OUTBOUND_HTTP_CONNECT_TIMEOUT", default=3.0)
+OUTBOUND_HTTP_MAX_CONNECTIONS = env.int("OUTBOUND_HTTP_MAX_CONNECTIONS", default=100)
+
+# Endpoints de benchmark WSGI vs ASGI (scripts/bench_server.py). Nunca en producción.
+BENCHMARK_ENDPOINTS = env.bool("BENCHMARK_ENDPOINTS", default=False)
+BENCHMARK_UPSTREAM_URL = env("BENCHMARK_UPSTREAM_URL", default="http://127.0.0.1:8099/")
+
+
+# Estimaciones ML (apps.estimation)
+
+ESTIMATION_MODEL_PATH = Path(env("ML_MODEL_PATH", default=str(BASE_DIR / "ml_models"))) / (
+    "estimation.joblib"
+)
+# Tamaño máximo de lote y espera máxima para agrupar predicciones concurrentes
+ESTIMATION_BATCH_MAX_SIZE = env.int("ESTIMATION_BATCH_MAX_SIZE", default=32)
+ESTIMATION_BATCH_MAX_WAIT_MS = env.float("ESTIMATION_BATCH_MAX_WAIT_MS", default=10.0)
+# Segundos que el web espera la respuesta del worker de inferencia
+ESTIMATION_PREDICT_TIMEOUT = env.float("ESTIMATION_PREDICT_TIMEOUT", default=10.0)
+# Estimación en lote (EstimationService.estimate_projects): modelo de spaCy,
+# cache en disco de features por hash del texto, proyectos por página (y por
+# tarea en la cola batch) y procesos de extracción del comando (0 = uno por núcleo)
+ESTIMATION_SPACY_MODEL = env("ESTIMATION_SPACY_MODEL", default="es_core_news_sm")
+ESTIMATION_FEATURE_CACHE_DIR = Path(
+    env("ESTIMATION_FEATURE_CACHE_DIR", default=str(BASE_DIR / "ml_cache" / "features"))
+)
+ESTIMATION_PIPELINE_CHUNK_SIZE = env.int("ESTIMATION_PIPELINE_CHUNK_SIZE", default=500)
+ESTIMATION_PIPELINE_WORKERS = env.int("ESTIMATION_PIPELINE_WORKERS", default=0)
+# Registro de modelos (apps.estimation.registry): los artefactos van al storage
+# por defecto; con storages remotos se descargan a ML_ARTIFACT_CACHE_DIR (uno
+# por nodo) para mapearlos en memoria. Los workers de inferencia comprueban la
+# versión activa cada ML_MODEL_CHECK_INTERVAL segundos.
+ML_ARTIFACT_CACHE_DIR = Path(
+    env("ML_ARTIFACT_CACHE_DIR", default=str(BASE_DIR / "ml_cache" / "artifacts"))
+)
+ML_MODEL_CHECK_INTERVAL = env.float("ML_MODEL_CHECK_INTERVAL", default=30.0)
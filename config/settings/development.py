@@ -18,5 +18,13 @@ MIDDLEWARE += [  # noqa: F405
 # === CONFIGURACIÓN DE DEBUG TOOLBAR ===
 INTERNAL_IPS = ["127.0.0.1", "localhost"]
 
+# === VITE ===
+# Assets servidos por el dev server de Vite (HMR) en vez del manifest del build
+DJANGO_VITE["default"]["dev_mode"] = env.bool("DJANGO_VITE_DEV_MODE", default=True)  # noqa: F405
+
 # CORS permisivo en desarrollo
 CORS_ALLOW_ALL_ORIGINS = True
+
+# === PRESUPUESTO DE QUERIES ===
+# Medir todas las requests en desarrollo; N+1 y excesos se ven en el log
+QUERY_BUDGET_SAMPLE_RATE = 1.0
@@ -5,6 +5,8 @@ from .base import *  # noqa: F403
 ALLOWED_HOSTS = list(env("ALLOWED_HOSTS", default="ocalhost,127.0.0.1").split(","))  # noqa: F405
 
 SECURE_SSL_REDIRECT = env("SECURE_SSL_REDIRECT", default="True") == "True"  # noqa: F405
+# Los healthchecks llegan por HTTP desde dentro del contenedor
+SECURE_REDIRECT_EXEMPT = [r"^healthz/$", r"^readyz/$"]
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 SECURE_BROWSER_XSS_FILTER = True
@@ -12,24 +14,28 @@ SECURE_CONTENT_TYPE_NOSNIFF = True
 X_FRAME_OPTIONS = "DENY"
 
 # CORS específico
-CORS_ALLOWED_ORIGINS = (
-    env("CORS_ALLOWED_ORIGINS", default="").split(",") if env("CORS_ALLOWED_ORIGINS") else []  # noqa: F405
-)
+CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[])  # noqa: F405
 
-# Logging a stdout (Docker-friendly)
+# Logging a stdout (Docker-friendly). En JSON (config.logs) cada línea lleva
+# trace_id, span_id y request_id; LOG_FORMAT=text para el formato clásico.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
+    "filters": {
+        "trace_context": {"()": "config.logs.TraceContextFilter"},
+    },
     "formatters": {
+        "json": {"()": "config.logs.JsonFormatter"},
         "verbose": {
-            "format": "{levelname} {asctime} {module} {message}",
+            "format": "{levelname} {asctime} {module} {request_id} {message}",
             "style": "{",
         },
     },
     "handlers": {
         "console": {
             "class": "logging.StreamHandler",
-            "formatter": "verbose",
+            "formatter": "json" if env("LOG_FORMAT", default="json") == "json" else "verbose",  # noqa: F405
+            "filters": ["trace_context"],
         },
     },
     "root": {
@@ -37,22 +43,6 @@ LOGGING = {
         "level": env("LOG_LEVEL", default="INFO"),  # noqa: F405
     },
 }
+# Los workers usan el mismo LOGGING (JSON) en lugar del formato de Celery
+CELERY_WORKER_HIJACK_ROOT_LOGGER = False
 # Otras configuraciones de producción pueden ir aquí
-
-# Configuración de caché para producción (ejemplo con Redis)
-CACHES = {
-    "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
-        "LOCATION": env("REDIS_URL", default="redis://localhost:6379/0"),  # noqa: F405
-        "OPTIONS": {
-            "CLIENT_CLASS": "django_redis.client.DefaultClient",
-        },
-    }
-}
-
-# Configuración de Celery para producción
-CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="redis://localhost:6379/1")  # noqa: F405
-CELERY_RESULT_BACKEND = CELERY_BROKER_URL
-CELERY_ACCEPT_CONTENT = ["json"]
-CELERY_TASK_SERIALIZER = "json"
-CELERY_TIMEZONE = TIME_ZONE  # noqa: F405
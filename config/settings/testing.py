@@ -0,0 +1,29 @@
+# config/settings/testing.py
+import os
+
+from .base import *  # noqa: F403
+
+# === HOSTS PERMITIDOS ===
+ALLOWED_HOSTS = ["*"]
+
+# === HASHING RÁPIDO PARA TESTS ===
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# === PRESUPUESTO DE QUERIES ===
+# Cualquier vista que supere el presupuesto o tenga un N+1 hace fallar el test
+QUERY_BUDGET_SAMPLE_RATE = 1.0
+QUERY_BUDGET_MODE = "raise"
+
+# === ESTÁTICOS ===
+# Sin manifest: los tests no ejecutan collectstatic
+STORAGES = {
+    **STORAGES,  # noqa: F405
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+# Sin build de Vite: las plantillas apuntan al dev server en vez de al manifest
+DJANGO_VITE["default"]["dev_mode"] = True  # noqa: F405
+
+# === CACHE ===
+# Un prefijo por worker de pytest-xdist: cada worker limpia solo sus claves
+# entre tests (ver tests/conftest.py) sin afectar a los demás
+CACHES["default"]["KEY_PREFIX"] = f"test-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"  # noqa: F405
@@ -0,0 +1,651 @@
+"""
+Trazas de bajo coste compatibles con OpenTelemetry.
+
+Cada request, tarea Celery, vista, selector, service, query SQL y llamada a
+Redis puede abrir un span. Los spans usan el modelo de OpenTelemetry
+(trace_id de 128 bits, span_id de 64 bits, kind, atributos, estado), se
+propagan con la cabecera W3C ``traceparent`` y se exportan en formato OTLP
+JSON, así que cualquier collector OpenTelemetry los entiende sin añadir el
+SDK como dependencia.
+
+Muestreo por traza (decidido en el span raíz, TELEMETRY_SAMPLE_RATE) y
+respetando la decisión del llamante cuando llega un ``traceparent``. En una
+traza no muestreada los spans hijos no se crean: abrir uno cuesta leer una
+variable de contexto. Los identificadores existen igualmente para
+correlacionar logs (ver ``config.logs``).
+
+Los spans terminados se encolan y un thread en segundo plano los exporta
+por lotes (BatchSpanProcessor); si la cola se llena se descartan en vez de
+bloquear la request.
+
+Example:
+    >>> from config.telemetry import start_span, traced
+    >>> with start_span("estimation.features", attributes={"project.id": 3}) as s:
+    ...     s.set_attribute("features.count", 42)
+    >>> @traced
+    ... def get_team_capacity(*, team_id): ...
+"""
+
+import atexit
+import functools
+import inspect
+import logging
+import os
+import random
+import re
+import socket
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from contextvars import ContextVar
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class SpanKind(IntEnum):
+    """Tipos de span (mismos valores que OTLP)."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+class StatusCode(IntEnum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+class SpanContext(NamedTuple):
+    """Identidad de un span remoto (recibido en un ``traceparent``)."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+
+_request_id: ContextVar[str | None] = ContextVar("telemetry_request_id", default=None)
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+# --- SPANS ---
+
+
+class Span:
+    """
+    Span en curso o terminado de una traza muestreada.
+
+    Se usa como context manager: al entrar pasa a ser el span actual (padre
+    de los que se abran dentro) y al salir se cierra, registrando la
+    excepción si la hay.
+    """
+
+    __slots__ = (
+        "_active",
+        "_previous",
+        "_start_perf",
+        "attributes",
+        "end_ns",
+        "kind",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "status",
+        "status_message",
+        "trace_id",
+    )
+
+    sampled = True
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        trace_id: str,
+        parent_id: str | None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Mapping[str, Any] | None = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = _new_span_id()
+        self.parent_id = parent_id
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = StatusCode.UNSET
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter_ns()
+        self.end_ns: int | None = None
+        self._active = False
+        self._previous: Span | None = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def set_status(self, status: StatusCode, message: str = "") -> None:
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.attributes["exception.type"] = type(exc).__qualname__
+        self.attributes["exception.message"] = str(exc)[:500]
+        self.set_status(StatusCode.ERROR, type(exc).__qualname__)
+
+    def activate(self) -> None:
+        """
+        Convertir en span actual sin context manager (cerrar con ``end``).
+
+        Al cerrarse se restaura el span anterior con ``set`` y no con un
+        token: el middleware puede activar y cerrar en contextos distintos
+        (sync_to_async copia el contexto y devuelve los cambios).
+        """
+        self._previous = _current_span.get()
+        self._active = True
+        _current_span.set(self)
+
+    def _deactivate(self) -> None:
+        if self._active:
+            self._active = False
+            _current_span.set(self._previous)
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self._deactivate()
+        self.end_ns = self.start_ns + time.perf_counter_ns() - self._start_perf
+        if _processor is not None:
+            _processor.on_end(self)
+
+    def __enter__(self) -> Self:
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.record_exception(exc)
+        self.end()
+
+
+class NonRecordingSpan(Span):
+    """
+    Raíz de una traza no muestreada: identificadores para los logs y la
+    propagación, sin atributos ni exportación.
+    """
+
+    __slots__ = ("_sampled",)
+
+    def __init__(self, *, trace_id: str, span_id: str | None = None, sampled: bool = False):
+        self.name = ""
+        self.kind = SpanKind.INTERNAL
+        self.trace_id = trace_id
+        self.span_id = span_id or _new_span_id()
+        self.parent_id = None
+        self.attributes = {}
+        self.status = StatusCode.UNSET
+        self.status_message = ""
+        self.start_ns = self.end_ns = 0
+        self._start_perf = 0
+        self._active = False
+        self._previous = None
+        self._sampled = sampled
+
+    @property
+    def sampled(self) -> bool:  # type: ignore[override]
+        return self._sampled
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self._sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        pass
+
+    def set_status(self, status: StatusCode, message: str = "") -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        self._deactivate()
+
+
+class _NoopSpan:
+    """Hijo de una traza no muestreada: no cambia el span actual."""
+
+    __slots__ = ()
+
+    sampled = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        pass
+
+    def set_status(self, status: StatusCode, message: str = "") -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def activate(self) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("telemetry_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Span actual (None fuera de cualquier request o tarea)."""
+    return _current_span.get()
+
+
+def is_recording() -> bool:
+    """True si la traza actual se está muestreando."""
+    current = _current_span.get()
+    return current is not None and current.sampled
+
+
+def parse_traceparent(value: str | None) -> SpanContext | None:
+    """Cabecera W3C ``traceparent`` → SpanContext (None si falta o no es válida)."""
+    if not value:
+        return None
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None or match[1] == "0" * 32 or match[2] == "0" * 16:
+        return None
+    return SpanContext(match[1], match[2], bool(int(match[3], 16) & 1))
+
+
+def start_span(
+    name: str,
+    *,
+    kind: SpanKind = SpanKind.INTERNAL,
+    attributes: Mapping[str, Any] | None = None,
+    parent: SpanContext | None = None,
+) -> Span | _NoopSpan:
+    """
+    Crear un span hijo del actual, o la raíz de una traza nueva.
+
+    Args:
+        name: Nombre del span (``GET /api/projects/``, ``selector get_hours_series``)
+        kind: Tipo de span (SERVER para requests, CONSUMER para tareas...)
+        attributes: Atributos iniciales (convenciones semánticas de OpenTelemetry)
+        parent: Contexto remoto (``traceparent`` recibido); si se indica,
+            el span es raíz local de esa traza y hereda su decisión de muestreo
+
+    Returns:
+        El span, sin activar: usarlo como context manager o con
+        ``activate()`` / ``end()``
+    """
+    if parent is None:
+        current = _current_span.get()
+        if current is not None:
+            if not current.sampled:
+                return NOOP_SPAN
+            return Span(
+                name,
+                trace_id=current.trace_id,
+                parent_id=current.span_id,
+                kind=kind,
+                attributes=attributes,
+            )
+        sampled = _config.enabled and random.random() < _config.sample_rate  # noqa: S311
+        if not sampled:
+            return NonRecordingSpan(trace_id=_new_trace_id())
+        return Span(
+            name, trace_id=_new_trace_id(), parent_id=None, kind=kind, attributes=attributes
+        )
+
+    if not (_config.enabled and parent.sampled):
+        return NonRecordingSpan(trace_id=parent.trace_id, sampled=parent.sampled)
+    return Span(
+        name, trace_id=parent.trace_id, parent_id=parent.span_id, kind=kind, attributes=attributes
+    )
+
+
+def traced[F: Callable[..., Any]](func: F | None = None, *, name: str | None = None) -> Any:
+    """
+    Decorador que abre un span alrededor de cada llamada.
+
+    El nombre por defecto es el ``__qualname__`` de la función. Funciona con
+    funciones síncronas y async.
+
+    Example:
+        >>> @traced
+        ... def get_team_capacity(*, team_id: int) -> dict: ...
+        >>> @traced(name="estimation.predict")
+        ... def predict(features): ...
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+        attributes = {"code.function": func.__qualname__, "code.namespace": func.__module__}
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not is_recording():
+                    return await func(*args, **kwargs)
+                with start_span(span_name, attributes=attributes):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_recording():
+                return func(*args, **kwargs)
+            with start_span(span_name, attributes=attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator(func) if func is not None else decorator
+
+
+def get_request_id() -> str | None:
+    """Identificador de la request o tarea en curso (para logs y cabeceras)."""
+    return _request_id.get()
+
+
+def set_request_id(request_id: str | None):
+    """Fijar el identificador de request; devuelve el token para restaurarlo."""
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token) -> None:
+    _request_id.reset(token)
+
+
+# --- EXPORTACIÓN ---
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def encode_spans(spans: Iterable[Span], resource: Mapping[str, Any]) -> dict[str, Any]:
+    """Lote de spans como ExportTraceServiceRequest de OTLP (JSON)."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes(resource)},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "config.telemetry"},
+                        "spans": [
+                            {
+                                "traceId": s.trace_id,
+                                "spanId": s.span_id,
+                                "parentSpanId": s.parent_id or "",
+                                "name": s.name,
+                                "kind": int(s.kind),
+                                "startTimeUnixNano": str(s.start_ns),
+                                "endTimeUnixNano": str(s.end_ns),
+                                "attributes": _otlp_attributes(s.attributes),
+                                "status": {"code": int(s.status), "message": s.status_message},
+                            }
+                            for s in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter:
+    """Destino de los lotes de spans."""
+
+    def export(self, payload: bytes) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Una línea OTLP JSON por lote, añadida al fichero.
+
+    Es el formato del receiver ``otlpjsonfile`` del collector de
+    OpenTelemetry. Varios procesos pueden escribir en el mismo fichero: cada
+    lote es una única escritura en modo append.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, payload: bytes) -> None:
+        with self.path.open("ab") as f:
+            f.write(payload + b"\n")
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """POST de cada lote a ``{endpoint}/v1/traces`` (OTLP/HTTP con JSON)."""
+
+    def __init__(self, endpoint: str, *, timeout: float = 5.0):
+        self.url = f"{endpoint.rstrip('/')}/v1/traces"
+        self._client = httpx.Client(timeout=timeout)
+
+    def export(self, payload: bytes) -> None:
+        response = self._client.post(
+            self.url, content=payload, headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+
+    def shutdown(self) -> None:
+        self._client.close()
+
+
+class BatchSpanProcessor:
+    """
+    Cola de spans terminados exportada por lotes desde un thread propio.
+
+    Los workers de gunicorn y Celery (prefork) se crean con fork: el thread
+    se arranca de forma perezosa en cada proceso y la cola se vacía en el
+    hijo para no exportar dos veces los spans del padre.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        *,
+        resource: Mapping[str, Any],
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        interval: float = 2.0,
+    ):
+        self.exporter = exporter
+        self.resource = dict(resource)
+        self.max_batch_size = max_batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._queue: deque[Span] = deque()
+        self._max_queue_size = max_queue_size
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def on_end(self, span: Span) -> None:
+        if len(self._queue) >= self._max_queue_size:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if self._thread is None or self._pid != os.getpid():
+            self._start()
+        if len(self._queue) >= self.max_batch_size:
+            self._wakeup.set()
+
+    def force_flush(self) -> None:
+        while self._queue:
+            self._export_batch()
+
+    def shutdown(self) -> None:
+        self.force_flush()
+        self.exporter.shutdown()
+
+    def _after_fork(self) -> None:
+        self._queue.clear()
+        self._thread = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="telemetry-exporter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.force_flush()
+
+    def _export_batch(self) -> None:
+        batch = []
+        while self._queue and len(batch) < self.max_batch_size:
+            batch.append(self._queue.popleft())
+        if not batch:
+            return
+        try:
+            self.exporter.export(orjson.dumps(encode_spans(batch, self.resource)))
+        except Exception as e:
+            self.dropped += len(batch)
+            logger.warning(f"No se pudieron exportar {len(batch)} spans: {e}")
+
+
+# --- CONFIGURACIÓN ---
+
+
+class _Config(NamedTuple):
+    enabled: bool = False
+    sample_rate: float = 0.0
+
+
+_config = _Config()
+_processor: BatchSpanProcessor | None = None
+
+
+def configure(
+    *,
+    enabled: bool,
+    sample_rate: float = 1.0,
+    exporter: SpanExporter | None = None,
+    service_name: str = "intranet",
+    resource: Mapping[str, Any] | None = None,
+    max_queue_size: int = 2048,
+    max_batch_size: int = 512,
+    interval: float = 2.0,
+) -> BatchSpanProcessor | None:
+    """
+    Activar (o desactivar) el muestreo y la exportación en este proceso.
+
+    Sin exportador los spans muestreados se crean y se descartan al cerrarse
+    (útil para medir el coste de instrumentar sin I/O).
+    """
+    global _config, _processor
+    if _processor is not None:
+        _processor.shutdown()
+    _config = _Config(enabled=enabled, sample_rate=min(max(sample_rate, 0.0), 1.0))
+    _processor = None
+    if enabled and exporter is not None:
+        _processor = BatchSpanProcessor(
+            exporter,
+            resource={
+                "service.name": service_name,
+                "host.name": socket.gethostname(),
+                "process.pid": os.getpid(),
+                **(resource or {}),
+            },
+            max_queue_size=max_queue_size,
+            max_batch_size=max_batch_size,
+            interval=interval,
+        )
+    return _processor
+
+
+def build_exporter(kind: str, *, file_path: str = "", endpoint: str = "") -> SpanExporter | None:
+    """Exportador a partir de TELEMETRY_EXPORTER (file | otlp | none)."""
+    match kind:
+        case "file":
+            return FileSpanExporter(file_path)
+        case "otlp":
+            return OTLPHttpSpanExporter(endpoint)
+        case "none" | "":
+            return None
+    raise ValueError(f"TELEMETRY_EXPORTER desconocido: {kind!r} (file | otlp | none)")
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    if _processor is not None:
+        _processor.force_flush()
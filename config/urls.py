@@ -15,8 +15,11 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('reporting/', include('apps.reporting.urls')),
+    path('api/timetracking/', include('apps.timetracking.urls')),
+    path('', include('apps.core.urls')),
 ]
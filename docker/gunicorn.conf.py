@@ -0,0 +1,30 @@
+"""
+Configuración de gunicorn para 10Code Intranet.
+
+SERVER_MODE selecciona el tipo de worker:
+- wsgi (por defecto): workers síncronos sobre config.wsgi. Cada request ocupa
+  un worker durante toda su duración, incluidas las llamadas salientes.
+- asgi: workers uvicorn sobre config.asgi. Las vistas async (long-polling,
+  callbacks SSO, integraciones externas) esperan I/O sin bloquear el worker.
+
+Uso: gunicorn -c docker/gunicorn.conf.py
+"""
+
+import os
+
+server_mode = os.getenv("SERVER_MODE", "wsgi").lower()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "3"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+accesslog = "-"
+errorlog = "-"
+
+if server_mode == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "config.wsgi:application"
+    worker_class = "sync"
@@ -12,13 +12,16 @@ export default defineConfig({
     },
   },
 
-  // Configuración para django-vite
-  base: '/static/',
+  // Configuración para django-vite: STATIC_URL + static_url_prefix ("dist")
+  base: '/static/dist/',
 
   build: {
-    // Output a la carpeta que Django espera
-    outDir: '../staticfiles/dist',
+    // collectstatic recoge frontend/dist como STATIC_ROOT/dist (STATICFILES_DIRS)
+    // y genera las variantes .gz/.br; los ficheros de assets/ llevan el hash de
+    // Vite y WhiteNoise los sirve como immutable
+    outDir: 'dist',
     emptyOutDir: true,
+    assetsDir: 'assets',
 
     // Generar manifest para django-vite
     manifest: 'manifest.json',
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""
+Microbenchmark de serialización JSON: encoder de la stdlib frente a orjson.
+
+Compara, sobre payloads representativos (registro de horas y backlog):
+- inertia: json.dumps + InertiaJsonEncoder  vs  FastInertiaJSONEncoder
+- drf:     JSONRenderer                     vs  FastJSONRenderer
+
+Los payloads incluyen Decimal, datetime aware (UTC, como llegan de la base de
+datos), date, UUID y
+cadenas de traducción lazy, que son los tipos que pasan por ``default``.
+
+Uso:
+    python scripts/bench_json.py [--rows 5000] [--repeat 5] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+
+def timesheet_payload(rows: int) -> dict:
+    """Props de una página de registro de horas: una fila por TimeEntry."""
+    start = datetime(2025, 1, 6, 8, 30, tzinfo=UTC)
+    return {
+        "entries": [
+            {
+                "id": i,
+                "uuid": uuid.UUID(int=i),
+                "date": (start + timedelta(days=i % 90)).date(),
+                "user": {
+                    "id": i % 40,
+                    "username": f"user{i % 40}",
+                    "email": f"user{i % 40}@10code.es",
+                },
+                "project": {"id": i % 25, "name": f"Proyecto {i % 25}", "client": "Cliente S.L."},
+                "hours": Decimal("7.50") - Decimal(i % 4) / 4,
+                "billable": i % 3 != 0,
+                "description": "Desarrollo de la funcionalidad de exportación y revisión de PRs",
+                "created_at": start + timedelta(minutes=i),
+                "updated_at": start + timedelta(minutes=i, seconds=12, microseconds=345678),
+            }
+            for i in range(rows)
+        ],
+        "totals": {"hours": Decimal("31250.00"), "billable_hours": Decimal("20833.25")},
+        "filters": {"date_from": date(2025, 1, 1), "date_to": date(2025, 3, 31)},
+    }
+
+
+def backlog_payload(rows: int) -> dict:
+    """
+    Lista de backlog: tareas con estado y cabeceras de columna traducibles.
+
+    Por fila el estado ya es str (``get_status_display``); las cadenas lazy
+    aparecen en los metadatos de la tabla.
+    """
+    from django.utils.translation import gettext_lazy as _
+
+    statuses = ["Pendiente", "En curso", "Hecho"]
+    now = datetime(2025, 6, 1, 10, 0, tzinfo=UTC)
+    return {
+        "columns": [
+            {"key": key, "label": _(label)}
+            for key, label in (
+                ("title", "Título"),
+                ("status", "Estado"),
+                ("estimate_hours", "Estimación"),
+            )
+        ],
+        "tasks": [
+            {
+                "id": i,
+                "title": f"Tarea {i}: revisar estimación del módulo {i % 12}",
+                "status": statuses[i % 3],
+                "estimate_hours": Decimal(i % 16) + Decimal("0.5"),
+                "tags": ["backend", "frontend", "ml"][: 1 + i % 3],
+                "assignee_id": i % 40 or None,
+                "due_date": (now + timedelta(days=i % 30)).date(),
+                "updated_at": now - timedelta(hours=i),
+            }
+            for i in range(rows)
+        ],
+        "can_edit": True,
+    }
+
+
+def measure(func, payload, repeat: int) -> tuple[float, int]:
+    """Mediana en ms de ``repeat`` ejecuciones y tamaño de la salida."""
+    output = func(payload)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payload)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), len(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=5000, help="Filas por payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por medición")
+    parser.add_argument(
+        "--settings",
+        default=os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings.development"),
+        help="Módulo de settings de Django",
+    )
+    parser.add_argument("--json", action="store_true", help="Emitir resultados en JSON")
+    args = parser.parse_args()
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    import django
+
+    django.setup()
+
+    from inertia.utils import InertiaJsonEncoder
+    from rest_framework.renderers import JSONRenderer
+
+    from django.utils import translation
+
+    from apps.core.json import FastInertiaJSONEncoder, FastJSONRenderer
+
+    translation.activate("es")
+    drf, fast_drf = JSONRenderer(), FastJSONRenderer()
+    encoders = {
+        "inertia": (
+            lambda data: json.dumps(data, cls=InertiaJsonEncoder),
+            lambda data: json.dumps(data, cls=FastInertiaJSONEncoder),
+        ),
+        "drf": (drf.render, fast_drf.render),
+    }
+    payloads = {
+        "timesheet": timesheet_payload(args.rows),
+        "backlog": backlog_payload(args.rows),
+    }
+
+    results = []
+    for payload_name, payload in payloads.items():
+        for target, (baseline, fast) in encoders.items():
+            base_ms, base_size = measure(baseline, payload, args.repeat)
+            fast_ms, fast_size = measure(fast, payload, args.repeat)
+            results.append(
+                {
+                    "payload": payload_name,
+                    "target": target,
+                    "rows": args.rows,
+                    "stdlib_ms": round(base_ms, 2),
+                    "orjson_ms": round(fast_ms, 2),
+                    "speedup": round(base_ms / fast_ms, 1),
+                    "stdlib_bytes": base_size,
+                    "orjson_bytes": fast_size,
+                }
+            )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{args.rows} filas por payload, mediana de {args.repeat} ejecuciones\n")
+    print(
+        f"{'payload':<10} {'destino':<8} {'stdlib ms':>10} {'orjson ms':>10} {'x':>6} {'bytes':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['payload']:<10} {r['target']:<8} {r['stdlib_ms']:>10} {r['orjson_ms']:>10} "
+            f"{r['speedup']:>6} {r['orjson_bytes']:>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+"""
+Benchmark WSGI vs ASGI con carga mixta (base de datos + I/O saliente).
+
+Para cada modo arranca gunicorn con docker/gunicorn.conf.py (SERVER_MODE=wsgi
+o asgi) y un servidor upstream local que responde con un retardo fijo
+(simula Google SSO o una integración externa). Después lanza N requests con
+C clientes concurrentes y mide throughput y latencias p50/p99.
+
+Escenarios:
+- wsgi/sync:  workers síncronos + vista síncrona (despliegue actual)
+- asgi/sync:  workers uvicorn + vista síncrona (ejecutada en thread)
+- asgi/async: workers uvicorn + vista async
+
+Requiere una base de datos accesible con la configuración de --settings.
+
+Uso:
+    python scripts/bench_server.py [--requests 2000] [--concurrency 64]
+        [--upstream-delay-ms 50] [--workers 3] [--json]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SCENARIOS = (
+    ("wsgi", "sync", "/_bench/mixed/"),
+    ("asgi", "sync", "/_bench/mixed/"),
+    ("asgi", "async", "/_bench/amixed/"),
+)
+
+
+def serve_upstream(port: int, delay_ms: float) -> None:
+    """Servidor HTTP mínimo (keep-alive) que responde tras ``delay_ms``."""
+    body = b'{"ok": true}'
+    response = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+    )
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            # El cliente cierra la conexión al terminar
+            with contextlib.suppress(asyncio.IncompleteReadError, ConnectionError):
+                while await reader.readuntil(b"\r\n\r\n"):
+                    await asyncio.sleep(delay_ms / 1000)
+                    writer.write(response)
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", port, backlog=1024)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def start_server(
+    mode: str, port: int, args: argparse.Namespace, upstream_url: str
+) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": args.settings,
+        "SERVER_MODE": mode,
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "WEB_CONCURRENCY": str(args.workers),
+        "BENCHMARK_ENDPOINTS": "True",
+        "BENCHMARK_UPSTREAM_URL": upstream_url,
+        "QUERY_BUDGET_SAMPLE_RATE": "0",
+        "DEBUG": "False",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "docker/gunicorn.conf.py"],
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL if not args.verbose else None,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get(url)).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise SystemExit(f"❌ El servidor no respondió en {timeout}s: {url}")
+
+
+async def run_load(url: str, total: int, concurrency: int) -> dict:
+    """Lanza ``total`` GET con ``concurrency`` clientes y mide latencias."""
+    latencies: list[float] = []
+    errors = 0
+    queue: asyncio.Queue[None] = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=60.0) as client:
+        await wait_ready(client, url)
+
+        async def worker() -> None:
+            nonlocal errors
+            while not queue.empty():
+                queue.get_nowait()
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 1) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 1) if latencies else None,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> list[dict]:
+    # Proceso aparte para que el upstream no compita con el generador de carga
+    upstream = multiprocessing.Process(
+        target=serve_upstream, args=(args.upstream_port, args.upstream_delay_ms), daemon=True
+    )
+    upstream.start()
+    upstream_url = f"http://127.0.0.1:{args.upstream_port}/"
+    results = []
+    try:
+        for mode, view, path in SCENARIOS:
+            server = start_server(mode, args.port, args, upstream_url)
+            try:
+                url = f"http://127.0.0.1:{args.port}{path}"
+                # Calentamiento: workers arrancados, conexiones al pool y al upstream
+                await run_load(url, args.concurrency * 2, args.concurrency)
+                stats = await run_load(url, args.requests, args.concurrency)
+                results.append({"mode": mode, "view": view, **stats})
+            finally:
+                server.send_signal(signal.SIGTERM)
+                await asyncio.to_thread(server.wait, 30)
+    finally:
+        upstream.terminate()
+        upstream.join()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="Requests por escenario")
+    parser.add_argument("--concurrency", type=int, default=64, help="Clientes concurrentes")
+    parser.add_argument("--workers", type=int, default=3, help="Workers de gunicorn")
+    parser.add_argument(
+        "--upstream-delay-ms",
+        type=float,
+        default=50.0,
+        help="Latencia simulada de la llamada saliente",
+    )
+    parser.add_argument("--port", type=int, default=8765, help="Puerto para gunicorn")
+    parser.add_argument(
+        "--upstream-port", type=int, default=8099, help="Puerto del upstream simulado"
+    )
+    parser.add_argument(
+        "--settings",
+        default=os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings.production"),
+        help="Módulo de settings de Django",
+    )
+    parser.add_argument("--json", action="store_true", help="Emitir resultados en JSON")
+    parser.add_argument("--verbose", action="store_true", help="Mostrar logs de gunicorn")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(
+        f"\n{args.requests} requests, {args.concurrency} concurrentes, {args.workers} workers, "
+        f"upstream {args.upstream_delay_ms:.0f}ms\n"
+    )
+    print(f"{'modo':<6} {'vista':<6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errores':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<6} {r['view']:<6} {r['rps']:>9} {r['p50_ms']!s:>9} "
+            f"{r['p99_ms']!s:>9} {r['errors']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Control de regresión del tiempo de arranque de Django.
+
+Ejecuta ``django.setup()`` en un intérprete limpio con ``python -X importtime``
+y falla si:
+- El tiempo total de imports supera el presupuesto (--budget-ms)
+- Se importa alguna dependencia pesada de ML (deben cargarse de forma
+  diferida vía apps.estimation.lazy)
+
+Uso:
+    python scripts/check_import_time.py [--budget-ms 1500] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+DEFAULT_BUDGET_MS = 1500
+
+
+def measure_imports(settings_module: str) -> list[tuple[int, int, str]]:
+    """
+    Lanza ``django.setup()`` con -X importtime y parsea la salida.
+
+    Returns:
+        Lista de (self_us, cumulative_us, módulo) en orden de import
+    """
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module, "PYTHONDONTWRITEBYTECODE": ""}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import django; django.setup()"],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        raise SystemExit(f"❌ django.setup() falló con código {result.returncode}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        # Quitar el espacio separador: la indentación restante indica anidamiento
+        rows.append((int(self_us), int(cumulative_us), name[1:].rstrip()))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=int,
+        default=int(os.environ.get("IMPORT_TIME_BUDGET_MS", DEFAULT_BUDGET_MS)),
+        help=f"Presupuesto de tiempo de imports en ms (default: {DEFAULT_BUDGET_MS})",
+    )
+    parser.add_argument("--top", type=int, default=15, help="Módulos más lentos a mostrar")
+    parser.add_argument(
+        "--settings",
+        default=os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings.development"),
+        help="Módulo de settings a cargar",
+    )
+    args = parser.parse_args()
+
+    # apps.estimation.lazy solo usa la stdlib: no importa Django en este proceso
+    # (la medición se hace en un intérprete aparte)
+    from apps.estimation.lazy import HEAVY_MODULES
+
+    print(f"⏱️  Midiendo imports de django.setup() ({args.settings})...")
+    rows = measure_imports(args.settings)
+
+    total_ms = sum(self_us for self_us, _, _ in rows) / 1000
+    top_level = {}
+    for _, cumulative_us, name in rows:
+        # Las líneas sin indentar son imports de primer nivel (cumulative incluye hijos)
+        if not name.startswith(" "):
+            top_level[name] = cumulative_us
+
+    print(f"\n🐢 Top {args.top} imports de primer nivel (acumulado):")
+    for name, cumulative_us in sorted(top_level.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    errors = []
+    imported = {name.strip() for _, _, name in rows}
+    heavy = sorted(m for m in HEAVY_MODULES if m in imported)
+    if heavy:
+        errors.append(
+            f"Dependencias de ML importadas al arrancar: {', '.join(heavy)}. "
+            "Usa apps.estimation.lazy para diferirlas."
+        )
+    if total_ms > args.budget_ms:
+        errors.append(
+            f"Tiempo de imports {total_ms:.0f} ms supera el presupuesto de {args.budget_ms} ms"
+        )
+
+    print(
+        f"\n📦 {len(rows)} módulos importados en {total_ms:.0f} ms (presupuesto: {args.budget_ms} ms)"
+    )
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        return 1
+
+    print("✅ Tiempo de arranque dentro del presupuesto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Medir el tiempo de arranque en frío del contenedor web.
+
+Recrea el servicio ``web`` con docker compose (sin tocar db/redis) y mide el
+tiempo hasta que ``/readyz/`` responde 200. Repite N veces y muestra la
+mediana y el máximo.
+
+Se ejecuta desde el host, no dentro del contenedor.
+
+Uso:
+    python scripts/measure_startup.py [--runs 5] [--url http://127.0.0.1:8000/readyz/]
+        [--compose-file compose.yml] [--timeout 120] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def compose(args: argparse.Namespace, *command: str) -> None:
+    files = [arg for path in args.compose_file for arg in ("-f", path)]
+    subprocess.run(  # noqa: S603
+        ["docker", "compose", *files, *command],  # noqa: S607
+        cwd=BASE_DIR,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def is_ready(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:  # noqa: S310
+            return response.status == 200
+    except OSError:  # URLError, ConnectionError, TimeoutError
+        return False
+
+
+def measure_once(args: argparse.Namespace) -> float:
+    """Segundos desde ``up --force-recreate`` hasta el primer 200 de readyz."""
+    compose(args, "stop", args.service)
+    started = time.monotonic()
+    compose(args, "up", "-d", "--no-deps", "--force-recreate", args.service)
+    deadline = started + args.timeout
+    while time.monotonic() < deadline:
+        if is_ready(args.url):
+            return time.monotonic() - started
+        time.sleep(0.1)
+    raise SystemExit(f"❌ {args.url} no respondió 200 en {args.timeout}s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Número de arranques a medir")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/readyz/", help="URL de readiness")
+    parser.add_argument("--service", default="web", help="Servicio de compose a recrear")
+    parser.add_argument(
+        "--compose-file",
+        action="append",
+        default=None,
+        help="Fichero compose (repetible). Por defecto compose.yml",
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="Espera máxima por arranque")
+    parser.add_argument("--json", action="store_true", help="Emitir resultados en JSON")
+    args = parser.parse_args()
+    args.compose_file = args.compose_file or ["compose.yml"]
+
+    samples = [measure_once(args) for _ in range(args.runs)]
+    result = {
+        "runs": args.runs,
+        "median_s": round(statistics.median(samples), 2),
+        "max_s": round(max(samples), 2),
+        "samples_s": [round(s, 2) for s in samples],
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"Arranque de '{args.service}' hasta readyz: mediana {result['median_s']}s, "
+            f"máximo {result['max_s']}s ({args.runs} arranques)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
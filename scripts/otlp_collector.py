@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+Collector OTLP/HTTP mínimo para desarrollo (sustituto de otel-collector).
+
+Recibe los lotes de spans que exporta config.telemetry con
+TELEMETRY_EXPORTER=otlp (POST /v1/traces, OTLP JSON), los añade a un fichero
+JSON Lines con el mismo formato que TELEMETRY_EXPORTER=file y, al pararlo
+(Ctrl+C), muestra dónde se va el tiempo: duración total, media y p95 por
+nombre de span.
+
+Con --summarize no arranca el servidor: resume un fichero ya escrito (por
+este script o por el exportador de ficheros).
+
+Uso:
+    python scripts/otlp_collector.py [--port 4318] [--output traces/collector.jsonl]
+    python scripts/otlp_collector.py --summarize traces/spans.jsonl [--top 20]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock
+
+
+def iter_spans(payload: dict):
+    for resource_spans in payload.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            yield from scope_spans.get("spans", [])
+
+
+def summarize(lines, *, top: int) -> str:
+    """Tabla de tiempos por nombre de span (milisegundos)."""
+    durations: dict[str, list[float]] = defaultdict(list)
+    traces = set()
+    for line in lines:
+        if not line.strip():
+            continue
+        for span in iter_spans(json.loads(line)):
+            traces.add(span["traceId"])
+            duration = int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])
+            durations[span["name"]].append(duration / 1_000_000)
+
+    rows = sorted(durations.items(), key=lambda item: sum(item[1]), reverse=True)[:top]
+    output = [
+        f"{sum(map(len, durations.values()))} spans en {len(traces)} trazas",
+        f"{'span':60} {'n':>6} {'total ms':>10} {'media':>8} {'p95':>8}",
+    ]
+    for name, values in rows:
+        p95 = statistics.quantiles(values, n=20)[-1] if len(values) > 1 else values[0]
+        output.append(
+            f"{name[:60]:60} {len(values):>6} {sum(values):>10.1f} "
+            f"{statistics.fmean(values):>8.2f} {p95:>8.2f}"
+        )
+    return "\n".join(output)
+
+
+def serve(port: int, output: Path, top: int) -> None:
+    output.parent.mkdir(parents=True, exist_ok=True)
+    lock = Lock()
+    received: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != "/v1/traces":
+                self.send_error(404)
+                return
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            try:
+                line = json.dumps(json.loads(body), separators=(",", ":"))
+            except ValueError:
+                self.send_error(400, "OTLP JSON no válido")
+                return
+            with lock, output.open("a") as f:
+                f.write(line + "\n")
+                received.append(line)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    print(f"Escuchando en http://127.0.0.1:{port}/v1/traces → {output}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if received:
+            print(summarize(received, top=top))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--output", type=Path, default=Path("traces/collector.jsonl"))
+    parser.add_argument("--summarize", type=Path, help="Resumir un fichero de spans y salir")
+    parser.add_argument("--top", type=int, default=20, help="Filas del resumen")
+    args = parser.parse_args()
+
+    if args.summarize:
+        with args.summarize.open() as f:
+            print(summarize(f, top=args.top))
+        return 0
+    serve(args.port, args.output, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
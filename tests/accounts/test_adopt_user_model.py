@@ -0,0 +1,47 @@
+import pytest
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.recorder import MigrationRecorder
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def recorder():
+    recorder = MigrationRecorder(connection)
+    recorder.ensure_schema()
+    recorder.migration_qs.filter(app__in=["auth", "accounts"]).delete()
+    return recorder
+
+
+@pytest.fixture
+def legacy_database(recorder):
+    """Base de datos creada con django.contrib.auth.User (antes de accounts.User)."""
+    recorder.record_applied("auth", "0001_initial")
+    ContentType.objects.filter(app_label="accounts", model="user").delete()
+    legacy = ContentType.objects.create(app_label="auth", model="user")
+    ContentType.objects.clear_cache()
+    yield legacy
+    ContentType.objects.clear_cache()
+
+
+def test_adopts_existing_auth_user_table(legacy_database, recorder, capsys):
+    call_command("adopt_user_model")
+
+    assert ("accounts", "0001_initial") in recorder.applied_migrations()
+    legacy_database.refresh_from_db()
+    # Mismo content type: se conservan los permisos ya asignados
+    assert legacy_database.app_label == "accounts"
+    assert "1 content type movido" in capsys.readouterr().out
+
+    call_command("adopt_user_model")
+    assert "ya está aplicada" in capsys.readouterr().out
+
+
+def test_new_database_only_needs_migrate(recorder, capsys):
+    call_command("adopt_user_model")
+
+    assert "basta con migrate" in capsys.readouterr().out
+    assert ("accounts", "0001_initial") not in recorder.applied_migrations()
@@ -0,0 +1,84 @@
+from importlib import import_module
+
+import pytest
+
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.http import HttpRequest
+
+from apps.accounts.models import User
+from apps.core.auth import AUTH_PERMISSIONS_CACHE_KEY, AUTH_USER_CACHE_KEY, CachedModelBackend
+
+pytestmark = pytest.mark.django_db
+
+
+def _request_user(client, user):
+    """Usuario de una request nueva con la sesión de ``user``."""
+    client.force_login(user)
+    session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+    request = HttpRequest()
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore(session_key)
+    return auth.get_user(request)
+
+
+def test_user_model_is_swapped():
+    assert auth.get_user_model() is User
+    assert User._meta.db_table == "auth_user"
+
+
+def test_warm_request_makes_no_auth_queries(user, django_assert_num_queries):
+    # Cache fría: usuario + permisos directos + permisos de grupo
+    with django_assert_num_queries(3):
+        request_user = CachedModelBackend().get_user(user.pk)
+        assert not request_user.has_perm("projects.view_project")
+
+    with django_assert_num_queries(0):
+        request_user = CachedModelBackend().get_user(user.pk)
+        assert request_user == user
+        assert not request_user.has_perm("projects.view_project")
+        # Dentro de la request se memoriza en el propio usuario
+        assert not request_user.has_perm("projects.add_project")
+
+
+def test_permission_changes_invalidate_cache(
+    client, user, grant, django_capture_on_commit_callbacks
+):
+    assert not _request_user(client, user).has_perm("projects.view_project")
+    grant(user, "projects.view_project")
+    assert _request_user(client, user).has_perm("projects.view_project")
+
+    group = Group.objects.create(name="Auditoría")
+    with django_capture_on_commit_callbacks(execute=True):
+        user.groups.add(group)
+    assert not _request_user(client, user).has_perm("projects.change_project")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        group.permissions.add(Permission.objects.get(codename="change_project"))
+    assert _request_user(client, user).has_perm("projects.change_project")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        group.delete()
+    assert not _request_user(client, user).has_perm("projects.change_project")
+
+
+def test_inactive_or_missing_user_is_anonymous(user, django_capture_on_commit_callbacks):
+    backend = CachedModelBackend()
+    assert backend.get_user(user.pk) == user
+    assert cache.get(AUTH_USER_CACHE_KEY.format(user_id=user.pk)) == user
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_active = False
+        user.save()
+    assert cache.get(AUTH_USER_CACHE_KEY.format(user_id=user.pk)) is None
+    assert backend.get_user(user.pk) is None
+    assert backend.get_user(999_999) is None
+
+
+def test_object_and_inactive_permissions_are_empty(user):
+    backend = CachedModelBackend()
+    assert backend.get_all_permissions(user, obj=object()) == set()
+    user.is_active = False
+    assert backend.get_all_permissions(user) == set()
+    assert cache.get(AUTH_PERMISSIONS_CACHE_KEY.format(user_id=user.pk)) is None
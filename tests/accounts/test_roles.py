@@ -0,0 +1,54 @@
+import pytest
+
+from django.contrib.auth.models import Group
+
+from apps.accounts.models import ROLE_GROUPS, User
+from apps.accounts.services import UserRoleService
+
+pytestmark = pytest.mark.django_db
+
+
+def _flags(user) -> dict[str, bool]:
+    user = User.objects.get(pk=user.pk)
+    return {flag: getattr(user, flag) for flag in ROLE_GROUPS}
+
+
+@pytest.fixture
+def directors():
+    return Group.objects.create(name=ROLE_GROUPS["is_director"])
+
+
+def test_flags_follow_group_membership(user, other_user, directors):
+    user.groups.add(directors)
+    assert _flags(user) == {"is_director": True, "is_project_manager": False, "is_tech_lead": False}
+
+    # Desde el lado del grupo
+    directors.user_set.add(other_user)
+    assert _flags(other_user)["is_director"]
+    directors.user_set.clear()
+    assert not _flags(user)["is_director"]
+    assert not _flags(other_user)["is_director"]
+
+
+def test_renaming_or_deleting_role_group(user, directors):
+    user.groups.add(directors)
+
+    directors.name = "Antigua dirección"
+    directors.save()
+    assert not _flags(user)["is_director"]
+
+    directors.name = ROLE_GROUPS["is_director"]
+    directors.save()
+    assert _flags(user)["is_director"]
+
+    directors.delete()
+    assert not _flags(user)["is_director"]
+
+
+def test_sync_all_users(user, other_user, directors):
+    user.groups.add(directors)
+    User.objects.update(is_director=True)
+
+    assert UserRoleService.sync_role_flags() == 2
+    assert _flags(user)["is_director"]
+    assert not _flags(other_user)["is_director"]
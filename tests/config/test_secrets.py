@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from config import secrets
+
+
+@pytest.fixture(autouse=True)
+def secret_dirs(tmp_path, monkeypatch):
+    """Directorios de secretos vacíos y caché limpia en cada test."""
+    monkeypatch.setattr(secrets, "DOCKER_SECRETS_DIR", tmp_path / "run")
+    monkeypatch.setattr(secrets, "BASE_DIR", tmp_path)
+    (tmp_path / "run").mkdir()
+    (tmp_path / "secrets").mkdir()
+    secrets.invalidate_secret()
+    yield tmp_path
+    secrets.invalidate_secret()
+
+
+def test_priority_docker_over_local_over_env(secret_dirs, monkeypatch):
+    monkeypatch.setenv("api_token", "from-env")
+    assert secrets.read_secret("api_token") == "from-env"
+
+    (secret_dirs / "secrets" / "api_token.txt").write_text("from-local\n")
+    secrets.invalidate_secret("api_token")
+    assert secrets.read_secret("api_token") == "from-local"
+
+    (secret_dirs / "run" / "api_token").write_text("from-docker")
+    secrets.invalidate_secret("api_token")
+    assert secrets.read_secret("api_token") == "from-docker"
+
+
+def test_cached_per_process_without_reload(secret_dirs, monkeypatch):
+    monkeypatch.setenv("api_token", "first")
+    assert secrets.read_secret("api_token") == "first"
+
+    monkeypatch.setenv("api_token", "second")
+    (secret_dirs / "secrets" / "api_token.txt").write_text("file")
+    assert secrets.read_secret("api_token") == "first"
+
+
+def test_reload_picks_up_env_change(monkeypatch):
+    monkeypatch.setenv("api_token", "first")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "first"
+
+    monkeypatch.setenv("api_token", "second")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "second"
+
+
+def test_reload_picks_up_file_created_after_missing(secret_dirs):
+    assert secrets.read_secret("api_token", required=False, reload_on_change=True) is None
+
+    (secret_dirs / "secrets" / "api_token.txt").write_text("created")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "created"
+
+
+def test_reload_picks_up_file_over_env(secret_dirs, monkeypatch):
+    monkeypatch.setenv("api_token", "from-env")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "from-env"
+
+    (secret_dirs / "run" / "api_token").write_text("from-docker")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "from-docker"
+
+
+def test_reload_picks_up_docker_secret_over_local(secret_dirs):
+    (secret_dirs / "secrets" / "api_token.txt").write_text("from-local")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "from-local"
+
+    (secret_dirs / "run" / "api_token").write_text("from-docker")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "from-docker"
+
+
+def test_reload_on_rotated_and_removed_file(secret_dirs, monkeypatch):
+    path = secret_dirs / "secrets" / "api_token.txt"
+    path.write_text("v1")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "v1"
+
+    path.write_text("v2")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert secrets.read_secret("api_token", reload_on_change=True) == "v2"
+
+    path.unlink()
+    monkeypatch.setenv("api_token", "fallback")
+    assert secrets.read_secret("api_token", reload_on_change=True) == "fallback"
+
+
+def test_required_missing_raises():
+    with pytest.raises(ValueError, match="no encontrado"):
+        secrets.read_secret("api_token")
+    assert secrets.read_secret("api_token", required=False, default="x") == "x"
@@ -0,0 +1,63 @@
+import pytest
+
+from django.core.cache import cache
+
+from config.celery import app as celery_app
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Vaciar la cache tras cada test.
+
+    Los tests no hacen commit, así que las invalidaciones en on_commit (auth,
+    props compartidas) no llegan a ejecutarse.
+    """
+    yield
+    cache.delete_pattern("*")
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(
+        username="ana", email="ana@10code.es", password="x"
+    )
+
+
+@pytest.fixture
+def other_user(django_user_model):
+    return django_user_model.objects.create_user(
+        username="luis", email="luis@10code.es", password="x"
+    )
+
+
+@pytest.fixture
+def project(user):
+    from apps.projects.models import Project
+
+    return Project.objects.create(name="Intranet", client="10Code", created_by=user)
+
+
+@pytest.fixture
+def grant(django_capture_on_commit_callbacks):
+    """Dar permisos (``app_label.codename``) a un usuario y devolverlo recargado."""
+    from django.contrib.auth.models import Permission
+
+    def _grant(user, *perms):
+        # Las invalidaciones de la cache de auth se ejecutan tras el commit
+        with django_capture_on_commit_callbacks(execute=True):
+            for perm in perms:
+                app_label, codename = perm.split(".")
+                user.user_permissions.add(
+                    Permission.objects.get(content_type__app_label=app_label, codename=codename)
+                )
+        return type(user).objects.get(pk=user.pk)
+
+    return _grant
+
+
+@pytest.fixture
+def celery_eager(monkeypatch):
+    """Ejecutar las tareas de Celery en el propio proceso al encolarlas."""
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(celery_app.conf, "task_eager_propagates", True)
@@ -0,0 +1,107 @@
+import threading
+import time
+import uuid
+
+import pytest
+
+from django.core.cache import cache, caches
+
+from apps.core.cache import _MISSING, LocalLRU
+
+
+@pytest.fixture
+def key():
+    """Clave única por test: la caché es el Redis compartido de los tests."""
+    name = f"test-cache-{uuid.uuid4().hex}"
+    yield name
+    cache.delete(name)
+
+
+def _redis():
+    return cache.client.get_client(write=True)
+
+
+def test_local_lru_evicts_oldest_and_expires():
+    lru = LocalLRU(max_entries=2, timeout=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+    assert lru.get("b") is _MISSING
+    assert lru.get("a") == 1
+    assert len(lru) == 2
+
+    lru.set("short", 1, timeout=0.01)
+    time.sleep(0.02)
+    assert lru.get("short") is _MISSING
+
+
+def test_backend_instances_share_process_tier():
+    tiers = []
+
+    def use_cache():
+        backend = caches["default"]
+        backend.get("test-cache-shared")
+        tiers.append((id(backend), backend.tier))
+
+    threads = [threading.Thread(target=use_cache) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({backend_id for backend_id, _ in tiers}) == 3
+    assert len({id(tier) for _, tier in tiers}) == 1
+    names = [thread.name for thread in threading.enumerate()]
+    assert names.count("cache-invalidation") == 1
+
+
+def test_get_serves_from_local_tier_until_invalidated(key):
+    cache.set(key, "v1")
+    assert cache.get(key) == "v1"
+
+    # Cambio directo en Redis: el nivel local sigue sirviendo el valor anterior
+    _redis().set(cache.make_key(key), cache.client.encode("v2"))
+    assert cache.get(key) == "v1"
+
+    # Otro nodo publica la invalidación
+    cache.tier.handle_invalidation(f"other-node|{cache.make_key(key)}")
+    assert cache.get(key) == "v2"
+
+
+def test_local_entry_bounded_by_redis_ttl(key):
+    cache.set(key, "short", timeout=1)
+    cache.tier.lru.clear()
+    assert cache.get(key) == "short"
+
+    _redis().delete(cache.make_key(key))
+    time.sleep(1.1)
+    assert cache.get(key) is None
+
+
+def test_excluded_prefixes_skip_local_tier_and_publish():
+    pubsub = _redis().pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(cache.tier.channel)
+    pubsub.get_message(timeout=0.5)
+    excluded = f"throttle_{uuid.uuid4().hex}"
+    try:
+        cache.set(excluded, 1)
+        cache.touch(excluded)
+        assert cache.get(excluded) == 1
+        assert cache.tier.lru.get(cache.make_key(excluded)) is _MISSING
+        assert pubsub.get_message(timeout=0.5) is None
+    finally:
+        cache.delete(excluded)
+        pubsub.close()
+
+
+def test_get_many_mixes_local_and_redis(key):
+    cache.set(key, "local")
+    cache.get(key)
+    other = f"{key}-other"
+    cache.set(other, "redis")
+    cache.tier.lru.delete(cache.make_key(other))
+    try:
+        assert cache.get_many([key, other, f"{key}-missing"]) == {key: "local", other: "redis"}
+    finally:
+        cache.delete(other)
@@ -0,0 +1,103 @@
+import time
+
+from django.core.management import call_command
+
+from apps.core import celery_metrics
+from apps.core.celery_metrics import (
+    SENT_AT_HEADER,
+    get_task_stats,
+    metric_key,
+    reset_task_stats,
+)
+from config.celery import app as celery_app
+
+
+@celery_app.task(name="tests.core.ok_task")
+def ok_task():
+    return "ok"
+
+
+@celery_app.task(name="tests.core.failing_task")
+def failing_task():
+    raise RuntimeError("fallo")
+
+
+TASKS = ["tests.core.ok_task", "tests.core.failing_task"]
+
+
+def test_eager_tasks_are_counted(celery_eager):
+    ok_task.delay()
+    ok_task.delay()
+    # Con task_eager_propagates la excepción sale antes de la señal task_failure
+    result = failing_task.apply(throw=False)
+
+    stats = get_task_stats(TASKS)
+    assert result.failed()
+    assert stats["tests.core.ok_task"]["count"] == 2
+    assert stats["tests.core.ok_task"]["failures"] == 0
+    assert stats["tests.core.failing_task"]["failures"] == 1
+    assert stats["tests.core.ok_task"]["avg_runtime_ms"] >= 0
+    assert not celery_metrics._started
+
+
+def test_disabled_metrics_are_not_recorded(celery_eager, settings):
+    settings.CELERY_METRICS_ENABLED = False
+
+    ok_task.delay()
+
+    assert get_task_stats(TASKS) == {}
+
+
+def test_wait_time_from_sent_at_header():
+    # En eager las cabeceras no llegan a task.request; se simula lo que ve un worker
+    ok_task.push_request(sent_at=time.time() - 2, retries=0)
+    try:
+        celery_metrics._task_started(task_id="t-1", task=ok_task)
+        celery_metrics._task_finished(task_id="t-1", task=ok_task, state="SUCCESS")
+    finally:
+        ok_task.pop_request()
+
+    row = get_task_stats(TASKS)["tests.core.ok_task"]
+    assert row["wait_ms"] >= 2000
+
+
+def test_stamp_sent_at_keeps_existing_header():
+    headers = {SENT_AT_HEADER: 1.0}
+    celery_metrics._stamp_sent_at(headers=headers)
+    assert headers[SENT_AT_HEADER] == 1.0
+
+    headers = {}
+    celery_metrics._stamp_sent_at(headers=headers)
+    assert headers[SENT_AT_HEADER] <= time.time()
+
+
+def test_retries_are_counted():
+    celery_metrics._task_retried(request=type("Request", (), {"task": "tests.core.ok_task"}))
+
+    assert celery_metrics.cache.get(metric_key("tests.core.ok_task", "retries")) == 1
+
+
+def test_incr_ignores_cache_errors(mocker):
+    mocker.patch.object(celery_metrics.cache, "incr", side_effect=ConnectionError)
+
+    celery_metrics._incr("tests.core.ok_task", "count")
+
+
+def test_reset_task_stats(celery_eager):
+    ok_task.delay()
+
+    reset_task_stats(TASKS)
+
+    assert get_task_stats(TASKS) == {}
+
+
+def test_celery_task_stats_command(celery_eager, capsys):
+    call_command("celery_task_stats")
+    assert "Sin métricas registradas" in capsys.readouterr().out
+
+    ok_task.delay()
+    call_command("celery_task_stats", "--reset")
+    out = capsys.readouterr().out
+    assert "tests.core.ok_task" in out
+    assert "Métricas reiniciadas" in out
+    assert get_task_stats(TASKS) == {}
@@ -0,0 +1,160 @@
+import pytest
+
+from django.db import DatabaseError, OperationalError, connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from apps.core import db
+from apps.core.middleware import REPLICA_PIN_COOKIE, ReplicaPinMiddleware
+from apps.projects.models import Project
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def replica_state():
+    db.reset_write_state()
+    db._replica_health.update(checked_at=0.0, healthy=False)
+    yield
+    db.reset_write_state()
+    db._replica_health.update(checked_at=0.0, healthy=False)
+
+
+@pytest.fixture
+def replica_alias(mocker):
+    """Alias ``replica`` apuntando a la base de datos de test (sin recovery: lag 0)."""
+    mocker.patch.dict(
+        db.connections.settings, {db.REPLICA_ALIAS: db.connections.settings["default"]}
+    )
+    yield
+    db.connections[db.REPLICA_ALIAS].close()
+    del db.connections[db.REPLICA_ALIAS]
+
+
+@pytest.fixture
+def replica(mocker):
+    """Réplica configurada y sana, fuera de una transacción del primario."""
+    mocker.patch.object(db, "replica_configured", return_value=True)
+    mocker.patch.object(db, "replica_is_healthy", return_value=True)
+    mocker.patch.object(connection, "in_atomic_block", False)
+
+
+def test_server_connections_and_pool_stats():
+    rows = db.get_server_connections()
+    assert sum(row["count"] for row in rows) >= 1
+    stats = db.get_pool_stats()
+    assert stats is None or stats["checked_out"] == stats["size"] - stats["available"]
+
+
+def test_wait_for_database_retries_with_backoff(mocker):
+    assert db.wait_for_database() == 1
+
+    probe = mocker.patch.object(db, "_probe_connection", side_effect=[OperationalError, None])
+    sleep = mocker.patch.object(db.time, "sleep")
+    assert db.wait_for_database(initial_delay=0.01) == 2
+    assert probe.call_count == 2
+    sleep.assert_called_once_with(0.01)
+
+    probe.side_effect = OperationalError("connection refused")
+    with pytest.raises(DatabaseError, match="no disponible"):
+        db.wait_for_database(timeout=0)
+
+
+def test_advisory_lock_is_released():
+    def held() -> int:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory'")
+            return cursor.fetchone()[0]
+
+    with db.advisory_lock(4242):
+        assert held() == 1
+    assert held() == 0
+
+
+def test_reads_stay_on_primary_without_replica():
+    with db.replica_reads():
+        assert db.get_read_alias() is None
+
+
+def test_replica_reads_only_inside_selectors(replica):
+    assert db.get_read_alias() is None
+    with db.replica_reads():
+        assert db.get_read_alias() == db.REPLICA_ALIAS
+
+
+def test_recent_write_pins_primary(replica, settings):
+    settings.DATABASE_REPLICA_READ_YOUR_WRITES = 10
+    db.mark_write()
+    with db.replica_reads():
+        assert db.get_read_alias() is None
+
+    settings.DATABASE_REPLICA_READ_YOUR_WRITES = 0
+    with db.replica_reads():
+        assert db.get_read_alias() == db.REPLICA_ALIAS
+
+
+def test_reads_inside_atomic_stay_on_primary(mocker):
+    mocker.patch.object(db, "replica_configured", return_value=True)
+    health = mocker.patch.object(db, "replica_is_healthy", return_value=True)
+    # Los tests corren dentro de atomic()
+    with db.replica_reads():
+        assert db.get_read_alias() is None
+    health.assert_not_called()
+
+
+def test_replica_selector_binds_querysets(replica):
+    @db.replica_selector
+    def get_projects():
+        return Project.objects.all()
+
+    @db.replica_selector
+    def get_primary_projects():
+        return Project.objects.using("default")
+
+    assert get_projects()._db == db.REPLICA_ALIAS
+    assert get_primary_projects()._db == "default"
+
+
+def test_replica_health_is_cached_per_interval(replica_alias, settings, mocker):
+    settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL = 60
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+    lag = mocker.patch.object(db, "_replica_lag", return_value=1.0)
+    assert db.replica_is_healthy()
+    lag.return_value = 30.0
+    assert db.replica_is_healthy()
+    assert lag.call_count == 1
+
+    settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL = 0
+    assert not db.replica_is_healthy()
+    lag.side_effect = OperationalError("timeout")
+    assert not db.replica_is_healthy()
+
+
+def test_replica_lag_on_primary_is_zero(replica_alias):
+    assert db._replica_lag() == 0
+
+
+def test_pin_cookie_after_writes(mocker, settings):
+    settings.DATABASE_REPLICA_READ_YOUR_WRITES = 10
+    mocker.patch("apps.core.middleware.replica_configured", return_value=True)
+
+    def write_view(request):
+        db.mark_write()
+        return HttpResponse()
+
+    response = ReplicaPinMiddleware(write_view)(RequestFactory().post("/"))
+    assert response.cookies[REPLICA_PIN_COOKIE]["max-age"] == 10
+
+    def read_only_view(request):
+        return HttpResponse()
+
+    response = ReplicaPinMiddleware(read_only_view)(RequestFactory().get("/"))
+    assert REPLICA_PIN_COOKIE not in response.cookies
+
+    def read_view(request):
+        assert db.recent_write()
+        return HttpResponse()
+
+    request = RequestFactory().get("/")
+    request.COOKIES[REPLICA_PIN_COOKIE] = "1"
+    ReplicaPinMiddleware(read_view)(request)
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from inertia import render
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from django.urls import reverse
+
+from apps.core import inertia
+from apps.core.inertia import (
+    MenuItem,
+    build_shared_props,
+    deferred_prop,
+    get_shared_props,
+    lazy_prop,
+    register_menu_item,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def menu(monkeypatch):
+    monkeypatch.setattr(inertia, "MENU_ITEMS", [])
+    register_menu_item(MenuItem("Búsqueda", "core:search", icon="search"))
+    register_menu_item(MenuItem("Proyectos", "core:search", permission="projects.view_project"))
+    register_menu_item(MenuItem("Roto", "no-existe"))
+
+
+def _render_page(headers: dict[str, str], calls: list[str]) -> dict:
+    def selector(name, *, size=1):
+        calls.append(name)
+        return [name] * size
+
+    request = RequestFactory().get("/", headers={"X-Inertia": "true", **headers})
+    request.session = {}
+    response = render(
+        request,
+        "Test/Page",
+        props={
+            "plain": 1,
+            "history": lazy_prop(selector, "history", size=2),
+            "chart": deferred_prop(selector, "chart", group="charts"),
+        },
+    )
+    return json.loads(response.content)
+
+
+def test_lazy_and_deferred_props_skip_first_load():
+    calls = []
+    page = _render_page({}, calls)
+    assert page["props"] == {"plain": 1}
+    assert page["deferredProps"] == {"charts": ["chart"]}
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    ("only", "value"), [("history", ["history", "history"]), ("chart", ["chart"])]
+)
+def test_partial_reload_runs_only_requested_selectors(only, value):
+    calls = []
+    page = _render_page(
+        {"X-Inertia-Partial-Component": "Test/Page", "X-Inertia-Partial-Data": only}, calls
+    )
+    assert page["props"] == {only: value}
+    assert calls == [only]
+
+
+def test_shared_props(user, grant, menu):
+    anonymous = build_shared_props(AnonymousUser())
+    assert anonymous["auth"] == {"user": None}
+    assert [item["label"] for item in anonymous["menu"]] == ["Búsqueda"]
+
+    props = build_shared_props(grant(user, "projects.view_project"))
+    assert props["auth"]["user"]["username"] == "ana"
+    assert props["permissions"] == {"projects.view_project": True}
+    assert props["menu"] == [
+        {"label": "Búsqueda", "url": reverse("core:search"), "icon": "search"},
+        {"label": "Proyectos", "url": reverse("core:search"), "icon": ""},
+    ]
+
+
+def test_shared_props_are_cached_until_user_changes(
+    user, menu, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    get_shared_props(user)
+    with django_assert_num_queries(0):
+        assert get_shared_props(user)["auth"]["user"]["first_name"] == ""
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.first_name = "Ana"
+        user.save()
+    assert get_shared_props(user)["auth"]["user"]["first_name"] == "Ana"
+
+
+def test_middleware_shares_props_only_when_requested(client, user, menu):
+    client.force_login(user)
+    url = reverse("core:search")
+
+    props = client.get(url, headers={"X-Inertia": "true"}).json()["props"]
+    assert props["auth"]["user"]["id"] == user.pk
+    assert props["menu"][0]["label"] == "Búsqueda"
+
+    props = client.get(
+        url,
+        {"q": "intranet", "type": "project"},
+        headers={
+            "X-Inertia": "true",
+            "X-Inertia-Partial-Component": "Search/Index",
+            "X-Inertia-Partial-Data": "query",
+        },
+    ).json()["props"]
+    assert props == {"query": "intranet"}
@@ -0,0 +1,63 @@
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from rest_framework.exceptions import ParseError
+
+from django.utils.translation import gettext_lazy
+
+from apps.core.json import FastInertiaJSONEncoder, FastJSONParser, FastJSONRenderer
+from apps.projects.models import Project
+
+
+class _Stream:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def read(self) -> bytes:
+        return self.data
+
+
+def test_renderer_matches_drf_types():
+    renderer = FastJSONRenderer()
+    data = {
+        1: Decimal("2.50"),
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "at": datetime(2026, 3, 2, 9, 30, tzinfo=UTC),
+        "label": gettext_lazy("Proyectos"),
+        "tags": {"a"},
+        "text": "línea\u2028siguiente",
+    }
+    rendered = renderer.render(data)
+    assert b"\\u2028" in rendered
+    assert json.loads(rendered) == {
+        "1": "2.50",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "at": "2026-03-02T09:30:00Z",
+        "label": "Proyectos",
+        "tags": ["a"],
+        "text": "línea\u2028siguiente",
+    }
+    assert renderer.render(None) == b""
+
+    indented = renderer.render({"a": 1}, "application/json; indent=4", {})
+    assert indented == b'{\n    "a": 1\n}'
+
+
+def test_parser_rejects_invalid_json():
+    parser = FastJSONParser()
+    assert parser.parse(_Stream(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+    with pytest.raises(ParseError):
+        parser.parse(_Stream(b"{'a': 1}"))
+
+
+@pytest.mark.django_db
+def test_inertia_encoder_serializes_models(project):
+    encoded = json.loads(
+        json.dumps({"project": project, "budget": Decimal("10.0")}, cls=FastInertiaJSONEncoder)
+    )
+    assert encoded["budget"] == "10.0"
+    assert encoded["project"]["name"] == "Intranet"
+    assert encoded["project"]["status"] == Project.Status.DRAFT
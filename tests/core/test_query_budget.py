@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from apps.core.decorators import query_budget
+from apps.core.middleware import QueryBudgetMiddleware
+from apps.core.query_budget import QueryBudgetExceededError, check_budget, track_queries
+
+
+def make_view():
+    # Una función por test: @query_budget guarda los ajustes en la propia vista
+    def view(request):
+        return HttpResponse()
+
+    return view
+
+
+def _run(view, *, queries: int) -> HttpResponse:
+    def get_response(request):
+        for _ in range(queries):
+            get_user_model().objects.exists()
+        return HttpResponse()
+
+    request = RequestFactory().get("/budget/")
+    request.resolver_match = SimpleNamespace(func=view)
+    return QueryBudgetMiddleware(get_response)(request)
+
+
+@pytest.mark.django_db
+def test_track_queries_counts_and_detects_repeats():
+    with track_queries() as stats:
+        for _ in range(3):
+            get_user_model().objects.exists()
+    assert stats.count == 3
+    assert check_budget(stats, max_queries=5, n_plus_one_threshold=None) == []
+    violations = check_budget(stats, max_queries=2, n_plus_one_threshold=3)
+    assert len(violations) == 2
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_BUDGET_MAX_QUERIES=10, QUERY_BUDGET_N_PLUS_ONE_THRESHOLD=None)
+def test_middleware_sets_server_timing_within_budget():
+    response = _run(make_view(), queries=2)
+    assert 'desc="2 queries"' in response["Server-Timing"]
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_BUDGET_MAX_QUERIES=10, QUERY_BUDGET_N_PLUS_ONE_THRESHOLD=None)
+def test_explicit_zero_override_is_not_the_global_budget():
+    budgeted = query_budget(max_queries=0)(make_view())
+    with pytest.raises(QueryBudgetExceededError):
+        _run(budgeted, queries=1)
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_BUDGET_MAX_QUERIES=1, QUERY_BUDGET_N_PLUS_ONE_THRESHOLD=None)
+def test_exempt_view_skips_budget():
+    exempt = query_budget(exempt=True)(make_view())
+    assert _run(exempt, queries=3).status_code == 200
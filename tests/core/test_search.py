@@ -0,0 +1,134 @@
+import pytest
+
+from django.urls import reverse
+
+from apps.core.search import (
+    MAX_LIMIT,
+    SEARCH_DOMAINS,
+    SearchDomain,
+    normalize_query,
+    parse_search_params,
+    search,
+    search_domain,
+)
+from apps.projects.models import Project
+from apps.projects.selectors import get_visible_projects
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def fulltext_domain(monkeypatch):
+    """Proyectos solo por full-text (sin trigramas, sin pg_trgm)."""
+    domain = SearchDomain(
+        name="project_text",
+        label="Proyectos (texto)",
+        queryset=get_visible_projects,
+        title="name",
+        subtitle="client",
+    )
+    monkeypatch.setitem(SEARCH_DOMAINS, domain.name, domain)
+    return domain
+
+
+@pytest.fixture
+def projects(user, other_user):
+    return [
+        Project.objects.create(
+            name="Portal de clientes",
+            client="Acme",
+            description="Migración del portal de facturación",
+            status=Project.Status.ACTIVE,
+            created_by=other_user,
+        ),
+        Project.objects.create(
+            name="Intranet",
+            client="10Code",
+            description="Facturación de partes de horas",
+            status=Project.Status.ACTIVE,
+            created_by=user,
+        ),
+        Project.objects.create(
+            name="Facturación interna",
+            status=Project.Status.DRAFT,
+            created_by=other_user,
+        ),
+    ]
+
+
+def test_normalize_and_parse_params():
+    assert normalize_query("  portal   de\nclientes ") == "portal de clientes"
+    assert normalize_query(" a ") == ""
+    assert parse_search_params({"q": "portal", "type": "project", "limit": "500"}) == {
+        "query": "portal",
+        "domains": ["project"],
+        "limit": MAX_LIMIT,
+    }
+    with pytest.raises(ValueError, match="desconocidos: nope"):
+        parse_search_params({"type": "project,nope"})
+    with pytest.raises(ValueError, match="limit"):
+        parse_search_params({"limit": "diez"})
+
+
+def test_fulltext_ranks_by_weight_and_respects_visibility(user, projects, fulltext_domain):
+    # "facturación" coincide con los tres; el borrador ajeno no es visible
+    results = search(user=user, query="facturación", domains=[fulltext_domain.name])
+    assert [result["id"] for result in results] == [projects[0].pk, projects[1].pk]
+    assert results[0] == {
+        "type": "project_text",
+        "label": "Proyectos (texto)",
+        "id": projects[0].pk,
+        "title": "Portal de clientes",
+        "subtitle": "Acme",
+        "score": results[0]["score"],
+    }
+
+    # Peso A (nombre) por encima de peso B (descripción)
+    results = search(user=user, query="portal", domains=[fulltext_domain.name])
+    assert [result["id"] for result in results] == [projects[0].pk]
+    assert search(user=user, query="x", domains=[fulltext_domain.name]) == []
+    assert (
+        search(user=user, query="facturación", domains=[fulltext_domain.name], limit=1)[0]["id"]
+        == projects[0].pk
+    )
+
+
+def test_domain_permission(user, grant, projects, fulltext_domain, monkeypatch):
+    restricted = SearchDomain(**{**fulltext_domain.__dict__, "permission": "projects.view_project"})
+    monkeypatch.setitem(SEARCH_DOMAINS, restricted.name, restricted)
+    assert search(user=user, query="facturación", domains=[restricted.name]) == []
+
+    user = grant(user, "projects.view_project")
+    assert len(search(user=user, query="facturación", domains=[restricted.name])) == 3
+
+
+def test_project_domain_combines_fulltext_and_trigrams(user):
+    sql = str(search_domain(SEARCH_DOMAINS["project"], user=user, query="intranet").query)
+    assert "@@" in sql
+    assert '"projects_project"."name" %>' in sql
+    assert '"projects_project"."client" %>' in sql
+    assert "GREATEST(WORD_SIMILARITY" in sql
+
+
+def test_search_api(client, user, projects, fulltext_domain):
+    url = reverse("core:search_api")
+    assert client.get(url, {"q": "portal"}).status_code in (401, 403)
+
+    client.force_login(user)
+    response = client.get(url, {"q": "portal", "type": fulltext_domain.name})
+    assert response.status_code == 200
+    assert [result["id"] for result in response.json()["results"]] == [projects[0].pk]
+    assert client.get(url, {"q": "portal", "type": "nope"}).status_code == 400
+
+
+def test_search_page(client, user, projects, fulltext_domain):
+    client.force_login(user)
+    url = reverse("core:search")
+    response = client.get(
+        url, {"q": "portal", "type": fulltext_domain.name}, headers={"X-Inertia": "true"}
+    )
+    assert response.status_code == 200
+    props = response.json()["props"]
+    assert props["query"] == "portal"
+    assert [result["id"] for result in props["results"]] == [projects[0].pk]
+    assert client.get(url, {"q": "portal", "limit": "x"}).status_code == 400
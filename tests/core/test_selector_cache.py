@@ -0,0 +1,171 @@
+import time
+
+import pytest
+
+from django.core.cache import cache
+from django.db.models import QuerySet
+
+from apps.core import selector_cache
+from apps.core.selector_cache import (
+    SELECTOR_LOCK_KEY,
+    SELECTOR_RESULT_KEY,
+    SELECTOR_TAG_KEY,
+    _Entry,
+    _get_versions,
+    cached_selector,
+    invalidate_tags,
+)
+from apps.projects.models import Project
+
+pytestmark = pytest.mark.django_db
+
+calls: list[str] = []
+
+
+@cached_selector(tags=["tests.selector"])
+def get_label(*, name: str, upper: bool = False) -> str:
+    calls.append(name)
+    return name.upper() if upper else name
+
+
+@cached_selector(tags=[Project])
+def get_project_names() -> list[str]:
+    calls.append("projects")
+    return sorted(Project.objects.values_list("name", flat=True))
+
+
+@cached_selector(tags=["tests.warm"], warm=lambda: [{"name": "a"}, {"name": "b"}])
+def get_warm_label(*, name: str) -> str:
+    calls.append(name)
+    return name
+
+
+@cached_selector(tags=["tests.selector"])
+def get_queryset() -> QuerySet:
+    return Project.objects.all()
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_caches_by_bound_arguments():
+    assert get_label(name="a") == "a"
+    # Con o sin el default explícito: misma clave
+    assert get_label(name="a", upper=False) == "a"
+    assert calls == ["a"]
+
+    assert get_label(name="a", upper=True) == "A"
+    assert calls == ["a", "a"]
+
+    with pytest.raises(TypeError, match="no admitido"):
+        get_label(name=object())
+
+
+def test_invalidate_tags_after_commit(django_capture_on_commit_callbacks):
+    get_label(name="a")
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        invalidate_tags("tests.selector")
+    # Hasta el commit la entrada sigue vigente
+    get_label(name="a")
+    assert calls == ["a"]
+
+    for callback in callbacks:
+        callback()
+    get_label(name="a")
+    assert calls == ["a", "a"]
+
+
+def test_model_signals_invalidate_tagged_selectors(user, django_capture_on_commit_callbacks):
+    assert get_project_names() == []
+    with django_capture_on_commit_callbacks(execute=True):
+        project = Project.objects.create(name="Intranet", created_by=user)
+    assert get_project_names() == ["Intranet"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        project.delete()
+    assert get_project_names() == []
+    assert calls == ["projects"] * 3
+
+
+def test_disabled_cache_calls_selector(settings):
+    settings.SELECTOR_CACHE_ENABLED = False
+    get_label(name="a")
+    get_label(name="a")
+    assert calls == ["a", "a"]
+
+
+def test_rejects_querysets():
+    with pytest.raises(TypeError, match="QuerySet"):
+        get_queryset()
+
+
+def test_locked_entry_serves_stale_value():
+    get_label(name="a")
+    key = get_label._key((), {"name": "a"})
+    cache.set(SELECTOR_LOCK_KEY.format(key=key), 1)
+    cache.set(SELECTOR_TAG_KEY.format(tag="tests.selector"), "otra", timeout=None)
+
+    # Otro proceso tiene el lock: se sirve la entrada obsoleta sin recalcular
+    assert get_label(name="a") == "a"
+    assert calls == ["a"]
+
+
+def test_locked_without_entry_waits_for_current_versions(settings, mocker):
+    settings.SELECTOR_CACHE_LOCK_WAIT = 1
+    key = get_label._key((), {"name": "a"})
+    result_key = SELECTOR_RESULT_KEY.format(key=key)
+    cache.set(SELECTOR_LOCK_KEY.format(key=key), 1)
+    versions = _get_versions(("tests.selector",))
+    entries = iter(
+        [
+            # Calculada antes de la última invalidación: se ignora
+            _Entry(("vieja",), "obsoleta", 0, 0),
+            _Entry(versions, "del otro proceso", 0, 0),
+        ]
+    )
+    sleep = mocker.patch.object(
+        selector_cache.time, "sleep", side_effect=lambda _: cache.set(result_key, next(entries))
+    )
+
+    assert get_label(name="a") == "del otro proceso"
+    assert sleep.call_count == 2
+    assert calls == []
+
+
+def test_locked_without_entry_computes_after_wait(settings):
+    settings.SELECTOR_CACHE_LOCK_WAIT = 0
+    key = get_label._key((), {"name": "a"})
+    cache.set(SELECTOR_LOCK_KEY.format(key=key), 1)
+
+    assert get_label(name="a") == "a"
+    assert calls == ["a"]
+
+
+def test_expires_early_near_expiration(mocker):
+    get_label(name="a")
+    result_key = SELECTOR_RESULT_KEY.format(key=get_label._key((), {"name": "a"}))
+    entry = cache.get(result_key)
+    # Caduca en 1 s y costó 1 s calcularla
+    cache.set(result_key, entry._replace(expires_at=time.time() + 1, cost=1.0))
+
+    mocker.patch.object(selector_cache.random, "random", return_value=0.0)
+    get_label(name="a")
+    assert calls == ["a"]
+
+    mocker.patch.object(selector_cache.random, "random", return_value=0.99)
+    get_label(name="a")
+    assert calls == ["a", "a"]
+
+
+def test_warm_recalculates_missing_or_stale_keys():
+    assert get_warm_label.warm() == 2
+    assert get_warm_label.warm() == 0
+    assert get_warm_label.warm(force=True) == 2
+
+    get_warm_label(name="a")
+    assert calls == ["a", "b"] * 2
+
+    assert selector_cache.warm_selectors(names=[get_warm_label.name]) == {get_warm_label.name: 0}
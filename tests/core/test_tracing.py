@@ -0,0 +1,116 @@
+import orjson
+import pytest
+
+from django.db import connection
+
+from apps.core import tracing
+from apps.projects.models import Project
+from config import telemetry
+from config.celery import app as celery_app
+
+
+class MemoryExporter(telemetry.SpanExporter):
+    def __init__(self):
+        self.spans = []
+
+    def export(self, payload: bytes) -> None:
+        for resource_spans in orjson.loads(payload)["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                self.spans.extend(scope_spans["spans"])
+
+
+@celery_app.task(name="tests.core.traced_task")
+def traced_task(fail=False):
+    if fail:
+        raise RuntimeError("fallo")
+    return "ok"
+
+
+@pytest.fixture
+def exported():
+    """Muestrear todas las trazas y devolver los spans exportados."""
+    exporter = MemoryExporter()
+    processor = telemetry.configure(enabled=True, sample_rate=1.0, exporter=exporter)
+
+    def spans():
+        processor.force_flush()
+        return exporter.spans
+
+    yield spans
+    telemetry.configure(enabled=False)
+
+
+def _attributes(span) -> dict:
+    return {item["key"]: next(iter(item["value"].values())) for item in span["attributes"]}
+
+
+@pytest.mark.django_db
+def test_query_span_is_child_of_current_span(exported, settings):
+    settings.TELEMETRY_DB_STATEMENT = True
+    tracing._instrument_connection(sender=None, connection=connection)
+
+    with telemetry.start_span("request") as root:
+        Project.objects.count()
+
+    query = next(span for span in exported() if span["name"] == "SELECT default")
+    assert query["parentSpanId"] == root.span_id
+    assert query["kind"] == telemetry.SpanKind.CLIENT
+    attributes = _attributes(query)
+    assert attributes["db.system"] == "postgresql"
+    assert attributes["db.operation.name"] == "SELECT"
+    assert "projects_project" in attributes["db.query.text"]
+
+
+@pytest.mark.django_db
+def test_queries_outside_a_trace_are_not_recorded(exported):
+    tracing._instrument_connection(sender=None, connection=connection)
+
+    Project.objects.count()
+
+    assert exported() == []
+
+
+def test_inject_trace_context_into_task_headers(exported):
+    token = telemetry.set_request_id("req-1")
+    try:
+        with telemetry.start_span("request") as root:
+            headers = {}
+            tracing._inject_trace_context(headers=headers)
+    finally:
+        telemetry.reset_request_id(token)
+
+    assert headers == {
+        tracing.TRACEPARENT_HEADER: root.traceparent,
+        tracing.REQUEST_ID_HEADER: "req-1",
+    }
+
+
+def test_task_span_continues_remote_trace(exported):
+    parent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    # En eager las cabeceras no llegan a task.request; se simula lo que ve un worker
+    traced_task.push_request(traceparent=parent, request_id="req-1", retries=0)
+    try:
+        tracing._task_span_started(task_id="t-1", task=traced_task)
+        assert telemetry.get_request_id() == "req-1"
+        tracing._task_span_finished(task_id="t-1", state="SUCCESS")
+    finally:
+        traced_task.pop_request()
+
+    (span,) = exported()
+    assert span["name"] == "task tests.core.traced_task"
+    assert span["traceId"] == "0af7651916cd43dd8448eb211c80319c"
+    assert span["parentSpanId"] == "b7ad6b7169203331"
+    assert span["status"]["code"] == telemetry.StatusCode.OK
+    assert telemetry.current_span() is None
+    assert telemetry.get_request_id() is None
+
+
+def test_failed_task_span_records_exception(exported, celery_eager):
+    # Con task_eager_propagates la excepción sale antes de la señal task_failure
+    traced_task.apply(kwargs={"fail": True}, throw=False)
+
+    (span,) = exported()
+    attributes = _attributes(span)
+    assert span["status"]["code"] == telemetry.StatusCode.ERROR
+    assert attributes["exception.type"] == "RuntimeError"
+    assert attributes["celery.task.state"] == "FAILURE"
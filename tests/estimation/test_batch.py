@@ -0,0 +1,146 @@
+import pytest
+
+from apps.estimation import features, inference
+from apps.estimation.features import (
+    FEATURE_NAMES,
+    FeatureCache,
+    FeatureExtractor,
+    content_hash,
+    project_text,
+)
+from apps.estimation.inference import LoadedModel
+from apps.estimation.models import ProjectEstimation
+from apps.estimation.services import EstimationService
+from apps.estimation.tasks import estimate_projects_chunk, summarize_estimations
+from apps.projects.models import Project
+from tests.estimation.test_inference import SumModel
+
+pytestmark = pytest.mark.django_db
+
+
+def test_schedule_estimation_fans_out_one_task_per_page(user, mocker):
+    status = Project.Status
+    projects = [
+        Project.objects.create(name=f"P{i}", status=project_status, created_by=user)
+        for i, project_status in enumerate(
+            [status.DRAFT, status.ACTIVE, status.COMPLETED, status.ACTIVE, status.DRAFT]
+        )
+    ]
+    chord = mocker.patch("apps.estimation.services.chord")
+
+    assert EstimationService.schedule_estimation(chunk_size=2, only_changed=True) == 2
+
+    open_ids = [p.pk for p in projects if p.status != status.COMPLETED]
+    assert list(chord.call_args.args[0]) == [
+        estimate_projects_chunk.s(project_ids=open_ids[:2], only_changed=True),
+        estimate_projects_chunk.s(project_ids=open_ids[2:], only_changed=True),
+    ]
+    chord.return_value.assert_called_once_with(summarize_estimations.s())
+
+
+def test_schedule_estimation_without_projects(mocker):
+    chord = mocker.patch("apps.estimation.services.chord")
+    assert EstimationService.schedule_estimation(project_ids=[]) == 0
+    chord.assert_not_called()
+
+
+def test_chunk_extracts_in_process(mocker):
+    estimate = mocker.patch.object(EstimationService, "estimate_projects", return_value={})
+    estimate_projects_chunk([1, 2], only_changed=True)
+    estimate.assert_called_once_with(project_ids=[1, 2], only_changed=True, workers=1)
+
+
+def test_summarize_estimations_adds_page_stats():
+    pages = [
+        {"projects": 2, "estimated": 1, "skipped": 1, "features_computed": 1},
+        {"projects": 1, "estimated": 1, "skipped": 0, "features_cached": 1},
+    ]
+    assert summarize_estimations(pages) == {
+        "projects": 3,
+        "estimated": 2,
+        "skipped": 1,
+        "features_computed": 1,
+        "features_cached": 1,
+    }
+
+
+@pytest.fixture
+def fake_nlp(monkeypatch):
+    """Features sin spaCy: longitud del texto en todas las posiciones."""
+    computed = []
+
+    def extract_batch(texts):
+        computed.extend(texts)
+        return [[float(len(text))] * len(FEATURE_NAMES) for text in texts]
+
+    monkeypatch.setattr(features, "_nlp", object())
+    monkeypatch.setattr(features, "extract_batch", extract_batch)
+    return computed
+
+
+def test_feature_cache_roundtrip(tmp_path):
+    cache = FeatureCache(tmp_path)
+    vector = [float(i) for i in range(len(FEATURE_NAMES))]
+    assert cache.get("ab" * 20) is None
+    cache.set("ab" * 20, vector)
+    assert cache.get("ab" * 20) == vector
+    assert (tmp_path / "ab" / ("ab" * 20)).is_file()
+
+    # Vectores de otra versión de FEATURE_NAMES: se ignoran
+    cache.set("cd" * 20, [1.0])
+    assert cache.get("cd" * 20) is None
+
+
+def test_extractor_reuses_disk_cache(tmp_path, fake_nlp):
+    texts = ["Portal\n\nMigración", "Intranet", "Portal\n\nMigración"]
+    with FeatureExtractor(model_name="es_test", cache_dir=tmp_path, workers=1) as extractor:
+        vectors, hashes = extractor.extract(texts)
+    assert fake_nlp == texts[:2]
+    assert vectors[0] == vectors[2] == [float(len(texts[0]))] * len(FEATURE_NAMES)
+    assert hashes[0] == hashes[2] == content_hash(texts[0], model_name="es_test")
+    assert extractor.stats == {"cached": 0, "computed": 2}
+
+    with FeatureExtractor(model_name="es_test", cache_dir=tmp_path, workers=1) as extractor:
+        assert extractor.extract(texts) == (vectors, hashes)
+    assert extractor.stats == {"cached": 2, "computed": 0}
+    assert len(fake_nlp) == 2
+
+    # Otro modelo de spaCy: otras claves
+    assert content_hash(texts[0], model_name="es_otro") != hashes[0]
+
+
+def test_extractor_in_daemon_process_stays_in_process(tmp_path, mocker):
+    process = mocker.patch.object(features.multiprocessing, "current_process")
+    process.return_value.daemon = True
+    assert FeatureExtractor(model_name="es_test", cache_dir=tmp_path, workers=4).workers == 1
+
+
+def test_estimate_projects_writes_estimations(user, tmp_path, settings, fake_nlp, mocker):
+    pytest.importorskip("numpy")
+    settings.ESTIMATION_FEATURE_CACHE_DIR = tmp_path
+    settings.ESTIMATION_SPACY_MODEL = "es_test"
+    mocker.patch.object(inference, "_loaded", LoadedModel(SumModel(), "estimation@1"))
+    mocker.patch.object(inference, "_checked_at", float("inf"))
+    first = Project.objects.create(name="Portal", description="Migración", created_by=user)
+    second = Project.objects.create(name="Intranet", created_by=user)
+    Project.objects.create(name="Cerrado", status=Project.Status.COMPLETED, created_by=user)
+
+    stats = EstimationService.estimate_projects(chunk_size=1, workers=1)
+    assert stats == {
+        "projects": 2,
+        "estimated": 2,
+        "skipped": 0,
+        "features_computed": 2,
+        "features_cached": 0,
+    }
+    estimation = ProjectEstimation.objects.get(project=first)
+    text = project_text(first.name, first.description)
+    assert estimation.effort_hours == len(text) * len(FEATURE_NAMES)
+    assert estimation.model_version == "estimation@1"
+    assert estimation.features_hash == content_hash(text, model_name="es_test")
+
+    second.description = "Partes de horas"
+    second.save()
+    stats = EstimationService.estimate_projects(only_changed=True, workers=1)
+    assert (stats["estimated"], stats["skipped"]) == (1, 1)
+    assert ProjectEstimation.objects.count() == 2
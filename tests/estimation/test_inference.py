@@ -0,0 +1,148 @@
+import threading
+
+import pytest
+
+from apps.estimation import inference, registry
+from apps.estimation.inference import LOCAL_MODEL_VERSION, MicroBatcher, Prediction
+from apps.estimation.models import ModelArtifact
+
+pytestmark = pytest.mark.django_db
+
+
+class SumModel:
+    """Estimador mínimo: el esfuerzo es la suma de las features por el factor."""
+
+    def __init__(self, factor: float = 1.0):
+        self.factor = factor
+
+    def predict(self, features):
+        return features.sum(axis=1) * self.factor
+
+
+@pytest.fixture(autouse=True)
+def process_model(monkeypatch, settings):
+    """Modelo, comprobación y batcher del proceso desde cero en cada test."""
+    monkeypatch.setattr(inference, "_loaded", None)
+    monkeypatch.setattr(inference, "_checked_at", 0.0)
+    monkeypatch.setattr(inference, "_batcher", None)
+    settings.ML_MODEL_CHECK_INTERVAL = 0
+
+
+@pytest.fixture
+def load_model(mocker):
+    """Cargar SumModel con el factor de la versión (1 sin registro)."""
+    return mocker.patch.object(
+        inference,
+        "load_model",
+        side_effect=lambda artifact=None: SumModel(artifact.version if artifact else 1),
+    )
+
+
+def _artifact(version: int, *, active: bool = True) -> ModelArtifact:
+    ModelArtifact.objects.filter(name=inference.ESTIMATION_MODEL_NAME).update(is_active=False)
+    artifact = ModelArtifact.objects.create(
+        name=inference.ESTIMATION_MODEL_NAME,
+        version=version,
+        artifact_format=ModelArtifact.Format.SAFETENSORS,
+        file=f"ml_models/estimation/{version}/model.safetensors",
+        sha256="0" * 64,
+        size=1,
+        is_active=active,
+    )
+    registry.invalidate_active_artifact(inference.ESTIMATION_MODEL_NAME)
+    return artifact
+
+
+def test_micro_batcher_groups_concurrent_predictions():
+    batches = []
+    release = threading.Event()
+
+    def predict_fn(features):
+        release.wait(5)
+        batches.append(len(features))
+        return [Prediction(sum(f), "v") for f in features]
+
+    batcher = MicroBatcher(predict_fn, max_batch_size=3, max_wait_ms=200)
+    futures = [batcher.submit([i, 1]) for i in range(4)]
+    release.set()
+
+    assert [future.result(timeout=5).effort_hours for future in futures] == [1, 2, 3, 4]
+    assert sum(batches) == 4
+    assert max(batches) <= 3
+
+
+def test_micro_batcher_propagates_errors():
+    def predict_fn(features):
+        raise RuntimeError("modelo roto")
+
+    future = MicroBatcher(predict_fn, max_batch_size=2, max_wait_ms=1).submit([1.0])
+    with pytest.raises(RuntimeError, match="modelo roto"):
+        future.result(timeout=5)
+
+
+def test_hot_swaps_active_version(load_model):
+    pytest.importorskip("numpy")
+
+    assert inference.get_model().version == LOCAL_MODEL_VERSION
+    assert inference.predict_many([[1, 2]]) == [Prediction(3.0, LOCAL_MODEL_VERSION)]
+    assert inference.predict_many([]) == []
+
+    _artifact(2)
+    assert inference.predict_many([[1, 2]]) == [Prediction(6.0, "estimation@2")]
+    # Misma versión: no se vuelve a cargar
+    inference.get_model()
+    assert load_model.call_count == 2
+
+
+def test_keeps_loaded_version_if_new_one_fails(load_model):
+    loaded = inference.get_model()
+
+    _artifact(3)
+    load_model.side_effect = OSError("fichero no encontrado")
+    assert inference.get_model() is loaded
+
+    inference._loaded = None
+    with pytest.raises(OSError, match="no encontrado"):
+        inference.get_model()
+
+
+def test_checks_registry_once_per_interval(load_model, settings):
+    settings.ML_MODEL_CHECK_INTERVAL = 60
+    loaded = inference.get_model()
+    _artifact(2)
+    assert inference.get_model() is loaded
+    assert load_model.call_count == 1
+
+
+def test_predict_goes_through_the_batcher(load_model, settings):
+    pytest.importorskip("numpy")
+    settings.ESTIMATION_BATCH_MAX_WAIT_MS = 1
+    # Modelo ya cargado: el thread del batcher no consulta la base de datos
+    inference.get_model()
+    settings.ML_MODEL_CHECK_INTERVAL = 60
+
+    assert inference.predict([2, 3], timeout=5) == Prediction(5.0, LOCAL_MODEL_VERSION)
+    assert inference.get_batcher() is inference.get_batcher()
+
+
+def test_load_model_from_registry_or_local_path(mocker, settings, tmp_path):
+    load_artifact = mocker.patch.object(registry, "load_artifact", return_value="modelo")
+    assert inference.load_model() == "modelo"
+    load_artifact.assert_called_with(settings.ESTIMATION_MODEL_PATH, ModelArtifact.Format.JOBLIB)
+
+    artifact = _artifact(1)
+    path = tmp_path / "model.safetensors"
+    mocker.patch.object(registry, "artifact_path", return_value=path)
+    inference.load_model(artifact)
+    load_artifact.assert_called_with(path, ModelArtifact.Format.SAFETENSORS)
+
+
+def test_warm_up_only_in_inference_workers(mocker, settings):
+    get_model = mocker.patch.object(inference, "get_model")
+    settings.CELERY_WORKER_QUEUE = "batch"
+    inference._warm_up()
+    get_model.assert_not_called()
+
+    settings.CELERY_WORKER_QUEUE = inference.INFERENCE_QUEUE
+    inference._warm_up()
+    get_model.assert_called_once()
@@ -0,0 +1,186 @@
+import json
+import struct
+import threading
+from pathlib import Path
+
+import pytest
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.db import IntegrityError, connection
+
+from apps.core.db import advisory_lock
+from apps.estimation import registry
+from apps.estimation.models import ModelArtifact
+from apps.estimation.services import ModelArtifactService, _publish_lock_id
+
+pytestmark = pytest.mark.django_db
+
+
+def write_safetensors(path: Path, tensors: dict[str, tuple[str, list[int], bytes]]) -> Path:
+    """Fichero safetensors mínimo: {nombre: (dtype, shape, bytes)}."""
+    header, data, offset = {"__metadata__": {"format": "np"}}, b"", 0
+    for name, (dtype, shape, raw) in tensors.items():
+        header[name] = {"dtype": dtype, "shape": shape, "data_offsets": [offset, offset + len(raw)]}
+        data += raw
+        offset += len(raw)
+    encoded = json.dumps(header).encode()
+    path.write_bytes(len(encoded).to_bytes(8, "little") + encoded + data)
+    return path
+
+
+class RemoteStorage(Storage):
+    """Storage sin ficheros locales (``path()`` no implementado), como S3."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+
+    def _save(self, name, content):
+        self.files[name] = content.read()
+        return name
+
+    def _open(self, name, mode="rb"):
+        return ContentFile(self.files[name], name=name)
+
+    def exists(self, name):
+        return name in self.files
+
+
+@pytest.fixture
+def weights(tmp_path):
+    return write_safetensors(
+        tmp_path / "estimation.safetensors",
+        {
+            "coef": ("F64", [2, 2], struct.pack("<4d", 1.0, 2.0, 3.0, 4.0)),
+            "bias": ("I32", [1], struct.pack("<i", 7)),
+        },
+    )
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.ML_ARTIFACT_CACHE_DIR = tmp_path / "artifacts"
+    return settings.MEDIA_ROOT
+
+
+def test_check_artifact(weights, tmp_path):
+    registry.check_artifact(weights, ModelArtifact.Format.SAFETENSORS)
+
+    broken = tmp_path / "broken.safetensors"
+    broken.write_bytes((10).to_bytes(8, "little") + b"no es json")
+    with pytest.raises(ValueError, match="cabecera safetensors"):
+        registry.check_artifact(broken, ModelArtifact.Format.SAFETENSORS)
+
+    compressed = tmp_path / "model.joblib"
+    compressed.write_bytes(b"x\x9c comprimido con zlib")
+    with pytest.raises(ValueError, match="compress=0"):
+        registry.check_artifact(compressed, ModelArtifact.Format.JOBLIB)
+    compressed.write_bytes(b"\x80\x05 pickle")
+    registry.check_artifact(compressed, ModelArtifact.Format.JOBLIB)
+
+
+def test_load_safetensors_is_read_only_memmap(weights, tmp_path):
+    np = pytest.importorskip("numpy")
+
+    tensors = registry.load_artifact(weights, ModelArtifact.Format.SAFETENSORS)
+
+    assert tensors.keys() == {"coef", "bias"}
+    assert tensors["coef"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+    assert tensors["bias"].tolist() == [7]
+    assert isinstance(tensors["coef"].base, np.memmap)
+    assert not tensors["coef"].flags.writeable
+
+    unsupported = write_safetensors(tmp_path / "bf16.safetensors", {"w": ("BF16", [1], b"\0\0")})
+    with pytest.raises(ValueError, match="BF16"):
+        registry.load_artifact(unsupported, ModelArtifact.Format.SAFETENSORS)
+
+
+def test_publish_and_activate_versions(media, weights, django_capture_on_commit_callbacks):
+    assert registry.get_active_artifact("estimation") is None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        first = ModelArtifactService.publish(name="estimation", path=weights, metrics={"mae": 3})
+    assert (first.version, first.artifact_format) == (1, ModelArtifact.Format.SAFETENSORS)
+    assert (first.sha256, first.size) == registry.file_sha256(weights)
+    assert registry.get_active_artifact("estimation") == first
+    # Con FileSystemStorage se carga el propio fichero del storage
+    assert registry.artifact_path(first) == media / first.file.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second = ModelArtifactService.publish(name="estimation", path=weights, activate=False)
+    assert second.version == 2
+    assert not second.is_active
+    assert registry.get_active_artifact("estimation") == first
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ModelArtifactService.activate(name="estimation", version=2)
+    assert registry.get_active_artifact("estimation") == second
+    first.refresh_from_db()
+    assert not first.is_active
+
+
+def test_failed_publish_removes_stored_file(media, weights, mocker):
+    mocker.patch.object(ModelArtifact, "save", side_effect=IntegrityError("duplicada"))
+
+    with pytest.raises(IntegrityError):
+        ModelArtifactService.publish(name="estimation", path=weights)
+
+    assert not ModelArtifact.objects.exists()
+    assert not [path for path in media.rglob("*") if path.is_file()]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_first_publishes_get_consecutive_versions(media, weights):
+    published, errors = [], []
+
+    def publish():
+        try:
+            published.append(ModelArtifactService.publish(name="estimation", path=weights))
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=publish) for _ in range(2)]
+    # Con el lock tomado por otra sesión las dos publicaciones esperan
+    with advisory_lock(_publish_lock_id("estimation")):
+        for thread in threads:
+            thread.start()
+        threads[0].join(timeout=0.2)
+        assert threads[0].is_alive()
+        assert not ModelArtifact.objects.exists()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(artifact.version for artifact in published) == [1, 2]
+    assert ModelArtifact.objects.get(is_active=True).version == 2
+
+
+def test_active_artifact_is_cached(media, weights, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert registry.get_active_artifact("estimation") is None
+        # "Sin versión activa" también se cachea
+        assert registry.get_active_artifact("estimation") is None
+
+    ModelArtifactService.publish(name="estimation", path=weights)
+    assert registry.get_active_artifact("estimation") is None
+    registry.invalidate_active_artifact("estimation")
+    assert registry.get_active_artifact("estimation").version == 1
+
+
+def test_remote_storage_downloads_once_and_checks_sha256(settings, media, weights, mocker):
+    mocker.patch.object(ModelArtifact._meta.get_field("file"), "storage", RemoteStorage())
+    artifact = ModelArtifactService.publish(name="estimation", path=weights)
+
+    path = registry.artifact_path(artifact)
+    assert path == settings.ML_ARTIFACT_CACHE_DIR / f"{artifact.sha256}.safetensors"
+    assert path.read_bytes() == weights.read_bytes()
+    assert registry.artifact_path(artifact) == path
+
+    artifact.sha256 = "0" * 64
+    with pytest.raises(ValueError, match="sha256"):
+        registry.artifact_path(artifact)
+    # Sin temporales a medias en el directorio de cache
+    assert list(settings.ML_ARTIFACT_CACHE_DIR.iterdir()) == [path]
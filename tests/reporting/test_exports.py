@@ -0,0 +1,157 @@
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.urls import reverse
+
+from apps.reporting.exports import get_export, iter_rows, stream_csv, write_csv, write_xlsx
+from apps.reporting.models import ExportJob
+from apps.reporting.services import ExportService, RollupService
+from apps.timetracking.models import TimeEntry
+
+pytestmark = pytest.mark.django_db
+
+DAY = date(2026, 3, 2)
+
+
+@pytest.fixture
+def entries(user, other_user, project):
+    return TimeEntry.objects.bulk_create(
+        [
+            TimeEntry(user=user, project=project, date=DAY, hours=Decimal(3), description="a"),
+            TimeEntry(user=other_user, project=project, date=DAY, hours=Decimal(5)),
+        ]
+    )
+
+
+def _csv_rows(content: str) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(content.removeprefix("\ufeff"))))
+
+
+def test_stream_csv_yields_bom_header_and_rows():
+    lines = list(stream_csv(("a", "b"), [(1, "x,y"), (2, None)]))
+    assert lines[0] == "\ufeffa,b\r\n"
+    assert lines[1:] == ['1,"x,y"\r\n', "2,\r\n"]
+
+
+def test_write_csv_and_xlsx_count_rows(tmp_path):
+    text = io.StringIO()
+    assert write_csv(text, ("a",), iter([(1,), (2,)])) == 2
+    assert _csv_rows(text.getvalue()) == [["a"], ["1"], ["2"]]
+
+    with (tmp_path / "out.xlsx").open("wb") as f:
+        assert write_xlsx(f, ("a",), iter([(1,), (2,), (3,)]), title="x" * 40) == 3
+    assert (tmp_path / "out.xlsx").read_bytes()[:2] == b"PK"
+    assert write_csv(io.StringIO(), ("a",), []) == 0
+
+
+def test_exports_are_scoped_to_visible_time_entries(grant, user, other_user, entries):
+    definition = get_export("time_entries")
+    # Sin view_timeentry solo las propias, aunque se pida otra persona
+    assert [row[1] for row in iter_rows(definition, user=user, filters={})] == ["ana"]
+    assert list(iter_rows(definition, user=user, filters={"user_id": other_user.pk})) == []
+
+    manager = grant(user, "timetracking.view_timeentry")
+    rows = iter_rows(definition, user=manager, filters={"user_id": other_user.pk})
+    assert [row[1] for row in rows] == ["luis"]
+
+
+def test_rollup_exports_follow_time_entry_visibility(grant, user, other_user, project, entries):
+    RollupService.rebuild()
+    viewer = grant(user, "projects.view_project")
+    rows = list(iter_rows(get_export("project_hours"), user=viewer, filters={}))
+    assert [(row[3], row[4]) for row in rows] == [("ana", Decimal(3))]
+
+
+def test_download_streams_csv(grant, client, user, entries):
+    client.force_login(grant(user, "timetracking.view_timeentry"))
+    response = client.get(reverse("reporting:export_download", args=["time_entries"]))
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Disposition"].startswith('attachment; filename="time_entries-')
+    rows = _csv_rows(b"".join(response.streaming_content).decode())
+    assert rows[0][0] == "Fecha"
+    assert sorted(row[1] for row in rows[1:]) == ["ana", "luis"]
+
+
+def test_download_streams_csv_in_chunks_over_asgi(grant, async_client, user, entries, settings):
+    settings.EXPORT_CHUNK_SIZE = 2
+    async_client.force_login(grant(user, "timetracking.view_timeentry"))
+    url = reverse("reporting:export_download", args=["time_entries"])
+
+    async def download():
+        response = await async_client.get(url)
+        return response, [chunk async for chunk in response.streaming_content]
+
+    response, chunks = async_to_sync(download)()
+
+    assert response.status_code == 200
+    # Iterador async: Django no lo consume entero con sync_to_async(list)
+    assert response.is_async
+    assert len(chunks) == 2  # cabecera + 1 fila, 1 fila
+    rows = _csv_rows(b"".join(chunks).decode())
+    assert rows[0][0] == "Fecha"
+    assert sorted(row[1] for row in rows[1:]) == ["ana", "luis"]
+
+
+def test_download_xlsx(grant, client, user, entries):
+    client.force_login(grant(user, "timetracking.view_timeentry"))
+    url = reverse("reporting:export_download", args=["time_entries"])
+    response = client.get(url, {"format": "xlsx"})
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content)[:2] == b"PK"
+
+
+def test_download_rejects_bad_input_and_missing_permission(grant, client, user):
+    client.force_login(user)
+    url = reverse("reporting:export_download", args=["time_entries"])
+    assert client.get(url).status_code == 403
+
+    client.force_login(grant(user, "timetracking.view_timeentry"))
+    assert client.get(url, {"format": "pdf"}).status_code == 400
+    assert client.get(url, {"date_from": "ayer"}).status_code == 400
+    assert client.get(reverse("reporting:export_download", args=["nope"])).status_code == 404
+
+
+def test_large_export_runs_in_background(
+    grant,
+    client,
+    user,
+    entries,
+    settings,
+    tmp_path,
+    celery_eager,
+    django_capture_on_commit_callbacks,
+):
+    settings.EXPORT_SYNC_MAX_ROWS = 1
+    settings.MEDIA_ROOT = tmp_path
+    client.force_login(grant(user, "timetracking.view_timeentry"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.get(reverse("reporting:export_download", args=["time_entries"]))
+    assert response.status_code == 202
+
+    job = ExportJob.objects.get(pk=response.json()["job_id"])
+    assert (job.status, job.row_count) == (ExportJob.Status.DONE, 2)
+
+    status = client.get(response.json()["status_url"]).json()
+    assert status["status"] == ExportJob.Status.DONE
+    download = client.get(status["download_url"])
+    rows = _csv_rows(b"".join(download.streaming_content).decode())
+    assert len(rows) == 3
+
+
+def test_run_export_scopes_rows_to_requester(user, entries, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    job = ExportJob.objects.create(
+        export_name="project_hours", format="csv", filters={}, requested_by=user
+    )
+    # Sin permisos ni agregados: la exportación termina vacía, no falla
+    job = ExportService.run_export(job_id=job.pk)
+    assert (job.status, job.row_count) == (ExportJob.Status.DONE, 0)
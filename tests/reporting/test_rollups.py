@@ -0,0 +1,123 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from apps.reporting.models import DailyTimeRollup, WeeklyTimeRollup
+from apps.reporting.services import RollupService, week_start
+from apps.reporting.tasks import refresh_time_rollups
+from apps.timetracking.models import TimeEntry
+
+pytestmark = pytest.mark.django_db
+
+MONDAY = date(2026, 3, 2)
+
+
+def _entry(user, project, day=MONDAY, hours="2.50", billable=True):
+    return TimeEntry.objects.create(
+        user=user, project=project, date=day, hours=Decimal(hours), billable=billable
+    )
+
+
+def _daily(project, user, day=MONDAY):
+    return DailyTimeRollup.objects.get(project=project, user=user, date=day)
+
+
+def test_week_start_is_monday():
+    assert week_start(MONDAY + timedelta(days=6)) == MONDAY
+    assert week_start(MONDAY) == MONDAY
+
+
+def test_signals_refresh_buckets_after_commit(
+    user, project, celery_eager, django_capture_on_commit_callbacks, mocker
+):
+    delay = mocker.spy(refresh_time_rollups, "delay")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _entry(user, project)
+        _entry(user, project, hours="1.00", billable=False)
+    # Una sola tarea por commit aunque cambien varias entradas
+    delay.assert_called_once_with([[project.pk, user.pk, MONDAY.isoformat()]])
+
+    daily = _daily(project, user)
+    assert (daily.hours, daily.billable_hours, daily.entry_count) == (
+        Decimal("3.50"),
+        Decimal("2.50"),
+        2,
+    )
+    weekly = WeeklyTimeRollup.objects.get(project=project, user=user, week_start=MONDAY)
+    assert weekly.hours == Decimal("3.50")
+
+
+def test_moving_entry_refreshes_old_and_new_bucket(
+    user, project, celery_eager, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        entry = _entry(user, project)
+    next_week = MONDAY + timedelta(days=7)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        entry.date = next_week
+        entry.save()
+
+    assert not DailyTimeRollup.objects.filter(date=MONDAY).exists()
+    assert not WeeklyTimeRollup.objects.filter(week_start=MONDAY).exists()
+    assert _daily(project, user, next_week).hours == Decimal("2.50")
+
+
+def test_delete_removes_empty_bucket(
+    user, project, celery_eager, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        entry = _entry(user, project)
+    with django_capture_on_commit_callbacks(execute=True):
+        entry.delete()
+
+    assert not DailyTimeRollup.objects.exists()
+    assert not WeeklyTimeRollup.objects.exists()
+
+
+def test_rebuild_fixes_bulk_writes_and_orphans(user, other_user, project):
+    # bulk_create no emite señales: los agregados quedan desfasados
+    TimeEntry.objects.bulk_create(
+        [
+            TimeEntry(user=user, project=project, date=MONDAY, hours=Decimal(4)),
+            TimeEntry(user=user, project=project, date=MONDAY + timedelta(days=1), hours=1),
+            TimeEntry(user=other_user, project=project, date=MONDAY + timedelta(days=9), hours=2),
+        ]
+    )
+    orphan_day = MONDAY - timedelta(days=14)
+    DailyTimeRollup.objects.create(project=project, user=user, date=orphan_day, hours=8)
+    WeeklyTimeRollup.objects.create(project=project, user=user, week_start=orphan_day, hours=8)
+
+    stats = RollupService.rebuild()
+
+    assert stats == {"daily": 3, "weekly": 2, "daily_deleted": 1, "weekly_deleted": 1}
+    assert _daily(project, user).hours == Decimal(4)
+    weeks = dict(
+        WeeklyTimeRollup.objects.filter(project=project).values_list("week_start", "hours")
+    )
+    assert weeks == {MONDAY: Decimal(5), MONDAY + timedelta(days=7): Decimal(2)}
+
+
+def test_rebuild_range_leaves_other_weeks_untouched(user, project):
+    TimeEntry.objects.bulk_create(
+        [
+            TimeEntry(user=user, project=project, date=MONDAY, hours=3),
+            TimeEntry(user=user, project=project, date=MONDAY + timedelta(days=7), hours=5),
+        ]
+    )
+    # date_from a mitad de semana: se amplía a la semana completa
+    RollupService.rebuild(date_from=MONDAY + timedelta(days=9))
+
+    assert not DailyTimeRollup.objects.filter(date=MONDAY).exists()
+    assert _daily(project, user, MONDAY + timedelta(days=7)).hours == Decimal(5)
+
+
+def test_rebuild_empty_database():
+    assert RollupService.rebuild() == {
+        "daily": 0,
+        "weekly": 0,
+        "daily_deleted": 0,
+        "weekly_deleted": 0,
+    }
@@ -0,0 +1,190 @@
+from array import array
+from datetime import date
+
+import pytest
+
+from apps.resources.capacity import (
+    Capacity,
+    build_month,
+    common_free_minutes,
+    get_capacity,
+    month_starts,
+    sum_capacity,
+)
+from apps.resources.models import Absence, Assignment, Holiday, Team, TeamMember, WorkCalendar
+from apps.resources.selectors import (
+    get_availability_percent,
+    get_overallocated_people,
+    get_team_capacity,
+)
+
+WEEK = [450, 450, 450, 450, 450, 0, 0]
+# Marzo de 2026 empieza en domingo
+MARCH = date(2026, 3, 1)
+
+
+def _day(value: array, day: int) -> int:
+    return value[day - 1]
+
+
+def test_build_month_follows_weekly_schedule():
+    available, assigned = build_month(MARCH, weekday_minutes=WEEK)
+
+    assert len(available) == 31
+    assert (_day(available, 1), _day(available, 2), _day(available, 7)) == (0, 450, 0)
+    assert sum(available) == 22 * 450
+    assert assigned == array("H", [0] * 31)
+
+
+def test_build_month_holidays_and_absences():
+    available, _ = build_month(
+        MARCH,
+        weekday_minutes=WEEK,
+        holidays=[date(2026, 3, 19), date(2026, 4, 2)],
+        absences=[
+            # Vacaciones que empiezan en febrero
+            (date(2026, 2, 25), date(2026, 3, 3), None),
+            # Permiso de dos horas
+            (date(2026, 3, 10), date(2026, 3, 10), 120),
+            # Más minutos que la jornada: se queda en 0, no desborda
+            (date(2026, 3, 11), date(2026, 3, 11), 600),
+        ],
+    )
+
+    assert _day(available, 19) == 0
+    assert (_day(available, 2), _day(available, 3), _day(available, 4)) == (0, 0, 450)
+    assert (_day(available, 10), _day(available, 11)) == (330, 0)
+
+
+def test_build_month_sums_assignments_over_the_working_day():
+    _, assigned = build_month(
+        MARCH,
+        weekday_minutes=WEEK,
+        assignments=[
+            (date(2026, 1, 1), None, 50),
+            (date(2026, 3, 16), date(2026, 3, 20), 80),
+        ],
+    )
+
+    assert (_day(assigned, 2), _day(assigned, 16), _day(assigned, 21)) == (225, 585, 0)
+    # Los festivos y ausencias no reducen lo asignado: aparece como sobreasignación
+    capacity = Capacity(start=MARCH, available=array("H", [0] * 31), assigned=assigned)
+    assert _day(capacity.overallocated, 2) == 225
+
+
+def test_capacity_arithmetic():
+    a = Capacity(start=MARCH, available=array("H", [450, 450, 0]), assigned=array("H", [0, 600, 0]))
+    b = Capacity(start=MARCH, available=array("H", [450, 0, 0]), assigned=array("H", [225, 0, 0]))
+
+    assert list(a.free) == [450, 0, 0]
+    assert list(a.overallocated) == [0, 150, 0]
+    assert a.utilization == pytest.approx(600 / 900)
+    assert list((a + b).available) == [900, 450, 0]
+    assert list(common_free_minutes([a, b])) == [225, 0, 0]
+    assert common_free_minutes([]) == array("L")
+
+    part = a.slice(date(2026, 3, 2), date(2026, 3, 10))
+    assert (part.start, part.end, list(part.available)) == (
+        date(2026, 3, 2),
+        date(2026, 3, 3),
+        [450, 0],
+    )
+    with pytest.raises(ValueError, match="mismo rango"):
+        a + part
+
+    total = sum_capacity([a, b], date_from=MARCH, date_to=date(2026, 3, 2))
+    assert list(total.available) == [900, 450]
+    assert Capacity(start=MARCH, available=array("H"), assigned=array("H")).utilization is None
+    assert a.to_dict()["available"] == [450, 450, 0]
+
+
+def test_month_starts():
+    assert month_starts(date(2026, 1, 31), date(2026, 3, 1)) == [
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+        date(2026, 3, 1),
+    ]
+
+
+@pytest.mark.django_db
+class TestGetCapacity:
+    @pytest.fixture
+    def work_calendar(self):
+        calendar = WorkCalendar.objects.create(name="Madrid", weekday_minutes=WEEK)
+        Holiday.objects.create(calendar=calendar, date=date(2026, 3, 19), name="San José")
+        return calendar
+
+    @pytest.fixture
+    def team(self, user, other_user, work_calendar):
+        team = Team.objects.create(name="Plataforma")
+        TeamMember.objects.create(user=user, team=team, calendar=work_calendar)
+        TeamMember.objects.create(
+            user=other_user, team=team, calendar=work_calendar, workload_percent=50
+        )
+        return team
+
+    def test_computes_and_caches_months(self, user, other_user, team, django_assert_num_queries):
+        with django_assert_num_queries(4):
+            capacity = get_capacity(
+                user_ids=[user.pk, other_user.pk],
+                date_from=date(2026, 3, 16),
+                date_to=date(2026, 4, 3),
+            )
+        assert capacity[user.pk].days == 19
+        assert capacity[user.pk].available[:5].tolist() == [450, 450, 450, 0, 450]
+        assert capacity[other_user.pk].available[0] == 225
+
+        with django_assert_num_queries(0):
+            cached = get_capacity(
+                user_ids=[user.pk], date_from=date(2026, 3, 16), date_to=date(2026, 4, 3)
+            )
+        assert cached[user.pk] == capacity[user.pk]
+
+    def test_without_member_record_capacity_is_zero(self, user):
+        capacity = get_capacity(user_ids=[user.pk], date_from=MARCH, date_to=date(2026, 3, 31))
+        assert sum(capacity[user.pk].available) == 0
+        assert get_capacity(user_ids=[], date_from=MARCH, date_to=MARCH) == {}
+
+    def test_changes_invalidate_cached_months(
+        self, user, team, project, django_capture_on_commit_callbacks
+    ):
+        day = date(2026, 3, 16)
+
+        def available():
+            return get_capacity(user_ids=[user.pk], date_from=day, date_to=day)[user.pk]
+
+        assert available().available[0] == 450
+        with django_capture_on_commit_callbacks(execute=True):
+            absence = Absence.objects.create(
+                user=user, kind=Absence.Kind.LEAVE, start_date=day, end_date=day, minutes_per_day=60
+            )
+        # Solo cuentan las aprobadas
+        assert available().available[0] == 450
+
+        with django_capture_on_commit_callbacks(execute=True):
+            absence.status = Absence.Status.APPROVED
+            absence.save()
+            Assignment.objects.create(user=user, project=project, percent=100, start_date=day)
+        capacity = available()
+        assert (capacity.available[0], capacity.assigned[0]) == (390, 450)
+        assert list(capacity.overallocated) == [60]
+
+    def test_team_selectors(self, user, other_user, team, project):
+        for percent in (100, 50):
+            Assignment.objects.create(
+                user=other_user, project=project, percent=percent, start_date=date(2026, 3, 16)
+            )
+        days = {"date_from": date(2026, 3, 16), "date_to": date(2026, 3, 20)}
+
+        team_capacity = get_team_capacity(team_id=team.pk, **days)
+        assert sum(team_capacity["total"].available) == 4 * 450 + 4 * 225
+        assert set(team_capacity["members"]) == {user.pk, other_user.pk}
+
+        overallocated = get_overallocated_people(user_ids=[user.pk, other_user.pk], **days)
+        assert [row["user_id"] for row in overallocated] == [other_user.pk]
+        # 150 % de 225 minutos, salvo el festivo (sin jornada no hay asignación)
+        assert overallocated[0]["days"] == [date(2026, 3, d) for d in (16, 17, 18, 20)]
+        assert overallocated[0]["excess_minutes"] == 4 * (337 - 225)
+
+        assert get_availability_percent(user_id=user.pk, **days) == 100.0
+        assert get_availability_percent(user_id=other_user.pk, **days) == 0.0
@@ -0,0 +1,84 @@
+from base64 import b64encode
+from datetime import date, timedelta
+from decimal import Decimal
+from urllib.parse import urlencode
+
+import pytest
+
+from django.urls import reverse
+
+from apps.timetracking.models import TimeEntry
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("timetracking:time_entry_list")
+
+
+@pytest.fixture
+def entries(user, project):
+    # Muchas entradas por día: los empates de fecha cruzan los límites de página
+    day = date(2026, 3, 2)
+    return TimeEntry.objects.bulk_create(
+        [
+            TimeEntry(user=user, project=project, date=day + timedelta(days=i // 4), hours=1)
+            for i in range(11)
+        ]
+    )
+
+
+def _walk(client, url, direction="next"):
+    ids = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        ids.extend(row["id"] for row in data["results"])
+        url = data[direction]
+    return ids, data
+
+
+def test_cursor_walks_every_entry_once_in_order(client, user, entries):
+    client.force_login(user)
+    ids, _ = _walk(client, f"{URL}?page_size=3")
+
+    expected = sorted(entries, key=lambda e: (e.date, e.pk), reverse=True)
+    assert ids == [e.pk for e in expected]
+
+
+def test_cursor_encodes_every_ordering_field(client, user, entries):
+    client.force_login(user)
+    first = client.get(URL, {"page_size": 3}).json()
+    second = client.get(first["next"]).json()
+
+    # Sin OFFSET: la segunda página se pide solo por (date, id)
+    assert "o%3D" not in first["next"]
+    assert [row["id"] for row in second["results"]] == [
+        e.pk for e in sorted(entries, key=lambda e: (e.date, e.pk), reverse=True)[3:6]
+    ]
+    # Y hacia atrás se vuelve a la primera página
+    back = client.get(second["previous"]).json()
+    assert back["results"] == first["results"]
+
+
+def test_previous_links_walk_back_to_start(client, user, entries):
+    client.force_login(user)
+    _, last = _walk(client, f"{URL}?page_size=4")
+    ids, _ = _walk(client, last["previous"], direction="previous")
+    assert len(ids) == len(entries) - len(last["results"])
+
+
+@pytest.mark.parametrize(
+    "position", ["garbage", '["2026-03-02"]', '["not-a-date","1"]', '["2026-03-02","x"]']
+)
+def test_invalid_cursor_is_not_found(client, user, entries, position):
+    client.force_login(user)
+    cursor = b64encode(urlencode({"p": position}).encode()).decode()
+    assert client.get(URL, {"cursor": cursor}).status_code == 404
+
+
+def test_only_visible_entries(client, other_user, entries):
+    client.force_login(other_user)
+    TimeEntry.objects.create(
+        user=other_user, project=entries[0].project, date=date(2026, 1, 1), hours=Decimal(2)
+    )
+    assert [row["user_id"] for row in client.get(URL).json()["results"]] == [other_user.pk]
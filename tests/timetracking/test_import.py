@@ -0,0 +1,119 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from django.core.management import call_command
+
+from apps.reporting.models import DailyTimeRollup
+from apps.timetracking.models import TimeEntry
+from apps.timetracking.services import TimeEntryImportService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def row(user, project):
+    def _row(external_id="k-1", **overrides):
+        return {
+            "external_id": external_id,
+            "user_id": user.pk,
+            "project_id": project.pk,
+            "date": "2026-03-02",
+            "hours": "7.5",
+            "billable": "true",
+            "description": "Sprint",
+        } | overrides
+
+    return _row
+
+
+def test_import_creates_updates_and_skips_unchanged(row):
+    result = TimeEntryImportService.import_rows(rows=[row("k-1"), row("k-2")], source="kronos")
+    assert (result.created, result.updated, result.unchanged, result.errors) == (2, 0, 0, [])
+
+    entry = TimeEntry.objects.get(source="kronos", external_id="k-1")
+    assert (entry.date, entry.hours, entry.billable) == (date(2026, 3, 2), Decimal("7.50"), True)
+
+    # Reimportar: solo cambia k-2
+    result = TimeEntryImportService.import_rows(
+        rows=[row("k-1"), row("k-2", hours="3")], source="kronos", batch_size=1
+    )
+    assert (result.created, result.updated, result.unchanged) == (0, 1, 1)
+    assert TimeEntry.objects.get(external_id="k-2").hours == Decimal(3)
+    assert TimeEntry.objects.count() == 2
+
+
+def test_same_external_id_in_other_source_is_another_entry(row):
+    TimeEntryImportService.import_rows(rows=[row()], source="kronos")
+    TimeEntryImportService.import_rows(rows=[row()], source="csv-rrhh")
+    assert TimeEntry.objects.count() == 2
+
+
+def test_invalid_rows_are_reported_and_skipped(row):
+    rows = [
+        row("ok"),
+        row("bad-hours", hours="25"),
+        row("bad-date", date="ayer"),
+        row("no-user", user_id=999_999),
+        row("no-project", project_id=999_999),
+        row("ok"),
+    ]
+    result = TimeEntryImportService.import_rows(rows=rows, source="kronos")
+
+    assert result.created == 1
+    assert [(error.row, error.field) for error in result.errors] == [
+        (2, "hours"),
+        (3, "date"),
+        (4, "user_id"),
+        (5, "project_id"),
+        (6, "external_id"),
+    ]
+    assert list(TimeEntry.objects.values_list("external_id", flat=True)) == ["ok"]
+
+
+def test_dry_run_rolls_back(row):
+    result = TimeEntryImportService.import_rows(rows=[row()], source="kronos", dry_run=True)
+    assert result.created == 1
+    assert not TimeEntry.objects.exists()
+
+
+def test_source_is_required(row):
+    with pytest.raises(ValueError, match="source"):
+        TimeEntryImportService.import_rows(rows=[row()], source="")
+
+
+def test_import_refreshes_old_and_new_rollup_buckets(
+    row, project, user, celery_eager, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        TimeEntryImportService.import_rows(rows=[row()], source="kronos")
+    assert DailyTimeRollup.objects.get(date=date(2026, 3, 2)).hours == Decimal("7.50")
+
+    # Cambiar de día refresca el bucket anterior (queda vacío) y el nuevo
+    with django_capture_on_commit_callbacks(execute=True):
+        TimeEntryImportService.import_rows(rows=[row(date="2026-03-03")], source="kronos")
+    assert list(DailyTimeRollup.objects.values_list("date", "hours")) == [
+        (date(2026, 3, 3), Decimal("7.50"))
+    ]
+
+
+def test_import_command_reads_csv_and_jsonl(tmp_path, row, capsys):
+    csv_path = tmp_path / "horas.csv"
+    header = "external_id,user_id,project_id,date,hours\n"
+    data = row()
+    csv_path.write_text(
+        header + f"c-1,{data['user_id']},{data['project_id']},2026-03-02,8\n"
+        f"c-2,{data['user_id']},{data['project_id']},2026-03-02,-1\n"
+    )
+    call_command("import_time_entries", str(csv_path), "--source", "csv")
+    captured = capsys.readouterr()
+    assert "1 creadas" in captured.out
+    assert "Fila 2 [hours]" in captured.err
+
+    jsonl_path = tmp_path / "horas.jsonl"
+    jsonl_path.write_text(json.dumps(row("j-1")) + "\n\n" + json.dumps(row("j-2")) + "\n")
+    call_command("import_time_entries", str(jsonl_path), "--source", "api", "--dry-run")
+    assert "[dry run] 2 creadas" in capsys.readouterr().out
+    assert not TimeEntry.objects.filter(source="api").exists()